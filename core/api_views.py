@@ -3,26 +3,33 @@ Simple API views for SmartBet recommendations
 Works with the current PredictionLog model structure
 """
 
-from django.http import JsonResponse
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.utils import timezone
+from collections import namedtuple
 from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import lru_cache
+import base64
 import hashlib
 import hmac
 import json
 import logging
 import os
 import uuid
-import requests
 from django.db.models import Q
 
 from django.db import transaction
+from asgiref.sync import sync_to_async
 from .models import (EmailSubscriber, IngestRequest, MarketingEvent,
                      PredictionLog, PredictionSnapshot, UserBankroll)
-from .bankroll_utils import calculate_stake_amount
-from .services.marketing import MarketingSyncError, sync_marketing_profile
-from .services import (ingest_auth, public_universe, recommendation_ingest,
+from .bankroll_utils import calculate_stake_amount, calculate_stake_amounts
+from .services.marketing import (MarketingSyncError, async_sync_marketing_profile,
+                                 sync_marketing_profile)
+from .services import (fixture_search, ingest_auth, provider_http,
+                       public_universe, recommendation_ingest,
                        snapshot_recording)
 from .services.redaction import redact, redact_exception
 
@@ -56,9 +63,25 @@ PHASE_2C_WATCHLIST_LEAGUES = {
 }
 
 
+# Everything generate_model_explanation reads. The text is a pure function of
+# these, so it is cached per (fixture, field values): an unchanged prediction
+# is formatted once, and any re-logged field produces a new key.
+_ExplanationInputs = namedtuple('_ExplanationInputs', [
+    'fixture_id', 'confidence', 'consensus', 'variance', 'predicted_outcome',
+    'home_team', 'away_team', 'expected_value', 'league', 'model_count',
+    'ensemble_strategy',
+])
+
+
 def generate_model_explanation(prediction):
     """Generate beautiful, comprehensive model insights"""
-    
+    return _model_explanation(_ExplanationInputs(
+        *(getattr(prediction, field) for field in _ExplanationInputs._fields)
+    ))
+
+
+@lru_cache(maxsize=4096)
+def _model_explanation(prediction):
     # Determine prediction strength
     confidence = prediction.confidence
     if confidence >= 0.70:
@@ -204,6 +227,7 @@ def get_recommendations(request):
         
         # Convert to frontend format
         recommendations = []
+        stake_inputs = []  # (recommendation, win_probability, odds, confidence)
         for pred in predictions:
             recommendation = {
                 'fixture_id': pred.fixture_id,
@@ -283,49 +307,66 @@ def get_recommendations(request):
                 }
             }
             
-            # Add stake recommendation if user has bankroll
+            # Queue for the batched stake calculation below
             if user_bankroll:
-                try:
-                    # Get odds for predicted outcome
-                    predicted_odds = None
-                    if pred.predicted_outcome.lower() == 'home':
-                        predicted_odds = pred.odds_home
-                        win_probability = pred.probability_home
-                    elif pred.predicted_outcome.lower() == 'draw':
-                        predicted_odds = pred.odds_draw
-                        win_probability = pred.probability_draw
-                    elif pred.predicted_outcome.lower() == 'away':
-                        predicted_odds = pred.odds_away
-                        win_probability = pred.probability_away
-                    
-                    if predicted_odds and win_probability:
-                        stake_calc = calculate_stake_amount(
+                outcome = pred.predicted_outcome.lower()
+                predicted_odds, win_probability = {
+                    'home': (pred.odds_home, pred.probability_home),
+                    'draw': (pred.odds_draw, pred.probability_draw),
+                    'away': (pred.odds_away, pred.probability_away),
+                }.get(outcome, (None, None))
+                if predicted_odds and win_probability:
+                    stake_inputs.append((recommendation, win_probability, predicted_odds,
+                                         pred.confidence * 100))  # Convert to percentage
+            
+            recommendations.append(recommendation)
+        
+        # Add stake recommendations if user has bankroll: one vectorised pass
+        if stake_inputs:
+            targets, probabilities, odds, confidences = zip(*stake_inputs)
+            try:
+                stake_calcs = calculate_stake_amounts(
+                    bankroll=user_bankroll.current_bankroll,
+                    strategy=user_bankroll.staking_strategy,
+                    win_probabilities=probabilities,
+                    odds=odds,
+                    confidences=confidences,
+                    fixed_amount=user_bankroll.fixed_stake_amount,
+                    fixed_percentage=user_bankroll.fixed_stake_percentage,
+                    max_stake_percentage=user_bankroll.max_stake_percentage
+                )
+            except Exception:
+                # Size the page row by row instead, so a failure costs only the
+                # recommendation it belongs to.
+                stake_calcs = []
+                for win_probability, predicted_odds, confidence in zip(probabilities, odds, confidences):
+                    try:
+                        stake_calcs.append(calculate_stake_amount(
                             bankroll=user_bankroll.current_bankroll,
                             strategy=user_bankroll.staking_strategy,
                             win_probability=win_probability,
                             odds=predicted_odds,
-                            confidence=pred.confidence * 100,  # Convert to percentage
+                            confidence=confidence,
                             fixed_amount=user_bankroll.fixed_stake_amount,
                             fixed_percentage=user_bankroll.fixed_stake_percentage,
                             max_stake_percentage=user_bankroll.max_stake_percentage
-                        )
-                        
-                        recommendation['stake_recommendation'] = {
-                            'recommended_stake': float(stake_calc['recommended_stake']),
-                            'stake_percentage': stake_calc['stake_percentage'],
-                            'currency': user_bankroll.currency,
-                            'strategy': stake_calc['strategy'],
-                            'risk_level': stake_calc['risk_level'],
-                            'risk_explanation': stake_calc['risk_explanation'],
-                            'warnings': stake_calc['warnings']
-                        }
-                except Exception as e:
+                        ))
+                    except Exception as e:
+                        stake_calcs.append({'error': redact_exception(e)})
+            for recommendation, stake_calc in zip(targets, stake_calcs):
+                if 'error' in stake_calc:
                     # Don't fail the whole request if stake calc fails
-                    recommendation['stake_recommendation'] = {
-                        'error': redact_exception(e)
-                    }
-            
-            recommendations.append(recommendation)
+                    recommendation['stake_recommendation'] = stake_calc
+                    continue
+                recommendation['stake_recommendation'] = {
+                    'recommended_stake': float(stake_calc['recommended_stake']),
+                    'stake_percentage': stake_calc['stake_percentage'],
+                    'currency': user_bankroll.currency,
+                    'strategy': stake_calc['strategy'],
+                    'risk_level': stake_calc['risk_level'],
+                    'risk_explanation': stake_calc['risk_explanation'],
+                    'warnings': stake_calc['warnings']
+                }
         
         response_data = {
             'success': True,
@@ -486,91 +527,113 @@ def get_fixture_context_timeline(request, fixture_id):
     })
 
 
-@csrf_exempt
-@require_http_methods(["GET"])
-def get_recommended_predictions_with_outcomes(request):
-    """
-    Get recommended predictions with their actual outcomes for monitoring.
-    
-    GET /api/recommended-predictions/
-    Query params:
-    - limit (optional): Limit number of results (default: 50)
-    - include_pending (optional): Include matches that haven't finished yet (default: true)
+# Columns the monitoring table needs. Read with .values() so no model
+# instances are built, whichever response mode is used.
+_RECOMMENDED_FIELDS = (
+    'id', 'fixture_id', 'home_team', 'away_team', 'league', 'kickoff',
+    'predicted_outcome', 'confidence', 'expected_value', 'raw_expected_value',
+    'odds', 'odds_home', 'odds_draw', 'odds_away', 'bookmaker',
+    'is_audit_excluded', 'pricing_integrity_status', 'actual_outcome',
+    'actual_score_home', 'actual_score_away', 'match_status', 'was_correct',
+    'profit_loss_10', 'roi_percent', 'probability_home', 'probability_draw',
+    'probability_away', 'model_count', 'consensus', 'variance',
+    'prediction_logged_at', 'result_logged_at', 'market_type', 'market_score',
+)
+RECOMMENDED_PAGE_SIZE = 200
+RECOMMENDED_MAX_PAGE_SIZE = 1000
+
+
+def _recommended_row(p):
+    """One .values() row in the frontend's format."""
+    return {
+        'fixture_id': p['fixture_id'],
+        'home_team': p['home_team'],
+        'away_team': p['away_team'],
+        'league': p['league'],
+        'kickoff': p['kickoff'].isoformat(),
+        'predicted_outcome': p['predicted_outcome'].capitalize() if p['predicted_outcome'] else 'Unknown',
+        'predicted_outcome_raw': p['predicted_outcome'],  # For comparison
+        # Convert confidence to percentage if stored as decimal
+        'confidence': round(p['confidence'] * 100, 1) if p['confidence'] and p['confidence'] < 1 else round(p['confidence'], 1),
+        # Convert EV to percentage if stored as decimal
+        'expected_value': round(p['expected_value'] * 100, 2) if p['expected_value'] and p['expected_value'] < 1 else round(p['expected_value'], 2) if p['expected_value'] else None,
+        'raw_expected_value': round(p['raw_expected_value'] * 100, 2) if p['raw_expected_value'] and abs(p['raw_expected_value']) < 1 else round(p['raw_expected_value'], 2) if p['raw_expected_value'] is not None else None,
+        'odds': p['odds'],
+        'odds_home': p['odds_home'],
+        'odds_draw': p['odds_draw'],
+        'odds_away': p['odds_away'],
+        'bookmaker': p['bookmaker'],
+        'is_audit_excluded': p['is_audit_excluded'],
+        'pricing_integrity_status': p['pricing_integrity_status'],
+        'actual_outcome': p['actual_outcome'].capitalize() if p['actual_outcome'] else None,
+        'actual_outcome_raw': p['actual_outcome'],  # For comparison
+        'actual_score_home': p['actual_score_home'],
+        'actual_score_away': p['actual_score_away'],
+        'match_status': p['match_status'],
+        'was_correct': p['was_correct'],
+        'profit_loss_10': round(p['profit_loss_10'], 2) if p['profit_loss_10'] is not None else None,
+        'roi_percent': round(p['roi_percent'], 2) if p['roi_percent'] is not None else None,
+        'probabilities': {
+            'home': round(p['probability_home'] * 100, 1),
+            'draw': round(p['probability_draw'] * 100, 1),
+            'away': round(p['probability_away'] * 100, 1)
+        },
+        'model_count': p['model_count'],
+        'consensus': round(p['consensus'] * 100, 1) if p['consensus'] else None,
+        'variance': round(p['variance'], 2) if p['variance'] else None,
+        'prediction_logged_at': p['prediction_logged_at'].isoformat(),
+        'result_logged_at': p['result_logged_at'].isoformat() if p['result_logged_at'] else None,
+        'is_completed': p['actual_outcome'] is not None,
+        # Multi-Market Support
+        'market_type': p['market_type'] or '1x2',
+        'market_score': p['market_score'],
+    }
+
+
+class _RecommendedSummary:
+    """The monitoring summary, accumulated one row at a time.
+
+    Holds running totals rather than the rows, so the summary costs the same
+    memory for ten predictions as for ten thousand and can be built while the
+    rows themselves are being streamed out.
     """
-    try:
-        include_pending = request.GET.get('include_pending', 'true').lower() == 'true'
-        
-        # Get ALL recommended predictions - no limit!
-        # This ensures complete transparency and no "missing" data.
-        # Exclude archived (SportMonks no longer has the fixture) — these are
-        # permanently un-settle-able and shouldn't appear in user-facing stats.
-        queryset = PredictionLog.objects.filter(
-            is_recommended=True
-        ).exclude(
-            match_status='archived'
-        ).defer('notes', 'home_team_form', 'away_team_form').order_by('-kickoff')
-        
-        # If not including pending, only show completed matches
-        if not include_pending:
-            queryset = queryset.filter(actual_outcome__isnull=False)
-        
-        predictions = list(queryset)
-        
-        # Convert to frontend format
-        results = []
-        for pred in predictions:
-            result = {
-                'fixture_id': pred.fixture_id,
-                'home_team': pred.home_team,
-                'away_team': pred.away_team,
-                'league': pred.league,
-                'kickoff': pred.kickoff.isoformat(),
-                'predicted_outcome': pred.predicted_outcome.capitalize() if pred.predicted_outcome else 'Unknown',
-                'predicted_outcome_raw': pred.predicted_outcome,  # For comparison
-                # Convert confidence to percentage if stored as decimal
-                'confidence': round(pred.confidence * 100, 1) if pred.confidence and pred.confidence < 1 else round(pred.confidence, 1),
-                # Convert EV to percentage if stored as decimal
-                'expected_value': round(pred.expected_value * 100, 2) if pred.expected_value and pred.expected_value < 1 else round(pred.expected_value, 2) if pred.expected_value else None,
-                'raw_expected_value': round(pred.raw_expected_value * 100, 2) if pred.raw_expected_value and abs(pred.raw_expected_value) < 1 else round(pred.raw_expected_value, 2) if pred.raw_expected_value is not None else None,
-                'odds': pred.odds,
-                'odds_home': pred.odds_home,
-                'odds_draw': pred.odds_draw,
-                'odds_away': pred.odds_away,
-                'bookmaker': pred.bookmaker,
-                'is_audit_excluded': pred.is_audit_excluded,
-                'pricing_integrity_status': pred.pricing_integrity_status,
-                'actual_outcome': pred.actual_outcome.capitalize() if pred.actual_outcome else None,
-                'actual_outcome_raw': pred.actual_outcome,  # For comparison
-                'actual_score_home': pred.actual_score_home,
-                'actual_score_away': pred.actual_score_away,
-                'match_status': pred.match_status,
-                'was_correct': pred.was_correct,
-                'profit_loss_10': round(pred.profit_loss_10, 2) if pred.profit_loss_10 is not None else None,
-                'roi_percent': round(pred.roi_percent, 2) if pred.roi_percent is not None else None,
-                'probabilities': {
-                    'home': round(pred.probability_home * 100, 1),
-                    'draw': round(pred.probability_draw * 100, 1),
-                    'away': round(pred.probability_away * 100, 1)
-                },
-                'model_count': pred.model_count,
-                'consensus': round(pred.consensus * 100, 1) if pred.consensus else None,
-                'variance': round(pred.variance, 2) if pred.variance else None,
-                'prediction_logged_at': pred.prediction_logged_at.isoformat(),
-                'result_logged_at': pred.result_logged_at.isoformat() if pred.result_logged_at else None,
-                'is_completed': pred.actual_outcome is not None,
-                # Multi-Market Support
-                'market_type': getattr(pred, 'market_type', '1x2') or '1x2',
-                'market_score': getattr(pred, 'market_score', None)
-            }
-            results.append(result)
-        
-        # Calculate summary statistics.
+    MARKET_TYPES = ('1x2', 'btts', 'over_under_2.5', 'double_chance')
+
+    def __init__(self):
+        self.total = 0
+        self.completed = 0
+        self.correct = 0
+        self.quarantined = 0
+        self.pending = 0
+        self.priced = 0
+        self.total_pl = 0
+        self.total_roi = 0
+        self.implied_probabilities = 0
+        self.implied_sum = 0
+        self.by_market = {m: {'total': 0, 'correct': 0, 'profit_loss': 0, 'priced': 0}
+                          for m in self.MARKET_TYPES}
+
+    def add(self, r):
+        self.total += 1
+        if not r['is_completed']:
+            # "pending" excludes quarantined-but-incomplete rows on principle.
+            if not r.get('is_audit_excluded'):
+                self.pending += 1
+            return
         # Audit-excluded rows are returned in `data` (so the table can render them with a
         # "excluded — see why" badge) but are kept OUT of all aggregate metrics. This is the
         # whole point of the quarantine flag — public stats reflect only data we trust.
-        completed = [r for r in results if r['is_completed'] and not r.get('is_audit_excluded')]
-        quarantined = [r for r in results if r['is_completed'] and r.get('is_audit_excluded')]
-        correct = [r for r in completed if r['was_correct']]
+        if r.get('is_audit_excluded'):
+            self.quarantined += 1
+            return
+        self.completed += 1
+        market = self.by_market.get(r.get('market_type'))
+        if market is not None:
+            market['total'] += 1
+        if r['was_correct']:
+            self.correct += 1
+            if market is not None:
+                market['correct'] += 1
 
         # 2026-07-29 audit: every PRICE-dependent figure must denominate on
         # pricing-verified rows only. Legacy rows were priced by substring
@@ -578,76 +641,77 @@ def get_recommended_predictions_with_outcomes(request):
         # therefore any P/L, ROI or implied-probability figure derived from
         # them — cannot be verified. Accuracy counts are not price-dependent
         # and remain on `completed`, flagged as provisional in the payload.
-        priced = [
-            r for r in completed
-            if r.get('pricing_integrity_status') == PredictionLog.PRICING_VERIFIED
-        ]
-        total_pl = sum([r['profit_loss_10'] for r in priced if r['profit_loss_10'] is not None])
-        avg_roi = sum([r['roi_percent'] for r in priced if r['roi_percent'] is not None]) / len(priced) if priced else 0
+        if r.get('pricing_integrity_status') != PredictionLog.PRICING_VERIFIED:
+            return
+        self.priced += 1
+        if r['profit_loss_10'] is not None:
+            self.total_pl += r['profit_loss_10']
+        if r['roi_percent'] is not None:
+            self.total_roi += r['roi_percent']
+        if market is not None:
+            market['priced'] += 1
+            if r['profit_loss_10'] is not None:
+                market['profit_loss'] += r['profit_loss_10']
 
-        # Per-Market Accuracy Breakdown (also excludes quarantined rows)
-        market_types = ['1x2', 'btts', 'over_under_2.5', 'double_chance']
-        by_market = {}
-        for market in market_types:
-            market_completed = [r for r in completed if r.get('market_type') == market]
-            market_correct = [r for r in market_completed if r['was_correct']]
-            market_priced = [r for r in priced if r.get('market_type') == market]
-            by_market[market] = {
-                'total': len(market_completed),
-                'correct': len(market_correct),
-                'accuracy': round((len(market_correct) / len(market_completed) * 100), 1) if market_completed else None,
-                # Price-dependent -> verified rows only.
-                'profit_loss': round(sum([r['profit_loss_10'] for r in market_priced if r['profit_loss_10'] is not None]), 2),
-                'priced_sample': len(market_priced),
-            }
-        
         # ============= BASELINE COMPARISON =============
         # "Implied probability baseline": what hit-rate would we expect if the bookmaker
         # priced the predicted outcome perfectly? Always use `r['odds']` (the actual bet-time
         # odds for the predicted outcome — works for any market). Fall back to per-outcome
         # 1X2 columns only for legacy rows where `odds` is null (pre-Stage-A data).
-        # Price-derived: verified rows only.
-        implied_probabilities = []
-        for r in priced:
-            odds = r.get('odds')
-            if not odds:
-                outcome = (r.get('predicted_outcome_raw') or r.get('predicted_outcome', '')).lower()
-                if outcome == 'home':
-                    odds = r.get('odds_home')
-                elif outcome == 'draw':
-                    odds = r.get('odds_draw')
-                elif outcome == 'away':
-                    odds = r.get('odds_away')
-                # For O/U / BTTS / DC legacy rows we don't have bet-time odds at all —
-                # back-calculate from EV + confidence if possible.
-                elif r.get('expected_value') is not None and r.get('confidence'):
-                    conf_dec = r['confidence'] / 100.0 if r['confidence'] > 1 else r['confidence']
-                    ev_dec = r['expected_value'] / 100.0 if abs(r['expected_value']) > 1 else r['expected_value']
-                    if conf_dec > 0:
-                        odds = (ev_dec + 1) / conf_dec
-
-            if odds and odds > 1:
-                # Implied probability = 1 / odds (simplified, ignoring bookmaker margin)
-                implied_probabilities.append(1 / odds)
-        
+        odds = r.get('odds')
+        if not odds:
+            outcome = (r.get('predicted_outcome_raw') or r.get('predicted_outcome', '')).lower()
+            if outcome == 'home':
+                odds = r.get('odds_home')
+            elif outcome == 'draw':
+                odds = r.get('odds_draw')
+            elif outcome == 'away':
+                odds = r.get('odds_away')
+            # For O/U / BTTS / DC legacy rows we don't have bet-time odds at all —
+            # back-calculate from EV + confidence if possible.
+            elif r.get('expected_value') is not None and r.get('confidence'):
+                conf_dec = r['confidence'] / 100.0 if r['confidence'] > 1 else r['confidence']
+                ev_dec = r['expected_value'] / 100.0 if abs(r['expected_value']) > 1 else r['expected_value']
+                if conf_dec > 0:
+                    odds = (ev_dec + 1) / conf_dec
+
+        if odds and odds > 1:
+            # Implied probability = 1 / odds (simplified, ignoring bookmaker margin)
+            self.implied_probabilities += 1
+            self.implied_sum += 1 / odds
+
+    def build(self):
+        completed, correct = self.completed, self.correct
+        total_pl = self.total_pl
+        avg_roi = self.total_roi / self.priced if self.priced else 0
+
+        # Per-Market Accuracy Breakdown (also excludes quarantined rows)
+        by_market = {
+            market: {
+                'total': m['total'],
+                'correct': m['correct'],
+                'accuracy': round((m['correct'] / m['total'] * 100), 1) if m['total'] else None,
+                # Price-dependent -> verified rows only.
+                'profit_loss': round(m['profit_loss'], 2),
+                'priced_sample': m['priced'],
+            }
+            for market, m in self.by_market.items()
+        }
+
         # Calculate baseline
-        if implied_probabilities:
-            avg_implied_prob = sum(implied_probabilities) / len(implied_probabilities)
+        if self.implied_probabilities:
+            avg_implied_prob = self.implied_sum / self.implied_probabilities
             implied_baseline = round(avg_implied_prob * 100, 1)  # As percentage
         else:
             implied_baseline = None
-        
+
         # Calculate edge over baseline
-        actual_accuracy = round((len(correct) / len(completed) * 100), 1) if completed else None
+        actual_accuracy = round((correct / completed * 100), 1) if completed else None
         edge_vs_market = round(actual_accuracy - implied_baseline, 1) if actual_accuracy and implied_baseline else None
-        
+
         # Yield = profit per unit staked. With flat $10 stakes, yield = total_pl / (n * 10) * 100.
         # This is the headline number bettors actually compare services on.
-        yield_percent = round(total_pl / (len(completed) * 10) * 100, 2) if completed else None
-
-        # "pending" excludes quarantined-but-incomplete rows on principle; the
-        # quarantined_count surfaces them separately for transparency.
-        pending_count = sum(1 for r in results if not r['is_completed'] and not r.get('is_audit_excluded'))
+        yield_percent = round(total_pl / (completed * 10) * 100, 2) if completed else None
 
         # ── Public performance: resolved, verified PublishedClaims ONLY ──────
         # Headline figures must never mix the verified public record with
@@ -655,8 +719,8 @@ def get_recommended_predictions_with_outcomes(request):
         # pipeline re-runs, so a stored predicted_outcome cannot be proven
         # identical to the one generated at its timestamp. Legacy data stays
         # below under `legacy_diagnostics`, explicitly labelled.
-        from core.services.accuracy_calculator import AccuracyCalculator
-        _calc = AccuracyCalculator()
+        from core.services.accuracy_calculator import RollupAccuracyCalculator
+        _calc = RollupAccuracyCalculator()
         _public_acc = _calc.get_overall_accuracy()['overall']
         _public_roi = _calc.get_roi_simulation()
         _has_verified = _public_roi['total_bets'] > 0
@@ -672,7 +736,7 @@ def get_recommended_predictions_with_outcomes(request):
             'roi_percent': _public_roi['roi_percent'] if _has_verified else None,
         }
 
-        summary = {
+        return {
             # THE public performance block. Everything else on this endpoint is
             # internal diagnostics.
             'verified_public': verified_public,
@@ -684,18 +748,18 @@ def get_recommended_predictions_with_outcomes(request):
                     'state, cannot be reconstructed to the current verification '
                     'standard. Not public performance.'
                 ),
-                'completed': len(completed),
-                'correct': len(correct),
-                'incorrect': len(completed) - len(correct),
-                'accuracy': round((len(correct) / len(completed) * 100), 1) if completed else None,
+                'completed': completed,
+                'correct': correct,
+                'incorrect': completed - correct,
+                'accuracy': round((correct / completed * 100), 1) if completed else None,
                 'total_profit_loss': round(total_pl, 2) if total_pl else 0,
                 'average_roi': round(avg_roi, 2) if avg_roi else None,
                 'by_market': by_market,
             },
-            'total_recommended': len(results),
-            'completed': len(completed),
-            'pending': pending_count,
-            'quarantined': len(quarantined),
+            'total_recommended': self.total,
+            'completed': completed,
+            'pending': self.pending,
+            'quarantined': self.quarantined,
             'yield_percent': yield_percent,
             # NEW: Baseline comparison metrics
             'implied_baseline': implied_baseline,  # Expected accuracy based on odds
@@ -704,15 +768,162 @@ def get_recommended_predictions_with_outcomes(request):
                 'our_accuracy': actual_accuracy,
                 'market_implied': implied_baseline,
                 'edge': edge_vs_market,
-                'sample_size': len(implied_probabilities),
+                'sample_size': self.implied_probabilities,
                 'explanation': f"Our model achieves {actual_accuracy}% accuracy vs. {implied_baseline}% implied by odds (+{edge_vs_market}% edge)" if edge_vs_market and edge_vs_market > 0 else f"Our model achieves {actual_accuracy}% accuracy vs. {implied_baseline}% implied by odds ({edge_vs_market}% edge)" if edge_vs_market else None
             }
         }
+
+
+def _encode_cursor(row):
+    raw = f"{row['kickoff'].isoformat()}|{row['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def _decode_cursor(cursor):
+    """(kickoff, id) of the last row already returned; ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        kickoff, pk = raw.rsplit('|', 1)
+        kickoff = datetime.fromisoformat(kickoff)
+        return kickoff, int(pk)
+    except (TypeError, ValueError, UnicodeDecodeError) as exc:
+        raise ValueError('invalid cursor') from exc
+
+
+class _RecommendedStream:
+    """The default response body, written row by row.
+
+    Same JSON object as the buffered response — `data`, then `summary`,
+    `count` and `timestamp` — but only one row is ever held at a time.
+    """
+    head = '{"success": true, "data": ['
+
+    def __init__(self):
+        self.encoder = DjangoJSONEncoder()
+        self.summary = _RecommendedSummary()
+
+    def row(self, values):
+        row = _recommended_row(values)
+        self.summary.add(row)
+        return (', ' if self.summary.total > 1 else '') + self.encoder.encode(row)
+
+    def tail(self):
+        return ('], "summary": ' + self.encoder.encode(self.summary.build())
+                + ', "count": %d, "timestamp": %s}' % (
+                    self.summary.total, self.encoder.encode(timezone.now().isoformat())))
+
+
+def _stream_recommended(rows):
+    stream = _RecommendedStream()
+    yield stream.head
+    for values in rows:
+        yield stream.row(values)
+    yield stream.tail()
+
+
+async def _astream_recommended(rows):
+    """_stream_recommended over an async iterator, for the ASGI worker.
+
+    Django's ASGI handler cannot stream a sync iterator: it reads the whole
+    thing into a list first (and warns), which is exactly the memory the
+    stream exists to avoid.
+    """
+    stream = _RecommendedStream()
+    yield stream.head
+    async for values in rows:
+        yield stream.row(values)
+    # The summary reads the verified public record from the database.
+    yield await sync_to_async(stream.tail)()
+
+
+@csrf_exempt
+@require_http_methods(["GET"])
+def get_recommended_predictions_with_outcomes(request):
+    """
+    Get recommended predictions with their actual outcomes for monitoring.
+    
+    GET /api/recommended-predictions/
+    Query params:
+    - limit (optional): Limit number of results (default: 50)
+    - include_pending (optional): Include matches that haven't finished yet (default: true)
+    - stream (optional): `true` writes the same response incrementally, so
+      worker memory stays flat however many predictions there are
+    - page_size / cursor (optional): keyset pages, newest kickoff first. Each
+      page carries `next_cursor` (null on the last page); the summary is
+      returned with the first page only, since it covers every page.
+    """
+    try:
+        include_pending = request.GET.get('include_pending', 'true').lower() == 'true'
+        
+        # Get ALL recommended predictions - no limit!
+        # This ensures complete transparency and no "missing" data.
+        # Exclude archived (SportMonks no longer has the fixture) — these are
+        # permanently un-settle-able and shouldn't appear in user-facing stats.
+        # `id` breaks kickoff ties so cursor pages neither skip nor repeat rows.
+        queryset = PredictionLog.objects.filter(
+            is_recommended=True
+        ).exclude(
+            match_status='archived'
+        ).order_by('-kickoff', '-id')
+        
+        # If not including pending, only show completed matches
+        if not include_pending:
+            queryset = queryset.filter(actual_outcome__isnull=False)
+
+        rows = queryset.values(*_RECOMMENDED_FIELDS)
+
+        if request.GET.get('stream', '').lower() == 'true':
+            if isinstance(request, ASGIRequest):
+                body = _astream_recommended(rows.aiterator(chunk_size=500))
+            else:
+                body = _stream_recommended(rows.iterator(chunk_size=500))
+            return StreamingHttpResponse(body, content_type='application/json')
+
+        cursor = request.GET.get('cursor')
+        if cursor or 'page_size' in request.GET:
+            try:
+                page_size = int(request.GET.get('page_size', RECOMMENDED_PAGE_SIZE))
+            except ValueError:
+                page_size = RECOMMENDED_PAGE_SIZE
+            page_size = max(1, min(page_size, RECOMMENDED_MAX_PAGE_SIZE))
+            page_rows = rows
+            if cursor:
+                try:
+                    kickoff, pk = _decode_cursor(cursor)
+                except ValueError:
+                    return JsonResponse({
+                        'success': False, 'error': 'invalid cursor', 'data': [], 'count': 0,
+                    }, status=400)
+                page_rows = rows.filter(Q(kickoff__lt=kickoff) | Q(kickoff=kickoff, id__lt=pk))
+            page = list(page_rows[:page_size + 1])
+            has_more = len(page) > page_size
+            page = page[:page_size]
+            body = {
+                'success': True,
+                'data': [_recommended_row(p) for p in page],
+                'count': len(page),
+                'next_cursor': _encode_cursor(page[-1]) if has_more else None,
+                'timestamp': timezone.now().isoformat(),
+            }
+            if not cursor:
+                summary = _RecommendedSummary()
+                for values in rows.iterator(chunk_size=500):
+                    summary.add(_recommended_row(values))
+                body['summary'] = summary.build()
+            return JsonResponse(body)
+
+        # Convert to frontend format
+        results = []
+        summary = _RecommendedSummary()
+        for values in rows.iterator(chunk_size=500):
+            row = _recommended_row(values)
+            summary.add(row)
+            results.append(row)
         
         return JsonResponse({
             'success': True,
             'data': results,
-            'summary': summary,
+            'summary': summary.build(),
             'count': len(results),
             'timestamp': timezone.now().isoformat()
         })
@@ -857,7 +1068,7 @@ def log_recommendations(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
-def search_fixtures(request):
+async def search_fixtures(request):
     """
     Search fixtures by team names or league.
 
@@ -866,6 +1077,10 @@ def search_fixtures(request):
     - q: Search query (team name)
     - league (optional): Filter by league ID
     - limit (optional): Limit results (default: 20)
+
+    Answered from the local fixture index (core.services.fixture_search),
+    which the scheduler refreshes every cycle. Async: the cold-start provider
+    sweep is awaited, so under the ASGI worker it never holds a worker.
     """
     try:
         query = request.GET.get('q', '').strip()
@@ -878,89 +1093,37 @@ def search_fixtures(request):
                 'error': 'Search query is required'
             }, status=400)
 
-        api_token = os.getenv('SPORTMONKS_API_TOKEN') or os.getenv('SPORTMONKS_TOKEN')
-        if not api_token:
-            return search_fixtures_from_database(request, query, league_filter, limit)
-
-        print(f"Searching SportMonks for: {query}")
-
-        now = timezone.now()
-        start_date = now.strftime("%Y-%m-%d")
-        end_date = (now + timedelta(days=14)).strftime("%Y-%m-%d")
-        supported_leagues = [8, 9, 24, 27, 72, 82, 181, 208, 244, 271, 301, 384, 387,
-                            390, 444, 453, 462, 486, 501, 564, 567, 570, 573, 591, 600, 609, 1371]
-
-        url = f"https://api.sportmonks.com/v3/football/fixtures/between/{start_date}/{end_date}"
-        params = {
-            'api_token': api_token,
-            'include': 'participants;league;predictions',
-            'filters': f'fixtureLeagues:{",".join(map(str, supported_leagues))}',
-            'per_page': '200'
-        }
-
-        try:
-            response = requests.get(url, params=params, timeout=10)
-            if response.status_code != 200:
-                print(f"SportMonks API error: {response.status_code}")
-                return search_fixtures_from_database(request, query, league_filter, limit)
-
-            data = response.json()
-            fixtures_data = data.get('data', [])
-            matching_fixtures = []
-            query_lower = query.lower()
-
-            for fixture in fixtures_data:
-                participants = fixture.get('participants', [])
-                if len(participants) < 2:
-                    continue
-
-                home_team = next((p for p in participants if p.get('meta', {}).get('location') == 'home'), None)
-                away_team = next((p for p in participants if p.get('meta', {}).get('location') == 'away'), None)
-                if not home_team or not away_team:
-                    continue
-
-                home_name = home_team.get('name', '')
-                away_name = away_team.get('name', '')
-                league_name = fixture.get('league', {}).get('name', 'Unknown')
-                league_id = fixture.get('league', {}).get('id', 0)
-
-                if query_lower in home_name.lower() or query_lower in away_name.lower():
-                    if league_filter and str(league_id) != league_filter:
-                        continue
-
-                    predictions = fixture.get('predictions', [])
-                    has_predictions = len([p for p in predictions if p.get('type_id') in [233, 237, 238]]) > 0
-                    matching_fixtures.append({
-                        'fixture_id': fixture.get('id'),
-                        'home_team': home_name,
-                        'away_team': away_name,
-                        'league': league_name,
-                        'kickoff': fixture.get('starting_at', ''),
-                        'has_predictions': has_predictions,
-                        'has_odds': False
-                    })
-
-            matching_fixtures.sort(key=lambda x: x['kickoff'])
-            matching_fixtures = matching_fixtures[:limit]
-
-            return JsonResponse({
-                'success': True,
-                'results': matching_fixtures,
-                'data': matching_fixtures,
-                'count': len(matching_fixtures),
-                'query': query,
-                'message': f'Found {len(matching_fixtures)} upcoming fixtures'
-            })
-        except requests.exceptions.Timeout:
-            print('SportMonks API timeout - falling back to database search')
-            return search_fixtures_from_database(request, query, league_filter, limit)
-        except Exception as e:
-            # NEVER str(e) here. requests embeds the fully resolved URL in its
-            # exception message, and SportMonks authenticates by query
-            # parameter, so the unredacted text contains the live token. This
-            # exact line printed it to CI stdout on 2026-08-06.
-            print(f"SportMonks API error: {redact_exception(e)}")
-            return search_fixtures_from_database(request, query, league_filter, limit)
+        database_search = sync_to_async(search_fixtures_from_database)
+        if not await sync_to_async(fixture_search.is_warm)():
+            # Cold start: nothing has refreshed the index recently (a fresh
+            # database, or the scheduler is down). One live sweep answers this
+            # search and seeds the index for the next ones.
+            api_token = os.getenv('SPORTMONKS_API_TOKEN') or os.getenv('SPORTMONKS_TOKEN')
+            if not api_token:
+                return await database_search(request, query, league_filter, limit)
+            try:
+                fixtures = await fixture_search.fetch_upcoming_async(api_token)
+                await sync_to_async(fixture_search.refresh)(fixtures)
+            except provider_http.ProviderTimeout:
+                print('SportMonks API timeout - falling back to database search')
+                return await database_search(request, query, league_filter, limit)
+            except Exception as e:
+                # NEVER str(e) here. The HTTP client embeds the fully resolved
+                # URL in its exception message, and SportMonks authenticates by
+                # query parameter, so the unredacted text contains the live
+                # token. This exact line printed it to CI stdout on 2026-08-06.
+                print(f"SportMonks API error: {redact_exception(e)}")
+                return await database_search(request, query, league_filter, limit)
+
+        matching_fixtures = await sync_to_async(fixture_search.search)(query, league_filter, limit)
+        return JsonResponse({
+            'success': True,
+            'results': matching_fixtures,
+            'data': matching_fixtures,
+            'count': len(matching_fixtures),
+            'query': query,
+            'message': f'Found {len(matching_fixtures)} upcoming fixtures'
+        })
 
     except Exception as e:
         # Same hazard, worse blast radius: this one goes into an HTTP response
@@ -1091,13 +1254,83 @@ def _subscriber_payload(data):
     }
 
 
+def _record_subscription(email, payload):
+    """The database side of subscribe_email.
+
+    Returns (response body, subscriber to sync or None, sync action, metadata).
+    """
+    existing = EmailSubscriber.objects.filter(email=email).first()
+    if existing:
+        updated_fields = []
+        for field, value in payload.items():
+            if getattr(existing, field) != value and value not in ('', []):
+                setattr(existing, field, value)
+                updated_fields.append(field)
+
+        if existing.is_active:
+            if updated_fields:
+                existing.save(update_fields=updated_fields)
+            return {
+                'success': True,
+                'message': 'You are already subscribed!',
+                'already_subscribed': True,
+                'subscriber_id': existing.id
+            }, None, None, None
+
+        existing.is_active = True
+        existing.source = payload['source']
+        existing.email_platform_status = 'reactivated'
+        updated_fields.extend(['is_active', 'source', 'email_platform_status'])
+        existing.save(update_fields=sorted(set(updated_fields)))
+
+        _record_marketing_event('email_subscribed', existing, payload['source'], payload['landing_page'], {'reactivated': True})
+        _record_marketing_event('welcome_sequence_started', existing, payload['source'], payload['landing_page'], {'reactivated': True})
+
+        return {
+            'success': True,
+            'message': 'Welcome back! Your subscription has been reactivated.',
+            'reactivated': True,
+            'subscriber_id': existing.id
+        }, existing, 'reactivate', {'reactivated': True}
+
+    subscriber = EmailSubscriber.objects.create(email=email, **payload)
+    _record_marketing_event('email_subscribed', subscriber, payload['source'], payload['landing_page'], {
+        'utm_source': payload['utm_source'],
+        'utm_medium': payload['utm_medium'],
+        'utm_campaign': payload['utm_campaign'],
+        'league_interest': payload['league_interest'],
+    })
+    _record_marketing_event('welcome_sequence_started', subscriber, payload['source'], payload['landing_page'], {
+        'trigger': 'subscription'
+    })
+    print(f"New subscriber: {email} from {payload['source']}")
+
+    return {
+        'success': True,
+        'message': 'Thank you for subscribing! You will receive our best picks weekly.',
+        'subscriber_id': subscriber.id
+    }, subscriber, 'subscribe', {'trigger': 'subscription'}
+
+
+async def _async_sync_subscriber(subscriber, action, metadata=None):
+    try:
+        await async_sync_marketing_profile(subscriber, action, metadata or {})
+    except MarketingSyncError:
+        if subscriber.email_platform_status in ('pending', 'reactivated'):
+            subscriber.email_platform_status = 'sync_failed'
+            await sync_to_async(subscriber.save)(update_fields=['email_platform_status'])
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
-def subscribe_email(request):
+async def subscribe_email(request):
     """
     Email capture endpoint for newsletter/updates.
     POST /api/subscribe/
     Body: { "email": "user@example.com", "source": "homepage" }
+
+    Async: the marketing platform sync is awaited, so a slow provider does not
+    hold a worker under ASGI. The database writes run in Django's sync thread.
     """
     try:
         data = json.loads(request.body)
@@ -1116,60 +1349,10 @@ def subscribe_email(request):
                 'error': 'Please enter a valid email address'
             }, status=400)
 
-        existing = EmailSubscriber.objects.filter(email=email).first()
-        if existing:
-            updated_fields = []
-            for field, value in payload.items():
-                if getattr(existing, field) != value and value not in ('', []):
-                    setattr(existing, field, value)
-                    updated_fields.append(field)
-
-            if existing.is_active:
-                if updated_fields:
-                    existing.save(update_fields=updated_fields)
-                return JsonResponse({
-                    'success': True,
-                    'message': 'You are already subscribed!',
-                    'already_subscribed': True,
-                    'subscriber_id': existing.id
-                })
-
-            existing.is_active = True
-            existing.source = payload['source']
-            existing.email_platform_status = 'reactivated'
-            updated_fields.extend(['is_active', 'source', 'email_platform_status'])
-            existing.save(update_fields=sorted(set(updated_fields)))
-
-            _record_marketing_event('email_subscribed', existing, payload['source'], payload['landing_page'], {'reactivated': True})
-            _record_marketing_event('welcome_sequence_started', existing, payload['source'], payload['landing_page'], {'reactivated': True})
-            _sync_subscriber(existing, 'reactivate', {'reactivated': True})
-
-            return JsonResponse({
-                'success': True,
-                'message': 'Welcome back! Your subscription has been reactivated.',
-                'reactivated': True,
-                'subscriber_id': existing.id
-            })
-
-        subscriber = EmailSubscriber.objects.create(email=email, **payload)
-        _record_marketing_event('email_subscribed', subscriber, payload['source'], payload['landing_page'], {
-            'utm_source': payload['utm_source'],
-            'utm_medium': payload['utm_medium'],
-            'utm_campaign': payload['utm_campaign'],
-            'league_interest': payload['league_interest'],
-        })
-        _record_marketing_event('welcome_sequence_started', subscriber, payload['source'], payload['landing_page'], {
-            'trigger': 'subscription'
-        })
-        _sync_subscriber(subscriber, 'subscribe', {'trigger': 'subscription'})
-
-        print(f"New subscriber: {email} from {payload['source']}")
-
-        return JsonResponse({
-            'success': True,
-            'message': 'Thank you for subscribing! You will receive our best picks weekly.',
-            'subscriber_id': subscriber.id
-        })
+        body, subscriber, action, metadata = await sync_to_async(_record_subscription)(email, payload)
+        if subscriber is not None:
+            await _async_sync_subscriber(subscriber, action, metadata)
+        return JsonResponse(body)
 
     except json.JSONDecodeError:
         return JsonResponse({
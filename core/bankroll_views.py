@@ -9,17 +9,27 @@ from rest_framework import status
 from django.views.decorators.csrf import csrf_exempt
 from django.utils import timezone
 from decimal import Decimal, InvalidOperation
+import math
 from typing import Dict, Any, Optional
 
-from .models import UserBankroll, BankrollTransaction, StakeRecommendation, PredictionLog
+from .models import UserBankroll, BankrollTransaction, BankrollStats, StakeRecommendation, PredictionLog
 from .bankroll_utils import (
     calculate_stake_amount,
     calculate_kelly_criterion,
     check_bankroll_limits,
     get_risk_profile_settings,
+    simulate_bankroll_paths,
     simulate_bet_outcomes
 )
 
+# Upper bounds for /api/bankroll/simulate/ — 100k x 500 stays well under a second.
+MAX_SIMULATION_PATHS = 100000
+MAX_SIMULATION_BETS = 500
+SIMULATION_STRATEGIES = (
+    'fixed_amount', 'fixed_percentage', 'kelly', 'kelly_fractional', 'confidence_scaled',
+)
+RISK_PROFILES = ('conservative', 'balanced', 'aggressive')
+
 
 # ── Permission policy for this module ───────────────────────────────────────
 # Bankroll is deliberately usable WITHOUT an account: every row is keyed by an
@@ -362,6 +372,114 @@ def get_stake_recommendation(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])  # session-scoped; see module note
+def simulate_bankroll(request):
+    """
+    Monte Carlo a season of bets against the caller's bankroll.
+    
+    Required:
+    - bets: list of {win_probability, odds, confidence}, or a single
+      win_probability/odds/confidence plus num_bets to repeat it
+    - session_id: (only for anonymous users)
+    
+    Optional:
+    - strategy: staking strategy to simulate (default: the bankroll's own)
+    - risk_profile: apply a risk profile's strategy, caps and bet filters
+    - num_paths: default 10000, max 100000
+    - ruin_fraction: bankroll share counted as ruin (default 0.2)
+    - seed: for reproducible runs
+    """
+    try:
+        bankroll = get_bankroll_for_request(request, request.data.get('session_id'))
+        if not bankroll:
+            return Response({
+                'error': 'Bankroll not found. Please create a bankroll first.',
+                'exists': False
+            }, status=status.HTTP_404_NOT_FOUND)
+        
+        try:
+            bets = request.data.get('bets')
+            num_bets = len(bets) if bets is not None else int(request.data.get('num_bets', 1))
+        except (TypeError, ValueError):
+            num_bets = None
+        # Checked before anything is built: num_bets comes from an anonymous caller.
+        if num_bets is None or not 1 <= num_bets <= MAX_SIMULATION_BETS:
+            return Response({
+                'error': f'Between 1 and {MAX_SIMULATION_BETS} bets can be simulated'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            if bets is None:
+                bets = [{
+                    'win_probability': request.data.get('win_probability'),
+                    'odds': request.data.get('odds'),
+                    'confidence': request.data.get('confidence', 100),
+                }] * num_bets
+            win_probabilities = [float(b['win_probability']) for b in bets]
+            odds = [float(b['odds']) for b in bets]
+            confidences = [float(b.get('confidence', 100)) for b in bets]
+            num_paths = int(request.data.get('num_paths', 10000))
+            ruin_fraction = float(request.data.get('ruin_fraction', 0.2))
+            seed = request.data.get('seed')
+            seed = int(seed) if seed is not None else None
+        except (TypeError, ValueError, KeyError):
+            return Response({
+                'error': 'bets must be a list of {win_probability, odds, confidence}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        strategy = request.data.get('strategy', bankroll.staking_strategy)
+        risk_profile = request.data.get('risk_profile')
+        if strategy not in SIMULATION_STRATEGIES:
+            return Response({
+                'error': f'strategy must be one of {list(SIMULATION_STRATEGIES)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if risk_profile is not None and risk_profile not in RISK_PROFILES:
+            return Response({
+                'error': f'risk_profile must be one of {list(RISK_PROFILES)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if not 1 <= num_paths <= MAX_SIMULATION_PATHS:
+            return Response({
+                'error': f'num_paths must be between 1 and {MAX_SIMULATION_PATHS}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if not all(map(math.isfinite, [*win_probabilities, *odds, *confidences, ruin_fraction])):
+            return Response({
+                'error': 'win_probability, odds, confidence and ruin_fraction must be finite numbers'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if any(not 0 <= p <= 1 for p in win_probabilities) or any(o <= 1 for o in odds):
+            return Response({
+                'error': 'win_probability must be in [0, 1] and odds above 1.0'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        simulation = simulate_bankroll_paths(
+            initial_bankroll=bankroll.current_bankroll,
+            win_probabilities=win_probabilities,
+            odds=odds,
+            confidences=confidences,
+            strategy=strategy,
+            num_paths=num_paths,
+            fixed_amount=bankroll.fixed_stake_amount,
+            fixed_percentage=bankroll.fixed_stake_percentage,
+            max_stake_percentage=bankroll.max_stake_percentage,
+            risk_profile=risk_profile,
+            ruin_fraction=ruin_fraction,
+            seed=seed
+        )
+        
+        return Response({
+            'success': True,
+            'currency': bankroll.currency,
+            'simulation': simulation,
+            'note': 'Assumes every win_probability is correct; outcomes are only as good as those inputs.'
+        })
+        
+    except Exception as e:
+        return Response({
+            'error': f'Failed to simulate bankroll: {str(e)}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 @csrf_exempt
 @api_view(['POST'])
 @permission_classes([AllowAny])  # session-scoped; see module note
@@ -424,6 +542,7 @@ def record_bet(request):
             recommended_stake=request.data.get('recommended_stake'),
             status='pending'
         )
+        BankrollStats.apply_placement(transaction)
         
         # Deduct stake from bankroll
         bankroll.current_bankroll -= stake_amount
@@ -539,47 +658,30 @@ def get_bankroll_stats(request, session_id):
     try:
         bankroll = UserBankroll.objects.get(session_id=session_id)
         
-        # Get all settled transactions
-        settled_transactions = BankrollTransaction.objects.filter(
-            bankroll=bankroll,
-            status__in=['settled_won', 'settled_lost']
-        )
-        
-        won_bets = settled_transactions.filter(status='settled_won')
-        lost_bets = settled_transactions.filter(status='settled_lost')
+        # Running totals, kept in step by record_bet / settle(); O(1) to read.
+        stats = BankrollStats.for_bankroll(bankroll)
         
-        total_bets = settled_transactions.count()
-        wins = won_bets.count()
-        losses = lost_bets.count()
-        win_rate = (wins / total_bets * 100) if total_bets > 0 else 0
-        
-        # Calculate profitability
-        total_profit = sum(float(t.profit_loss or 0) for t in settled_transactions)
-        avg_profit_per_bet = total_profit / total_bets if total_bets > 0 else 0
+        total_bets = stats.settled_bets
+        win_rate = (Decimal(stats.wins) * 100 / total_bets) if total_bets > 0 else Decimal('0')
+        avg_profit_per_bet = stats.total_profit / total_bets if total_bets > 0 else Decimal('0')
         
         # Bankroll performance
-        bankroll_change = float(bankroll.current_bankroll - bankroll.initial_bankroll)
-        bankroll_change_pct = (bankroll_change / float(bankroll.initial_bankroll)) * 100
-        
-        # Get pending bets
-        pending = BankrollTransaction.objects.filter(
-            bankroll=bankroll,
-            status='pending'
-        )
+        bankroll_change = bankroll.current_bankroll - bankroll.initial_bankroll
+        bankroll_change_pct = bankroll_change * 100 / bankroll.initial_bankroll
         
         return Response({
             'stats': {
                 'total_bets': total_bets,
-                'wins': wins,
-                'losses': losses,
-                'win_rate': round(win_rate, 1),
-                'total_profit': round(total_profit, 2),
-                'avg_profit_per_bet': round(avg_profit_per_bet, 2),
-                'bankroll_change': round(bankroll_change, 2),
-                'bankroll_change_pct': round(bankroll_change_pct, 1),
+                'wins': stats.wins,
+                'losses': stats.losses,
+                'win_rate': float(round(win_rate, 1)),
+                'total_profit': float(stats.total_profit),
+                'avg_profit_per_bet': float(round(avg_profit_per_bet, 2)),
+                'bankroll_change': float(bankroll_change),
+                'bankroll_change_pct': float(round(bankroll_change_pct, 1)),
                 'roi': round(float(bankroll.roi_percent), 1),
-                'pending_bets': pending.count(),
-                'pending_exposure': sum(float(t.stake_amount) for t in pending)
+                'pending_bets': stats.pending_bets,
+                'pending_exposure': float(stats.pending_exposure)
             },
             'bankroll': serialize_bankroll(bankroll)
         })
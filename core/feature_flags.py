@@ -2,17 +2,31 @@
 
 from functools import wraps
 
+from asgiref.sync import iscoroutinefunction
 from django.conf import settings
 from django.http import JsonResponse
 
 
+def _not_found():
+    return JsonResponse({'detail': 'Not found.'}, status=404)
+
+
 def account_features_required(view_func):
     """Make a personal-data endpoint indistinguishable from a missing route."""
 
-    @wraps(view_func)
-    def wrapped(request, *args, **kwargs):
-        if not settings.ACCOUNT_FEATURES_ENABLED:
-            return JsonResponse({'detail': 'Not found.'}, status=404)
-        return view_func(request, *args, **kwargs)
+    # An async view must stay a coroutine function once wrapped, or Django
+    # would run it in a thread under ASGI and hand back an unawaited coroutine.
+    if iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def wrapped(request, *args, **kwargs):
+            if not settings.ACCOUNT_FEATURES_ENABLED:
+                return _not_found()
+            return await view_func(request, *args, **kwargs)
+    else:
+        @wraps(view_func)
+        def wrapped(request, *args, **kwargs):
+            if not settings.ACCOUNT_FEATURES_ENABLED:
+                return _not_found()
+            return view_func(request, *args, **kwargs)
 
     return wrapped
@@ -13,7 +13,8 @@ module therefore states its permission explicitly.
 import hmac
 import os
 
-from django.utils import timezone
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
 from rest_framework.authentication import SessionAuthentication
 from rest_framework.decorators import (
     api_view,
@@ -25,24 +26,82 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from core.services import gem_feed_cache
-from core.services.scheduler_health import get_heartbeat
+from core.services.scheduler_health import (
+    STAGE_HISTORY_RUNS,
+    get_heartbeat,
+    stage_timing_summary,
+)
 from core.services.strategy_lab import build_report
 
 
-def _private_response(body, status=200):
-    response = Response(body, status=status)
+def _private(response, vary='X-Internal-Auth'):
     response['Cache-Control'] = 'private, no-store, max-age=0, must-revalidate'
     response['Pragma'] = 'no-cache'
     response['Expires'] = '0'
-    response['Vary'] = 'X-Internal-Auth'
+    response['Vary'] = vary
     return response
 
 
+def _private_response(body, status=200):
+    return _private(Response(body, status=status))
+
+
+# Stored column per content coding, in order of preference.
+FEED_ENCODINGS = (('br', 'body_br'), ('gzip', 'body_gzip'))
+
+
+def _accepted_codings(header):
+    accepted = set()
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = params.strip()
+        if quality.startswith('q='):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _etag_matches(header, etag):
+    if not header:
+        return False
+    candidates = parse_etags(header)
+    return '*' in candidates or etag in (c.removeprefix('W/') for c in candidates)
+
+
+def _stored_feed_response(request, etag):
+    """Serve the precompressed feed bytes, or 304 if the poller has them."""
+    if _etag_matches(request.headers.get('If-None-Match'), etag):
+        response = HttpResponseNotModified()
+    else:
+        accepted = _accepted_codings(request.headers.get('Accept-Encoding', ''))
+        codings = [(c, col) for c, col in FEED_ENCODINGS
+                   if c in accepted or '*' in accepted]
+        etag, *variants, body = gem_feed_cache.encoded(
+            *(column for _, column in codings), 'body')
+        coding, data = next((
+            (coding, data) for (coding, _), data in zip(codings, variants)
+            if data is not None
+        ), (None, body))
+        response = HttpResponse(bytes(data), content_type='application/json')
+        if coding:
+            response['Content-Encoding'] = coding
+    response['ETag'] = etag
+    return _private(response, vary='X-Internal-Auth, Accept-Encoding')
+
+
 @api_view(['GET'])
 @authentication_classes([])
 @permission_classes([AllowAny])
 def gem_feed_snapshot(request):
-    """Return the worker-produced Gem feed to the frontend server only."""
+    """Return the worker-produced Gem feed to the frontend server only.
+
+    Served from bytes encoded at store() time, with ETag / If-None-Match, so a
+    poll for an unchanged feed is one column lookup and a 304.
+    """
     expected = os.environ.get('INTERNAL_API_SECRET', '')
     provided = request.headers.get('X-Internal-Auth', '')
 
@@ -55,23 +114,13 @@ def gem_feed_snapshot(request):
             {'available': False, 'error': 'unauthorized'}, status=401,
         )
 
-    snapshot = gem_feed_cache.latest()
-    if snapshot is None:
+    etag = gem_feed_cache.current_etag()
+    if etag is None:
         return _private_response({'available': False, 'feed': None})
-
-    age_seconds = max(
-        0,
-        int((timezone.now() - snapshot.generated_at).total_seconds()),
-    )
-    return _private_response({
-        'available': True,
-        'generated_at': snapshot.generated_at,
-        'refreshed_at': snapshot.refreshed_at,
-        'age_seconds': age_seconds,
-        'recommendation_count': snapshot.recommendation_count,
-        'ranking_version': snapshot.ranking_version,
-        'feed': snapshot.payload,
-    })
+    if not etag:
+        # Stored before the encoded columns existed; encode it once here.
+        etag = gem_feed_cache.precompress(gem_feed_cache.latest()).etag
+    return _stored_feed_response(request, etag)
 
 
 @api_view(['GET'])
@@ -85,8 +134,16 @@ def scheduler_health(request):
 
     Reports whether the background worker is alive. Anonymous and non-staff
     users get 401/403 and learn nothing about scheduler state.
+
+    `stage_timings` gives p50/p95 per stage over the last `?cycles=` runs
+    (default and maximum: every cycle still retained).
     """
     hb = get_heartbeat()
+    try:
+        cycles = int(request.query_params.get('cycles', STAGE_HISTORY_RUNS))
+    except (TypeError, ValueError):
+        cycles = STAGE_HISTORY_RUNS
+    cycles = max(1, min(cycles, STAGE_HISTORY_RUNS))
 
     return Response({
         'health': hb.health(),
@@ -105,6 +162,7 @@ def scheduler_health(request):
         'last_failure_code': hb.last_failure_code,
         'run_id': hb.run_id,
         'version': hb.version,
+        'stage_timings': stage_timing_summary(runs=cycles),
     })
 
 
@@ -12,13 +12,129 @@ Usage:
 """
 
 from django.core.management.base import BaseCommand
-from django.db.models import Count, Avg, Q, Sum, StdDev, Min, Max, F
 from core.models import PredictionLog
-from collections import defaultdict
-import json
 import csv
 import os
-from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+# Columns the analyses read. Loaded once, as one frame, with .values_list().
+FRAME_FIELDS = [
+    'predicted_outcome', 'confidence', 'expected_value', 'odds_home',
+    'odds_draw', 'odds_away', 'probability_home', 'probability_draw',
+    'probability_away', 'consensus', 'variance', 'league', 'market_type',
+    'was_correct', 'profit_loss_10', 'home_team_form', 'away_team_form',
+]
+NUMERIC_FIELDS = [
+    'confidence', 'expected_value', 'odds_home', 'odds_draw', 'odds_away',
+    'probability_home', 'probability_draw', 'probability_away', 'consensus',
+    'variance', 'profit_loss_10',
+]
+
+EXPORT_FIELDS = [
+    'fixture_id', 'home_team', 'away_team', 'league', 'kickoff',
+    'predicted_outcome', 'confidence', 'probability_home',
+    'probability_draw', 'probability_away', 'odds_home', 'odds_draw',
+    'odds_away', 'expected_value', 'model_count', 'consensus',
+    'variance', 'market_type', 'home_team_form', 'away_team_form',
+    'actual_outcome', 'actual_score_home', 'actual_score_away',
+    'was_correct', 'profit_loss_10', 'is_recommended',
+]
+
+
+def form_win_pct(form_str):
+    if not form_str:
+        return None
+    results = [r.strip().upper() for r in form_str.split(',') if r.strip()]
+    if not results:
+        return None
+    wins = sum(1 for r in results if r == 'W')
+    return wins / len(results) * 100
+
+
+def load_frame(queryset):
+    """One row per prediction, plus the derived columns every analysis shares.
+
+    conf_pct / ev_pct put confidence and EV on a percent scale whichever way
+    they were stored (a missing EV reads as 0); pred_odds is the 1X2 price of
+    the predicted outcome, NaN when absent; prob_gap is the distance between
+    the two most likely outcomes.
+    """
+    df = pd.DataFrame.from_records(
+        queryset.values_list(*FRAME_FIELDS).iterator(chunk_size=2000),
+        columns=FRAME_FIELDS,
+    )
+    for field in NUMERIC_FIELDS:
+        df[field] = pd.to_numeric(df[field], errors='coerce').astype(float)
+    df['was_correct'] = df['was_correct'].astype(bool)
+
+    conf = df['confidence']
+    df['conf_pct'] = conf.where(conf >= 1, conf * 100)
+    ev = df['expected_value']
+    df['ev_pct'] = ev.where(ev.abs() >= 1, ev * 100).fillna(0)
+
+    outcome = df['predicted_outcome'].fillna('').str.lower()
+    pred_odds = pd.Series(np.nan, index=df.index)
+    for name in ('home', 'draw', 'away'):
+        price = df['odds_' + name]
+        pick = (outcome == name) & price.notna() & (price != 0)
+        pred_odds = pred_odds.mask(pick, price)
+    df['pred_odds'] = pred_odds
+    df['outcome_lower'] = outcome
+
+    probs = df[['probability_home', 'probability_draw', 'probability_away']].to_numpy()
+    probs = np.where(probs <= 1, probs, probs / 100)
+    known = ~np.isnan(probs)
+    with np.errstate(invalid='ignore'):
+        ranked = -np.sort(-np.where(known, probs, -np.inf), axis=1)
+        gap = ranked[:, 0] - ranked[:, 1]
+    df['prob_gap'] = np.where(known.sum(axis=1) >= 2, gap, np.nan)
+    return df
+
+
+def _or_default(series, default):
+    """`value or default`, column-wise."""
+    return series.where(series.notna() & (series != ''), default)
+
+
+def _total(values):
+    """Left-to-right sum of the non-null values.
+
+    Pandas and NumPy reductions sum pairwise, which can move a total by an
+    ulp and tip a printed half-cent the other way; an accumulate adds in
+    row order like the per-row loops this command used to run.
+    """
+    values = values.dropna().to_numpy()
+    return float(np.cumsum(values)[-1]) if len(values) else 0
+
+
+def _mean(values):
+    """Mean of the non-null values, summed like _total(); NaN when none."""
+    count = values.notna().sum()
+    return _total(values) / count if count else np.nan
+
+
+def _tally(df, mask):
+    """(total, correct) for the rows selected by `mask`."""
+    total = int(mask.sum())
+    return total, int((mask & df['was_correct']).sum())
+
+
+def _by_count(df, key, pl=True):
+    """Group on `key` in order of first appearance, largest groups first.
+
+    The stable sort keeps first-appearance order among equal counts, which is
+    the order a dict filled row by row and sorted by count would give.
+    """
+    grouped = df.groupby(key, sort=False, dropna=False)
+    table = pd.DataFrame({
+        'total': grouped.size(),
+        'correct': grouped['was_correct'].sum(),
+    })
+    if pl:
+        table['pl'] = grouped['profit_loss_10'].agg(_total)
+    return table.sort_values('total', ascending=False, kind='stable')
 
 
 class Command(BaseCommand):
@@ -60,84 +176,45 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING(
                 'Filtering to RECOMMENDED predictions only\n'))
 
-        predictions = list(base_qs.order_by('kickoff'))
-        total = len(predictions)
+        base_qs = base_qs.order_by('kickoff')
+        df = load_frame(base_qs)
+        total = len(df)
 
         if total == 0:
             self.stdout.write(self.style.ERROR(
                 'No completed predictions found in the database.'))
             return
 
-        correct = [p for p in predictions if p.was_correct]
-        incorrect = [p for p in predictions if not p.was_correct]
+        n_correct = int(df['was_correct'].sum())
+        n_incorrect = total - n_correct
 
         self.stdout.write('  Total Completed Predictions: %d' % total)
         self.stdout.write(self.style.SUCCESS(
-            '  Correct: %d (%.1f%%)' % (len(correct), len(correct)/total*100)))
+            '  Correct: %d (%.1f%%)' % (n_correct, n_correct/total*100)))
         self.stdout.write(self.style.ERROR(
-            '  Incorrect: %d (%.1f%%)' % (len(incorrect), len(incorrect)/total*100)))
+            '  Incorrect: %d (%.1f%%)' % (n_incorrect, n_incorrect/total*100)))
         self.stdout.write('')
 
         # Run all analyses
-        self._analyze_confidence_calibration(predictions)
-        self._analyze_miss_patterns(correct, incorrect)
-        self._analyze_consensus_variance(predictions)
-        self._analyze_ev_vs_accuracy(predictions)
-        self._analyze_by_league(predictions)
-        self._analyze_by_market_type(predictions)
-        self._analyze_by_odds_range(predictions)
-        self._analyze_by_outcome_type(predictions)
-        self._analyze_probability_gap(predictions)
-        self._analyze_form_correlation(predictions)
+        self._analyze_confidence_calibration(df)
+        self._analyze_miss_patterns(df)
+        self._analyze_consensus_variance(df)
+        self._analyze_ev_vs_accuracy(df)
+        self._analyze_by_league(df)
+        self._analyze_by_market_type(df)
+        self._analyze_by_odds_range(df)
+        self._analyze_by_outcome_type(df)
+        self._analyze_probability_gap(df)
+        self._analyze_form_correlation(df)
 
         if options['backtest']:
-            self._run_threshold_backtest(predictions)
+            self._run_threshold_backtest(df)
 
         if options['export_csv']:
-            self._export_to_csv(predictions)
+            self._export_to_csv(base_qs)
 
         # Final recommendations
-        self._generate_recommendations(predictions, correct, incorrect)
-
-    # ──────────────────────────────────────────────────────────────
-    # HELPER
-    # ──────────────────────────────────────────────────────────────
-    @staticmethod
-    def _conf_pct(p):
-        c = p.confidence
-        return c * 100 if c < 1 else c
-
-    @staticmethod
-    def _ev_pct(p):
-        ev = p.expected_value
-        if ev is None:
-            return 0
-        return ev * 100 if abs(ev) < 1 else ev
-
-    @staticmethod
-    def _predicted_odds(p):
-        outcome = (p.predicted_outcome or '').lower()
-        if outcome == 'home' and p.odds_home:
-            return p.odds_home
-        elif outcome == 'draw' and p.odds_draw:
-            return p.odds_draw
-        elif outcome == 'away' and p.odds_away:
-            return p.odds_away
-        return None
-
-    @staticmethod
-    def _prob_gap(p):
-        probs = []
-        if p.probability_home is not None:
-            probs.append(p.probability_home if p.probability_home <= 1 else p.probability_home / 100)
-        if p.probability_draw is not None:
-            probs.append(p.probability_draw if p.probability_draw <= 1 else p.probability_draw / 100)
-        if p.probability_away is not None:
-            probs.append(p.probability_away if p.probability_away <= 1 else p.probability_away / 100)
-        if len(probs) < 2:
-            return None
-        sorted_probs = sorted(probs, reverse=True)
-        return sorted_probs[0] - sorted_probs[1]
+        self._generate_recommendations(df)
 
     def _print_table_header(self, columns):
         """Print a formatted table header. columns is list of (label, width, align)."""
@@ -154,7 +231,7 @@ class Command(BaseCommand):
     # ──────────────────────────────────────────────────────────────
     # 1. CONFIDENCE CALIBRATION
     # ──────────────────────────────────────────────────────────────
-    def _analyze_confidence_calibration(self, predictions):
+    def _analyze_confidence_calibration(self, df):
         self.stdout.write(self.style.SUCCESS('-' * 90))
         self.stdout.write(self.style.SUCCESS(
             '  1. CONFIDENCE CALIBRATION'))
@@ -180,13 +257,10 @@ class Command(BaseCommand):
         ])
 
         for low, high, label in bands:
-            bucket = [p for p in predictions
-                      if low <= self._conf_pct(p) < high]
-            if not bucket:
+            total, correct = _tally(df, df['conf_pct'].between(low, high, inclusive='left'))
+            if not total:
                 continue
 
-            total = len(bucket)
-            correct = sum(1 for p in bucket if p.was_correct)
             accuracy = correct / total * 100
             expected = (low + high) / 2
             gap = accuracy - expected
@@ -214,7 +288,7 @@ class Command(BaseCommand):
     # ──────────────────────────────────────────────────────────────
     # 2. MISS PATTERN ANALYSIS
     # ──────────────────────────────────────────────────────────────
-    def _analyze_miss_patterns(self, correct, incorrect):
+    def _analyze_miss_patterns(self, df):
         self.stdout.write(self.style.SUCCESS('-' * 90))
         self.stdout.write(self.style.SUCCESS(
             '  2. MISS PATTERN ANALYSIS'))
@@ -222,16 +296,18 @@ class Command(BaseCommand):
             '  What do our INCORRECT predictions have in common?'))
         self.stdout.write(self.style.SUCCESS('-' * 90))
 
-        if not incorrect:
+        correct = df[df['was_correct']]
+        incorrect = df[~df['was_correct']]
+        if incorrect.empty:
             self.stdout.write('  No incorrect predictions found!\n')
             return
 
         # Avg confidence of correct vs incorrect
-        avg_conf_c = sum(self._conf_pct(p) for p in correct) / len(correct) if correct else 0
-        avg_conf_i = sum(self._conf_pct(p) for p in incorrect) / len(incorrect)
+        avg_conf_c = _mean(correct['conf_pct']) if len(correct) else 0
+        avg_conf_i = _mean(incorrect['conf_pct'])
 
-        avg_ev_c = sum(self._ev_pct(p) for p in correct) / len(correct) if correct else 0
-        avg_ev_i = sum(self._ev_pct(p) for p in incorrect) / len(incorrect)
+        avg_ev_c = _mean(correct['ev_pct']) if len(correct) else 0
+        avg_ev_i = _mean(incorrect['ev_pct'])
 
         self._print_table_header([
             ('Metric', 30, 'l'), ('Correct', 15, 'r'),
@@ -245,26 +321,20 @@ class Command(BaseCommand):
             '  %-30s %14.1f%% %14.1f%% %+11.1f%%' % (
                 'Avg Expected Value', avg_ev_c, avg_ev_i, avg_ev_c - avg_ev_i))
 
-        # Avg odds
-        correct_odds = [self._predicted_odds(p) for p in correct if self._predicted_odds(p)]
-        incorrect_odds = [self._predicted_odds(p) for p in incorrect if self._predicted_odds(p)]
-
-        avg_odds_c = sum(correct_odds) / len(correct_odds) if correct_odds else 0
-        avg_odds_i = sum(incorrect_odds) / len(incorrect_odds) if incorrect_odds else 0
+        # Avg odds (mean() skips predictions without a price; 0 when none have one)
+        avg_odds_c = _mean(correct['pred_odds'])
+        avg_odds_i = _mean(incorrect['pred_odds'])
+        avg_odds_c = 0 if np.isnan(avg_odds_c) else avg_odds_c
+        avg_odds_i = 0 if np.isnan(avg_odds_i) else avg_odds_i
 
         self.stdout.write(
             '  %-30s %15.2f %15.2f %+12.2f' % (
                 'Avg Predicted Odds', avg_odds_c, avg_odds_i, avg_odds_c - avg_odds_i))
 
         # Consensus / Variance
-        correct_cons = [p.consensus for p in correct if p.consensus is not None]
-        incorrect_cons = [p.consensus for p in incorrect if p.consensus is not None]
-        correct_var = [p.variance for p in correct if p.variance is not None]
-        incorrect_var = [p.variance for p in incorrect if p.variance is not None]
-
-        if correct_cons and incorrect_cons:
-            avg_cons_c = sum(correct_cons) / len(correct_cons)
-            avg_cons_i = sum(incorrect_cons) / len(incorrect_cons)
+        if correct['consensus'].notna().any() and incorrect['consensus'].notna().any():
+            avg_cons_c = _mean(correct['consensus'])
+            avg_cons_i = _mean(incorrect['consensus'])
             if avg_cons_c < 1:
                 avg_cons_c *= 100
             if avg_cons_i < 1:
@@ -273,38 +343,28 @@ class Command(BaseCommand):
                 '  %-30s %14.1f%% %14.1f%% %+11.1f%%' % (
                     'Avg Consensus', avg_cons_c, avg_cons_i, avg_cons_c - avg_cons_i))
 
-        if correct_var and incorrect_var:
-            avg_var_c = sum(correct_var) / len(correct_var)
-            avg_var_i = sum(incorrect_var) / len(incorrect_var)
+        if correct['variance'].notna().any() and incorrect['variance'].notna().any():
+            avg_var_c = _mean(correct['variance'])
+            avg_var_i = _mean(incorrect['variance'])
             self.stdout.write(
                 '  %-30s %15.3f %15.3f %+12.3f' % (
                     'Avg Variance', avg_var_c, avg_var_i, avg_var_c - avg_var_i))
 
         # Breakdown of misses by outcome type
         self.stdout.write('\n  Misses by Predicted Outcome:')
-        miss_outcomes = defaultdict(int)
-        for p in incorrect:
-            miss_outcomes[p.predicted_outcome or 'Unknown'] += 1
-        for outcome, count in sorted(miss_outcomes.items(),
-                                      key=lambda x: x[1], reverse=True):
+        miss_outcomes = _by_count(
+            incorrect, _or_default(incorrect['predicted_outcome'], 'Unknown'), pl=False)
+        for outcome, count in miss_outcomes['total'].items():
             pct = count / len(incorrect) * 100
             self.stdout.write('    [X] %s: %d (%.1f%% of misses)' % (outcome, count, pct))
 
         # Breakdown by league
         self.stdout.write('\n  Misses by League:')
-        miss_leagues = defaultdict(int)
-        total_by_league = defaultdict(int)
-        correct_by_league = defaultdict(int)
-        for p in correct + incorrect:
-            total_by_league[p.league] += 1
-        for p in correct:
-            correct_by_league[p.league] += 1
-        for p in incorrect:
-            miss_leagues[p.league] += 1
-        for league, count in sorted(miss_leagues.items(),
-                                     key=lambda x: x[1], reverse=True):
-            total_in_league = total_by_league[league]
-            acc = correct_by_league[league] / total_in_league * 100 if total_in_league > 0 else 0
+        by_league = _by_count(df, 'league', pl=False)
+        miss_leagues = _by_count(incorrect, 'league', pl=False)
+        for league, count in miss_leagues['total'].items():
+            total_in_league = by_league.at[league, 'total']
+            acc = by_league.at[league, 'correct'] / total_in_league * 100 if total_in_league > 0 else 0
             self.stdout.write(
                 '    [X] %s: %d misses / %d total (league accuracy: %.1f%%)' % (
                     league, count, total_in_league, acc))
@@ -314,7 +374,7 @@ class Command(BaseCommand):
     # ──────────────────────────────────────────────────────────────
     # 3. CONSENSUS / VARIANCE CORRELATION
     # ──────────────────────────────────────────────────────────────
-    def _analyze_consensus_variance(self, predictions):
+    def _analyze_consensus_variance(self, df):
         self.stdout.write(self.style.SUCCESS('-' * 90))
         self.stdout.write(self.style.SUCCESS(
             '  3. MODEL CONSENSUS & VARIANCE ANALYSIS'))
@@ -322,9 +382,8 @@ class Command(BaseCommand):
             '  Does higher model agreement = higher accuracy?'))
         self.stdout.write(self.style.SUCCESS('-' * 90))
 
-        with_var = [p for p in predictions if p.variance is not None]
-
-        if not with_var:
+        variance = df['variance']
+        if variance.isna().all():
             self.stdout.write('  No variance data available.\n')
             return
 
@@ -342,12 +401,10 @@ class Command(BaseCommand):
         ])
 
         for low, high, label in var_bands:
-            bucket = [p for p in with_var if low <= p.variance < high]
-            if not bucket:
+            total, correct = _tally(df, variance.between(low, high, inclusive='left'))
+            if not total:
                 continue
 
-            total = len(bucket)
-            correct = sum(1 for p in bucket if p.was_correct)
             accuracy = correct / total * 100
 
             if accuracy >= 75:
@@ -362,8 +419,8 @@ class Command(BaseCommand):
                     label, total, correct, accuracy, signal))
 
         # Consensus analysis
-        with_cons = [p for p in predictions if p.consensus is not None]
-        if with_cons:
+        consensus = df['consensus']
+        if consensus.notna().any():
             self.stdout.write('\n  Consensus Bands:')
             cons_bands = [
                 (0.0, 0.60, 'Low (<60%)'),
@@ -373,14 +430,13 @@ class Command(BaseCommand):
             ]
 
             for low, high, label in cons_bands:
-                bucket = [p for p in with_cons
-                          if (low <= p.consensus < high) or
-                          (low * 100 <= p.consensus < high * 100)]
-                if not bucket:
+                # Consensus is stored either as a fraction or a percentage.
+                total, correct = _tally(df, (
+                    consensus.between(low, high, inclusive='left')
+                    | consensus.between(low * 100, high * 100, inclusive='left')))
+                if not total:
                     continue
 
-                total = len(bucket)
-                correct = sum(1 for p in bucket if p.was_correct)
                 accuracy = correct / total * 100
 
                 self.stdout.write(
@@ -391,7 +447,7 @@ class Command(BaseCommand):
     # ──────────────────────────────────────────────────────────────
     # 4. EV vs ACCURACY
     # ──────────────────────────────────────────────────────────────
-    def _analyze_ev_vs_accuracy(self, predictions):
+    def _analyze_ev_vs_accuracy(self, df):
         self.stdout.write(self.style.SUCCESS('-' * 90))
         self.stdout.write(self.style.SUCCESS(
             '  4. EXPECTED VALUE vs ACCURACY'))
@@ -399,10 +455,8 @@ class Command(BaseCommand):
             '  Do high-EV predictions actually hit more often?'))
         self.stdout.write(self.style.SUCCESS('-' * 90))
 
-        with_ev = [(p, self._ev_pct(p)) for p in predictions
-                   if p.expected_value is not None]
-
-        if not with_ev:
+        has_ev = df['expected_value'].notna()
+        if not has_ev.any():
             self.stdout.write('  No EV data available.\n')
             return
 
@@ -422,16 +476,15 @@ class Command(BaseCommand):
         ])
 
         for low, high, label in ev_bands:
-            bucket = [(p, ev) for p, ev in with_ev if low <= ev < high]
-            if not bucket:
+            in_band = has_ev & df['ev_pct'].between(low, high, inclusive='left')
+            total, correct = _tally(df, in_band)
+            if not total:
                 continue
 
-            total = len(bucket)
-            correct = sum(1 for p, _ in bucket if p.was_correct)
             accuracy = correct / total * 100
 
-            pls = [p.profit_loss_10 for p, _ in bucket if p.profit_loss_10 is not None]
-            avg_pl = sum(pls) / len(pls) if pls else 0
+            avg_pl = _mean(df.loc[in_band, 'profit_loss_10'])
+            avg_pl = 0 if np.isnan(avg_pl) else avg_pl
 
             if accuracy >= 70:
                 signal = '[STRONG]'
@@ -449,7 +502,7 @@ class Command(BaseCommand):
     # ──────────────────────────────────────────────────────────────
     # 5. LEAGUE PERFORMANCE
     # ──────────────────────────────────────────────────────────────
-    def _analyze_by_league(self, predictions):
+    def _analyze_by_league(self, df):
         self.stdout.write(self.style.SUCCESS('-' * 90))
         self.stdout.write(self.style.SUCCESS(
             '  5. LEAGUE PERFORMANCE ANALYSIS'))
@@ -457,24 +510,14 @@ class Command(BaseCommand):
             '  Which leagues are we best/worst at predicting?'))
         self.stdout.write(self.style.SUCCESS('-' * 90))
 
-        leagues = defaultdict(lambda: {'total': 0, 'correct': 0, 'pl': 0})
-
-        for p in predictions:
-            league = p.league or 'Unknown'
-            leagues[league]['total'] += 1
-            if p.was_correct:
-                leagues[league]['correct'] += 1
-            if p.profit_loss_10 is not None:
-                leagues[league]['pl'] += p.profit_loss_10
+        leagues = _by_count(df, _or_default(df['league'], 'Unknown'))
 
         self._print_table_header([
             ('League', 35, 'l'), ('Total', 6, 'r'), ('Correct', 8, 'r'),
             ('Accuracy', 10, 'r'), ('P/L ($10)', 10, 'r'), ('Signal', 15, 'l')
         ])
 
-        for league, data in sorted(leagues.items(),
-                                    key=lambda x: x[1]['total'],
-                                    reverse=True):
+        for league, data in leagues.iterrows():
             accuracy = data['correct'] / data['total'] * 100 if data['total'] > 0 else 0
 
             if accuracy >= 75:
@@ -496,7 +539,7 @@ class Command(BaseCommand):
     # ──────────────────────────────────────────────────────────────
     # 6. MARKET TYPE ANALYSIS
     # ──────────────────────────────────────────────────────────────
-    def _analyze_by_market_type(self, predictions):
+    def _analyze_by_market_type(self, df):
         self.stdout.write(self.style.SUCCESS('-' * 90))
         self.stdout.write(self.style.SUCCESS(
             '  6. MARKET TYPE ANALYSIS'))
@@ -504,24 +547,14 @@ class Command(BaseCommand):
             '  Which market types are most accurate?'))
         self.stdout.write(self.style.SUCCESS('-' * 90))
 
-        markets = defaultdict(lambda: {'total': 0, 'correct': 0, 'pl': 0})
-
-        for p in predictions:
-            market = p.market_type or '1x2'
-            markets[market]['total'] += 1
-            if p.was_correct:
-                markets[market]['correct'] += 1
-            if p.profit_loss_10 is not None:
-                markets[market]['pl'] += p.profit_loss_10
+        markets = _by_count(df, _or_default(df['market_type'], '1x2'))
 
         self._print_table_header([
             ('Market Type', 25, 'l'), ('Total', 6, 'r'),
             ('Correct', 8, 'r'), ('Accuracy', 10, 'r'), ('P/L ($10)', 10, 'r')
         ])
 
-        for market, data in sorted(markets.items(),
-                                    key=lambda x: x[1]['total'],
-                                    reverse=True):
+        for market, data in markets.iterrows():
             accuracy = data['correct'] / data['total'] * 100 if data['total'] > 0 else 0
             self.stdout.write(
                 '  %-25s %6d %8d %9.1f%% $%+8.2f' % (
@@ -532,7 +565,7 @@ class Command(BaseCommand):
     # ──────────────────────────────────────────────────────────────
     # 7. ODDS RANGE ANALYSIS
     # ──────────────────────────────────────────────────────────────
-    def _analyze_by_odds_range(self, predictions):
+    def _analyze_by_odds_range(self, df):
         self.stdout.write(self.style.SUCCESS('-' * 90))
         self.stdout.write(self.style.SUCCESS(
             '  7. ODDS RANGE ANALYSIS'))
@@ -557,19 +590,16 @@ class Command(BaseCommand):
         ])
 
         for low, high, label in odds_bands:
-            bucket = [p for p in predictions
-                      if self._predicted_odds(p) is not None
-                      and low <= self._predicted_odds(p) < high]
-            if not bucket:
+            in_band = df['pred_odds'].between(low, high, inclusive='left')
+            total, correct = _tally(df, in_band)
+            if not total:
                 continue
 
-            total = len(bucket)
-            correct = sum(1 for p in bucket if p.was_correct)
             accuracy = correct / total * 100
 
-            pls = [p.profit_loss_10 for p in bucket if p.profit_loss_10 is not None]
-            avg_pl = sum(pls) / len(pls) if pls else 0
-            total_pl = sum(pls) if pls else 0
+            pls = df.loc[in_band, 'profit_loss_10']
+            avg_pl = _mean(pls) if pls.notna().any() else 0
+            total_pl = _total(pls)
             roi = (total_pl / (total * 10) * 100) if total > 0 else 0
 
             self.stdout.write(
@@ -581,7 +611,7 @@ class Command(BaseCommand):
     # ──────────────────────────────────────────────────────────────
     # 8. OUTCOME TYPE ANALYSIS
     # ──────────────────────────────────────────────────────────────
-    def _analyze_by_outcome_type(self, predictions):
+    def _analyze_by_outcome_type(self, df):
         self.stdout.write(self.style.SUCCESS('-' * 90))
         self.stdout.write(self.style.SUCCESS(
             '  8. PREDICTED OUTCOME TYPE ANALYSIS'))
@@ -589,18 +619,9 @@ class Command(BaseCommand):
             '  Home vs Draw vs Away prediction performance'))
         self.stdout.write(self.style.SUCCESS('-' * 90))
 
-        outcomes = defaultdict(lambda: {'total': 0, 'correct': 0, 'pl': 0,
-                                         'confidences': []})
-
-        for p in predictions:
-            outcome = p.predicted_outcome or 'Unknown'
-            outcomes[outcome]['total'] += 1
-            conf = p.confidence * 100 if p.confidence < 1 else p.confidence
-            outcomes[outcome]['confidences'].append(conf)
-            if p.was_correct:
-                outcomes[outcome]['correct'] += 1
-            if p.profit_loss_10 is not None:
-                outcomes[outcome]['pl'] += p.profit_loss_10
+        key = _or_default(df['predicted_outcome'], 'Unknown')
+        outcomes = _by_count(df, key)
+        outcomes['avg_conf'] = df.groupby(key, sort=False)['conf_pct'].agg(_mean)
 
         self._print_table_header([
             ('Outcome', 15, 'l'), ('Total', 6, 'r'),
@@ -608,23 +629,20 @@ class Command(BaseCommand):
             ('Avg Conf', 10, 'r'), ('P/L ($10)', 10, 'r')
         ])
 
-        for outcome, data in sorted(outcomes.items(),
-                                     key=lambda x: x[1]['total'],
-                                     reverse=True):
+        for outcome, data in outcomes.iterrows():
             accuracy = data['correct'] / data['total'] * 100 if data['total'] > 0 else 0
-            avg_conf = sum(data['confidences']) / len(data['confidences']) if data['confidences'] else 0
 
             self.stdout.write(
                 '  %-15s %6d %8d %9.1f%% %9.1f%% $%+8.2f' % (
                     outcome, data['total'], data['correct'], accuracy,
-                    avg_conf, data['pl']))
+                    data['avg_conf'], data['pl']))
 
         self.stdout.write('')
 
     # ──────────────────────────────────────────────────────────────
     # 9. PROBABILITY GAP ANALYSIS
     # ──────────────────────────────────────────────────────────────
-    def _analyze_probability_gap(self, predictions):
+    def _analyze_probability_gap(self, df):
         self.stdout.write(self.style.SUCCESS('-' * 90))
         self.stdout.write(self.style.SUCCESS(
             '  9. PROBABILITY GAP ANALYSIS'))
@@ -647,14 +665,10 @@ class Command(BaseCommand):
         ])
 
         for low, high, label in gap_bands:
-            bucket = [p for p in predictions
-                      if self._prob_gap(p) is not None
-                      and low <= self._prob_gap(p) < high]
-            if not bucket:
+            total, correct = _tally(df, df['prob_gap'].between(low, high, inclusive='left'))
+            if not total:
                 continue
 
-            total = len(bucket)
-            correct = sum(1 for p in bucket if p.was_correct)
             accuracy = correct / total * 100
 
             if accuracy >= 75:
@@ -673,7 +687,7 @@ class Command(BaseCommand):
     # ──────────────────────────────────────────────────────────────
     # 10. TEAM FORM CORRELATION
     # ──────────────────────────────────────────────────────────────
-    def _analyze_form_correlation(self, predictions):
+    def _analyze_form_correlation(self, df):
         self.stdout.write(self.style.SUCCESS('-' * 90))
         self.stdout.write(self.style.SUCCESS(
             '  10. TEAM FORM CORRELATION'))
@@ -681,35 +695,19 @@ class Command(BaseCommand):
             '  Does recent form data correlate with correct predictions?'))
         self.stdout.write(self.style.SUCCESS('-' * 90))
 
-        def form_win_pct(form_str):
-            if not form_str:
-                return None
-            results = [r.strip().upper() for r in form_str.split(',') if r.strip()]
-            if not results:
-                return None
-            wins = sum(1 for r in results if r == 'W')
-            return wins / len(results) * 100
-
-        with_form = [p for p in predictions
-                     if p.home_team_form or p.away_team_form]
-
-        if not with_form:
+        home_form = df['home_team_form'].fillna('')
+        away_form = df['away_team_form'].fillna('')
+        if not ((home_form != '') | (away_form != '')).any():
             self.stdout.write('  No team form data available.\n')
             return
 
-        predicted_team_forms = []
-        for p in with_form:
-            outcome = (p.predicted_outcome or '').lower()
-            if outcome == 'home':
-                form = form_win_pct(p.home_team_form)
-            elif outcome == 'away':
-                form = form_win_pct(p.away_team_form)
-            else:
-                continue
-            if form is not None:
-                predicted_team_forms.append((p, form))
+        # Form of the team we backed; draws have no backed team.
+        outcome = df['outcome_lower']
+        form = pd.Series(np.nan, index=df.index)
+        form = form.mask(outcome == 'home', home_form.map(form_win_pct).astype(float))
+        form = form.mask(outcome == 'away', away_form.map(form_win_pct).astype(float))
 
-        if not predicted_team_forms:
+        if form.isna().all():
             self.stdout.write('  Insufficient form data for analysis.\n')
             return
 
@@ -727,13 +725,10 @@ class Command(BaseCommand):
         ])
 
         for low, high, label in form_bands:
-            bucket = [(p, f) for p, f in predicted_team_forms
-                      if low <= f < high]
-            if not bucket:
+            total, correct = _tally(df, form.between(low, high, inclusive='left'))
+            if not total:
                 continue
 
-            total = len(bucket)
-            correct = sum(1 for p, _ in bucket if p.was_correct)
             accuracy = correct / total * 100
 
             self.stdout.write(
@@ -744,7 +739,7 @@ class Command(BaseCommand):
     # ──────────────────────────────────────────────────────────────
     # THRESHOLD BACKTESTING
     # ──────────────────────────────────────────────────────────────
-    def _run_threshold_backtest(self, predictions):
+    def _run_threshold_backtest(self, df):
         self.stdout.write(self.style.SUCCESS('-' * 90))
         self.stdout.write(self.style.SUCCESS(
             '  THRESHOLD BACKTESTING'))
@@ -767,6 +762,12 @@ class Command(BaseCommand):
             'Max Odds <= %.1f' % (current_conf, current_ev, current_max_odds))
         self.stdout.write('')
 
+        won = df['was_correct'].to_numpy()
+        conf = df['conf_pct'].to_numpy()
+        ev = df['ev_pct'].to_numpy()
+        odds = df['pred_odds'].fillna(2.0).to_numpy()
+        gap = df['prob_gap'].fillna(0).to_numpy()
+
         # ── Part A: Confidence x EV Grid ──
         self.stdout.write('  Confidence x EV Grid (accuracy%% / count):')
         self.stdout.write('')
@@ -777,21 +778,26 @@ class Command(BaseCommand):
         self.stdout.write(header)
         self.stdout.write('  ' + '-' * (12 + len(ev_thresholds) * 12))
 
+        # Every (confidence, EV) cell at once: a conf x ev x prediction mask.
+        grid = (
+            (conf >= np.array(confidence_thresholds)[:, None, None])
+            & (ev >= np.array(ev_thresholds)[None, :, None])
+        )
+        grid_totals = grid.sum(axis=2)
+        grid_correct = (grid & won).sum(axis=2)
+
         best_accuracy = 0
         best_params = {}
         min_sample = 10
 
-        for conf_th in confidence_thresholds:
+        for i, conf_th in enumerate(confidence_thresholds):
             row = '  C>=%d%%      ' % conf_th
             if conf_th >= 100:
                 row = '  C>=%d%%     ' % conf_th
-            for ev_th in ev_thresholds:
-                filtered = [p for p in predictions
-                            if self._conf_pct(p) >= conf_th
-                            and self._ev_pct(p) >= ev_th]
-                total = len(filtered)
+            for j, ev_th in enumerate(ev_thresholds):
+                total = int(grid_totals[i, j])
                 if total >= min_sample:
-                    correct = sum(1 for p in filtered if p.was_correct)
+                    correct = int(grid_correct[i, j])
                     acc = correct / total * 100
                     cell = '%.0f%%/%d' % (acc, total)
 
@@ -822,22 +828,16 @@ class Command(BaseCommand):
             ('Correct', 8, 'r'), ('Accuracy', 10, 'r'), ('Change', 10, 'r')
         ])
 
-        current_filtered = [p for p in predictions
-                            if self._conf_pct(p) >= current_conf
-                            and self._ev_pct(p) >= current_ev
-                            and (self._predicted_odds(p) or 2.0) <= current_max_odds]
-        current_total = len(current_filtered)
-        current_correct = sum(1 for p in current_filtered if p.was_correct)
+        # A prediction without a price counts as even money (2.0).
+        current = (conf >= current_conf) & (ev >= current_ev)
+        current_total = int((current & (odds <= current_max_odds)).sum())
+        current_correct = int((current & (odds <= current_max_odds) & won).sum())
         current_acc = current_correct / current_total * 100 if current_total > 0 else 0
 
-        for max_odds in max_odds_options:
-            filtered = [p for p in predictions
-                        if self._conf_pct(p) >= current_conf
-                        and self._ev_pct(p) >= current_ev
-                        and (self._predicted_odds(p) or 2.0) <= max_odds]
-            total = len(filtered)
+        capped = current & (odds <= np.array(max_odds_options)[:, None])
+        for max_odds, total, correct in zip(
+                max_odds_options, capped.sum(axis=1), (capped & won).sum(axis=1)):
             if total > 0:
-                correct = sum(1 for p in filtered if p.was_correct)
                 acc = correct / total * 100
                 change = acc - current_acc
 
@@ -853,12 +853,11 @@ class Command(BaseCommand):
             ('Correct', 8, 'r'), ('Accuracy', 10, 'r')
         ])
 
-        for min_gap in [0.0, 0.05, 0.10, 0.15, 0.20, 0.25]:
-            filtered = [p for p in predictions
-                        if (self._prob_gap(p) or 0) >= min_gap]
-            total = len(filtered)
+        min_gaps = [0.0, 0.05, 0.10, 0.15, 0.20, 0.25]
+        wide = gap >= np.array(min_gaps)[:, None]
+        for min_gap, total, correct in zip(
+                min_gaps, wide.sum(axis=1), (wide & won).sum(axis=1)):
             if total > 0:
-                correct = sum(1 for p in filtered if p.was_correct)
                 acc = correct / total * 100
                 self.stdout.write(
                     '  >= %-11.0f%% %6d %8d %9.1f%%' % (
@@ -869,23 +868,22 @@ class Command(BaseCommand):
     # ──────────────────────────────────────────────────────────────
     # RECOMMENDATIONS
     # ──────────────────────────────────────────────────────────────
-    def _generate_recommendations(self, predictions, correct, incorrect):
+    def _generate_recommendations(self, df):
         self.stdout.write(self.style.SUCCESS('-' * 90))
         self.stdout.write(self.style.SUCCESS(
             '  ACTIONABLE RECOMMENDATIONS'))
         self.stdout.write(self.style.SUCCESS('-' * 90))
 
-        total = len(predictions)
-        overall_acc = len(correct) / total * 100 if total > 0 else 0
+        total = len(df)
+        overall_acc = df['was_correct'].sum() / total * 100 if total > 0 else 0
+        incorrect = df[~df['was_correct']]
 
         recommendations = []
 
         # Check draw performance
-        draw_preds = [p for p in predictions
-                      if (p.predicted_outcome or '').lower() == 'draw']
-        if draw_preds:
-            draw_correct = sum(1 for p in draw_preds if p.was_correct)
-            draw_acc = draw_correct / len(draw_preds) * 100
+        draw_total, draw_correct = _tally(df, df['outcome_lower'] == 'draw')
+        if draw_total:
+            draw_acc = draw_correct / draw_total * 100
             if draw_acc < overall_acc - 10:
                 recommendations.append(
                     'Draw predictions accuracy (%.1f%%) is significantly below '
@@ -894,43 +892,38 @@ class Command(BaseCommand):
                         draw_acc, overall_acc))
 
         # Check low confidence misses
-        low_conf_misses = [p for p in incorrect if self._conf_pct(p) < 60]
-        if low_conf_misses and len(low_conf_misses) > len(incorrect) * 0.3:
+        low_conf_misses = int((incorrect['conf_pct'] < 60).sum())
+        if low_conf_misses and low_conf_misses > len(incorrect) * 0.3:
             recommendations.append(
                 '%d of %d misses (%.0f%%) had confidence < 60%%. '
                 'Consider raising the confidence floor.' % (
-                    len(low_conf_misses), len(incorrect),
-                    len(low_conf_misses) / len(incorrect) * 100))
+                    low_conf_misses, len(incorrect),
+                    low_conf_misses / len(incorrect) * 100))
 
         # Check high-odds misses
-        high_odds_misses = [p for p in incorrect
-                            if self._predicted_odds(p) and self._predicted_odds(p) > 3.0]
-        if high_odds_misses and len(high_odds_misses) > len(incorrect) * 0.2:
+        high_odds_misses = int((incorrect['pred_odds'] > 3.0).sum())
+        if high_odds_misses and high_odds_misses > len(incorrect) * 0.2:
             recommendations.append(
                 '%d misses had odds > 3.0. '
-                'Consider lowering max_odds to reduce variance.' % len(high_odds_misses))
-
-        # Check league-specific issues
-        league_stats = defaultdict(lambda: {'total': 0, 'correct': 0})
-        for p in predictions:
-            league_stats[p.league]['total'] += 1
-            if p.was_correct:
-                league_stats[p.league]['correct'] += 1
-
-        for league, stats in league_stats.items():
-            if stats['total'] >= 5:
-                league_acc = stats['correct'] / stats['total'] * 100
+                'Consider lowering max_odds to reduce variance.' % high_odds_misses)
+
+        # Check league-specific issues (in order of first appearance)
+        league_stats = df.groupby('league', sort=False, dropna=False)['was_correct'].agg(
+            ['size', 'sum'])
+        for league, stats in league_stats.iterrows():
+            if stats['size'] >= 5:
+                league_acc = stats['sum'] / stats['size'] * 100
                 if league_acc < 50:
                     recommendations.append(
                         '%s accuracy is only %.1f%% (%d/%d). '
                         'Consider excluding or requiring higher thresholds '
                         'for this league.' % (
-                            league, league_acc, stats['correct'], stats['total']))
+                            league, league_acc, stats['sum'], stats['size']))
 
         # Check EV vs accuracy alignment
-        high_ev = [p for p in predictions if self._ev_pct(p) >= 25]
-        if high_ev:
-            high_ev_acc = sum(1 for p in high_ev if p.was_correct) / len(high_ev) * 100
+        high_ev_total, high_ev_correct = _tally(df, df['ev_pct'] >= 25)
+        if high_ev_total:
+            high_ev_acc = high_ev_correct / high_ev_total * 100
             if high_ev_acc < overall_acc:
                 recommendations.append(
                     'High-EV (>=25%%) predictions accuracy (%.1f%%) is below '
@@ -939,27 +932,25 @@ class Command(BaseCommand):
                         high_ev_acc, overall_acc))
 
         # Check if "Value Bet" track is underperforming
-        value_bets = [p for p in predictions
-                      if self._conf_pct(p) < 60 and self._ev_pct(p) >= 10]
-        if value_bets and len(value_bets) >= 3:
-            vb_acc = sum(1 for p in value_bets if p.was_correct) / len(value_bets) * 100
+        vb_total, vb_correct = _tally(df, (df['conf_pct'] < 60) & (df['ev_pct'] >= 10))
+        if vb_total >= 3:
+            vb_acc = vb_correct / vb_total * 100
             if vb_acc < 50:
                 recommendations.append(
                     'Value Bet track (conf<60%%, EV>=10%%) accuracy is only '
                     '%.1f%% (%d bets). This track may be hurting overall '
                     'accuracy. Consider requiring higher EV or disabling.' % (
-                        vb_acc, len(value_bets)))
+                        vb_acc, vb_total))
 
         # Check variance-based filtering potential
-        high_var = [p for p in predictions
-                    if p.variance is not None and p.variance > 10]
-        if high_var and len(high_var) >= 3:
-            hv_acc = sum(1 for p in high_var if p.was_correct) / len(high_var) * 100
+        hv_total, hv_correct = _tally(df, df['variance'] > 10)
+        if hv_total >= 3:
+            hv_acc = hv_correct / hv_total * 100
             if hv_acc < overall_acc - 15:
                 recommendations.append(
                     'High-variance predictions (var>10) accuracy is %.1f%% '
                     '(%d preds). Adding a max_variance filter could improve '
-                    'accuracy.' % (hv_acc, len(high_var)))
+                    'accuracy.' % (hv_acc, hv_total))
 
         # Print recommendations
         if recommendations:
@@ -982,32 +973,18 @@ class Command(BaseCommand):
     # ──────────────────────────────────────────────────────────────
     # CSV EXPORT
     # ──────────────────────────────────────────────────────────────
-    def _export_to_csv(self, predictions):
+    def _export_to_csv(self, queryset):
         filepath = os.path.join(os.path.dirname(os.path.dirname(
             os.path.dirname(os.path.dirname(__file__)))),
             'analysis_export.csv')
 
-        fields = [
-            'fixture_id', 'home_team', 'away_team', 'league', 'kickoff',
-            'predicted_outcome', 'confidence', 'probability_home',
-            'probability_draw', 'probability_away', 'odds_home', 'odds_draw',
-            'odds_away', 'expected_value', 'model_count', 'consensus',
-            'variance', 'market_type', 'home_team_form', 'away_team_form',
-            'actual_outcome', 'actual_score_home', 'actual_score_away',
-            'was_correct', 'profit_loss_10', 'is_recommended',
-        ]
-
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
-            for p in predictions:
-                row = {}
-                for field in fields:
-                    val = getattr(p, field, None)
-                    if hasattr(val, 'isoformat'):
-                        val = val.isoformat()
-                    row[field] = val
-                writer.writerow(row)
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_FIELDS)
+            for values in queryset.values_list(*EXPORT_FIELDS).iterator(chunk_size=2000):
+                writer.writerow(
+                    val.isoformat() if hasattr(val, 'isoformat') else val
+                    for val in values)
 
         self.stdout.write(self.style.SUCCESS(
             '\n  Data exported to: %s\n' % filepath))
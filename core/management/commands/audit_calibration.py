@@ -35,6 +35,7 @@ from collections import Counter, defaultdict
 from django.core.management.base import BaseCommand
 
 from core.models import PredictionLog
+from core.services import bootstrap
 
 BUCKETS = [(0.0, 0.5), (0.5, 0.55), (0.55, 0.6), (0.6, 0.65), (0.65, 0.7),
            (0.7, 0.8), (0.8, 1.01)]
@@ -86,6 +87,16 @@ def discrimination(pairs):
     return (wins + 0.5 * ties) / (len(pos) * len(neg))
 
 
+def brier_ci_text(fixture_ids, pairs):
+    """Fixture-clustered 95% bootstrap interval on Brier, for output."""
+    if len(set(fixture_ids)) < 2:
+        return '(CI n/a)'
+    interval = bootstrap.bootstrap_ci(
+        [(p - y) ** 2 for p, y in pairs], clusters=fixture_ids,
+    )
+    return f'95% CI [{interval.lo:.5f}, {interval.hi:.5f}]'
+
+
 # ── calibrators (fit on earlier rows only) ───────────────────────────────────
 def fit_platt(pairs, iters=2000, lr=0.05):
     """Logistic calibration on the logit of the raw score."""
@@ -231,7 +242,8 @@ class Command(BaseCommand):
             pairs = [(r['score'], r['y']) for r in mrows]
             base = sum(y for _, y in pairs) / len(pairs)
             out(f'base rate (observed hit rate): {base:.4f}')
-            out(f'raw Brier   : {brier(pairs):.5f}')
+            out(f'raw Brier   : {brier(pairs):.5f}   '
+                f'{brier_ci_text([r["fixture_id"] for r in mrows], pairs)}')
             out(f'raw log loss: {log_loss(pairs):.5f}')
             auc = discrimination(pairs)
             out(f'raw AUC     : {"n/a" if auc is None else f"{auc:.4f}"}')
@@ -287,6 +299,13 @@ class Command(BaseCommand):
             pl = [(platt(p), y) for p, y in te]
             out(f'  Platt     test Brier {brier(pl):.5f}  log loss {log_loss(pl):.5f}  '
                 f'ECE {reliability(pl)[1]:.4f}   (a={a:.3f} b={b:.3f})')
+            # Paired per-row difference: negative means Platt improved Brier.
+            delta = bootstrap.bootstrap_ci(
+                [(q - y) ** 2 - (p - y) ** 2 for (q, y), (p, _) in zip(pl, te)],
+                clusters=[r['fixture_id'] for r in test],
+            )
+            out(f'  Platt - raw test Brier {delta.point:+.5f}  '
+                f'95% CI [{delta.lo:+.5f}, {delta.hi:+.5f}] (fixture-clustered)')
 
             iso, knots = fit_isotonic(tr)
             it = [(iso(p), y) for p, y in te]
@@ -23,7 +23,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from core.models import FixtureResultObservation, SignalObservation
-from core.services import market_outcomes, result_evidence
+from core.services import bootstrap, market_grading, market_outcomes, result_evidence
 
 HORIZONS = [(72, 12), (24, 6), (6, 2), (1, 0.5)]
 
@@ -37,20 +37,32 @@ def fixture_clustered_resample(units, rng_seed=0):
 
     `units` maps fixture_id -> list of that fixture's decisions. A draw takes a
     whole fixture with all its markets, preserving their dependence.
-    """
-    import random
 
-    rng = random.Random(rng_seed)
+    One materialised draw, for inspection. Intervals themselves come from
+    `bootstrap.bootstrap_ci(..., clusters=fixture_ids)`, which applies the same
+    rule to every resample at once.
+    """
     fixtures = list(units)
     if not fixtures:
         return []
-    drawn = [fixtures[rng.randrange(len(fixtures))] for _ in range(len(fixtures))]
+    drawn = bootstrap.index_matrix(len(fixtures), 1, seed=rng_seed)[0]
     out = []
-    for fixture_id in drawn:
-        out.extend(units[fixture_id])
+    for i in drawn:
+        out.extend(units[fixtures[i]])
     return out
 
 
+def clustered_ci_text(keys, losses):
+    """Fixture-clustered 95% interval on a mean loss, formatted for output.
+
+    `keys` are the (fixture_id, market, horizon) units the losses belong to.
+    """
+    if len({k[0] for k in keys}) < 2:
+        return 'CI n/a'
+    interval = bootstrap.bootstrap_ci(losses, clusters=[k[0] for k in keys])
+    return f'95% CI [{interval.lo:.5f}, {interval.hi:.5f}]'
+
+
 def brier_binary(pairs):
     return sum((p - y) ** 2 for p, y in pairs) / len(pairs) if pairs else None
 
@@ -146,6 +158,7 @@ class Command(BaseCommand):
         obs = list(
             SignalObservation.objects
             .filter(hours_to_kickoff__gte=0)   # strictly pre-kickoff only
+            .select_related('vector')
             .order_by('fixture_id', 'market', 'outcome', '-hours_to_kickoff')
         )
         out(f'raw pre-kickoff observations: {len(obs)}')
@@ -296,7 +309,7 @@ class Command(BaseCommand):
                 'scoreable final result WITH genuine Variant B. Variants A-D '
                 'are wired but cannot be compared until fixtures settle.')
             out('Once they do, this command reports matched Brier and log-loss '
-                'differences with a fixture-clustered interval.')
+                'with a fixture-clustered interval.')
             return
         if matched_fixtures <= 5:
             out('')
@@ -314,15 +327,15 @@ class Command(BaseCommand):
         for market, items in sorted(by_market.items()):
             out('')
             out(f'--- {market} (n={len(items)}) ---')
-            result_of = {k[0]: scoreable[k[0]] for k, _ in items}
-
-            def truth_for(fixture_id):
-                r = result_of[fixture_id]
-                return market_outcomes.outcome_vector(market, r.home_score, r.away_score)
+            results = [scoreable[key[0]] for key, _ in items]
+            truths = market_grading.outcome_vectors(
+                [market] * len(items),
+                [r.home_score for r in results],
+                [r.away_score for r in results],
+            )
 
             variants = {'A_raw': {}, 'B_heuristic': {}, 'D_devig': {}}
-            for key, outcome_map in items:
-                truth = truth_for(key[0])
+            for (key, outcome_map), truth in zip(items, truths):
                 a = {o: obs_row.normalized_probability
                      for o, obs_row in outcome_map.items()}
                 variants['A_raw'].setdefault(key, (a, truth))
@@ -340,13 +353,16 @@ class Command(BaseCommand):
                     variants['D_devig'].setdefault(key, (d, truth))
 
             for name, rows in variants.items():
+                keys = list(rows)
                 values = list(rows.values())
                 if not values:
                     out(f'  {name:12s} no coverage')
                     continue
                 if market == '1x2':
+                    losses = [brier_multiclass([v]) for v in values]
                     out(f'  {name:12s} n={len(values):4d}  '
-                        f'multiclass Brier {brier_multiclass(values):.5f}  '
+                        f'multiclass Brier {brier_multiclass(values):.5f} '
+                        f'({clustered_ci_text(keys, losses)})  '
                         f'log loss {log_loss_multiclass(values):.5f}  '
                         f'RPS {rps(values, ["home", "draw", "away"]):.5f}')
                 elif market == 'double_chance':
@@ -360,11 +376,13 @@ class Command(BaseCommand):
                     out('               (legs are deterministically dependent — '
                         'exactly two win every match; not independent trials)')
                 else:
-                    pos = list(truth_for(items[0][0][0]).keys())[0]
+                    pos = list(truths[0].keys())[0]
                     pairs = [(p.get(pos, 0.0), t.get(pos, 0)) for p, t in values]
                     a_auc = auc(pairs)
+                    losses = [(p - y) ** 2 for p, y in pairs]
                     out(f'  {name:12s} n={len(values):4d}  '
-                        f'Brier {brier_binary(pairs):.5f}  '
+                        f'Brier {brier_binary(pairs):.5f} '
+                        f'({clustered_ci_text(keys, losses)})  '
                         f'log loss {log_loss_binary(pairs):.5f}  '
                         f'AUC {"n/a" if a_auc is None else f"{a_auc:.4f}"}')
 
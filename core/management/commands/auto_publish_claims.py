@@ -35,6 +35,7 @@ from datetime import timedelta
 from types import SimpleNamespace
 
 from django.core.management.base import BaseCommand
+from django.db.models import F, OuterRef, Subquery
 from django.utils import timezone
 
 from core.models import PredictionLog, PredictionSnapshot, PublishedClaim
@@ -64,59 +65,71 @@ class Command(BaseCommand):
         lead_cutoff = now + timedelta(hours=options['min_lead_hours'])
 
         # Cheap DB pre-filter only — the authoritative gate stays inside
-        # publish_prediction_claim. Ordering gives newest-snapshot-first per
-        # fixture, which the seen-set below turns into "latest per fixture"
-        # without a Postgres-only DISTINCT ON.
-        candidates = (
-            PredictionSnapshot.objects
-            .filter(
-                is_recommended=True,
-                is_audit_excluded=False,
-                pricing_integrity_status=PredictionLog.PRICING_VERIFIED,
-                kickoff__gte=lead_cutoff,
-            )
-            .order_by('fixture_id', '-prediction_generated_at')
+        # publish_prediction_claim.
+        candidates = PredictionSnapshot.objects.filter(
+            is_recommended=True,
+            is_audit_excluded=False,
+            pricing_integrity_status=PredictionLog.PRICING_VERIFIED,
+            kickoff__gte=lead_cutoff,
         )
 
-        committed_fixtures = set(
+        # Criterion 3: one non-superseded commitment per fixture. Committed
+        # fixtures are excluded in SQL; only their number is reported.
+        committed = (
             PublishedClaim.objects
             .filter(superseded_by__isnull=True)
+            .values('fixture_id')
+        )
+        already_committed = (
+            candidates.filter(fixture_id__in=committed)
+            .values('fixture_id').distinct().count()
+        )
+        open_candidates = candidates.exclude(fixture_id__in=committed)
+
+        # Criterion 4: only the fixture's newest snapshot OVERALL may be
+        # committed — measured against ALL of its snapshots, not just the
+        # pre-filtered candidates. If the newest signal state failed the
+        # pre-filter (e.g. its price could not be verified), committing an
+        # older snapshot would publish a state we know has been replaced;
+        # the fixture waits for the next cycle instead. One correlated
+        # subquery on the (fixture_id, -prediction_generated_at) index, so the
+        # cost tracks open fixtures, not accumulated hourly snapshots.
+        newest_generated = (
+            PredictionSnapshot.objects
+            .filter(fixture_id=OuterRef('fixture_id'))
+            .order_by('-prediction_generated_at')
+            .values('prediction_generated_at')[:1]
+        )
+        latest = (
+            open_candidates
+            .annotate(newest_generated_at=Subquery(newest_generated))
+            .filter(prediction_generated_at=F('newest_generated_at'))
+            .order_by('fixture_id', '-prediction_generated_at')
+        )
+        waiting = (
+            open_candidates
+            .exclude(fixture_id__in=latest.values('fixture_id'))
             .values_list('fixture_id', flat=True)
+            .distinct()
         )
 
         published = 0
-        already_committed = 0
         ineligible = 0
         seen_fixtures = set()
 
-        for snap in candidates:
+        for fixture_id in waiting:
+            ineligible += 1
+            logger.info(
+                'auto-publish skipping fixture %s: a newer snapshot exists '
+                'but is not currently publishable', fixture_id)
+
+        for snap in latest:
+            # Two snapshots sharing the newest timestamp: the first one the
+            # ordering yields is the candidate, as before.
             if snap.fixture_id in seen_fixtures:
                 continue
             seen_fixtures.add(snap.fixture_id)
 
-            # Criterion 3: one non-superseded commitment per fixture.
-            if snap.fixture_id in committed_fixtures:
-                already_committed += 1
-                continue
-
-            # Criterion 4: only the fixture's newest snapshot OVERALL may be
-            # committed — measured against ALL of its snapshots, not just the
-            # pre-filtered candidates. If the newest signal state failed the
-            # pre-filter (e.g. its price could not be verified), committing an
-            # older snapshot would publish a state we know has been replaced;
-            # the fixture waits for the next cycle instead.
-            newer_exists = PredictionSnapshot.objects.filter(
-                fixture_id=snap.fixture_id,
-                prediction_generated_at__gt=snap.prediction_generated_at,
-            ).exists()
-            if newer_exists:
-                ineligible += 1
-                logger.info(
-                    'auto-publish skipping snapshot %s (fixture %s): a newer '
-                    'snapshot exists but is not currently publishable',
-                    snap.snapshot_id, snap.fixture_id)
-                continue
-
             problems = claim_publication.check_snapshot_publication_eligibility(
                 snap, now=now)
             if problems:
@@ -149,7 +162,6 @@ class Command(BaseCommand):
                 continue
 
             published += 1
-            committed_fixtures.add(snap.fixture_id)
             self.stdout.write(self.style.SUCCESS(
                 f'  committed {claim.claim_id} — {claim.home_team} v '
                 f'{claim.away_team} {claim.market_type}/{claim.predicted_outcome}'
@@ -10,19 +10,32 @@ Examples:
     python manage.py backtest --include-excluded   # don't filter out audit_excluded rows
     python manage.py backtest --json               # machine-readable output
 
+Parameter sweeps (Cartesian product over FilterConfig fields, on top of the
+first --config or current_prod):
+    python manage.py backtest --grid min_ev=0.05,0.08,0.10 --grid max_odds=2.0,2.5,none
+    python manage.py backtest --grid safe_min_confidence=0.55,0.60,0.65 --workers 4 --top 10
+
 Read-only — does not touch the DB.
 """
 
 from __future__ import annotations
 
 import json
+import math
 from datetime import datetime, date
 
 from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 
 from core.models import PredictionLog
-from core.services import backtester
+from core.services import backtest_engine, backtester
+
+# FilterConfig fields --grid can sweep from the command line: the numeric
+# thresholds. List and dict fields are swept through backtest_engine.grid().
+GRID_FIELDS = sorted(
+    name for name, f in backtester.FilterConfig.__dataclass_fields__.items()
+    if f.type == 'Optional[float]'
+)
 
 
 class Command(BaseCommand):
@@ -54,6 +67,25 @@ class Command(BaseCommand):
             action='store_true',
             help='Include rows without a result yet. Off by default — backtest needs outcomes.',
         )
+        parser.add_argument(
+            '--grid',
+            action='append',
+            metavar='FIELD=V1,V2,...',
+            help='Sweep a numeric FilterConfig field over values (repeatable; '
+                 '"none" = unset). Runs the Cartesian product of every --grid axis.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Processes to split a --grid sweep across (0 = one per CPU).',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=20,
+            help='With --grid, show only the N best configs by yield.',
+        )
         parser.add_argument(
             '--json',
             action='store_true',
@@ -61,13 +93,23 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        rows = self._load_rows(options)
+        if options.get('grid') and options.get('stratify'):
+            raise CommandError('--stratify reports one config and cannot be combined with --grid')
+        if options.get('grid'):
+            self._run_grid(options)
+            return
+
+        rows = list(self._queryset(options))
         if not rows:
             raise CommandError('No rows match the filters.')
 
         configs = self._resolve_configs(options.get('configs'))
 
-        results = backtester.compare(rows, configs)
+        universe = backtest_engine.Universe.from_rows(rows)
+        results = []
+        for cfg in configs:
+            m, kept_idx = backtest_engine.evaluate(universe, cfg)
+            results.append((cfg, m, [rows[i] for i in kept_idx]))
 
         if options['json']:
             self._emit_json(rows, configs, results, options.get('stratify'))
@@ -81,7 +123,7 @@ class Command(BaseCommand):
 
     # ── helpers ──────────────────────────────────────────────────────────
 
-    def _load_rows(self, options):
+    def _queryset(self, options):
         qs = PredictionLog.objects.filter(is_recommended=True)
         if not options['include_excluded']:
             qs = qs.filter(is_audit_excluded=False)
@@ -93,7 +135,69 @@ class Command(BaseCommand):
             except ValueError:
                 raise CommandError(f"--since must be YYYY-MM-DD, got {options['since']!r}")
             qs = qs.filter(kickoff__date__gte=d)
-        return list(qs)
+        return qs
+
+    def _parse_grid(self, specs):
+        axes = {}
+        for spec in specs:
+            field, sep, raw = spec.partition('=')
+            field = field.strip()
+            if not sep or not raw:
+                raise CommandError(f'--grid expects FIELD=V1,V2,..., got {spec!r}')
+            if field not in GRID_FIELDS:
+                raise CommandError(
+                    f'--grid sweeps numeric FilterConfig fields only, got {field!r}. '
+                    f'Available: {GRID_FIELDS}')
+            try:
+                axes[field] = [
+                    None if v.strip().lower() == 'none' else float(v)
+                    for v in raw.split(',')
+                ]
+            except ValueError:
+                raise CommandError(f'--grid values must be numbers or "none", got {raw!r}')
+        return axes
+
+    def _run_grid(self, options):
+        axes = self._parse_grid(options['grid'])
+        base = self._resolve_configs(options.get('configs'))[0]
+        try:
+            configs = backtest_engine.grid(base, **axes)
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        # Columnar load — no PredictionLog instances for a sweep.
+        universe = backtest_engine.Universe.from_queryset(self._queryset(options))
+        if not len(universe):
+            raise CommandError('No rows match the filters.')
+
+        swept = backtest_engine.sweep(universe, configs, workers=options['workers'])
+        # Baseline first so the delta annotation reads against it.
+        baseline = backtest_engine.sweep(universe, [base])[0]
+        ranked = sorted(
+            swept,
+            key=lambda cm: -(cm[1].yield_percent if cm[1].yield_percent is not None else -math.inf),
+        )[:max(options['top'], 0)]
+        results = [(cfg, m, None) for cfg, m in [baseline, *ranked]]
+
+        if options['json']:
+            self._emit_json(None, [cfg for cfg, _, _ in results], results, None,
+                            sample_size=len(universe))
+            return
+
+        self.stdout.write('=' * 88)
+        self.stdout.write(self.style.MIGRATE_HEADING('BACKTEST GRID'))
+        self.stdout.write('=' * 88)
+        # --include-pending loads unsettled rows too; say how many are settled.
+        self.stdout.write(
+            f'Sample size:      {len(universe)} rows, '
+            f'{int(universe.settled.sum())} settled')
+        self.stdout.write(
+            f'Configs swept:    {len(configs)} '
+            f'({" x ".join(f"{k}:{len(v)}" for k, v in axes.items())}), '
+            f'showing top {len(ranked)} by yield'
+        )
+        self.stdout.write('')
+        self._print_comparison(results, name_width=48)
 
     def _resolve_configs(self, names):
         if not names:
@@ -128,10 +232,10 @@ class Command(BaseCommand):
             self.stdout.write(f'Flags:            {", ".join(flags)}')
         self.stdout.write('')
 
-    def _print_comparison(self, results):
+    def _print_comparison(self, results, name_width=22):
         # Header
         headers = ('config', 'n_kept', 'acc%', 'P/L $', 'yield%', 'avg_roi%', 'brier', 'maxDD', 'winS', 'lossS')
-        widths  = ( 22,        7,        7,      9,      8,        9,         7,       8,       5,      5)
+        widths  = (name_width, 7,       7,      9,      8,        9,         7,       8,       5,      5)
         line = '  '.join(f'{h:>{w}}' for h, w in zip(headers, widths))
         self.stdout.write(line)
         self.stdout.write('  '.join('-' * w for w in widths))
@@ -192,7 +296,7 @@ class Command(BaseCommand):
             )
             self.stdout.write('  '.join(f'{v:>{w}}' for v, w in zip(row_vals, widths)))
 
-    def _emit_json(self, rows, configs, results, stratify_dim):
+    def _emit_json(self, rows, configs, results, stratify_dim, sample_size=None):
         def cfg_dict(c):
             return {
                 k: v for k, v in c.__dict__.items()
@@ -215,8 +319,9 @@ class Command(BaseCommand):
                 'max_drawdown': m.max_drawdown,
             }
 
+        rows = rows or []
         out = {
-            'sample_size': len(rows),
+            'sample_size': len(rows) if sample_size is None else sample_size,
             'kickoff_min': min((r.kickoff for r in rows if r.kickoff), default=None),
             'kickoff_max': max((r.kickoff for r in rows if r.kickoff), default=None),
             'configs': [
@@ -38,7 +38,7 @@ class Command(BaseCommand):
                 SignalObservation.objects.filter(
                     market=experiment.market,
                     created_at__lt=experiment.created_at,
-                ).iterator(),
+                ).select_related('vector').iterator(),
                 phase=StrategyLabObservation.PHASE_RETROSPECTIVE,
                 ingestion_run_id='strategy-lab-retrospective-v2',
             )
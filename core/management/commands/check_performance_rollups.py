@@ -0,0 +1,53 @@
+"""Reconcile the performance rollups against a full recompute. Scheduler stage 9.
+
+settle_published_claim keeps PerformanceRollup current one result at a time,
+but it cannot see eligibility that changes after settlement (a tampered or
+quarantined claim, a correction). This rebuilds the figures from
+public_universe.verified_claims(), reports every row that differs and, with
+--repair, rewrites the table to match.
+
+    python manage.py check_performance_rollups
+    python manage.py check_performance_rollups --repair
+
+Run with --repair once after deploying the rollup table, to backfill it from
+the claims settled before it existed. The scheduler passes --if-due so the
+full recompute runs once a day, not every cycle.
+"""
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+
+from core.services import performance_rollup
+
+DUE_KEY = 'performance_rollup:last_check'
+CHECK_INTERVAL_SECONDS = 23 * 60 * 60
+
+
+class Command(BaseCommand):
+    help = 'Compare the performance rollups with a full recompute of the public record.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repair', action='store_true',
+                            help='Rewrite the rollups from the recompute when they differ.')
+        parser.add_argument('--if-due', action='store_true',
+                            help='Skip unless a day has passed since the last check.')
+
+    def handle(self, *args, **options):
+        # cache.add is atomic on the shared cache, so concurrent workers agree
+        # on which one runs today's check.
+        if options['if_due'] and not cache.add(DUE_KEY, True, timeout=CHECK_INTERVAL_SECONDS):
+            self.stdout.write('performance rollups: checked within the last day, skipping')
+            return
+
+        summary = performance_rollup.check(repair=options['repair'])
+        for difference in summary['differences'][:20]:
+            self.stdout.write(
+                f"  {difference['key']}: stored={difference['stored']} "
+                f"expected={difference['expected']}")
+        if summary['mismatched']:
+            state = 'repaired' if summary['repaired'] else 'NOT repaired'
+            self.stdout.write(self.style.WARNING(
+                f"performance rollups: {summary['mismatched']} of {summary['rows']} "
+                f"rows differed ({state})"))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"performance rollups: {summary['rows']} rows match the recompute"))
@@ -13,7 +13,7 @@ historical point-in-time odds, so those prices cannot be reconstructed. They
 are preserved but permanently excluded from public pricing statistics.
 
     python manage.py classify_pricing_integrity --dry-run
-    python manage.py classify_pricing_integrity
+    python manage.py classify_pricing_integrity --workers 4
 """
 from collections import Counter
 
@@ -21,7 +21,7 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 
 from core.models import PredictionLog
-from core.services import public_universe
+from core.services import bulk_rows, public_universe
 
 
 class Command(BaseCommand):
@@ -33,6 +33,18 @@ class Command(BaseCommand):
             action='store_true',
             help='Report what would change without writing.',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Classify this many id ranges in parallel (ignored on SQLite).',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=bulk_rows.DEFAULT_CHUNK_SIZE,
+            help='Rows read, classified and written per transaction.',
+        )
 
     def handle(self, *args, **options):
         dry = options['dry_run']
@@ -41,37 +53,46 @@ class Command(BaseCommand):
             'is_audit_excluded', 'pricing_integrity_status',
         )
 
-        before = Counter()
-        after = Counter()
-        changed = []
-
-        for pred in rows.iterator(chunk_size=500):
-            current = pred.pricing_integrity_status
-            target = public_universe.classify_row(pred)
-            before[current] += 1
-            after[target] += 1
-            if current != target:
-                pred.pricing_integrity_status = target
-                changed.append(pred)
+        def classify_chunk(chunk):
+            stats = Counter()
+            changed = []
+            for pred in chunk:
+                current = pred.pricing_integrity_status
+                target = public_universe.classify_row(pred)
+                stats[('before', current)] += 1
+                stats[('after', target)] += 1
+                if current != target:
+                    pred.pricing_integrity_status = target
+                    changed.append(pred)
+            stats['changed'] += len(changed)
+            if not dry and changed:
+                with transaction.atomic():
+                    PredictionLog.objects.bulk_update(
+                        changed, ['pricing_integrity_status'],
+                    )
+            return stats
+
+        stats, seconds = bulk_rows.process_in_chunks(
+            rows, classify_chunk,
+            chunk_size=max(1, options['chunk_size']),
+            workers=max(1, options['workers']),
+        )
+        before = Counter({k[1]: v for k, v in stats.items() if k[0] == 'before'})
+        after = Counter({k[1]: v for k, v in stats.items() if k[0] == 'after'})
+        changed = stats['changed']
 
         self.stdout.write(
             f'Cutoff: {public_universe.PRICING_INTEGRITY_CUTOFF.isoformat()}'
         )
-        self.stdout.write(f'Scanned {sum(before.values())} rows\n')
+        self.stdout.write(f'Scanned {bulk_rows.throughput(sum(before.values()), seconds)}\n')
 
         self.stdout.write('Resulting distribution:')
         for status, _label in PredictionLog.PRICING_INTEGRITY_CHOICES:
             self.stdout.write(f'  {status:24s} {after.get(status, 0):6d}')
 
         verified = after.get(PredictionLog.PRICING_VERIFIED, 0)
-        self.stdout.write(f'\n{len(changed)} rows would change' if dry
-                          else f'\n{len(changed)} rows changed')
-
-        if not dry and changed:
-            with transaction.atomic():
-                PredictionLog.objects.bulk_update(
-                    changed, ['pricing_integrity_status'], batch_size=500
-                )
+        self.stdout.write(f'\n{changed} rows would change' if dry
+                          else f'\n{changed} rows changed')
 
         if verified == 0:
             self.stdout.write(self.style.WARNING(
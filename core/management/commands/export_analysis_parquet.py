@@ -0,0 +1,42 @@
+"""
+Export the prediction, claim and evidence tables to typed Parquet for offline
+analysis (see core.services.parquet_export for the layout).
+
+Each run appends only the rows recorded since the previous run into the same
+directory; prediction_log is rewritten whole. The audit scripts in docs/audit
+accept the directory wherever they accepted a SQLite snapshot.
+
+Needs pyarrow installed (it is not a production dependency).
+
+    python manage.py export_analysis_parquet --out exports/
+    python manage.py export_analysis_parquet --out exports/ --table published_claim --full
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from core.services import parquet_export
+
+
+class Command(BaseCommand):
+    help = ('Export predictions, snapshots, claims and evidence to typed, '
+            'month-partitioned Parquet, incrementally.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--out', required=True,
+                            help='Export directory; reused across runs.')
+        parser.add_argument('--table', action='append',
+                            choices=sorted(parquet_export.TABLES),
+                            help='Only this table (repeatable). Default: all.')
+        parser.add_argument('--full', action='store_true',
+                            help='Discard the previous export of the selected '
+                                 'tables and export them from the first row.')
+
+    def handle(self, *args, **options):
+        try:
+            written = parquet_export.export(
+                options['out'], tables=options['table'], full=options['full'])
+        except parquet_export.ExportUnavailable as exc:
+            raise CommandError(str(exc))
+
+        for table, count in written.items():
+            self.stdout.write(f'  {table}: {count} rows')
+        self.stdout.write(self.style.SUCCESS(f'Exported to {options["out"]}'))
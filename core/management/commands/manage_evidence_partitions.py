@@ -0,0 +1,104 @@
+"""
+Maintain the kickoff-month partitions of the evidence tables (PostgreSQL).
+
+Creates the partitions for the current month and the next few months, so new
+evidence never has to land in the default partition. It can also detach old
+months from the live tables. Detaching is the only removal it does: the table
+stays under the same name, readable with plain SQL, and `--attach` brings it
+back for an audit. Dropping a detached month is left to a human on purpose.
+A month that rows staying attached still point into is kept, with a warning
+naming the references.
+
+On SQLite the tables are not partitioned and the command reports that and exits.
+
+    python manage.py manage_evidence_partitions --dry-run
+    python manage.py manage_evidence_partitions --months-ahead 6
+    python manage.py manage_evidence_partitions --detach-before 2025-01
+    python manage.py manage_evidence_partitions --attach 2024-11
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from core.services import evidence_partitions as partitions
+
+
+def _month(text):
+    try:
+        return partitions.parse_month(text)
+    except ValueError:
+        raise CommandError(f'Expected a month as YYYY-MM, got {text!r}')
+
+
+class Command(BaseCommand):
+    help = ('Create upcoming kickoff-month partitions for the evidence tables '
+            'and detach or re-attach old ones (PostgreSQL only).')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int,
+                            default=partitions.DEFAULT_MONTHS_AHEAD,
+                            help='Months after the current one to create.')
+        parser.add_argument('--detach-before', metavar='YYYY-MM',
+                            help='Detach every attached month before this one.')
+        parser.add_argument('--attach', metavar='YYYY-MM',
+                            help='Re-attach a previously detached month.')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Report the plan without changing anything.')
+
+    def handle(self, *args, **options):
+        if not partitions.supported():
+            self.stdout.write(
+                f'Evidence tables are not partitioned on {connection.vendor}; '
+                f'nothing to do.')
+            return
+
+        dry = options['dry_run']
+        detach_before = options['detach_before'] and _month(options['detach_before'])
+        attach = options['attach'] and _month(options['attach'])
+        today = timezone.now()
+        verb = 'would' if dry else 'did'
+        attached_by_model = {}
+
+        for model in partitions.evidence_models():
+            table = model._meta.db_table
+            if not partitions.is_partitioned(model):
+                self.stdout.write(self.style.WARNING(
+                    f'  {table}: not partitioned, skipped (is migration 0047 applied?)'))
+                continue
+
+            attached = partitions.attached_months(model)
+            if attach:
+                if attach not in partitions.detached_months(model):
+                    raise CommandError(
+                        f'{partitions.partition_name(table, attach)} is not a '
+                        f'detached partition')
+                if not dry:
+                    partitions.attach_month(model, attach)
+                self.stdout.write(f'  {table}: {verb} attach {attach:%Y-%m}')
+                attached.append(attach)
+
+            for month in partitions.months_to_create(
+                    attached, today, max(0, options['months_ahead'])):
+                if not dry:
+                    partitions.create_month(model, month)
+                self.stdout.write(f'  {table}: {verb} create {month:%Y-%m}')
+
+            attached_by_model[model] = [month for month in attached if month != attach]
+
+        if detach_before:
+            plan, kept = partitions.detach_plan(attached_by_model, detach_before)
+            for model, months in plan.items():
+                for month in months:
+                    if not dry:
+                        partitions.detach_month(model, month)
+                    self.stdout.write(f'  {model._meta.db_table}: {verb} detach {month:%Y-%m}')
+            for (model, month), references in kept.items():
+                held = ', '.join(f'{label} ({count})' for label, count in references.items())
+                self.stdout.write(self.style.WARNING(
+                    f'  {model._meta.db_table}: kept {month:%Y-%m} attached, '
+                    f'still referenced by {held}'))
+
+        if dry:
+            self.stdout.write('Dry run: nothing changed.')
+        else:
+            self.stdout.write(self.style.SUCCESS('Evidence partitions up to date.'))
@@ -1,24 +1,75 @@
+from collections import Counter
+
 from django.core.management.base import BaseCommand
+from django.db import transaction
+
 from core.models import PredictionLog
+from core.services import bulk_rows
+
+# What compute_performance() reads, plus what it writes.
+PERFORMANCE_INPUTS = (
+    'id', 'fixture_id', 'market_type', 'predicted_outcome', 'actual_outcome',
+    'actual_score_home', 'actual_score_away', 'match_status', 'odds',
+    'odds_home', 'odds_draw', 'odds_away', 'expected_value', 'confidence',
+)
+PERFORMANCE_FIELDS = ('was_correct', 'profit_loss_10', 'roi_percent')
+
 
 class Command(BaseCommand):
     help = 'Recalculates performance metrics for all predictions with outcomes'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Recalculate this many id ranges in parallel (ignored on SQLite).',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=bulk_rows.DEFAULT_CHUNK_SIZE,
+            help='Rows read, graded and written per transaction.',
+        )
+
     def handle(self, *args, **options):
-        predictions = PredictionLog.objects.filter(actual_outcome__isnull=False)
+        predictions = PredictionLog.objects.filter(
+            actual_outcome__isnull=False,
+        ).only(*PERFORMANCE_INPUTS, *PERFORMANCE_FIELDS)
         count = predictions.count()
-        
+
         self.stdout.write(f"Found {count} predictions with outcomes. Recalculating...")
-        
-        updated = 0
-        for pred in predictions:
-            try:
-                # This will run the updated case-insensitive logic
-                pred.calculate_performance()
-                updated += 1
-                if updated % 10 == 0:
-                    self.stdout.write(f"Processed {updated}/{count}")
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"Error processing fixture {pred.fixture_id}: {e}"))
-        
-        self.stdout.write(self.style.SUCCESS(f"Successfully recalculated {updated} predictions"))
+
+        def recalculate_chunk(chunk):
+            stats = Counter()
+            changed = []
+            for pred in chunk:
+                before = tuple(getattr(pred, f) for f in PERFORMANCE_FIELDS)
+                try:
+                    # This will run the updated case-insensitive logic
+                    graded = pred.compute_performance()
+                except Exception as e:
+                    stats['errors'] += 1
+                    self.stdout.write(self.style.ERROR(f"Error processing fixture {pred.fixture_id}: {e}"))
+                    continue
+                if not graded:
+                    continue
+                stats['updated'] += 1
+                if tuple(getattr(pred, f) for f in PERFORMANCE_FIELDS) != before:
+                    changed.append(pred)
+            if changed:
+                with transaction.atomic():
+                    PredictionLog.objects.bulk_update(changed, PERFORMANCE_FIELDS)
+            stats['changed'] += len(changed)
+            return stats
+
+        stats, seconds = bulk_rows.process_in_chunks(
+            predictions, recalculate_chunk,
+            chunk_size=max(1, options['chunk_size']),
+            workers=max(1, options['workers']),
+        )
+
+        self.stdout.write(f"Processed {bulk_rows.throughput(count, seconds)}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Successfully recalculated {stats['updated']} predictions "
+            f"({stats['changed']} changed)"))
@@ -0,0 +1,30 @@
+"""Refresh the local upcoming-fixture search index. Scheduler stage 8.
+
+One paginated provider sweep of the next two weeks replaces FixtureSearchEntry,
+so /api/search/ answers from the database instead of calling SportMonks per
+search. Publishes nothing and touches no prediction or evidence row.
+"""
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.services import fixture_search
+
+
+class Command(BaseCommand):
+    help = 'Refresh the upcoming-fixture search index behind /api/search/.'
+
+    def handle(self, *args, **options):
+        token = os.getenv('SPORTMONKS_API_TOKEN') or os.getenv('SPORTMONKS_TOKEN')
+        if not token:
+            raise CommandError('SPORTMONKS_API_TOKEN is not set')
+
+        fixtures = fixture_search.fetch_upcoming(token)
+        summary = fixture_search.refresh(fixtures)
+        if not summary['indexed']:
+            self.stdout.write(self.style.WARNING(
+                'search index: the sweep returned no fixtures, previous index kept'))
+            return
+        self.stdout.write(
+            f"search index: {summary['indexed']} fixtures indexed, "
+            f"{summary['removed']} removed")
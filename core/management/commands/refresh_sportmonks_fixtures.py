@@ -1,6 +1,6 @@
 from django.core.management.base import BaseCommand
-from django.core.cache import cache
-from core.views import fetch_verified_fixtures, MAJOR_LEAGUES
+from core.services import shared_cache
+from core.views import fetch_verified_fixtures, verified_fixtures_cache_key, MAJOR_LEAGUES
 import time
 
 
@@ -33,8 +33,7 @@ class Command(BaseCommand):
         
         # Clear cache if requested
         if clear_cache:
-            cache_key = f"verified_fixtures_{days_ahead}"
-            cache.delete(cache_key)
+            shared_cache.invalidate(verified_fixtures_cache_key(days_ahead))
             self.stdout.write(
                 self.style.WARNING('🧹 Cleared existing fixture cache')
             )
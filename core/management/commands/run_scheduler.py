@@ -8,7 +8,11 @@ from django.core.management.base import BaseCommand
 from django.core.management import call_command
 from django.db import connection
 
-from core.services.scheduler_health import SchedulerAlreadyRunning, record_run
+from core.services.scheduler_health import (
+    SchedulerAlreadyRunning,
+    record_run,
+    stage_metrics,
+)
 from core.services.redaction import redact_exception
 
 # Configure logging
@@ -57,8 +61,15 @@ class Command(BaseCommand):
         self.stdout.write('  5. Append signal evidence (capture_signal_evidence)')
         self.stdout.write('  6. Append fixture results (capture_fixture_results)')
         self.stdout.write('  7. Settle private strategy experiments (settle_strategy_lab)')
+        self.stdout.write('  8. Refresh the fixture search index (refresh_fixture_search_index)')
+        self.stdout.write('  9. Reconcile performance rollups, daily (check_performance_rollups)')
         self.stdout.write('\nPress Ctrl+C to stop.\n')
 
+        # The worker can boot before the web process has migrated, and its
+        # stages use the shared cache from the first cycle. Creating the table
+        # is idempotent and does nothing unless the cache is database-backed.
+        call_command('createcachetable')
+
         if run_now:
             self.run_startup_cycle(interval_minutes)
 
@@ -171,6 +182,16 @@ class Command(BaseCommand):
         # This writes private research settlements and cannot publish a Gem.
         self.run_task('settle_strategy_lab')
 
+        # Task 8: Rebuild the local fixture search index, so /api/search/ is a
+        # database lookup rather than a provider call per keystroke. Isolated:
+        # a failure here only leaves search on the previous index.
+        self.run_task('refresh_fixture_search_index')
+
+        # Task 9: Once a day, recompute the public record from the verified
+        # claims and repair the rollups the public figures read, picking up
+        # exclusions and corrections made after a claim was settled.
+        self.run_task('check_performance_rollups', repair=True, if_due=True)
+
     def run_task(self, command_name, **kwargs):
         """Helper to run a single management command.
 
@@ -183,9 +204,10 @@ class Command(BaseCommand):
         self.stdout.write(f'▶️  Running {command_name}...')
         run = getattr(self, '_run', None)
         try:
-            call_command(command_name, **kwargs)
+            with stage_metrics() as metrics:
+                call_command(command_name, **kwargs)
             if run is not None and hasattr(run, 'stage'):
-                run.stage(command_name, True)
+                run.stage(command_name, True, metrics=metrics)
             self._stages[command_name] = 'ok'
         except Exception as e:
             logger.exception('scheduled task %s failed', command_name)
@@ -197,5 +219,6 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(
                 f'❌ Error running {command_name}: {redact_exception(e)}'))
             if run is not None and hasattr(run, 'stage'):
-                run.stage(command_name, False)
+                # Rows a stage wrote before failing were still written.
+                run.stage(command_name, False, metrics=metrics)
             self._stages[command_name] = 'failed'
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.3 on 2026-10-18 21:45
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0042_gemfeedcache'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BankrollStats',
+            fields=[
+                ('bankroll', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='core.userbankroll')),
+                ('settled_bets', models.IntegerField(default=0)),
+                ('wins', models.IntegerField(default=0)),
+                ('losses', models.IntegerField(default=0)),
+                ('total_profit', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('pending_bets', models.IntegerField(default=0)),
+                ('pending_exposure', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Bankroll Stats',
+                'verbose_name_plural': 'Bankroll Stats',
+            },
+        ),
+    ]
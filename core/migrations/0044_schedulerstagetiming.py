@@ -0,0 +1,34 @@
+# Generated by Django 5.1.3 on 2026-10-18 22:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0043_bankrollstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SchedulerStageTiming',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('run_id', models.CharField(db_index=True, max_length=36)),
+                ('run_started_at', models.DateTimeField(db_index=True)),
+                ('stage', models.CharField(max_length=64)),
+                ('ok', models.BooleanField(default=True)),
+                ('wall_seconds', models.FloatField()),
+                ('db_queries', models.IntegerField(default=0)),
+                ('db_seconds', models.FloatField(default=0.0)),
+                ('http_requests', models.IntegerField(default=0)),
+                ('http_seconds', models.FloatField(default=0.0)),
+                ('rss_delta_kb', models.IntegerField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Scheduler Stage Timing',
+                'verbose_name_plural': 'Scheduler Stage Timings',
+                'ordering': ['-run_started_at', 'id'],
+            },
+        ),
+    ]
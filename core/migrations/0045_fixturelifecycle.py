@@ -0,0 +1,79 @@
+# Generated by Django 5.1.3 on 2026-10-18 22:03
+
+from django.db import migrations, models
+from django.db.models import Max, Min
+
+VOIDLIKE = {'POSTP', 'CANCL', 'SUSP', 'ABAN', 'AWARDED', 'WO', 'DELETED'}
+
+
+def backfill(apps, schema_editor):
+    """Build one lifecycle row per fixture from the evidence already captured."""
+    FixtureLifecycle = apps.get_model('core', 'FixtureLifecycle')
+    rows = {}
+    for model in ('SignalObservation', 'StrategyLabObservation'):
+        observed = (
+            apps.get_model('core', model).objects
+            .values('fixture_id')
+            .annotate(kickoff=Min('kickoff'), first=Min('observed_at'), last=Max('observed_at'))
+        )
+        for o in observed:
+            row = rows.get(o['fixture_id'])
+            if row is None:
+                rows[o['fixture_id']] = FixtureLifecycle(
+                    fixture_id=o['fixture_id'], kickoff=o['kickoff'],
+                    first_observed_at=o['first'], last_observed_at=o['last'],
+                )
+                continue
+            row.kickoff = min(row.kickoff, o['kickoff'])
+            row.first_observed_at = min(row.first_observed_at, o['first'])
+            row.last_observed_at = max(row.last_observed_at, o['last'])
+
+    results = (
+        apps.get_model('core', 'FixtureResultObservation').objects
+        .order_by('fixture_id', '-result_version', '-captured_at')
+        .only('fixture_id', 'kickoff', 'provider_status', 'is_final', 'confirmed',
+              'result_version', 'captured_at')
+    )
+    seen = set()
+    for r in results.iterator(chunk_size=2000):
+        if r.fixture_id in seen:
+            continue
+        seen.add(r.fixture_id)
+        row = rows.setdefault(
+            r.fixture_id, FixtureLifecycle(fixture_id=r.fixture_id, kickoff=r.kickoff))
+        if r.provider_status in VOIDLIKE:
+            row.result_state = 'void'
+        elif r.is_final:
+            row.result_state = 'confirmed' if r.confirmed else 'provisional'
+        row.result_version = r.result_version
+        row.result_captured_at = r.captured_at
+
+    FixtureLifecycle.objects.bulk_create(rows.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0044_schedulerstagetiming'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FixtureLifecycle',
+            fields=[
+                ('fixture_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('kickoff', models.DateTimeField()),
+                ('first_observed_at', models.DateTimeField(blank=True, null=True)),
+                ('last_observed_at', models.DateTimeField(blank=True, null=True)),
+                ('result_state', models.CharField(choices=[('pending', 'Pending'), ('provisional', 'Provisional'), ('confirmed', 'Confirmed'), ('void', 'Void')], default='pending', max_length=16)),
+                ('result_version', models.PositiveIntegerField(default=0)),
+                ('result_captured_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Fixture Lifecycle',
+                'indexes': [models.Index(fields=['result_state', 'kickoff'], name='core_fixtur_result__97e724_idx')],
+            },
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
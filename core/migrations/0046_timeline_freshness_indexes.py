@@ -0,0 +1,21 @@
+# Generated by Django 5.1.3 on 2026-10-18 22:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0045_fixturelifecycle'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='fixturecontextobservation',
+            index=models.Index(fields=['fixture_id', 'created_at'], name='core_fixtur_fixture_e30512_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signalobservation',
+            index=models.Index(fields=['fixture_id', 'is_selected_outcome', 'created_at'], name='core_signal_fixture_f1c09c_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1.3 on 2026-10-18 22:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+from core.services import evidence_partitions
+
+
+def partition_evidence(apps, schema_editor):
+    """Rebuild the evidence tables as kickoff-month partitions (PostgreSQL only)."""
+    if not evidence_partitions.supported(schema_editor.connection):
+        return
+    today = timezone.now()
+    for label in evidence_partitions.PARTITIONED_MODELS:
+        evidence_partitions.convert_to_partitioned(
+            schema_editor, apps.get_model(label), today,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0046_timeline_freshness_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='fixtureresultobservation',
+            name='supersedes',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='superseded_by', to='core.fixtureresultobservation'),
+        ),
+        migrations.AlterField(
+            model_name='strategylabobservation',
+            name='source_signal',
+            field=models.ForeignKey(blank=True, db_constraint=False, help_text='Exact immutable signal row that produced this candidate. Null only for specialist candidates such as Asian Handicap.', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='strategy_lab_observations', to='core.signalobservation'),
+        ),
+        migrations.AlterField(
+            model_name='strategylabsettlement',
+            name='observation',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.PROTECT, related_name='settlements', to='core.strategylabobservation'),
+        ),
+        migrations.AlterField(
+            model_name='strategylabsettlement',
+            name='result',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.PROTECT, related_name='strategy_lab_settlements', to='core.fixtureresultobservation'),
+        ),
+        # After the AlterFields: the foreign keys into these tables must be
+        # gone before the tables they point at can be rebuilt.
+        migrations.RunPython(partition_evidence, migrations.RunPython.noop),
+    ]
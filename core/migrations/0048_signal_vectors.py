@@ -0,0 +1,64 @@
+# Generated by Django 5.1.3 on 2026-10-18 22:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from core.services import signal_vectors
+
+CHUNK = 2000
+
+
+def pack_vectors(apps, schema_editor):
+    """Move every row's JSON vectors into shared SignalVector rows."""
+    SignalObservation = apps.get_model('core', 'SignalObservation')
+    SignalVector = apps.get_model('core', 'SignalVector')
+    rows = SignalObservation.objects.order_by('pk')
+    last = None
+    while True:
+        page = rows.filter(pk__gt=last) if last is not None else rows
+        chunk = list(page.values_list('pk', 'raw_vector', 'market_price_vector')[:CHUNK])
+        if not chunk:
+            return
+        vectors, links = {}, []
+        for pk, raw_vector, price_vector in chunk:
+            fields = signal_vectors.encode(raw_vector, price_vector)
+            vectors.setdefault(fields['vector_hash'], fields)
+            links.append(SignalObservation(pk=pk, vector_id=fields['vector_hash']))
+        SignalVector.objects.bulk_create(
+            [SignalVector(**fields) for fields in vectors.values()],
+            ignore_conflicts=True,
+        )
+        SignalObservation.objects.bulk_update(links, ['vector'])
+        last = chunk[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0047_evidence_partitions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SignalVector',
+            fields=[
+                ('vector_hash', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('outcomes', models.CharField(blank=True, default='', max_length=200)),
+                ('probabilities', models.BinaryField(null=True)),
+                ('price_outcomes', models.CharField(blank=True, default='', max_length=200)),
+                ('prices', models.BinaryField(null=True)),
+                ('price_extras', models.JSONField(blank=True, null=True)),
+                ('verbatim', models.JSONField(blank=True, help_text='Vectors that cannot be packed losslessly, stored as received.', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Signal Vector',
+            },
+        ),
+        migrations.AddField(
+            model_name='signalobservation',
+            name='vector',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='observations', to='core.signalvector'),
+        ),
+        migrations.RunPython(pack_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.3 on 2026-10-18 22:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Separate from 0048 so the backfill's row updates are committed before
+    # the table is altered: PostgreSQL refuses ALTER TABLE while deferred
+    # foreign-key checks from the same transaction are still pending.
+
+    dependencies = [
+        ('core', '0048_signal_vectors'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='signalobservation',
+            name='vector',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='observations', to='core.signalvector'),
+        ),
+        migrations.RemoveField(
+            model_name='signalobservation',
+            name='market_price_vector',
+        ),
+        migrations.RemoveField(
+            model_name='signalobservation',
+            name='raw_vector',
+        ),
+    ]
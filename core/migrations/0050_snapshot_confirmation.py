@@ -0,0 +1,31 @@
+# Generated by Django 5.1.3 on 2026-10-18 22:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0049_signal_vectors_required'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SnapshotConfirmation',
+            fields=[
+                ('snapshot', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='confirmation', serialize=False, to='core.predictionsnapshot')),
+                ('last_confirmed_at', models.DateTimeField()),
+                ('last_confirmed_run_id', models.CharField(max_length=64)),
+                ('confirmed_run_count', models.PositiveIntegerField(default=0, help_text='Runs after the first that repeated this state.')),
+            ],
+            options={
+                'verbose_name': 'Snapshot Confirmation',
+            },
+        ),
+        migrations.AddField(
+            model_name='predictionsnapshot',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
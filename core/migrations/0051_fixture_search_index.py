@@ -0,0 +1,49 @@
+# Generated by Django 5.1.3 on 2026-10-18 22:45
+
+from django.db import migrations, models
+
+
+def add_trigram_index(apps, schema_editor):
+    """pg_trgm GIN index on search_text (PostgreSQL only).
+
+    Serves the substring match (LIKE '%q%') in core.services.fixture_search.
+    The word-similarity fallback compares a computed score and is not
+    indexable; it filters the rows of a table bounded to two weeks of
+    fixtures, as SQLite does for both matches.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS core_fixturesearchentry_text_trgm '
+        'ON core_fixturesearchentry USING gin (search_text gin_trgm_ops)'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0050_snapshot_confirmation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FixtureSearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fixture_id', models.IntegerField(unique=True)),
+                ('home_team', models.CharField(max_length=100)),
+                ('away_team', models.CharField(max_length=100)),
+                ('league', models.CharField(blank=True, default='', max_length=100)),
+                ('league_id', models.IntegerField(blank=True, db_index=True, null=True)),
+                ('kickoff', models.DateTimeField(db_index=True)),
+                ('has_predictions', models.BooleanField(default=False)),
+                ('search_text', models.TextField()),
+                ('indexed_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'ordering': ['kickoff'],
+            },
+        ),
+        migrations.RunPython(add_trigram_index, migrations.RunPython.noop),
+    ]
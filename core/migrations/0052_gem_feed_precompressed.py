@@ -0,0 +1,33 @@
+# Generated by Django 5.1.3 on 2026-10-18 22:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0051_fixture_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gemfeedcache',
+            name='body',
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AddField(
+            model_name='gemfeedcache',
+            name='body_br',
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AddField(
+            model_name='gemfeedcache',
+            name='body_gzip',
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AddField(
+            model_name='gemfeedcache',
+            name='etag',
+            field=models.CharField(blank=True, default='', max_length=66),
+        ),
+    ]
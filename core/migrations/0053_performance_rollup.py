@@ -0,0 +1,35 @@
+# Generated by Django 5.1.3 on 2026-10-18 23:13
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0052_gem_feed_precompressed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PerformanceRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(db_index=True)),
+                ('market_type', models.CharField(max_length=20)),
+                ('league', models.CharField(max_length=100)),
+                ('predicted_outcome', models.CharField(max_length=32)),
+                ('confidence_bucket', models.CharField(max_length=16)),
+                ('settled', models.IntegerField(default=0)),
+                ('wins', models.IntegerField(default=0)),
+                ('losses', models.IntegerField(default=0)),
+                ('voids', models.IntegerField(default=0)),
+                ('profit_units', models.FloatField(default=0.0)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['-day', 'league', 'market_type'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'market_type', 'league', 'predicted_outcome', 'confidence_bucket'), name='performance_rollup_unique_key')],
+            },
+        ),
+    ]
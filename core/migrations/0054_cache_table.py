@@ -0,0 +1,24 @@
+# Generated by Django 5.1.3 on 2026-10-18 23:40
+
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_table(apps, schema_editor):
+    """The shared DatabaseCache table, when settings.CACHES uses one.
+
+    Idempotent, and a no-op for locmem, file and Redis caches. Part of the
+    schema so no process can reach a cache call before the table exists.
+    """
+    call_command('createcachetable', database=schema_editor.connection.alias, verbosity=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0053_performance_rollup'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_table, migrations.RunPython.noop),
+    ]
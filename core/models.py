@@ -5,6 +5,8 @@ Core models for SmartBet - Prediction Tracking & Bankroll Management
 import uuid
 
 from django.db import models
+from django.db import transaction as db_transaction
+from django.db.models.functions import Coalesce
 from django.contrib.auth.models import User
 from django.db.models.signals import post_save
 from django.dispatch import receiver
@@ -211,11 +213,24 @@ class PredictionLog(models.Model):
         Calculate performance metrics after match completes.
         Supports multi-market verification: 1X2, BTTS, O/U 2.5, Double Chance
         """
+        if not self.compute_performance():
+            return
+
+        self.result_logged_at = timezone.now()
+        self.save()
+
+    def compute_performance(self) -> bool:
+        """
+        Set was_correct, profit_loss_10 and roi_percent in memory, without saving.
+
+        Returns False, changing nothing, when there is no result or no pick to
+        grade. Bulk recomputation uses this directly and writes with bulk_update.
+        """
         if self.actual_outcome is None and self.actual_score_home is None:
-            return  # No result data yet
+            return False  # No result data yet
             
         if not self.predicted_outcome:
-            return  # No prediction to verify
+            return False  # No prediction to verify
         
         # Grading rules live in ONE place: core.services.market_evaluation.
         # This row is graded against ITS CURRENT pick, which is correct for the
@@ -269,9 +284,7 @@ class PredictionLog(models.Model):
         # Calculate ROI
         if self.profit_loss_10 is not None:
             self.roi_percent = (self.profit_loss_10 / 10) * 100
-        
-        self.result_logged_at = timezone.now()
-        self.save()
+        return True
 
 
 class PredictionSnapshot(models.Model):
@@ -350,6 +363,11 @@ class PredictionSnapshot(models.Model):
     SNAPSHOT_HASH_VERSION = 'v1'
     snapshot_hash = models.CharField(max_length=64, db_index=True)
     snapshot_hash_version = models.CharField(max_length=8, default='v1')
+    # The same payload WITHOUT the run id and generation time: equal for two
+    # runs that saw the same prediction, price and provenance. A run that
+    # repeats the fixture's newest state is recorded on SnapshotConfirmation
+    # instead of appending another snapshot.
+    content_hash = models.CharField(max_length=64, blank=True, default='')
 
     # A correction appends a new snapshot pointing at the one it replaces.
     supersedes = models.ForeignKey(
@@ -362,9 +380,9 @@ class PredictionSnapshot(models.Model):
         ordering = ['-prediction_generated_at']
         # UNIQUENESS POLICY: one run produces at most one prediction per fixture
         # and market, so a retry of the same run is idempotent rather than
-        # duplicative. Two DIFFERENT runs over the same fixture legitimately
-        # produce two snapshots, even when the outcome is identical — they are
-        # distinct time-specific observations.
+        # duplicative. Two DIFFERENT runs over the same fixture produce two
+        # snapshots when anything frozen here changed between them; a run that
+        # repeats the newest state exactly confirms it (SnapshotConfirmation).
         constraints = [
             models.UniqueConstraint(
                 fields=['prediction_run_id', 'fixture_id', 'market_type',
@@ -424,6 +442,17 @@ class PredictionSnapshot(models.Model):
     def verify_integrity(self):
         return bool(self.snapshot_hash) and self.snapshot_hash == self.compute_hash()
 
+    def compute_content_hash(self):
+        from core.services.integrity import canonical_sha256
+
+        payload = self.canonical_payload()
+        del payload['prediction_run_id'], payload['prediction_generated_at']
+        # A state that classifies differently is not the same state, even when
+        # every frozen field matches.
+        payload['pricing_integrity_status'] = self.pricing_integrity_status
+        payload['is_audit_excluded'] = self.is_audit_excluded
+        return canonical_sha256(payload)
+
     def save(self, *args, **kwargs):
         """Append-only. A snapshot is never rewritten."""
         if not self._state.adding:
@@ -437,6 +466,7 @@ class PredictionSnapshot(models.Model):
             self.snapshot_id = uuid.uuid4()
         self.snapshot_hash_version = self.SNAPSHOT_HASH_VERSION
         self.snapshot_hash = self.compute_hash()
+        self.content_hash = self.compute_content_hash()
         super().save(*args, **kwargs)
 
     CORRECTABLE_FIELDS = (
@@ -476,6 +506,31 @@ class PredictionSnapshot(models.Model):
         return self.published_claims.exists()
 
 
+class SnapshotConfirmation(models.Model):
+    """Later runs that found a snapshot's state unchanged.
+
+    The snapshot stays immutable; this side row is the only thing a repeat
+    updates. `last_confirmed_at` is the newest run's generation time, so the
+    snapshot reads as "current from prediction_generated_at until
+    last_confirmed_at".
+    """
+    snapshot = models.OneToOneField(
+        PredictionSnapshot, on_delete=models.CASCADE, primary_key=True,
+        related_name='confirmation',
+    )
+    last_confirmed_at = models.DateTimeField()
+    last_confirmed_run_id = models.CharField(max_length=64)
+    confirmed_run_count = models.PositiveIntegerField(
+        default=0, help_text='Runs after the first that repeated this state.',
+    )
+
+    class Meta:
+        verbose_name = 'Snapshot Confirmation'
+
+    def __str__(self):
+        return f'{self.snapshot_id} confirmed {self.confirmed_run_count}x'
+
+
 class PublishedClaim(models.Model):
     """
     An immutable, insert-only snapshot of a claim made publicly.
@@ -839,6 +894,45 @@ class PerformanceSnapshot(models.Model):
         return f"Performance on {self.snapshot_date}: {self.accuracy_percent}% accuracy"
 
 
+class PerformanceRollup(models.Model):
+    """
+    Settled public claims summed per kickoff day, market, league, pick and
+    confidence band. Maintained incrementally by settle_published_claim and
+    reconciled against a full recompute by check_performance_rollups; the
+    public accuracy and ROI endpoints sum these rows instead of walking every
+    verified claim. See core/services/performance_rollup.py.
+    """
+    day = models.DateField(db_index=True)
+    market_type = models.CharField(max_length=20)
+    league = models.CharField(max_length=100)
+    predicted_outcome = models.CharField(max_length=32)
+    confidence_bucket = models.CharField(max_length=16)
+
+    settled = models.IntegerField(default=0)
+    wins = models.IntegerField(default=0)
+    losses = models.IntegerField(default=0)
+    voids = models.IntegerField(default=0)
+    # P/L of a one-unit flat stake at each claim's published price.
+    profit_units = models.FloatField(default=0.0)
+
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-day', 'league', 'market_type']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'market_type', 'league', 'predicted_outcome',
+                        'confidence_bucket'],
+                name='performance_rollup_unique_key',
+            ),
+        ]
+
+    def __str__(self):
+        return (f"{self.day} {self.league} {self.market_type}/"
+                f"{self.predicted_outcome} [{self.confidence_bucket}]: "
+                f"{self.wins}W-{self.losses}L-{self.voids}V")
+
+
 class UserBankroll(models.Model):
     """
     User's bankroll management settings and current state.
@@ -1143,15 +1237,102 @@ class BankrollTransaction(models.Model):
         
         self.settled_at = timezone.now()
         self.bankroll_after = self.bankroll_before + (self.profit_loss or Decimal('0.00'))
-        
-        # Update associated bankroll
-        if self.profit_loss:
-            self.bankroll.update_bankroll(
-                profit_loss=float(self.profit_loss),
-                stake_amount=float(self.stake_amount)
+
+        with db_transaction.atomic():
+            # Update associated bankroll
+            if self.profit_loss:
+                self.bankroll.update_bankroll(
+                    profit_loss=float(self.profit_loss),
+                    stake_amount=float(self.stake_amount)
+                )
+
+            self.save()
+            BankrollStats.apply_settlement(self)
+
+
+class BankrollStats(models.Model):
+    """
+    Running totals behind /api/bankroll/<session>/stats/.
+
+    One row per bankroll, moved by F() increments when a bet is recorded or
+    settled, so reading stats never touches the transaction history. A bankroll
+    without a row (created before this table existed) gets one built from a
+    single conditional-aggregation query on its first stats request; from
+    then on the increments keep it exact.
+    """
+    bankroll = models.OneToOneField(
+        UserBankroll,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats'
+    )
+    settled_bets = models.IntegerField(default=0)  # won + lost; voids excluded
+    wins = models.IntegerField(default=0)
+    losses = models.IntegerField(default=0)
+    total_profit = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))
+    pending_bets = models.IntegerField(default=0)
+    pending_exposure = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Bankroll Stats"
+        verbose_name_plural = "Bankroll Stats"
+
+    def __str__(self):
+        return f"Stats for bankroll {self.bankroll_id}: {self.settled_bets} settled, {self.total_profit} P/L"
+
+    @staticmethod
+    def aggregate(bankroll):
+        """Every running total for `bankroll`, in one query over its transactions."""
+        zero = models.Value(Decimal('0.00'), output_field=models.DecimalField(max_digits=12, decimal_places=2))
+        settled = models.Q(status__in=['settled_won', 'settled_lost'])
+        pending = models.Q(status='pending')
+        return BankrollTransaction.objects.filter(bankroll=bankroll).aggregate(
+            settled_bets=models.Count('pk', filter=settled),
+            wins=models.Count('pk', filter=models.Q(status='settled_won')),
+            losses=models.Count('pk', filter=models.Q(status='settled_lost')),
+            total_profit=Coalesce(
+                models.Sum('profit_loss', filter=settled), zero
+            ),
+            pending_bets=models.Count('pk', filter=pending),
+            pending_exposure=Coalesce(
+                models.Sum('stake_amount', filter=pending), zero
+            ),
+        )
+
+    @classmethod
+    def for_bankroll(cls, bankroll):
+        """The bankroll's stats row, built from its history the first time."""
+        try:
+            return cls.objects.get(bankroll=bankroll)
+        except cls.DoesNotExist:
+            stats, _ = cls.objects.get_or_create(
+                bankroll=bankroll, defaults=cls.aggregate(bankroll)
             )
-        
-        self.save()
+            return stats
+
+    @classmethod
+    def apply_placement(cls, txn):
+        """A new pending bet: count it and add its stake to exposure."""
+        cls.objects.filter(bankroll_id=txn.bankroll_id).update(
+            pending_bets=models.F('pending_bets') + 1,
+            pending_exposure=models.F('pending_exposure') + txn.stake_amount,
+        )
+
+    @classmethod
+    def apply_settlement(cls, txn):
+        """Move a just-settled bet out of pending and into the settled totals."""
+        changes = {
+            'pending_bets': models.F('pending_bets') - 1,
+            'pending_exposure': models.F('pending_exposure') - txn.stake_amount,
+        }
+        if txn.status in ('settled_won', 'settled_lost'):
+            changes['settled_bets'] = models.F('settled_bets') + 1
+            changes['total_profit'] = models.F('total_profit') + txn.profit_loss
+            field = 'wins' if txn.status == 'settled_won' else 'losses'
+            changes[field] = models.F(field) + 1
+        # No row yet means nothing to keep in step; for_bankroll() builds it.
+        cls.objects.filter(bankroll_id=txn.bankroll_id).update(**changes)
 
 
 class StakeRecommendation(models.Model):
@@ -1382,8 +1563,8 @@ class SchedulerHeartbeat(models.Model):
     status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_RUNNING)
     last_duration_seconds = models.FloatField(null=True, blank=True)
 
-    # Counts for the most recent completed run, measured as table deltas so they
-    # stay correct regardless of how the individual commands report themselves.
+    # Counts for the most recent completed run, reported by the code that does
+    # the writing (scheduler_health.report) and summed over the run's stages.
     snapshots_created = models.IntegerField(default=0)
     results_updated = models.IntegerField(default=0)
     claims_settled = models.IntegerField(default=0)
@@ -1442,6 +1623,40 @@ class SchedulerHeartbeat(models.Model):
         return self.HEALTH_HEALTHY
 
 
+class SchedulerStageTiming(models.Model):
+    """
+    What one stage of one scheduler cycle cost.
+
+    The heartbeat only says how long the whole cycle took; when a cycle goes
+    slow this says whether ingest, evidence capture or settlement regressed,
+    and whether it was our queries or the provider. A bounded history — the
+    scheduler prunes it to the most recent cycles (see
+    `scheduler_health.STAGE_HISTORY_RUNS`) — so it stays an operational gauge
+    rather than growing into an audit log. Staff-only, like the heartbeat.
+    """
+    run_id = models.CharField(max_length=36, db_index=True)
+    run_started_at = models.DateTimeField(db_index=True)
+    stage = models.CharField(max_length=64)
+    ok = models.BooleanField(default=True)
+
+    wall_seconds = models.FloatField()
+    db_queries = models.IntegerField(default=0)
+    db_seconds = models.FloatField(default=0.0)
+    http_requests = models.IntegerField(default=0)
+    http_seconds = models.FloatField(default=0.0)
+    # Growth of the process's peak resident set while the stage ran. Null
+    # where the platform cannot report it.
+    rss_delta_kb = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-run_started_at', 'id']
+        verbose_name = "Scheduler Stage Timing"
+        verbose_name_plural = "Scheduler Stage Timings"
+
+    def __str__(self):
+        return f"{self.run_id} {self.stage}: {self.wall_seconds:.1f}s"
+
+
 class IngestRequest(models.Model):
     """
     Replay ledger for signed server-to-server ingest requests.
@@ -1500,6 +1715,13 @@ class GemFeedCache(models.Model):
     refreshed_at = models.DateTimeField(auto_now=True)
     ranking_version = models.CharField(max_length=128, null=True, blank=True)
     recommendation_count = models.PositiveIntegerField(default=0)
+    # The internal endpoint's response, serialized and compressed once at
+    # store() time. The frontend server polls far more often than the worker
+    # scans, so polls serve these bytes or a 304 and never re-serialize payload.
+    body = models.BinaryField(null=True)
+    body_gzip = models.BinaryField(null=True)
+    body_br = models.BinaryField(null=True)
+    etag = models.CharField(max_length=66, blank=True, default='')
 
     class Meta:
         verbose_name = 'Gem feed cache'
@@ -1511,6 +1733,119 @@ class GemFeedCache(models.Model):
         )
 
 
+class FixtureSearchEntry(models.Model):
+    """One upcoming fixture in the local /api/search/ index.
+
+    Maintained by the scheduler (refresh_fixture_search_index) from a single
+    provider sweep, so a visitor's search is a database lookup instead of a
+    200-fixture provider request. Operational, like GemFeedCache: rows are
+    replaced on every refresh and carry no evidentiary weight.
+    """
+
+    fixture_id = models.IntegerField(unique=True)
+    home_team = models.CharField(max_length=100)
+    away_team = models.CharField(max_length=100)
+    league = models.CharField(max_length=100, blank=True, default='')
+    league_id = models.IntegerField(null=True, blank=True, db_index=True)
+    kickoff = models.DateTimeField(db_index=True)
+    has_predictions = models.BooleanField(default=False)
+    # Normalized team names, their TEAM_ALIASES spellings and the league name,
+    # space separated. Trigram-indexed on PostgreSQL.
+    search_text = models.TextField()
+    indexed_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        ordering = ['kickoff']
+
+    def __str__(self):
+        return f'{self.home_team} vs {self.away_team} ({self.kickoff:%Y-%m-%d %H:%M})'
+
+
+# Rows of one fixture do not all carry the same kickoff: a fixture brought
+# forward is re-observed with its new time. A lookup for known fixtures starts
+# this far before the earliest kickoff they were seen with.
+EVIDENCE_RESCHEDULE_SLACK = timedelta(days=7)
+
+
+class EvidenceQuerySet(models.QuerySet):
+    """Kickoff-window helpers for the append-only evidence tables.
+
+    On PostgreSQL these tables are partitioned by kickoff month (see
+    core.services.evidence_partitions), so a kickoff predicate is what lets a
+    query skip whole months. Lookups for fixtures whose kickoff is already
+    known go through covering(); scans of the whole history (audits, hash
+    dedup) stay unbounded on purpose.
+    """
+
+    def kickoff_window(self, start=None, end=None):
+        """Rows with `start <= kickoff < end`; either bound may be omitted."""
+        rows = self
+        if start is not None:
+            rows = rows.filter(kickoff__gte=start)
+        if end is not None:
+            rows = rows.filter(kickoff__lt=end)
+        return rows
+
+    def covering(self, kickoffs):
+        """Rows that can belong to fixtures seen with these kickoffs.
+
+        Only a lower bound: a postponed fixture is re-observed later, in a
+        month after the one it was first seen in. No kickoffs, no bound.
+        """
+        kickoffs = [kickoff for kickoff in kickoffs if kickoff is not None]
+        if not kickoffs:
+            return self
+        return self.kickoff_window(start=min(kickoffs) - EVIDENCE_RESCHEDULE_SLACK)
+
+
+class SignalVector(models.Model):
+    """The probability and price vectors of one fixture-market observation.
+
+    Shared by every SignalObservation outcome row that saw the same vectors,
+    and by later sweeps in which they did not change. Packed rather than JSON;
+    core.services.signal_vectors owns the encoding and documents it. Read the
+    vectors through SignalObservation.raw_vector / .market_price_vector.
+
+    INSERT-ONLY, like the observations that point at it.
+    """
+    vector_hash = models.CharField(max_length=64, primary_key=True)
+    outcomes = models.CharField(max_length=200, blank=True, default='')
+    probabilities = models.BinaryField(null=True)
+    price_outcomes = models.CharField(max_length=200, blank=True, default='')
+    prices = models.BinaryField(null=True)
+    price_extras = models.JSONField(null=True, blank=True)
+    verbatim = models.JSONField(
+        null=True, blank=True,
+        help_text='Vectors that cannot be packed losslessly, stored as received.',
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Signal Vector'
+
+    def __str__(self):
+        return self.vector_hash[:12]
+
+    @property
+    def raw_vector(self):
+        if not hasattr(self, '_raw_vector'):
+            from core.services.signal_vectors import decode_raw
+            self._raw_vector = decode_raw(self)
+        return self._raw_vector
+
+    @property
+    def market_price_vector(self):
+        if not hasattr(self, '_market_price_vector'):
+            from core.services.signal_vectors import decode_prices
+            self._market_price_vector = decode_prices(self)
+        return self._market_price_vector
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError('SignalVector is append-only.')
+        super().save(*args, **kwargs)
+
+
 class SignalObservation(models.Model):
     """An APPEND-ONLY record of one provider outcome, exactly as observed.
 
@@ -1583,9 +1918,12 @@ class SignalObservation(models.Model):
         help_text='raw/100 when the provider supplies percentages, else raw. '
                   'No BetGlitch heuristic is applied here.',
     )
-    # The COMPLETE vector this outcome came from, outcome name -> normalized
-    # value. Kept whole so a missing side can never be inferred as 1-p.
-    raw_vector = models.JSONField()
+    # The COMPLETE vectors this outcome came from, shared with the other
+    # outcome rows of the same sweep. `raw_vector` (outcome name -> normalized
+    # value) is kept whole so a missing side can never be inferred as 1-p.
+    vector = models.ForeignKey(
+        SignalVector, on_delete=models.PROTECT, related_name='observations',
+    )
     vector_sum = models.FloatField(
         help_text='Sum of the normalized vector. Stored rather than assumed: a '
                   'vector that does not sum to 1 must not be treated as a '
@@ -1646,21 +1984,22 @@ class SignalObservation(models.Model):
     odds_captured_at = models.DateTimeField(null=True, blank=True)
     odds_provenance = models.JSONField(null=True, blank=True)
     provenance_complete = models.BooleanField(default=False)
-    market_price_vector = models.JSONField(
-        null=True, blank=True,
-        help_text='Every outcome price for this market, so a de-vigged '
-                  'baseline can be computed. A baseline from the selected '
-                  'outcome alone is not a baseline.',
-    )
+    # `market_price_vector` (on `vector`): every outcome price for this
+    # market, so a de-vigged baseline can be computed. A baseline from the
+    # selected outcome alone is not a baseline.
     price_vector_complete = models.BooleanField(default=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = EvidenceQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Signal Observation'
         ordering = ['-observed_at']
         indexes = [
             models.Index(fields=['fixture_id', 'market', 'outcome']),
+            # The context timeline's freshness check: newest selected row per fixture.
+            models.Index(fields=['fixture_id', 'is_selected_outcome', 'created_at']),
             models.Index(fields=['-observed_at']),
             models.Index(fields=['kickoff']),
             models.Index(fields=['ingestion_run_id']),
@@ -1670,6 +2009,29 @@ class SignalObservation(models.Model):
         return (f'{self.fixture_id} {self.market}/{self.outcome} '
                 f'@{self.hours_to_kickoff:.1f}h')
 
+    # The vectors read and write like the JSON fields they used to be:
+    # `SignalObservation(raw_vector=..., market_price_vector=...)` keeps them
+    # on the instance and save() files them under a shared SignalVector.
+    @property
+    def raw_vector(self):
+        if '_raw_vector' in self.__dict__:
+            return self.__dict__['_raw_vector']
+        return self.vector.raw_vector
+
+    @raw_vector.setter
+    def raw_vector(self, value):
+        self.__dict__['_raw_vector'] = value
+
+    @property
+    def market_price_vector(self):
+        if '_market_price_vector' in self.__dict__:
+            return self.__dict__['_market_price_vector']
+        return self.vector.market_price_vector if self.vector_id else None
+
+    @market_price_vector.setter
+    def market_price_vector(self, value):
+        self.__dict__['_market_price_vector'] = value
+
     def save(self, *args, **kwargs):
         """Insert-only. A later probability or price appends a new row."""
         if not self._state.adding:
@@ -1677,6 +2039,11 @@ class SignalObservation(models.Model):
                 'SignalObservation is append-only — evidence is never revised. '
                 'Record a new observation instead.'
             )
+        if self.vector_id is None:
+            if self.__dict__.get('_raw_vector') is None:
+                raise ValueError('SignalObservation needs its raw_vector.')
+            from core.services.signal_vectors import intern
+            self.vector = intern(self.raw_vector, self.market_price_vector)
         super().save(*args, **kwargs)
 
 
@@ -1740,11 +2107,14 @@ class FixtureContextObservation(models.Model):
     calculation_version = models.CharField(max_length=80, blank=True, default='')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = EvidenceQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Fixture Context Observation'
         ordering = ['-observed_at']
         indexes = [
             models.Index(fields=['fixture_id', 'observed_at']),
+            models.Index(fields=['fixture_id', 'created_at']),
             models.Index(fields=['kickoff']),
             models.Index(fields=['ingestion_run_id']),
         ]
@@ -1845,7 +2215,7 @@ class FixtureResultObservation(models.Model):
     result_version = models.PositiveIntegerField(default=1)
     supersedes = models.ForeignKey(
         'self', null=True, blank=True, on_delete=models.PROTECT,
-        related_name='superseded_by',
+        related_name='superseded_by', db_constraint=False,
     )
     is_correction = models.BooleanField(default=False)
 
@@ -1854,6 +2224,8 @@ class FixtureResultObservation(models.Model):
     source_payload_hash = models.CharField(max_length=64, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = EvidenceQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Fixture Result Observation'
         ordering = ['-captured_at']
@@ -1878,6 +2250,119 @@ class FixtureResultObservation(models.Model):
         super().save(*args, **kwargs)
 
 
+class FixtureLifecycle(models.Model):
+    """Where one observed fixture stands: observed when, kicks off when, result how far.
+
+    A derived, mutable summary — one row per fixture — kept up to date as
+    evidence is appended (see the post_save receivers below). The evidence
+    tables stay the record; this exists so "which fixtures still need a
+    result?" is one indexed query over open fixtures instead of a rescan of
+    every observation and result ever captured.
+    """
+    STATE_PENDING = 'pending'          # no final result yet
+    STATE_PROVISIONAL = 'provisional'  # final, not yet confirmed by a later read
+    STATE_CONFIRMED = 'confirmed'      # terminal
+    STATE_VOID = 'void'                # terminal: postponed, cancelled, abandoned...
+    STATE_CHOICES = [
+        (STATE_PENDING, 'Pending'),
+        (STATE_PROVISIONAL, 'Provisional'),
+        (STATE_CONFIRMED, 'Confirmed'),
+        (STATE_VOID, 'Void'),
+    ]
+    OPEN_STATES = (STATE_PENDING, STATE_PROVISIONAL)
+
+    fixture_id = models.IntegerField(primary_key=True)
+    # The earliest kickoff any observation gave: result polling starts once it
+    # has passed. Until a fixture is observed, the result's own kickoff.
+    kickoff = models.DateTimeField()
+    # Null only for a fixture known from a result alone, which is not part of
+    # the observed universe and is never polled.
+    first_observed_at = models.DateTimeField(null=True, blank=True)
+    last_observed_at = models.DateTimeField(null=True, blank=True)
+
+    result_state = models.CharField(
+        max_length=16, choices=STATE_CHOICES, default=STATE_PENDING,
+    )
+    # Identity of the result observation `result_state` was read from: the
+    # latest by (result_version, captured_at), as canonical_results() picks.
+    result_version = models.PositiveIntegerField(default=0)
+    result_captured_at = models.DateTimeField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Fixture Lifecycle'
+        indexes = [
+            models.Index(fields=['result_state', 'kickoff']),
+        ]
+
+    def __str__(self):
+        return f'{self.fixture_id} {self.result_state}'
+
+    @staticmethod
+    def state_of(result):
+        """The lifecycle state a result observation puts its fixture in."""
+        if result.provider_status in FixtureResultObservation.STATUS_VOIDLIKE:
+            return FixtureLifecycle.STATE_VOID
+        if result.is_final and result.confirmed:
+            return FixtureLifecycle.STATE_CONFIRMED
+        if result.is_final:
+            return FixtureLifecycle.STATE_PROVISIONAL
+        return FixtureLifecycle.STATE_PENDING
+
+    @classmethod
+    def note_observation(cls, fixture_id, kickoff, observed_at):
+        with db_transaction.atomic():
+            row, created = cls.objects.select_for_update().get_or_create(
+                fixture_id=fixture_id,
+                defaults={'kickoff': kickoff, 'first_observed_at': observed_at,
+                          'last_observed_at': observed_at},
+            )
+            if created:
+                return row
+            if row.first_observed_at is None:
+                row.kickoff = kickoff
+            else:
+                row.kickoff = min(row.kickoff, kickoff)
+            row.first_observed_at = min(filter(None, (row.first_observed_at, observed_at)))
+            row.last_observed_at = max(filter(None, (row.last_observed_at, observed_at)))
+            row.save(update_fields=['kickoff', 'first_observed_at',
+                                    'last_observed_at', 'updated_at'])
+        return row
+
+    @classmethod
+    def note_result(cls, result):
+        with db_transaction.atomic():
+            row, created = cls.objects.select_for_update().get_or_create(
+                fixture_id=result.fixture_id,
+                defaults={'kickoff': result.kickoff},
+            )
+            if not created and row.result_captured_at is not None and (
+                    (result.result_version, result.captured_at)
+                    < (row.result_version, row.result_captured_at)):
+                return row  # an older version arriving late changes nothing
+            row.result_state = cls.state_of(result)
+            row.result_version = result.result_version
+            row.result_captured_at = result.captured_at
+            row.save(update_fields=['result_state', 'result_version',
+                                    'result_captured_at', 'updated_at'])
+        return row
+
+
+@receiver(post_save, sender='core.SignalObservation')
+@receiver(post_save, sender='core.StrategyLabObservation')
+def _note_fixture_observed(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        FixtureLifecycle.note_observation(
+            instance.fixture_id, instance.kickoff, instance.observed_at)
+
+
+@receiver(post_save, sender=FixtureResultObservation)
+def _note_fixture_result(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        FixtureLifecycle.note_result(instance)
+
+
 class StrategyLabExperiment(models.Model):
     """One versioned, forward-only strategy tested outside public picks.
 
@@ -1956,7 +2441,7 @@ class StrategyLabObservation(models.Model):
     )
     source_signal = models.ForeignKey(
         SignalObservation, null=True, blank=True, on_delete=models.PROTECT,
-        related_name='strategy_lab_observations',
+        related_name='strategy_lab_observations', db_constraint=False,
         help_text='Exact immutable signal row that produced this candidate. '
                   'Null only for specialist candidates such as Asian Handicap.',
     )
@@ -2003,6 +2488,8 @@ class StrategyLabObservation(models.Model):
     calculation_version = models.CharField(max_length=80, blank=True, default='')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = EvidenceQuerySet.as_manager()
+
     class Meta:
         ordering = ['-observed_at']
         indexes = [
@@ -2041,11 +2528,11 @@ class StrategyLabSettlement(models.Model):
                                      editable=False)
     observation = models.ForeignKey(
         StrategyLabObservation, on_delete=models.PROTECT,
-        related_name='settlements',
+        related_name='settlements', db_constraint=False,
     )
     result = models.ForeignKey(
         FixtureResultObservation, on_delete=models.PROTECT,
-        related_name='strategy_lab_settlements',
+        related_name='strategy_lab_settlements', db_constraint=False,
     )
     result_version = models.PositiveIntegerField()
     home_score = models.IntegerField()
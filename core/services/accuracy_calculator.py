@@ -10,7 +10,7 @@ from typing import Dict, List
 from decimal import Decimal
 
 from core.models import PredictionLog
-from core.services import public_universe
+from core.services import performance_rollup, public_universe
 
 # Per-market confidence thresholds (ROI tuning E4, SHIP verdict).
 # See docs/audit/roi-tuning-2026-07-20.md — the 0.55-0.60 confidence bucket
@@ -134,15 +134,9 @@ class AccuracyCalculator:
     def get_accuracy_by_confidence(self) -> List[Dict]:
         """Accuracy by confidence band, over resolved verified claims."""
         claims = self._resolved_claims()
-        ranges = [
-            (0.70, 1.01, '70-100%', 'Very High'),
-            (0.65, 0.70, '65-70%', 'High'),
-            (0.60, 0.65, '60-65%', 'Medium-High'),
-            (0.55, 0.60, '55-60%', 'Medium'),
-        ]
 
         results = []
-        for min_conf, max_conf, label, category in ranges:
+        for min_conf, max_conf, label, category in performance_rollup.CONFIDENCE_BANDS:
             subset = [c for c in claims if min_conf <= (c.confidence or 0) < max_conf]
             if not subset:
                 continue
@@ -234,19 +228,19 @@ class AccuracyCalculator:
 
         # Public surface -> the verified claim universe, like every other metric.
         completed = [
-            c.prediction for c in public_universe.resolved_claims()
+            c for c in self._resolved_claims()
             if c.kickoff >= cutoff_date
         ]
-        completed.sort(key=lambda p: p.kickoff)
+        completed.sort(key=lambda c: c.kickoff)
         
         # Group by week
         results = []
         current_week_start = None
         week_data = {'correct': 0, 'total': 0, 'week_start': None}
         
-        for pred in completed:
+        for claim in completed:
             # Get week start (Monday)
-            week_start = pred.kickoff.date() - timedelta(days=pred.kickoff.weekday())
+            week_start = claim.kickoff.date() - timedelta(days=claim.kickoff.weekday())
             
             if current_week_start != week_start:
                 # Save previous week
@@ -263,7 +257,7 @@ class AccuracyCalculator:
                 }
             
             week_data['total'] += 1
-            if pred.was_correct:
+            if _claim_won(claim):
                 week_data['correct'] += 1
         
         # Add last week
@@ -286,3 +280,148 @@ class AccuracyCalculator:
             'timestamp': timezone.now().isoformat()
         }
 
+
+def _accuracy(wins, total):
+    return round(wins / total * 100, 1) if total else None
+
+
+class RollupAccuracyCalculator(AccuracyCalculator):
+    """
+    The public figures read from PerformanceRollup instead of the claim list.
+
+    Same methods and payloads as AccuracyCalculator, which stays the
+    full-recompute reference that check_performance_rollups compares against.
+    Rows are per kickoff day, so the rolling windows here start at midnight
+    UTC of the cutoff day rather than at the exact cutoff instant.
+    """
+
+    @staticmethod
+    def _resolved(rows):
+        """Grouped rollup rows that hold at least one WON/LOST claim."""
+        return [r for r in rows if r['wins'] + r['losses']]
+
+    def get_overall_accuracy(self) -> Dict:
+        summed = performance_rollup.totals()
+        total = summed['wins'] + summed['losses']
+        correct = summed['wins']
+
+        outcomes = {
+            r['predicted_outcome']: r for r in performance_rollup.totals('predicted_outcome')
+        }
+
+        def outcome_block(name):
+            row = outcomes.get(name, {'wins': 0, 'losses': 0})
+            n = row['wins'] + row['losses']
+            return {'total': n, 'correct': row['wins'], 'accuracy': _accuracy(row['wins'], n)}
+
+        markets = {
+            r['market_type']: r
+            for r in self._resolved(performance_rollup.totals('market_type'))
+        }
+        market_order = ('1x2', 'btts', 'over_under_2.5', 'double_chance')
+        market_keys = list(market_order)
+        market_keys.extend(sorted(m for m in markets if m and m not in market_order))
+        by_market = []
+        for market_type in market_keys:
+            row = markets.get(market_type, {'wins': 0, 'losses': 0})
+            n = row['wins'] + row['losses']
+            by_market.append({
+                'market_type': market_type,
+                'total': n,
+                'correct': row['wins'],
+                'accuracy': _accuracy(row['wins'], n),
+            })
+
+        return {
+            'overall': {
+                'total_predictions': total,
+                'correct_predictions': correct,
+                'incorrect_predictions': total - correct,
+                'accuracy_percent': _accuracy(correct, total) or 0,
+                'has_verified_results': total > 0,
+            },
+            'by_outcome': {
+                'home': outcome_block('Home'),
+                'draw': outcome_block('Draw'),
+                'away': outcome_block('Away'),
+            },
+            'by_market': by_market,
+        }
+
+    def get_accuracy_by_confidence(self) -> List[Dict]:
+        buckets = {
+            r['confidence_bucket']: r
+            for r in self._resolved(performance_rollup.totals('confidence_bucket'))
+        }
+        results = []
+        for _, _, label, category in performance_rollup.CONFIDENCE_BANDS:
+            row = buckets.get(label)
+            if row is None:
+                continue
+            n = row['wins'] + row['losses']
+            results.append({
+                'confidence_range': label,
+                'category': category,
+                'total': n,
+                'correct': row['wins'],
+                'accuracy': _accuracy(row['wins'], n),
+            })
+        return results
+
+    def get_accuracy_by_league(self) -> List[Dict]:
+        results = []
+        for row in self._resolved(performance_rollup.totals('league')):
+            n = row['wins'] + row['losses']
+            results.append({
+                'league': row['league'],
+                'total_predictions': n,
+                'correct_predictions': row['wins'],
+                'accuracy_percent': _accuracy(row['wins'], n),
+                'roi_percent': round(row['profit_units'] / n * 100, 1),
+            })
+        results.sort(key=lambda x: x['total_predictions'], reverse=True)
+        return results
+
+    def get_roi_simulation(self, stake_per_bet: float = 10.0) -> Dict:
+        summed = performance_rollup.totals()
+        wins, losses = summed['wins'], summed['losses']
+        total_bets = wins + losses
+        total_staked = total_bets * stake_per_bet
+        total_pl = summed['profit_units'] * stake_per_bet
+        roi = (total_pl / total_staked * 100) if total_staked > 0 else 0
+        return {
+            'total_bets': total_bets,
+            'total_staked': round(total_staked, 2),
+            'total_profit_loss': round(total_pl, 2),
+            'roi_percent': round(roi, 1),
+            'wins': wins,
+            'losses': losses,
+            'win_rate': round(wins / total_bets * 100, 1) if total_bets > 0 else 0,
+            'avg_profit_per_bet': round(total_pl / total_bets, 2) if total_bets > 0 else 0,
+            'stake_per_bet': stake_per_bet,
+            'has_verified_results': total_bets > 0,
+        }
+
+    def get_recent_accuracy(self, days: int = 7) -> Dict:
+        """Accuracy over claims kicking off in the last `days` days."""
+        since = (timezone.now() - timedelta(days=days)).date()
+        summed = performance_rollup.totals(since=since)
+        total = summed['wins'] + summed['losses']
+        return {'accuracy': _accuracy(summed['wins'], total) or 0, 'total': total}
+
+    def get_performance_over_time(self, days: int = 30) -> List[Dict]:
+        since = (timezone.now() - timedelta(days=days)).date()
+        weeks = {}
+        for row in self._resolved(performance_rollup.totals('day', since=since)):
+            week_start = row['day'] - timedelta(days=row['day'].weekday())
+            week = weeks.setdefault(week_start, {
+                'week_start': week_start.isoformat(), 'correct': 0, 'total': 0,
+            })
+            week['correct'] += row['wins']
+            week['total'] += row['wins'] + row['losses']
+        results = []
+        for week_start in sorted(weeks):
+            week = weeks[week_start]
+            week['accuracy'] = _accuracy(week['correct'], week['total'])
+            results.append(week)
+        return results
@@ -0,0 +1,341 @@
+"""
+Columnar engine for the backtest harness.
+
+`backtester.passes()` answers "would this one row be recommended?" — fine for a
+dozen hand-written baselines, far too slow for a parameter sweep where every
+config re-walks every row in Python. This module loads the settled universe
+once into NumPy arrays and evaluates a `FilterConfig` as a boolean mask, so a
+Cartesian grid of thousands of configs costs one pass of array arithmetic each.
+
+The scalar harness stays the specification. Every rule below mirrors a branch
+of `passes()` / `metrics()` and returns the same `Metrics` dataclass;
+`core.tests_backtest_engine` holds the parity test that keeps them aligned.
+
+Read-only on the DB, like the harness it accelerates.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from core.services.backtester import FilterConfig, Metrics
+
+
+# Columns pulled with `.values_list()` — no model instances are built.
+_COLUMNS = (
+    'confidence', 'expected_value', 'odds', 'odds_home', 'odds_draw',
+    'odds_away', 'market_type', 'predicted_outcome', 'league', 'kickoff',
+    'was_correct', 'profit_loss_10', 'roi_percent',
+)
+
+
+def _float(value) -> float:
+    return np.nan if value is None else float(value)
+
+
+def _codes(values: Sequence[str]):
+    """Dictionary-encode strings: (labels, int32 codes into labels)."""
+    labels: dict = {}
+    codes = np.fromiter(
+        (labels.setdefault(v, len(labels)) for v in values),
+        dtype=np.int32, count=len(values),
+    )
+    return list(labels), codes
+
+
+def _label_mask(labels: Sequence[str], codes: np.ndarray, wanted) -> np.ndarray:
+    """Rows whose label is in `wanted`, via a per-label lookup table."""
+    table = np.fromiter((lbl in wanted for lbl in labels), dtype=bool, count=len(labels))
+    return table[codes] if len(labels) else np.zeros(len(codes), dtype=bool)
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Universe
+# ────────────────────────────────────────────────────────────────────────────
+
+@dataclass
+class Universe:
+    """The settled-row universe as parallel arrays, in load order.
+
+    Units are normalised exactly as `passes()` normalises them per row:
+    confidence and EV are decimal, odds are back-filled from odds_home/draw/away
+    for legacy 1X2 rows. Missing values are NaN, which makes every NaN
+    comparison False — the same "None = skip this bound" semantics.
+    """
+
+    confidence: np.ndarray      # float64, decimal; None -> 0
+    ev: np.ndarray              # float64, decimal; None -> NaN
+    odds: np.ndarray            # float64; None -> NaN
+    settled: np.ndarray         # bool: was_correct is not None
+    correct: np.ndarray         # bool: was_correct is True
+    pl: np.ndarray              # float64: profit_loss_10 (None -> 0)
+    roi: np.ndarray             # float64: roi_percent (None -> NaN)
+    chrono: np.ndarray          # int64 permutation: stable kickoff order
+    markets: List[str]
+    market_codes: np.ndarray
+    leagues: List[str]
+    league_codes: np.ndarray
+    outcomes: List[str]         # lower-cased predicted_outcome labels
+    outcome_codes: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.confidence)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable) -> 'Universe':
+        """Build from PredictionLog instances (or anything with the same attrs)."""
+        return cls._build([tuple(getattr(r, c) for c in _COLUMNS) for r in rows])
+
+    @classmethod
+    def from_queryset(cls, qs) -> 'Universe':
+        """Build straight from a PredictionLog queryset via `.values_list()`."""
+        return cls._build(list(qs.values_list(*_COLUMNS)))
+
+    @classmethod
+    def _build(cls, records: List[tuple]) -> 'Universe':
+        n = len(records)
+        conf = np.empty(n)
+        ev = np.empty(n)
+        odds = np.empty(n)
+        settled = np.zeros(n, dtype=bool)
+        correct = np.zeros(n, dtype=bool)
+        pl = np.zeros(n)
+        roi = np.empty(n)
+        kickoff = np.empty(n)
+        markets, leagues, outcomes = [], [], []
+
+        for i, (c, e, o, oh, od, oa, market, pred, league, ko, wc, p, r) in enumerate(records):
+            c = c or 0
+            conf[i] = c / 100.0 if c > 1 else c
+            if e is not None and abs(e) > 1:
+                e = e / 100.0
+            ev[i] = _float(e)
+            market = market or '1x2'
+            pred = (pred or '').lower()
+            if not o and market == '1x2':
+                o = {'home': oh, 'draw': od, 'away': oa}.get(pred)
+            odds[i] = _float(o)
+            settled[i] = wc is not None
+            correct[i] = bool(wc)
+            pl[i] = p or 0
+            roi[i] = _float(r)
+            kickoff[i] = ko.timestamp() if ko else -np.inf
+            markets.append(market)
+            leagues.append(league or '')
+            outcomes.append(pred)
+
+        market_labels, market_codes = _codes(markets)
+        league_labels, league_codes = _codes(leagues)
+        outcome_labels, outcome_codes = _codes(outcomes)
+        return cls(
+            confidence=conf, ev=ev, odds=odds,
+            settled=settled, correct=correct, pl=pl, roi=roi,
+            chrono=np.argsort(kickoff, kind='stable'),
+            markets=market_labels, market_codes=market_codes,
+            leagues=league_labels, league_codes=league_codes,
+            outcomes=outcome_labels, outcome_codes=outcome_codes,
+        )
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Filter mask — one branch per rule in backtester.passes()
+# ────────────────────────────────────────────────────────────────────────────
+
+def mask(u: Universe, cfg: FilterConfig) -> np.ndarray:
+    """Boolean array: True where `passes(row, cfg)` would be True."""
+    conf, ev, odds = u.confidence, u.ev, u.odds
+    keep = np.ones(len(u), dtype=bool)
+
+    if cfg.market_types_allowed is not None:
+        keep &= _label_mask(u.markets, u.market_codes, set(cfg.market_types_allowed))
+
+    if cfg.drop_outcomes_substrings:
+        needles = [n.lower() for n in cfg.drop_outcomes_substrings]
+        dropped = {o for o in u.outcomes if any(n in o for n in needles)}
+        keep &= ~_label_mask(u.outcomes, u.outcome_codes, dropped)
+
+    if cfg.league_blacklist:
+        keep &= ~_label_mask(u.leagues, u.league_codes, set(cfg.league_blacklist))
+
+    for league, tier in cfg.league_tiers.items():
+        if not tier or league not in u.leagues:
+            continue
+        in_league = u.league_codes == u.leagues.index(league)
+        if 'min_confidence' in tier:
+            keep &= ~(in_league & (conf < tier['min_confidence']))
+        if 'min_ev' in tier:
+            # NaN EV fails a tier EV floor, exactly like `ev is None` does.
+            keep &= ~(in_league & ~(ev >= tier['min_ev']))
+
+    if cfg.league_watchlist and cfg.watchlist_min_confidence is not None:
+        watched = _label_mask(u.leagues, u.league_codes, set(cfg.league_watchlist))
+        keep &= ~(watched & (conf < cfg.watchlist_min_confidence))
+
+    if cfg.max_odds is not None:
+        keep &= ~(odds > cfg.max_odds)
+    if cfg.min_odds is not None:
+        keep &= ~(odds < cfg.min_odds)
+    if cfg.max_ev is not None:
+        keep &= ~(ev > cfg.max_ev)
+    if cfg.min_ev is not None:
+        keep &= ~(ev < cfg.min_ev)
+
+    has_value_track = cfg.value_min_confidence is not None and cfg.value_min_ev is not None
+    if cfg.safe_min_confidence is not None or has_value_track:
+        track = np.zeros(len(u), dtype=bool)
+        if cfg.safe_min_confidence is not None:
+            track |= conf >= cfg.safe_min_confidence
+        if has_value_track:
+            track |= (conf >= cfg.value_min_confidence) & (
+                np.nan_to_num(ev, nan=0.0) >= cfg.value_min_ev
+            )
+        keep &= track
+    elif cfg.min_confidence is not None:
+        keep &= conf >= cfg.min_confidence
+
+    return keep
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Metrics
+# ────────────────────────────────────────────────────────────────────────────
+
+def _longest_run(flags: np.ndarray) -> int:
+    """Length of the longest run of True in a 1-D bool array."""
+    if not flags.any():
+        return 0
+    padded = np.concatenate(([False], flags, [False])).astype(np.int8)
+    edges = np.flatnonzero(np.diff(padded))
+    return int((edges[1::2] - edges[0::2]).max())
+
+
+def metrics(u: Universe, keep: np.ndarray) -> Metrics:
+    """`backtester.metrics()` over the rows selected by `keep`."""
+    n_kept = int(keep.sum())
+    settled = keep & u.settled
+    n_settled = int(settled.sum())
+
+    if not n_settled:
+        return Metrics(
+            n_total=len(u), n_kept=n_kept, n_settled=0,
+            correct=0, accuracy=None, total_pl=0.0,
+            yield_percent=None, avg_roi=None, brier=None,
+            longest_win_streak=0, longest_loss_streak=0, max_drawdown=0.0,
+        )
+
+    won = u.correct[settled]
+    correct = int(won.sum())
+    total_pl = float(u.pl[settled].sum())
+    rois = u.roi[settled]
+    rois = rois[~np.isnan(rois)]
+    brier = float(np.mean((u.confidence[settled] - won) ** 2))
+
+    order = u.chrono[settled[u.chrono]]
+    chrono_won = u.correct[order]
+    cumulative = np.cumsum(u.pl[order])
+    peak = np.maximum(np.maximum.accumulate(cumulative), 0.0)
+    max_dd = min(0.0, float((cumulative - peak).min()))
+
+    return Metrics(
+        n_total=len(u), n_kept=n_kept, n_settled=n_settled,
+        correct=correct, accuracy=correct / n_settled * 100,
+        total_pl=total_pl,
+        yield_percent=total_pl / (n_settled * 10) * 100,
+        avg_roi=float(rois.mean()) if len(rois) else None,
+        brier=brier,
+        longest_win_streak=_longest_run(chrono_won),
+        longest_loss_streak=_longest_run(~chrono_won),
+        max_drawdown=max_dd,
+    )
+
+
+def evaluate(u: Universe, cfg: FilterConfig) -> tuple[Metrics, np.ndarray]:
+    """Columnar `backtester.evaluate()`: (metrics_on_kept, kept row indices)."""
+    keep = mask(u, cfg)
+    return metrics(u, keep), np.flatnonzero(keep)
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Grid sweeps
+# ────────────────────────────────────────────────────────────────────────────
+
+def _axis_label(value, index: int) -> str:
+    if value is None:
+        return 'none'
+    if isinstance(value, float):
+        return f'{value:g}'
+    if isinstance(value, (int, str)):
+        return str(value)
+    # dicts / lists (league tiers, blacklists) — refer to them by position.
+    return f'#{index}'
+
+
+def grid(base: FilterConfig, **axes: Sequence) -> List[FilterConfig]:
+    """Cartesian product of `axes` applied on top of `base`.
+
+        grid(CURRENT_PROD, min_ev=[0.05, 0.10], max_odds=[2.0, 2.5, None])
+
+    yields six configs named e.g. `current_prod[min_ev=0.05,max_odds=none]`.
+    Axis names must be `FilterConfig` fields.
+    """
+    unknown = [k for k in axes if k not in FilterConfig.__dataclass_fields__]
+    if unknown:
+        raise ValueError(f'Unknown FilterConfig field(s): {unknown}')
+    names = list(axes)
+    configs = []
+    for combo in itertools.product(*(list(enumerate(axes[k])) for k in names)):
+        label = ','.join(
+            f'{k}={_axis_label(v, i)}' for k, (i, v) in zip(names, combo)
+        )
+        configs.append(replace(
+            base, name=f'{base.name}[{label}]',
+            **{k: v for k, (_, v) in zip(names, combo)},
+        ))
+    return configs
+
+
+# Worker-process state: the universe is shipped once per worker, not per config.
+_worker_universe: Optional[Universe] = None
+
+
+def _init_worker(u: Universe) -> None:
+    global _worker_universe
+    _worker_universe = u
+
+
+def _evaluate_chunk(configs: List[FilterConfig]) -> List[Metrics]:
+    return [metrics(_worker_universe, mask(_worker_universe, cfg)) for cfg in configs]
+
+
+def sweep(
+    u: Universe,
+    configs: Sequence[FilterConfig],
+    *,
+    workers: int = 1,
+) -> List[tuple]:
+    """Evaluate every config, return [(cfg, Metrics)] in input order.
+
+    `workers > 1` splits the configs into contiguous chunks across a process
+    pool. Each worker receives the universe once via the pool initializer.
+    `workers=0` means one per CPU.
+    """
+    configs = list(configs)
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(configs))
+    if workers <= 1:
+        return [(cfg, metrics(u, mask(u, cfg))) for cfg in configs]
+
+    size = -(-len(configs) // workers)
+    chunks = [configs[i:i + size] for i in range(0, len(configs), size)]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(u,),
+    ) as pool:
+        results = [m for chunk in pool.map(_evaluate_chunk, chunks) for m in chunk]
+    return list(zip(configs, results))
@@ -0,0 +1,190 @@
+"""
+Vectorized bootstrap confidence intervals, fixture-clustered when asked.
+
+Every interval this project quotes — strategy lab ROI gates, shadow-variant
+comparisons, calibration audits, the docs/audit scripts — comes from here, so
+they all share one resampling rule and one seed convention.
+
+Resamples are drawn as an index matrix in one NumPy call rather than one
+Python draw at a time, which puts a 10,000-iteration interval in the
+millisecond range. Large problems are split into fixed-size blocks, each with
+its own child seed; blocks can be spread across a process pool and the result
+does not depend on how many workers ran it.
+
+THE RESAMPLING UNIT
+-------------------
+Pass `clusters` (one fixture id per value) whenever several values share a
+scoreline. A draw then takes a whole fixture with all its rows. Row-level
+resampling would treat four markets off one match as four independent trials
+and shrink every interval by roughly half.
+
+Pure NumPy, no Django: the standalone audit scripts import it directly.
+"""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence, Union
+
+import numpy as np
+
+DEFAULT_ITERATIONS = 10_000
+DEFAULT_SEED = 42
+
+# Upper bound on index/weight cells materialised per block (~64 MB of int64).
+# Below it a whole run is ONE block drawn from `default_rng(seed)` — the exact
+# stream the audit scripts used before this module existed, so their published
+# numbers reproduce unchanged. That holds only while n_iter * n fits, i.e. up to
+# n = 800 at 10,000 iterations. Larger runs are drawn in child-seeded blocks:
+# the same interval up to Monte Carlo noise, not the same digits.
+MAX_BLOCK_CELLS = 8_000_000
+
+Statistic = Union[str, Callable[..., np.ndarray]]
+
+
+@dataclass(frozen=True)
+class BootstrapInterval:
+    point: float        # statistic on the observed sample
+    lo: float
+    median: float       # median of the bootstrap distribution
+    hi: float
+    n: int              # observations
+    clusters: int       # resampling units (== n when unclustered)
+    iterations: int
+    level: float        # per-interval coverage after any family-wise correction
+
+    def as_list(self, digits: int = 4) -> list:
+        return [round(self.lo, digits), round(self.hi, digits)]
+
+
+def familywise_alpha(alpha: float = 0.05, family_size: int = 1,
+                     method: str = 'bonferroni') -> float:
+    """Per-interval alpha that keeps the family-wise error rate at `alpha`."""
+    if family_size < 1:
+        raise ValueError('family_size must be >= 1')
+    if method == 'bonferroni':
+        return alpha / family_size
+    if method == 'sidak':
+        return 1 - (1 - alpha) ** (1 / family_size)
+    raise ValueError(f'Unknown family-wise correction {method!r}')
+
+
+def index_matrix(n_units: int, n_iter: int, *, seed=DEFAULT_SEED) -> np.ndarray:
+    """(n_iter, n_units) matrix of resampled unit indices, drawn in one call."""
+    return np.random.default_rng(seed).integers(0, n_units, size=(n_iter, n_units))
+
+
+def weighted_mean(weights: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Mean of `values` under each row of resample multiplicities."""
+    return (weights @ values) / weights.sum(axis=1)
+
+
+def _block_seeds(n_iter: int, rows_per_block: int, seed):
+    """[(rows, seed)] — one block seeded by `seed` itself when it all fits."""
+    if n_iter <= rows_per_block:
+        return [(n_iter, seed)]
+    blocks = math.ceil(n_iter / rows_per_block)
+    children = np.random.SeedSequence(seed).spawn(blocks)
+    sizes = [rows_per_block] * (blocks - 1) + [n_iter - rows_per_block * (blocks - 1)]
+    return list(zip(sizes, children))
+
+
+def _multiplicities(idx: np.ndarray, n_units: int) -> np.ndarray:
+    """Count matrix: how often each unit appears in each resample row."""
+    rows = idx.shape[0]
+    offsets = (np.arange(rows)[:, None] * n_units + idx).ravel()
+    return np.bincount(offsets, minlength=rows * n_units).reshape(rows, n_units)
+
+
+def _run_block(task) -> np.ndarray:
+    rows, seed, arrays, codes, n_units, statistic = task
+    idx = index_matrix(n_units, rows, seed=seed)
+    values = arrays[0]
+    if statistic == 'mean':
+        if codes is None:
+            return values[idx].mean(axis=1)
+        sums = np.bincount(codes, weights=values, minlength=n_units)
+        counts = np.bincount(codes, minlength=n_units)
+        return sums[idx].sum(axis=1) / counts[idx].sum(axis=1)
+    weights = _multiplicities(idx, n_units)
+    if codes is not None:
+        weights = weights[:, codes]
+    return np.asarray(statistic(weights, *arrays), dtype=float)
+
+
+def bootstrap_samples(
+    *arrays,
+    statistic: Statistic = 'mean',
+    clusters: Optional[Sequence] = None,
+    n_iter: int = DEFAULT_ITERATIONS,
+    seed=DEFAULT_SEED,
+    workers: int = 1,
+) -> np.ndarray:
+    """The bootstrap distribution of `statistic`, shape (n_iter,).
+
+    `statistic` is 'mean' (of the first array) or a callable
+    `statistic(weights, *arrays) -> (rows,)`, where `weights` is a
+    (rows, n) matrix of how often each observation appears in each resample.
+    Callables must be module-level functions when `workers > 1`.
+    """
+    arrays = tuple(np.asarray(a, dtype=float) for a in arrays)
+    n = len(arrays[0])
+    if clusters is None:
+        codes, n_units = None, n
+    else:
+        _, codes = np.unique(np.asarray(clusters), return_inverse=True)
+        n_units = int(codes.max()) + 1 if n else 0
+
+    rows_per_block = max(1, MAX_BLOCK_CELLS // max(n, 1))
+    tasks = [
+        (rows, block_seed, arrays, codes, n_units, statistic)
+        for rows, block_seed in _block_seeds(n_iter, rows_per_block, seed)
+    ]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            parts = list(pool.map(_run_block, tasks))
+    else:
+        parts = [_run_block(task) for task in tasks]
+    return np.concatenate(parts)
+
+
+def bootstrap_ci(
+    *arrays,
+    statistic: Statistic = 'mean',
+    clusters: Optional[Sequence] = None,
+    n_iter: int = DEFAULT_ITERATIONS,
+    seed=DEFAULT_SEED,
+    alpha: float = 0.05,
+    family_size: int = 1,
+    correction: str = 'bonferroni',
+    workers: int = 1,
+) -> BootstrapInterval:
+    """Percentile interval for `statistic`; NaN throughout for empty input.
+
+    `family_size > 1` widens each interval so that `family_size` of them
+    jointly hold at `1 - alpha` (Bonferroni by default, or 'sidak').
+    """
+    arrays = tuple(np.asarray(a, dtype=float) for a in arrays)
+    n = len(arrays[0])
+    per_alpha = familywise_alpha(alpha, family_size, correction)
+    n_clusters = n if clusters is None else len(set(np.asarray(clusters).tolist()))
+    if n == 0:
+        nan = float('nan')
+        return BootstrapInterval(nan, nan, nan, nan, 0, 0, n_iter, 1 - per_alpha)
+
+    if statistic == 'mean':
+        point = float(arrays[0].mean())
+    else:
+        point = float(statistic(np.ones((1, n)), *arrays)[0])
+    samples = bootstrap_samples(
+        *arrays, statistic=statistic, clusters=clusters,
+        n_iter=n_iter, seed=seed, workers=workers,
+    )
+    tail = per_alpha / 2 * 100
+    lo, median, hi = np.percentile(samples, [tail, 50, 100 - tail])
+    return BootstrapInterval(
+        point=point, lo=float(lo), median=float(median), hi=float(hi),
+        n=n, clusters=n_clusters, iterations=n_iter, level=1 - per_alpha,
+    )
@@ -0,0 +1,82 @@
+"""
+Chunked, optionally parallel passes over a table for maintenance commands.
+
+Reclassification and recomputation commands touch every PredictionLog row.
+Saving row by row costs one transaction per row; this walks the table in
+primary-key order, hands each chunk to the command to compute in memory and
+write back with one `bulk_update`, and can split the key space across worker
+threads. It decides nothing about the rows themselves.
+"""
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection, connections
+from django.db.models import Max, Min
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def id_ranges(queryset, parts):
+    """Split the queryset's primary-key span into `parts` half-open ranges."""
+    bounds = queryset.aggregate(lo=Min('pk'), hi=Max('pk'))
+    lo, hi = bounds['lo'], bounds['hi']
+    if lo is None:
+        return []
+    hi += 1
+    parts = max(1, min(parts, hi - lo))
+    step = -(-(hi - lo) // parts)
+    return [(start, min(start + step, hi)) for start in range(lo, hi, step)]
+
+
+def _walk(queryset, lo, hi, handle_chunk, chunk_size):
+    stats = Counter()
+    last = lo - 1
+    while True:
+        chunk = list(
+            queryset.filter(pk__gt=last, pk__lt=hi).order_by('pk')[:chunk_size]
+        )
+        if not chunk:
+            return stats
+        stats.update(handle_chunk(chunk))
+        last = chunk[-1].pk
+
+
+def _walk_in_worker(*args):
+    try:
+        return _walk(*args)
+    finally:
+        # Each worker thread opened its own connection; don't leave it behind.
+        connections.close_all()
+
+
+def process_in_chunks(queryset, handle_chunk, chunk_size=DEFAULT_CHUNK_SIZE, workers=1):
+    """Run `handle_chunk(rows)` over every row; return (merged stats, seconds).
+
+    `handle_chunk` gets a list of up to `chunk_size` instances in key order and
+    returns a Counter (or mapping) of whatever it wants tallied. With
+    `workers` > 1 the key space is split into that many ranges, each walked
+    by its own thread on its own connection — on SQLite, which serialises
+    writers anyway, a single worker is used.
+    """
+    if connection.vendor == 'sqlite':
+        workers = 1
+    started = time.perf_counter()
+    ranges = id_ranges(queryset, workers)
+    stats = Counter()
+    if len(ranges) <= 1:
+        for lo, hi in ranges:
+            stats.update(_walk(queryset, lo, hi, handle_chunk, chunk_size))
+    else:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [pool.submit(_walk_in_worker, queryset, lo, hi, handle_chunk, chunk_size)
+                       for lo, hi in ranges]
+            for future in futures:
+                stats.update(future.result())
+    return stats, time.perf_counter() - started
+
+
+def throughput(rows, seconds):
+    """One human line: '1234 rows in 2.1s (588 rows/s)'."""
+    rate = rows / seconds if seconds > 0 else float(rows)
+    return f'{rows} rows in {seconds:.1f}s ({rate:,.0f} rows/s)'
@@ -10,7 +10,7 @@ import math
 from collections import Counter, defaultdict
 
 from core.models import FixtureResultObservation, SignalObservation
-from core.services import market_outcomes
+from core.services import market_grading
 
 
 EVALUATION_HORIZON_HOURS = 1.0
@@ -59,13 +59,14 @@ def _valid_vector(market, vector):
     return {outcome: (p / total) * expected_sum for outcome, p in parsed.items()}
 
 
-def _latest_results(fixture_ids):
+def _latest_results(fixture_ids, kickoffs=()):
     """Return the latest result version, including provisional corrections."""
     latest = {}
     if not fixture_ids:
         return latest
     rows = (
         FixtureResultObservation.objects
+        .covering(kickoffs)
         .filter(fixture_id__in=fixture_ids)
         .order_by('fixture_id', '-result_version', '-captured_at')
     )
@@ -74,6 +75,31 @@ def _latest_results(fixture_ids):
     return latest
 
 
+def _scored(decision, actual_vector):
+    """Outcome, correctness and calibration losses against the truth vector."""
+    vector = decision['probabilities']
+    predicted_outcome = decision['predicted_outcome']
+    if decision['market'] == 'double_chance':
+        winners = [outcome for outcome, won in actual_vector.items() if won]
+        # The three legs are dependent marginals, not one multiclass
+        # probability distribution. Keep them visible in the archive but out
+        # of Brier/log-loss calibration summaries.
+        return {
+            'actual_outcome': ' + '.join(winners),
+            'correct': bool(actual_vector[predicted_outcome]),
+        }
+    actual_outcome = max(actual_vector, key=actual_vector.get)
+    return {
+        'actual_outcome': actual_outcome,
+        'correct': predicted_outcome == actual_outcome,
+        'brier_score': sum(
+            (vector[outcome] - actual_vector[outcome]) ** 2
+            for outcome in MARKET_OUTCOMES[decision['market']]
+        ),
+        'log_loss': -math.log(max(vector[actual_outcome], 1e-12)),
+    }
+
+
 def collect_decisions(horizon_hours=EVALUATION_HORIZON_HOURS):
     """Choose one reproducible probability vector per fixture and market.
 
@@ -84,12 +110,12 @@ def collect_decisions(horizon_hours=EVALUATION_HORIZON_HOURS):
     rows = list(
         SignalObservation.objects
         .filter(market__in=SUPPORTED_MARKETS)
+        .select_related('vector')
         .only(
             'observation_id', 'fixture_id', 'home_team', 'away_team', 'league',
             'league_id', 'kickoff', 'observed_at', 'hours_to_kickoff', 'market',
-            'provider', 'provider_model_version', 'raw_vector', 'vector_complete',
-            'market_price_vector', 'price_vector_complete', 'pipeline_version',
-            'calculation_version',
+            'provider', 'provider_model_version', 'vector', 'vector_complete',
+            'price_vector_complete', 'pipeline_version', 'calculation_version',
         )
         .order_by('fixture_id', 'market', 'hours_to_kickoff', '-observed_at')
     )
@@ -115,8 +141,10 @@ def collect_decisions(horizon_hours=EVALUATION_HORIZON_HOURS):
         if key not in candidates:
             candidates[key] = (row, vector)
 
-    results = _latest_results({fixture_id for fixture_id, _ in universe})
+    results = _latest_results({fixture_id for fixture_id, _ in universe},
+                              [row.kickoff for row in rows])
     decisions = []
+    to_grade = []
     exclusion_counts = Counter()
 
     for key in sorted(universe):
@@ -154,31 +182,9 @@ def collect_decisions(horizon_hours=EVALUATION_HORIZON_HOURS):
             else:
                 state = 'evaluated'
 
-        actual_vector = None
-        actual_outcome = None
-        brier = log_loss = None
         predicted_outcome = max(vector, key=vector.get)
-        correct = None
         if state == 'evaluated':
-            actual_vector = market_outcomes.outcome_vector(
-                row.market, result.home_score, result.away_score,
-            )
-            if row.market == 'double_chance':
-                winners = [outcome for outcome, won in actual_vector.items() if won]
-                actual_outcome = ' + '.join(winners)
-                correct = bool(actual_vector[predicted_outcome])
-                # The three legs are dependent marginals, not one multiclass
-                # probability distribution. Keep them visible in the archive
-                # but out of Brier/log-loss calibration summaries.
-            else:
-                actual_outcome = max(actual_vector, key=actual_vector.get)
-                brier = sum(
-                    (vector[outcome] - actual_vector[outcome]) ** 2
-                    for outcome in MARKET_OUTCOMES[row.market]
-                )
-                true_probability = max(vector[actual_outcome], 1e-12)
-                log_loss = -math.log(true_probability)
-                correct = predicted_outcome == actual_outcome
+            to_grade.append((len(decisions), row.market, result.home_score, result.away_score))
 
         decisions.append({
             'fixture_id': row.fixture_id,
@@ -199,16 +205,25 @@ def collect_decisions(horizon_hours=EVALUATION_HORIZON_HOURS):
             'calculation_version': row.calculation_version,
             'probabilities': vector,
             'predicted_outcome': predicted_outcome,
-            'actual_outcome': actual_outcome,
-            'correct': correct,
-            'brier_score': brier,
-            'log_loss': log_loss,
+            'actual_outcome': None,
+            'correct': None,
+            'brier_score': None,
+            'log_loss': None,
             'price_vector': row.market_price_vector,
             'price_vector_complete': row.price_vector_complete,
             'state': state,
             'result': result_payload,
         })
 
+    # Every evaluated decision's truth vector in one batch.
+    truths = market_grading.outcome_vectors(
+        [market for _, market, _, _ in to_grade],
+        [home for _, _, home, _ in to_grade],
+        [away for _, _, _, away in to_grade],
+    )
+    for (index, _, _, _), actual_vector in zip(to_grade, truths):
+        decisions[index].update(_scored(decisions[index], actual_vector))
+
     decisions.sort(key=lambda row: (row['kickoff'], row['fixture_id'], row['market']), reverse=True)
     return decisions, {
         'fixture_market_universe': len(universe),
@@ -16,11 +16,12 @@ import os
 from datetime import timedelta
 from datetime import timezone as dt_timezone
 
+from django.core.cache import cache
 from django.db import IntegrityError, transaction
 from django.utils import timezone
 
 from core.models import PredictionLog, PublishedClaim, PublishedClaimResult
-from core.services import public_universe
+from core.services import performance_rollup, public_universe, scheduler_health
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +134,44 @@ def check_snapshot_publication_eligibility(snapshot, now=None):
     return problems
 
 
+# ── Cached integrity status ─────────────────────────────────────────────────
+# Rehashing every candidate is the dominant cost of rendering the staff queue,
+# and a snapshot never changes once written. The queue therefore reads a cached
+# verdict keyed on (snapshot_id, stored hash): an edit that rewrites the hash
+# misses the cache at once, and any other raw edit is caught within the TTL.
+# The queue is advisory only — publish_prediction_claim always rehashes.
+INTEGRITY_CACHE_SECONDS = 15 * 60
+
+
+def _integrity_key(snapshot):
+    return f'snapshot-integrity:{snapshot.snapshot_id}:{snapshot.snapshot_hash}'
+
+
+def integrity_verified(snapshot):
+    """`snapshot.verify_integrity()`, cached for listing views. Not a gate."""
+    return integrity_verdicts([snapshot])[snapshot.snapshot_id]
+
+
+def integrity_verdicts(snapshots):
+    """integrity_verified for a page of snapshots: {snapshot_id: verdict}.
+
+    One cache read and at most one cache write for the whole page, so a
+    database-backed cache costs two queries rather than one per row.
+    """
+    keys = {snapshot.snapshot_id: _integrity_key(snapshot) for snapshot in snapshots}
+    cached = cache.get_many(keys.values())
+    verdicts, missed = {}, {}
+    for snapshot in snapshots:
+        key = keys[snapshot.snapshot_id]
+        if key in cached:
+            verdicts[snapshot.snapshot_id] = cached[key]
+        else:
+            verdicts[snapshot.snapshot_id] = missed[key] = snapshot.verify_integrity()
+    if missed:
+        cache.set_many(missed, timeout=INTEGRITY_CACHE_SECONDS)
+    return verdicts
+
+
 def price_age_hours_at_publication(claim):
     """How old the recorded price was when the claim was published.
 
@@ -359,6 +398,8 @@ def settle_published_claim(claim, status=None, now=None):
         result_reference=f'fixture:{prediction.fixture_id}:{prediction.match_status or ""}',
     )
     result.save()
+    performance_rollup.record(claim, status)
+    scheduler_health.report(claims_settled=1)
     # Drop the reverse one-to-one cache so the caller's in-memory claim sees the
     # new settlement immediately (Django caches the "no result" lookup).
     claim._state.fields_cache.pop('result', None)
@@ -0,0 +1,62 @@
+"""
+Load an exported evidence table as a DataFrame, without Django.
+
+`source` is either a directory written by `manage.py export_analysis_parquet`
+or a SQLite snapshot built the way docs/audit/README.md describes. Parquet is
+memory-mapped and only the requested columns (and months) are read; the types
+come from the export, so no per-column coercion is needed. A SQLite snapshot is
+read as before, every column as stored.
+
+The audit scripts take either:
+
+    df = evidence_frames.read_table(args.snapshot, 'prediction_log')
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+from typing import Iterable, Optional
+
+import pandas as pd
+
+PARTITION_COLUMN = 'month'
+
+
+def is_export(source: str) -> bool:
+    return os.path.isdir(source)
+
+
+def read_table(source: str, table: str,
+               columns: Optional[Iterable[str]] = None,
+               months: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """`table` from `source`, optionally narrowed to `columns` and to the
+    'YYYY-MM' `months` it was partitioned by (ignored for SQLite and for the
+    unpartitioned prediction_log)."""
+    columns = list(columns) if columns is not None else None
+    if is_export(source):
+        return _read_parquet(os.path.join(source, table), columns, months)
+    return _read_sqlite(source, table, columns)
+
+
+def _read_parquet(path: str, columns, months) -> pd.DataFrame:
+    if not os.path.isdir(path):
+        raise FileNotFoundError(f'no exported table at {path}')
+    partitioned = any(name.startswith(f'{PARTITION_COLUMN}=') for name in os.listdir(path))
+    filters = None
+    if partitioned and months is not None:
+        filters = [(PARTITION_COLUMN, 'in', sorted(months))]
+    frame = pd.read_parquet(path, engine='pyarrow', columns=columns,
+                            filters=filters, memory_map=True)
+    if partitioned and PARTITION_COLUMN in frame and (
+            columns is None or PARTITION_COLUMN not in columns):
+        frame = frame.drop(columns=PARTITION_COLUMN)
+    return frame
+
+
+def _read_sqlite(path: str, table: str, columns) -> pd.DataFrame:
+    selected = '*' if columns is None else ', '.join(f'"{c}"' for c in columns)
+    conn = sqlite3.connect(path)
+    try:
+        return pd.read_sql_query(f'SELECT {selected} FROM "{table}"', conn)
+    finally:
+        conn.close()
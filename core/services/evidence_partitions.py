@@ -0,0 +1,313 @@
+"""
+Monthly kickoff partitions for the append-only evidence tables (PostgreSQL).
+
+SignalObservation, FixtureContextObservation, StrategyLabObservation and
+FixtureResultObservation only ever grow — thousands of rows per hourly sweep —
+while their readers look at bounded kickoff windows. On PostgreSQL each table
+is range-partitioned by `kickoff` month, so a query with a kickoff predicate
+reads only the months it names and old months can be detached without a bulk
+DELETE. SQLite (tests, local runs) keeps ordinary tables: everything here
+reports "not partitioned" there and does nothing.
+
+What partitioning changes at the database level
+-----------------------------------------------
+PostgreSQL requires every unique constraint on a partitioned table to include
+the partition key. So the primary key becomes (id, kickoff) and
+`source_payload_hash` is unique per (hash, kickoff). The capture code already
+checks for an existing hash before inserting, across all partitions, which is
+what keeps a hash globally unique. Foreign keys INTO these tables cannot be
+enforced either and are declared `db_constraint=False`. The rows they point at
+are append-only and never deleted.
+
+Layout
+------
+    <table>             partitioned parent, PARTITION BY RANGE (kickoff)
+    <table>_p2026_08    one partition per kickoff month, [first day, next first day)
+    <table>_pdefault    anything outside the created months
+
+Creating a month moves any rows that reached the default partition first, so
+months can be created late without failing. Detaching a month keeps it as an
+ordinary table under the same name, still readable with SQL. Re-attaching it
+makes it visible through the ORM again for an audit.
+
+Because those foreign keys are not enforced, nothing in the database stops a
+month from being detached while rows that stay attached still point into it
+(a lab observation's source signal, a settlement's result, a correction's
+superseded result). `detach_plan` keeps such months attached and says why.
+"""
+from datetime import datetime, timezone as dt_timezone
+
+from django.apps import apps
+from django.db import connection, transaction
+from django.db.models import Q
+
+PARTITIONED_MODELS = (
+    'core.SignalObservation',
+    'core.FixtureContextObservation',
+    'core.StrategyLabObservation',
+    'core.FixtureResultObservation',
+)
+PARTITION_KEY = 'kickoff'
+
+#: Months created ahead of the current one by default.
+DEFAULT_MONTHS_AHEAD = 3
+
+
+def evidence_models():
+    return [apps.get_model(label) for label in PARTITIONED_MODELS]
+
+
+def month_start(value):
+    """First instant (UTC) of the month containing `value`."""
+    value = value.astimezone(dt_timezone.utc) if value.tzinfo else value
+    return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=dt_timezone.utc)
+
+
+def months_between(first, last):
+    """Month starts from the month of `first` through the month of `last`."""
+    month, end = month_start(first), month_start(last)
+    months = []
+    while month <= end:
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+def parse_month(text):
+    """'2026-08' -> the first instant of August 2026, UTC."""
+    year, month = text.split('-')
+    return datetime(int(year), int(month), 1, tzinfo=dt_timezone.utc)
+
+
+def partition_name(table, month):
+    return f'{table}_p{month.year:04d}_{month.month:02d}'
+
+
+def default_partition_name(table):
+    return f'{table}_pdefault'
+
+
+def month_of(table, name):
+    """The month a partition name stands for, or None (e.g. the default)."""
+    prefix = f'{table}_p'
+    if not name.startswith(prefix):
+        return None
+    try:
+        year, month = name[len(prefix):].split('_')
+        return datetime(int(year), int(month), 1, tzinfo=dt_timezone.utc)
+    except ValueError:
+        return None
+
+
+def supported(using=connection):
+    return using.vendor == 'postgresql'
+
+
+def _quote(name):
+    return connection.ops.quote_name(name)
+
+
+def _literal(moment):
+    # DDL takes no bind parameters; the bounds are datetimes we built ourselves.
+    return "'" + moment.isoformat() + "'"
+
+
+def is_partitioned(model):
+    if not supported():
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)',
+            [model._meta.db_table],
+        )
+        return cursor.fetchone() is not None
+
+
+def attached_months(model):
+    """Months with an attached partition, oldest first."""
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid '
+            'WHERE i.inhparent = to_regclass(%s)',
+            [table],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    return sorted(filter(None, (month_of(table, name) for name in names)))
+
+
+def detached_months(model):
+    """Months whose partition was detached and still exists as a table."""
+    table = model._meta.db_table
+    attached = set(attached_months(model))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relname FROM pg_class WHERE relkind = 'r' AND relname LIKE %s",
+            [table.replace('_', r'\_') + r'\_p%'],
+        )
+        months = {month_of(table, row[0]) for row in cursor.fetchall()}
+    return sorted(m for m in months if m is not None and m not in attached)
+
+
+def months_to_create(existing, today, months_ahead):
+    """Missing months from the current one through `months_ahead` later."""
+    wanted = months_between(today, add_months(month_start(today), months_ahead))
+    have = set(existing)
+    return [month for month in wanted if month not in have]
+
+
+def create_month(model, month):
+    """Create and attach one month, moving its rows out of the default partition."""
+    table = model._meta.db_table
+    name = partition_name(table, month)
+    lower, upper = _literal(month), _literal(add_months(month, 1))
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TABLE {_quote(name)} (LIKE {_quote(table)} '
+            f'INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        )
+        cursor.execute(
+            f'WITH moved AS (DELETE FROM {_quote(default_partition_name(table))} '
+            f'WHERE {PARTITION_KEY} >= {lower} AND {PARTITION_KEY} < {upper} RETURNING *) '
+            f'INSERT INTO {_quote(name)} SELECT * FROM moved'
+        )
+        cursor.execute(
+            f'ALTER TABLE {_quote(table)} ATTACH PARTITION {_quote(name)} '
+            f'FOR VALUES FROM ({lower}) TO ({upper})'
+        )
+
+
+def detach_month(model, month):
+    """Detach one month. The table stays, readable by SQL, until someone drops it."""
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'ALTER TABLE {_quote(table)} DETACH PARTITION '
+            f'{_quote(partition_name(table, month))}'
+        )
+
+
+def attach_month(model, month):
+    """Re-attach a previously detached month, e.g. for an audit."""
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'ALTER TABLE {_quote(table)} ATTACH PARTITION '
+            f'{_quote(partition_name(table, month))} FOR VALUES FROM '
+            f'({_literal(month)}) TO ({_literal(add_months(month, 1))})'
+        )
+
+
+def _references(model):
+    """Relations into `model` that the database does not enforce."""
+    return [rel for rel in model._meta.related_objects
+            if not rel.many_to_many and not rel.field.db_constraint]
+
+
+def _in_month(month, prefix=''):
+    return Q(**{f'{prefix}{PARTITION_KEY}__gte': month,
+                f'{prefix}{PARTITION_KEY}__lt': add_months(month, 1)})
+
+
+def live_references(model, month, leaving=None):
+    """Rows that stay attached but point into `model`'s `month`, per relation.
+
+    `leaving` maps evidence models to the months detached along with this one;
+    a reference held by a row in one of those months leaves with it.
+    """
+    leaving = leaving or {}
+    found = {}
+    for rel in _references(model):
+        rows = rel.related_model._default_manager.filter(
+            _in_month(month, prefix=f'{rel.field.name}__'))
+        for gone in leaving.get(rel.related_model, ()):
+            rows = rows.exclude(_in_month(gone))
+        count = rows.count()
+        if count:
+            found[f'{rel.related_model._meta.label}.{rel.field.name}'] = count
+    return found
+
+
+def detach_plan(attached, before):
+    """Which attached months before `before` can be detached safely.
+
+    `attached` maps each evidence model to its attached months. Returns
+    (plan, kept): the months to detach per model, and for every month kept
+    attached the references that hold it. Keeping one month keeps its rows,
+    so the months they point into are checked again until nothing changes.
+    """
+    plan = {model: [month for month in months if month < before]
+            for model, months in attached.items()}
+    kept = {}
+    changed = True
+    while changed:
+        changed = False
+        for model, months in plan.items():
+            for month in list(months):
+                references = live_references(model, month, plan)
+                if references:
+                    months.remove(month)
+                    kept[(model, month)] = references
+                    changed = True
+    return plan, kept
+
+
+def convert_to_partitioned(schema_editor, model, today, months_ahead=DEFAULT_MONTHS_AHEAD):
+    """Rebuild `model`'s table as a partitioned one holding the same rows.
+
+    Used once, by the migration that introduces partitioning. The table is
+    renamed aside, a partitioned parent is created with the same columns, the
+    months spanning the existing kickoffs (plus `months_ahead`) and a default
+    partition are created, the rows are copied, the old table is dropped, and
+    the model's indexes and outgoing foreign keys are recreated on the parent.
+    """
+    table = model._meta.db_table
+    legacy = f'{table}_unpartitioned'
+    pk = model._meta.pk.column
+    execute = schema_editor.execute
+
+    execute(f'ALTER TABLE {_quote(table)} RENAME TO {_quote(legacy)}')
+    execute(
+        f'CREATE TABLE {_quote(table)} (LIKE {_quote(legacy)} INCLUDING DEFAULTS '
+        f'INCLUDING STORAGE INCLUDING COMMENTS) PARTITION BY RANGE ({PARTITION_KEY})'
+    )
+    execute(f'ALTER TABLE {_quote(table)} ADD PRIMARY KEY ({_quote(pk)}, {PARTITION_KEY})')
+    for field in model._meta.local_fields:
+        if field.unique and not field.primary_key:
+            execute(
+                f'ALTER TABLE {_quote(table)} ADD CONSTRAINT '
+                f'{_quote(f"{table}_{field.column}_{PARTITION_KEY}_uniq")} '
+                f'UNIQUE ({_quote(field.column)}, {PARTITION_KEY})'
+            )
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'SELECT MIN({PARTITION_KEY}), MAX({PARTITION_KEY}) FROM {_quote(legacy)}')
+        first, last = cursor.fetchone()
+    first = min(filter(None, [first, today]))
+    last = max(filter(None, [last, add_months(month_start(today), months_ahead)]))
+    for month in months_between(first, last):
+        execute(
+            f'CREATE TABLE {_quote(partition_name(table, month))} PARTITION OF '
+            f'{_quote(table)} FOR VALUES FROM ({_literal(month)}) '
+            f'TO ({_literal(add_months(month, 1))})'
+        )
+    execute(
+        f'CREATE TABLE {_quote(default_partition_name(table))} '
+        f'PARTITION OF {_quote(table)} DEFAULT'
+    )
+
+    execute(f'INSERT INTO {_quote(table)} SELECT * FROM {_quote(legacy)}')
+    execute(f'DROP TABLE {_quote(legacy)}')
+
+    # Index names are schema-wide, so only now that the old table (and its
+    # indexes) are gone can the model's own indexes be created on the parent.
+    for statement in schema_editor._model_indexes_sql(model):
+        execute(statement)
+    for field in model._meta.local_fields:
+        if field.remote_field and field.db_constraint:
+            execute(schema_editor._create_fk_sql(model, field, '_fk_%(to_table)s_%(to_column)s'))
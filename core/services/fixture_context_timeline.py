@@ -1,6 +1,7 @@
 """Public, read-only timeline built from append-only pre-match evidence."""
 
-from collections import defaultdict
+from django.core.cache import cache
+from django.db.models import Count, Max, Value
 
 from core.models import FixtureContextObservation, SignalObservation
 
@@ -56,11 +57,15 @@ def _current(row):
     }
 
 
-def _context_events(rows):
+def _context_events(rows, previous=None):
+    """Events for `rows`, diffed from `previous` — the last row already seen."""
     if not rows:
         return []
-    events = [_event(rows[0], 'context_capture_started', 'availability')]
-    for previous, current in zip(rows, rows[1:]):
+    events = []
+    if previous is None:
+        events.append(_event(rows[0], 'context_capture_started', 'availability'))
+        previous, rows = rows[0], rows[1:]
+    for current in rows:
         if previous.fixture_predictable != current.fixture_predictable:
             events.append(_event(current, 'predictability_changed', 'context', {
                 'from': previous.fixture_predictable,
@@ -103,75 +108,188 @@ def _context_events(rows):
                 'from': previous.neutral_venue,
                 'to': current.neutral_venue,
             }))
+        previous = current
     return events
 
 
-def _signal_events(rows):
-    by_market = defaultdict(list)
-    for row in rows:
-        by_market[row.market].append(row)
+def _signal_events(rows, last_by_market, events_by_market):
+    """Append each market's events for `rows`, diffing from `last_by_market`.
 
-    events = []
-    for market, market_rows in by_market.items():
-        for previous, current in zip(market_rows, market_rows[1:]):
-            base = {'market': market}
-            if previous.outcome != current.outcome:
-                events.append(_event(current, 'model_leader_changed', 'model', {
-                    **base,
-                    'from': previous.outcome,
-                    'to': current.outcome,
-                    'probability': current.normalized_probability,
-                }))
-            elif abs(previous.normalized_probability - current.normalized_probability) >= 0.005:
-                events.append(_event(current, 'model_probability_changed', 'model', {
-                    **base,
-                    'outcome': current.outcome,
-                    'from': previous.normalized_probability,
-                    'to': current.normalized_probability,
-                }))
-
-            old_odds = previous.odds if previous.price_status == 'verified' else None
-            new_odds = current.odds if current.price_status == 'verified' else None
-            if old_odds != new_odds and (
-                old_odds is None or new_odds is None or abs(old_odds - new_odds) >= 0.01
-            ):
-                events.append(_event(current, 'verified_price_changed', 'price', {
-                    **base,
-                    'outcome': current.outcome,
-                    'from': old_odds,
-                    'to': new_odds,
-                    'bookmaker': current.bookmaker or None,
-                }))
-    return events
+    Both dicts are updated in place and keep markets in first-appearance order,
+    so the same rows fed all at once or in appended batches give the same
+    events in the same order.
+    """
+    for current in rows:
+        market = current.market
+        market_events = events_by_market.setdefault(market, [])
+        previous = last_by_market.get(market)
+        last_by_market[market] = current
+        if previous is None:
+            continue
+
+        base = {'market': market}
+        if previous.outcome != current.outcome:
+            market_events.append(_event(current, 'model_leader_changed', 'model', {
+                **base,
+                'from': previous.outcome,
+                'to': current.outcome,
+                'probability': current.normalized_probability,
+            }))
+        elif abs(previous.normalized_probability - current.normalized_probability) >= 0.005:
+            market_events.append(_event(current, 'model_probability_changed', 'model', {
+                **base,
+                'outcome': current.outcome,
+                'from': previous.normalized_probability,
+                'to': current.normalized_probability,
+            }))
 
+        old_odds = previous.odds if previous.price_status == 'verified' else None
+        new_odds = current.odds if current.price_status == 'verified' else None
+        if old_odds != new_odds and (
+            old_odds is None or new_odds is None or abs(old_odds - new_odds) >= 0.01
+        ):
+            market_events.append(_event(current, 'verified_price_changed', 'price', {
+                **base,
+                'outcome': current.outcome,
+                'from': old_odds,
+                'to': new_odds,
+                'bookmaker': current.bookmaker or None,
+            }))
 
-def build_timeline(fixture_id):
-    contexts = list(
-        FixtureContextObservation.objects
-        .filter(fixture_id=fixture_id, hours_to_kickoff__gte=0)
-        .order_by('observed_at', 'created_at')
+
+# ── Cached timeline state ────────────────────────────────────────────────────
+# Both sources are append-only, so a built timeline stays right until a row is
+# appended. The cache holds the state behind the timeline, stamped with the
+# newest created_at and row count of each source; one aggregate query decides
+# whether it is still current. When it is not, only the appended rows are read
+# and diffed onto the cached state — unless one of them sorts before a row
+# already seen, or the counts do not add up, in which case it is rebuilt.
+CACHE_SECONDS = 6 * 60 * 60
+
+
+def _cache_key(fixture_id):
+    return f'fixture-context-timeline:{fixture_id}'
+
+
+def _contexts(fixture_id, kickoffs=()):
+    return FixtureContextObservation.objects.covering(kickoffs).filter(
+        fixture_id=fixture_id, hours_to_kickoff__gte=0,
     )
-    selected_signals = list(
-        SignalObservation.objects
-        .filter(
-            fixture_id=fixture_id,
-            hours_to_kickoff__gte=0,
-            is_selected_outcome=True,
-        )
-        .order_by('observed_at', 'created_at')
+
+
+def _selected_signals(fixture_id, kickoffs=()):
+    return SignalObservation.objects.covering(kickoffs).filter(
+        fixture_id=fixture_id, hours_to_kickoff__gte=0, is_selected_outcome=True,
     )
 
-    events = _context_events(contexts) + _signal_events(selected_signals)
+
+def _stamp(fixture_id, kickoffs=()):
+    """(context latest, context rows, signal latest, signal rows), one query."""
+    def summary(queryset, source):
+        return (
+            queryset.order_by().values('fixture_id')
+            .annotate(source=Value(source), latest=Max('created_at'), rows=Count('pk'))
+            .values_list('source', 'latest', 'rows')
+        )
+
+    found = {
+        source: (latest, rows)
+        for source, latest, rows in summary(_contexts(fixture_id, kickoffs), 'context').union(
+            summary(_selected_signals(fixture_id, kickoffs), 'signal'), all=True)
+    }
+    return (*found.get('context', (None, 0)), *found.get('signal', (None, 0)))
+
+
+def _order(row):
+    return (row.observed_at, row.created_at)
+
+
+def _empty_state():
+    return {
+        'stamp': (None, 0, None, 0),
+        'first_context': None,
+        'last_context': None,
+        'last_signal': None,
+        'last_signal_by_market': {},
+        'context_events': [],
+        'signal_events': {},
+        'kickoffs': (),
+    }
+
+
+def _append(state, contexts, signals):
+    """Fold rows appended since `state` was built into it. False if they can't be."""
+    for rows, last in ((contexts, state['last_context']), (signals, state['last_signal'])):
+        if rows and last is not None and _order(rows[0]) < _order(last):
+            return False
+
+    state['context_events'] += _context_events(contexts, state['last_context'])
+    _signal_events(signals, state['last_signal_by_market'], state['signal_events'])
+
+    context_latest, context_rows, signal_latest, signal_rows = state['stamp']
+    if contexts:
+        state['first_context'] = state['first_context'] or contexts[0]
+        state['last_context'] = contexts[-1]
+        context_latest = max(filter(None, [context_latest, *(r.created_at for r in contexts)]))
+    if signals:
+        state['last_signal'] = signals[-1]
+        signal_latest = max(filter(None, [signal_latest, *(r.created_at for r in signals)]))
+    state['stamp'] = (context_latest, context_rows + len(contexts),
+                      signal_latest, signal_rows + len(signals))
+    return True
+
+
+def _since(queryset, latest):
+    if latest is not None:
+        queryset = queryset.filter(created_at__gt=latest)
+    return list(queryset.order_by('observed_at', 'created_at'))
+
+
+def _timeline_state(fixture_id):
+    # A cached timeline knows its fixture's kickoff, so the check and the
+    # appended-row reads skip every earlier kickoff month. Only a rebuild
+    # reads the fixture across all of them.
+    state = cache.get(_cache_key(fixture_id))
+    kickoffs = state.get('kickoffs', ()) if state is not None else ()
+    stamp = _stamp(fixture_id, kickoffs)
+    if state is not None and state['stamp'] == stamp:
+        return state
+
+    if state is not None:
+        contexts = _since(_contexts(fixture_id, kickoffs), state['stamp'][0])
+        signals = _since(_selected_signals(fixture_id, kickoffs), state['stamp'][2])
+        expected = (stamp[1] - state['stamp'][1], stamp[3] - state['stamp'][3])
+        if (len(contexts), len(signals)) != expected or not _append(state, contexts, signals):
+            state = None
+
+    if state is None:
+        state = _empty_state()
+        contexts = _since(_contexts(fixture_id), None)
+        signals = _since(_selected_signals(fixture_id), None)
+        _append(state, contexts, signals)
+        earliest = min((row.kickoff for row in (*contexts, *signals)), default=None)
+        state['kickoffs'] = (earliest,) if earliest else ()
+
+    cache.set(_cache_key(fixture_id), state, timeout=CACHE_SECONDS)
+    return state
+
+
+def build_timeline(fixture_id):
+    state = _timeline_state(fixture_id)
+    events = state['context_events'] + [
+        event for market_events in state['signal_events'].values() for event in market_events
+    ]
     events.sort(key=lambda row: row['observed_at'] or '', reverse=True)
-    latest = contexts[-1] if contexts else None
+    first = state['first_context']
+    latest = state['last_context']
 
     return {
         'fixture_id': fixture_id,
         'source': 'append_only_pre_match_observations',
         'methodology_version': 'fixture-context-v1',
-        'snapshot_count': len(contexts),
-        'signal_snapshot_count': len(selected_signals),
-        'first_observed_at': _iso(contexts[0].observed_at) if contexts else None,
+        'snapshot_count': state['stamp'][1],
+        'signal_snapshot_count': state['stamp'][3],
+        'first_observed_at': _iso(first.observed_at) if first else None,
         'last_observed_at': _iso(latest.observed_at) if latest else None,
         'current': _current(latest),
         'events': events[:MAX_EVENTS],
@@ -0,0 +1,227 @@
+"""
+Local search index of upcoming fixtures, behind /api/search/.
+
+Search used to make a live SportMonks request per keystroke (200 fixtures over
+14 days, predictions included) and substring-match team names in Python: a
+provider request and up to 10 seconds of a sync worker per search. The
+scheduler now refreshes FixtureSearchEntry from the same sweep once per cycle,
+and a search is an indexed lookup on a few hundred rows.
+
+Matching runs on `search_text`: team names, every TEAM_ALIASES spelling of
+them and the league name, all normalized (lower case, accents and punctuation
+removed). A normalized query matches as a substring, so 'spurs' finds
+Tottenham Hotspur and 'atletico' finds Atlético Madrid; on PostgreSQL the
+pg_trgm index from migration 0051 serves that match. A trigram word-similarity
+match is added there for misspellings ('tottenam'). It is a computed score, so
+it filters the few hundred indexed rows rather than using the index.
+
+The live provider call remains only as a cold-start fallback: when no refresh
+has landed within STALE_AFTER, the view sweeps once and seeds the index from
+that response.
+"""
+import re
+import unicodedata
+from datetime import timedelta, timezone as dt_timezone
+
+import requests
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.models import FixtureSearchEntry
+from core.services import provider_http
+from odds.team_aliases import TEAM_ALIASES
+
+BASE_URL = 'https://api.sportmonks.com/v3/football'
+REQUEST_TIMEOUT = 10
+HORIZON_DAYS = 14
+SUPPORTED_LEAGUES = [8, 9, 24, 27, 72, 82, 181, 208, 244, 271, 301, 384, 387,
+                     390, 444, 453, 462, 486, 501, 564, 567, 570, 573, 591, 600,
+                     609, 1371]
+PREDICTION_TYPE_IDS = (233, 237, 238)
+MAX_PAGES = 10
+
+# The scheduler refreshes hourly; three missed cycles means it is not running.
+STALE_AFTER = timedelta(hours=3)
+# pg_trgm word_similarity above which a misspelled query still matches.
+TRIGRAM_THRESHOLD = 0.4
+
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+
+def normalize(text):
+    """Lower case ASCII words separated by single spaces."""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    ascii_text = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_WORD.sub(' ', ascii_text.lower()).strip()
+
+
+def _alias_index():
+    """normalized name -> every normalized spelling TEAM_ALIASES links to it."""
+    linked = {}
+    for name, alias in TEAM_ALIASES.items():
+        name, alias = normalize(name), normalize(alias)
+        linked.setdefault(name, set()).add(alias)
+        linked.setdefault(alias, set()).add(name)
+    return linked
+
+
+def search_text(home_team, away_team, league, aliases=None):
+    aliases = _alias_index() if aliases is None else aliases
+    terms = []
+    for name in (home_team, away_team):
+        name = normalize(name)
+        terms.append(name)
+        terms.extend(sorted(aliases.get(name, ())))
+    terms.append(normalize(league))
+    return ' '.join(dict.fromkeys(t for t in terms if t))
+
+
+def _sweep_request(api_token, now, page):
+    """(url, params) for one page of the upcoming-fixtures sweep."""
+    start = now.strftime('%Y-%m-%d')
+    end = (now + timedelta(days=HORIZON_DAYS)).strftime('%Y-%m-%d')
+    return f'{BASE_URL}/fixtures/between/{start}/{end}', {
+        'api_token': api_token,
+        'include': 'participants;league;predictions',
+        'filters': f'fixtureLeagues:{",".join(map(str, SUPPORTED_LEAGUES))}',
+        'per_page': '200',
+        'page': str(page),
+    }
+
+
+def _has_more(body):
+    return bool((body.get('pagination') or {}).get('has_more'))
+
+
+def fetch_upcoming(api_token, now=None):
+    """The provider's supported-league fixtures for the next HORIZON_DAYS.
+
+    Follows pagination, so a busy fortnight is indexed whole. A refresh
+    removes whatever the sweep did not return.
+    """
+    now = now or timezone.now()
+    fixtures = []
+    for page in range(1, MAX_PAGES + 1):
+        url, params = _sweep_request(api_token, now, page)
+        response = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        body = response.json()
+        fixtures.extend(body.get('data') or [])
+        if not _has_more(body):
+            break
+    return fixtures
+
+
+async def fetch_upcoming_async(api_token, now=None):
+    """fetch_upcoming for the async search view; raises provider_http errors."""
+    now = now or timezone.now()
+    fixtures = []
+    for page in range(1, MAX_PAGES + 1):
+        url, params = _sweep_request(api_token, now, page)
+        body = await provider_http.get_json(url, params=params, timeout=REQUEST_TIMEOUT)
+        fixtures.extend(body.get('data') or [])
+        if not _has_more(body):
+            break
+    return fixtures
+
+
+def _entry_fields(fixture, aliases):
+    participants = fixture.get('participants') or []
+    home = next((p for p in participants
+                 if (p.get('meta') or {}).get('location') == 'home'), None)
+    away = next((p for p in participants
+                 if (p.get('meta') or {}).get('location') == 'away'), None)
+    kickoff = fixture.get('starting_at')
+    kickoff = parse_datetime(kickoff.replace(' ', 'T')) if isinstance(kickoff, str) else None
+    if not fixture.get('id') or not home or not away or kickoff is None:
+        return None
+    if timezone.is_naive(kickoff):
+        kickoff = timezone.make_aware(kickoff, dt_timezone.utc)
+
+    league = fixture.get('league') or {}
+    home_team = (home.get('name') or '')[:100]
+    away_team = (away.get('name') or '')[:100]
+    league_name = (league.get('name') or '')[:100]
+    return {
+        'home_team': home_team,
+        'away_team': away_team,
+        'league': league_name,
+        'league_id': league.get('id'),
+        'kickoff': kickoff,
+        'has_predictions': any(p.get('type_id') in PREDICTION_TYPE_IDS
+                               for p in fixture.get('predictions') or []),
+        'search_text': search_text(home_team, away_team, league_name, aliases),
+    }
+
+
+@transaction.atomic
+def refresh(fixtures, now=None):
+    """Replace the index with `fixtures` (one provider sweep).
+
+    Fixtures already indexed are updated in place, and fixtures that have
+    kicked off or dropped out of the sweep are removed. A sweep with no usable
+    fixture (a provider outage answering 200 with no data) leaves the index as
+    it is; it goes cold after STALE_AFTER like any missed refresh. Returns
+    {'indexed': n, 'removed': n}.
+    """
+    now = now or timezone.now()
+    aliases = _alias_index()
+    incoming = {}
+    for fixture in fixtures:
+        fields = _entry_fields(fixture, aliases)
+        if fields is not None:
+            incoming[fixture['id']] = FixtureSearchEntry(
+                fixture_id=fixture['id'], indexed_at=now, **fields)
+    if not incoming:
+        return {'indexed': 0, 'removed': 0}
+
+    removed, _ = FixtureSearchEntry.objects.exclude(
+        fixture_id__in=list(incoming)).delete()
+    FixtureSearchEntry.objects.bulk_create(
+        incoming.values(), batch_size=500,
+        update_conflicts=True, unique_fields=['fixture_id'],
+        update_fields=['home_team', 'away_team', 'league', 'league_id',
+                       'kickoff', 'has_predictions', 'search_text', 'indexed_at'],
+    )
+    return {'indexed': len(incoming), 'removed': removed}
+
+
+def is_warm(now=None):
+    """Whether a refresh has landed recently enough to answer from the index."""
+    now = now or timezone.now()
+    return FixtureSearchEntry.objects.filter(indexed_at__gte=now - STALE_AFTER).exists()
+
+
+def search(query, league_filter='', limit=20, now=None):
+    """Upcoming indexed fixtures matching `query`, soonest first."""
+    now = now or timezone.now()
+    needle = normalize(query)
+    if not needle:
+        return []
+
+    rows = FixtureSearchEntry.objects.filter(kickoff__gte=now)
+    if league_filter:
+        rows = rows.filter(league_id=int(league_filter)) if league_filter.isdigit() \
+            else rows.filter(league__icontains=league_filter)
+
+    match = Q(search_text__contains=needle)
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.search import TrigramWordSimilarity
+
+        rows = rows.annotate(similarity=TrigramWordSimilarity(needle, 'search_text'))
+        match |= Q(similarity__gte=TRIGRAM_THRESHOLD)
+
+    return [
+        {
+            'fixture_id': entry.fixture_id,
+            'home_team': entry.home_team,
+            'away_team': entry.away_team,
+            'league': entry.league,
+            'kickoff': entry.kickoff.isoformat(),
+            'has_predictions': entry.has_predictions,
+            'has_odds': False,
+        }
+        for entry in rows.filter(match).order_by('kickoff', 'fixture_id')[:limit]
+    ]
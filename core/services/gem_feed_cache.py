@@ -1,11 +1,16 @@
 """Persistence boundary for the latest successful Gem scan."""
 
+import gzip
+import hashlib
+import json
 from datetime import timezone as dt_timezone
 
 from django.db import transaction
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 
+from rest_framework.utils.encoders import JSONEncoder
+
 from core.models import GemFeedCache
 
 
@@ -49,8 +54,66 @@ def store(payload, *, now=None):
             'recommendation_count': len(recommendations),
         },
     )
+    return precompress(cache)
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        # Optional: without it the endpoint negotiates gzip or identity.
+        return None
+    return brotli
+
+
+def response_body(cache):
+    """The internal endpoint's JSON for this row, as the frontend reads it.
+
+    age_seconds is not part of it: it changes every second, and the frontend
+    derives it from generated_at.
+    """
+    return json.dumps({
+        'available': True,
+        'generated_at': cache.generated_at,
+        'refreshed_at': cache.refreshed_at,
+        'recommendation_count': cache.recommendation_count,
+        'ranking_version': cache.ranking_version,
+        'feed': cache.payload,
+    }, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def precompress(cache):
+    """Store the serialized, compressed and hashed response on the row."""
+    body = response_body(cache)
+    brotli = _brotli()
+    encoded = {
+        'body': body,
+        # mtime=0 keeps the bytes a pure function of the body.
+        'body_gzip': gzip.compress(body, compresslevel=9, mtime=0),
+        'body_br': brotli.compress(body) if brotli else None,
+        'etag': '"%s"' % hashlib.sha256(body).hexdigest(),
+    }
+    GemFeedCache.objects.filter(pk=cache.pk).update(**encoded)
+    for field, value in encoded.items():
+        setattr(cache, field, value)
     return cache
 
 
 def latest():
     return GemFeedCache.objects.filter(key=GemFeedCache.CACHE_KEY).first()
+
+
+def current_etag():
+    """The stored ETag: None before the first scan, '' if not yet encoded."""
+    return (
+        GemFeedCache.objects.filter(key=GemFeedCache.CACHE_KEY)
+        .values_list('etag', flat=True).first()
+    )
+
+
+def encoded(*columns):
+    """(etag, *columns) read together, so the bytes match the ETag sent."""
+    return (
+        GemFeedCache.objects.filter(key=GemFeedCache.CACHE_KEY)
+        .values_list('etag', *columns).first()
+    )
@@ -0,0 +1,238 @@
+"""
+Vectorized market grading: arrays of bets in, result flags and unit P/L out.
+
+The scalar graders (market_evaluation.evaluate_prediction, market_outcomes,
+strategy_lab.unit_profit / total_unit_profit) decode the market and side
+strings and branch on every call. Settlement and calibration grade thousands
+of rows per sweep, so this module grades a whole batch in a handful of NumPy
+operations; strings are decoded once per distinct value, not once per row.
+
+Every market is reduced to the same shape: two equal half-stake legs, each
+graded by the sign of an adjusted margin. A whole or half line has both legs
+on the same line; a quarter line splits the stake across the two neighbouring
+lines, exactly as strategy_lab settles Asian handicaps and goal lines. Fixed-
+outcome markets (1X2, BTTS, double chance) are a margin of +1 or -1 on both legs.
+
+Over/under markets named 'over_under_<line>' are graded as totals on that line.
+Every such market registered today is on a half line, where this is identical
+to the scalar over-or-under comparison; a whole line would push here.
+
+Rows this module cannot grade — unsupported market, unknown side, missing
+score, odds or line — come back with graded False and profit NaN, so a caller
+can fall back to the scalar path for them.
+
+Pure NumPy, no Django.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+# Same values as StrategyLabSettlement.OUTCOME_*.
+FULL_WIN = 'full_win'
+HALF_WIN = 'half_win'
+PUSH = 'push'
+HALF_LOSS = 'half_loss'
+FULL_LOSS = 'full_loss'
+
+# Outcome names per fixed-outcome market, matching SignalObservation and
+# market_outcomes.outcome_vector.
+OUTCOME_NAMES = {
+    '1x2': ('home', 'draw', 'away'),
+    'btts': ('yes', 'no'),
+    'over_under_2.5': ('over', 'under'),
+    'double_chance': ('1x', 'x2', '12'),
+}
+
+_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class Grades:
+    profit: np.ndarray      # unit P/L on a one-unit stake; NaN where not graded
+    graded: np.ndarray
+    won: np.ndarray
+    half_won: np.ndarray
+    push: np.ndarray
+    half_lost: np.ndarray
+    lost: np.ndarray
+
+    def outcomes(self) -> np.ndarray:
+        """Settlement outcome per row, None where not graded."""
+        return np.select(
+            [self.won, self.half_won, self.push, self.half_lost, self.lost],
+            [FULL_WIN, HALF_WIN, PUSH, HALF_LOSS, FULL_LOSS],
+            default=None,
+        )
+
+
+# Market families. Each row's market string is decoded to one of these once
+# per distinct string, and everything after that is integer arithmetic.
+_UNSUPPORTED, _RESULT, _BTTS, _DOUBLE, _HANDICAP, _TOTAL, _TEAM_TOTAL = range(7)
+
+_FAMILY = {
+    '1x2': _RESULT,
+    'btts': _BTTS,
+    'double_chance': _DOUBLE,
+    'asian_handicap': _HANDICAP,
+    'asian_goal_line': _TOTAL,
+    'team_total_goals': _TEAM_TOTAL,
+}
+_RESULT_SIDES = {'home': 1, 'draw': 0, 'away': -1}
+_DOUBLE_SIDES = {'1x': 0, 'x2': 1, '12': 2}
+_TEAM_TOTAL_SIDES = {'home_over', 'home_under', 'away_over', 'away_under'}
+_UNKNOWN = 9
+
+
+def _codes(values: Sequence) -> tuple[np.ndarray, list]:
+    """Integer code per row and the distinct values, in first-seen order."""
+    distinct = list(dict.fromkeys(values))
+    index = {value: code for code, value in enumerate(distinct)}
+    codes = np.fromiter(map(index.__getitem__, values), dtype=np.intp, count=len(values))
+    return codes, distinct
+
+
+def _decoded(codes: np.ndarray, distinct: list, decode, dtype) -> np.ndarray:
+    return np.array([decode(value) for value in distinct], dtype=dtype)[codes]
+
+
+def _market(name) -> tuple[int, float]:
+    """(family, line) for a market name; the line only for 'over_under_<line>'."""
+    name = str(name or '')
+    if name.startswith('over_under_'):
+        try:
+            return _TOTAL, float(name.rsplit('_', 1)[1])
+        except ValueError:
+            return _UNSUPPORTED, np.nan
+    return _FAMILY.get(name, _UNSUPPORTED), np.nan
+
+
+def _side(name) -> tuple[int, int, int, int, int]:
+    """(result, btts, double chance, over/under, team) codes for one side."""
+    side = str(name or '').lower()
+    direction = side.rsplit('_', 1)[-1]
+    return (
+        _RESULT_SIDES.get(side, _UNKNOWN),
+        {'yes': 1, 'no': 0}.get(side, _UNKNOWN),
+        _DOUBLE_SIDES.get(side, _UNKNOWN),
+        {'over': 1, 'under': -1}.get(direction, _UNKNOWN),
+        {'home': 0, 'away': 1}.get(side.split('_', 1)[0], _UNKNOWN)
+        if side in _TEAM_TOTAL_SIDES else _UNKNOWN,
+    )
+
+
+def _legs(line: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    quarter = np.round(line * 4) / 4
+    doubled = np.abs(quarter * 2)
+    split = np.abs(doubled - np.round(doubled)) >= _TOLERANCE
+    return quarter - .25 * split, quarter + .25 * split
+
+
+def grade(markets: Sequence, sides: Sequence, lines: Sequence, odds: Sequence,
+          home_scores: Sequence, away_scores: Sequence) -> Grades:
+    """Grade one bet per row. `lines` may hold None for fixed-outcome markets."""
+    market_codes, distinct_markets = _codes(markets)
+    decoded = _decoded(market_codes, distinct_markets, _market, 'i8,f8')
+    family, market_line = decoded['f0'], decoded['f1']
+    side_codes, distinct_sides = _codes(sides)
+    decoded = _decoded(side_codes, distinct_sides, _side, 'i8,i8,i8,i8,i8')
+    side_result, side_yes, side_double, direction, team = (
+        decoded[field] for field in ('f0', 'f1', 'f2', 'f3', 'f4'))
+
+    line = np.array(lines, dtype=float)
+    line = np.where(np.isnan(market_line), line, market_line)
+    price = np.array(odds, dtype=float)
+    home = np.array(home_scores, dtype=float)
+    away = np.array(away_scores, dtype=float)
+    difference = home - away
+    result = np.sign(difference)
+
+    # Fixed-outcome markets: did the selection happen?
+    is_result, is_btts, is_double = (family == _RESULT), (family == _BTTS), (family == _DOUBLE)
+    fixed_known = (
+        (is_result & (side_result != _UNKNOWN))
+        | (is_btts & (side_yes != _UNKNOWN))
+        | (is_double & (side_double != _UNKNOWN))
+    )
+    fixed_won = np.select(
+        [is_result, is_btts, side_double == 0, side_double == 1, side_double == 2],
+        [side_result == result, (side_yes == 1) == ((home > 0) & (away > 0)),
+         result >= 0, result <= 0, result != 0],
+        default=False,
+    )
+
+    # Line markets: the margin each leg is graded on.
+    is_handicap = family == _HANDICAP
+    is_total = (family == _TOTAL) | (family == _TEAM_TOTAL)
+    goals = np.select([family == _TOTAL, team == 0, team == 1], [home + away, home, away],
+                      default=np.nan)
+    line_known = np.isfinite(line) & (
+        (is_handicap & np.isin(side_result, (1, -1)))
+        | ((family == _TOTAL) & (direction != _UNKNOWN))
+        | ((family == _TEAM_TOTAL) & (team != _UNKNOWN))
+    )
+    leg_low, leg_high = _legs(np.where(line_known, line, 0.0))
+    handicap_margin = np.where(side_result == -1, -difference, difference)
+    fixed_margin = np.where(fixed_won, 1.0, -1.0)
+
+    def margin(leg):
+        return np.select(
+            [is_handicap, is_total],
+            [handicap_margin + leg, direction * (goals - leg)],
+            default=fixed_margin,
+        )
+
+    graded = (
+        (fixed_known | line_known)
+        & np.isfinite(home) & np.isfinite(away) & np.isfinite(price)
+    )
+    with np.errstate(invalid='ignore'):
+        leg_profits = [
+            np.where(m > 0, price - 1, np.where(m < 0, -1.0, 0.0))
+            for m in (margin(leg_low), margin(leg_high))
+        ]
+        profit = np.where(graded, (leg_profits[0] + leg_profits[1]) / 2, np.nan)
+        won = graded & np.isclose(profit, price - 1, rtol=0, atol=_TOLERANCE)
+        half_won = graded & ~won & (profit > 0)
+        push = graded & ~won & ~half_won & np.isclose(profit, 0, rtol=0, atol=_TOLERANCE)
+        half_lost = graded & ~won & ~half_won & ~push & (profit > -1)
+    lost = graded & ~won & ~half_won & ~push & ~half_lost
+    return Grades(profit, graded, won, half_won, push, half_lost, lost)
+
+
+def outcome_vectors(markets: Sequence, home_scores: Sequence,
+                    away_scores: Sequence) -> list[dict]:
+    """Batch market_outcomes.outcome_vector: one truth dict per row.
+
+    Same contract: ValueError on an unsupported market or on a score that is
+    not a pair of non-negative integers.
+    """
+    for value in (*home_scores, *away_scores):
+        if value is None or isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f'score must be an integer, got {value!r}')
+        if value < 0:
+            raise ValueError(f'score cannot be negative, got {value!r}')
+    names = []
+    for market in markets:
+        if market not in OUTCOME_NAMES:
+            raise ValueError(f'unsupported market {market!r}')
+        names.append(OUTCOME_NAMES[market])
+
+    counts = [len(row) for row in names]
+    grades = grade(
+        np.repeat(np.asarray(markets, dtype=str), counts),
+        [name for row in names for name in row],
+        [None] * sum(counts),
+        [2.0] * sum(counts),
+        np.repeat(np.asarray(home_scores, dtype=int), counts),
+        np.repeat(np.asarray(away_scores, dtype=int), counts),
+    )
+    won = grades.won.astype(int).tolist()
+    vectors, start = [], 0
+    for row in names:
+        vectors.append(dict(zip(row, won[start:start + len(row)])))
+        start += len(row)
+    return vectors
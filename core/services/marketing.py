@@ -3,8 +3,11 @@ import os
 from urllib.parse import quote
 
 import requests
+from asgiref.sync import sync_to_async
 from django.utils import timezone
 
+from core.services import provider_http
+
 logger = logging.getLogger(__name__)
 BREVO_API_BASE = 'https://api.brevo.com/v3'
 
@@ -44,18 +47,10 @@ def _brevo_enabled():
     return marketing_sync_enabled() and bool(os.getenv('BREVO_API_KEY', '').strip())
 
 
-def _brevo_request(method, path, payload=None):
-    response = requests.request(
-        method,
-        f'{BREVO_API_BASE}{path}',
-        headers=_brevo_headers(),
-        json=payload,
-        timeout=10,
-    )
-    response.raise_for_status()
-    if response.content:
-        return response.json()
-    return {}
+# A provider call as data: (method, url, headers, json payload, timeout). The
+# sync and async syncs build the same calls and differ only in the transport.
+def _brevo_call(method, path, payload=None):
+    return (method, f'{BREVO_API_BASE}{path}', _brevo_headers(), payload, 10)
 
 
 def _brevo_contact_attributes(subscriber):
@@ -71,7 +66,7 @@ def _brevo_contact_attributes(subscriber):
     return {key: value for key, value in mapping.items() if key and value}
 
 
-def _sync_brevo_contact(subscriber, action):
+def _brevo_contact_call(subscriber, action):
     default_list_ids = _parse_int_list(os.getenv('BREVO_DEFAULT_LIST_IDS', ''))
     paid_list_ids = _parse_int_list(os.getenv('BREVO_PAID_LIST_IDS', ''))
     contact_attributes = _brevo_contact_attributes(subscriber)
@@ -87,15 +82,13 @@ def _sync_brevo_contact(subscriber, action):
             payload['listIds'] = default_list_ids
         if contact_attributes:
             payload['attributes'] = contact_attributes
-        _brevo_request('POST', '/contacts', payload)
-        return
+        return _brevo_call('POST', '/contacts', payload)
 
     if action == 'unsubscribe':
         payload = {'emailBlacklisted': True}
         if paid_list_ids:
             payload['unlinkListIds'] = paid_list_ids
-        _brevo_request('PUT', f"/contacts/{quote(subscriber.email)}?identifierType=email_id", payload)
-        return
+        return _brevo_call('PUT', f"/contacts/{quote(subscriber.email)}?identifierType=email_id", payload)
 
     if action == 'paid_converted':
         payload = {
@@ -105,7 +98,8 @@ def _sync_brevo_contact(subscriber, action):
             payload['listIds'] = paid_list_ids
         if contact_attributes:
             payload['attributes'] = contact_attributes
-        _brevo_request('PUT', f"/contacts/{quote(subscriber.email)}?identifierType=email_id", payload)
+        return _brevo_call('PUT', f"/contacts/{quote(subscriber.email)}?identifierType=email_id", payload)
+    return None
 
 
 def _welcome_email_payload(subscriber, metadata=None):
@@ -164,23 +158,23 @@ def _welcome_email_payload(subscriber, metadata=None):
     return payload
 
 
-def _send_brevo_welcome_email(subscriber, metadata=None):
+def _brevo_welcome_email_call(subscriber, metadata=None):
     if os.getenv('BREVO_WELCOME_EMAIL_ENABLED', 'False') != 'True':
-        return
+        return None
 
     payload = _welcome_email_payload(subscriber, metadata)
     if not payload:
         logger.warning('Brevo welcome email skipped because BREVO_SENDER_EMAIL is not configured')
-        return
+        return None
 
-    _brevo_request('POST', '/smtp/email', payload)
+    return _brevo_call('POST', '/smtp/email', payload)
 
 
-def _sync_generic_webhook(subscriber, action, metadata=None):
+def _generic_webhook_call(subscriber, action, metadata=None):
     metadata = metadata or {}
     webhook_url = os.getenv('MARKETING_SYNC_WEBHOOK_URL', '').strip()
     if not webhook_url:
-        return {'sent': False, 'reason': 'disabled'}
+        return None
 
     payload = {
         'action': action,
@@ -205,9 +199,26 @@ def _sync_generic_webhook(subscriber, action, metadata=None):
     if token:
         headers['Authorization'] = f'Bearer {token}'
 
-    response = requests.post(webhook_url, json=payload, headers=headers, timeout=5)
-    response.raise_for_status()
-    return {'sent': True}
+    return ('POST', webhook_url, headers, payload, 5)
+
+
+def _profile_calls(subscriber, action, metadata):
+    """The provider calls that sync `action` for `subscriber`, in order."""
+    if _brevo_enabled():
+        calls = []
+        if action in ('subscribe', 'reactivate', 'unsubscribe', 'paid_converted'):
+            calls.append(_brevo_contact_call(subscriber, action))
+        if action in ('subscribe', 'reactivate'):
+            calls.append(_brevo_welcome_email_call(subscriber, metadata))
+    else:
+        calls = [_generic_webhook_call(subscriber, action, metadata)]
+    return [call for call in calls if call is not None]
+
+
+def _mark_synced(subscriber):
+    subscriber.last_synced_at = timezone.now()
+    subscriber.email_platform_status = 'synced'
+    subscriber.save(update_fields=['last_synced_at', 'email_platform_status'])
 
 
 def sync_marketing_profile(subscriber, action, metadata=None):
@@ -217,18 +228,30 @@ def sync_marketing_profile(subscriber, action, metadata=None):
         return {'sent': False, 'reason': 'disabled'}
 
     try:
-        if _brevo_enabled():
-            if action in ('subscribe', 'reactivate', 'unsubscribe', 'paid_converted'):
-                _sync_brevo_contact(subscriber, action)
-            if action in ('subscribe', 'reactivate'):
-                _send_brevo_welcome_email(subscriber, metadata)
-        else:
-            _sync_generic_webhook(subscriber, action, metadata)
+        for method, url, headers, payload, timeout in _profile_calls(subscriber, action, metadata):
+            response = requests.request(method, url, headers=headers, json=payload, timeout=timeout)
+            response.raise_for_status()
     except requests.RequestException as exc:
         logger.warning('Marketing sync failed for subscriber id=%s: %s', subscriber.id, exc)
         raise MarketingSyncError(str(exc)) from exc
 
-    subscriber.last_synced_at = timezone.now()
-    subscriber.email_platform_status = 'synced'
-    subscriber.save(update_fields=['last_synced_at', 'email_platform_status'])
+    _mark_synced(subscriber)
+    return {'sent': True}
+
+
+async def async_sync_marketing_profile(subscriber, action, metadata=None):
+    """sync_marketing_profile for async views: the provider calls are awaited."""
+    metadata = metadata or {}
+
+    if not marketing_sync_enabled():
+        return {'sent': False, 'reason': 'disabled'}
+
+    try:
+        for method, url, headers, payload, timeout in _profile_calls(subscriber, action, metadata):
+            await provider_http.request(method, url, headers=headers, json=payload, timeout=timeout)
+    except provider_http.ProviderError as exc:
+        logger.warning('Marketing sync failed for subscriber id=%s: %s', subscriber.id, exc)
+        raise MarketingSyncError(str(exc)) from exc
+
+    await sync_to_async(_mark_synced)(subscriber)
     return {'sent': True}
@@ -0,0 +1,250 @@
+"""
+Typed Parquet export of the prediction, claim and evidence tables.
+
+The audit scripts in docs/audit used to start from a SQLite copy of one table,
+read every column back as text and coerce booleans, numbers and dates by hand.
+This writes the tables once, already typed, in a layout pandas can memory-map
+and read only the needed columns of. core.services.evidence_frames is the
+reading side.
+
+Layout under the export root:
+
+    _watermarks.json                      last exported instant per table
+    prediction_log/part-0.parquet         rewritten whole on every export
+    <table>/month=YYYY-MM/part-<run>.parquet
+
+Every table except prediction_log is insert-only. Each export appends only the
+rows whose watermark column is newer than the last export, into a part file per
+month of that column. PredictionLog is the mutable latest-state row (results
+and grades arrive later) and has no update timestamp to follow, so it is
+exported whole. Rows from the last SETTLE_SECONDS are left for the next run, so
+a transaction still committing when the export starts is not skipped.
+
+A table's watermark is saved as soon as its part files are written. Part files
+carry their run's stamp, so any file newer than the table's saved watermark
+belongs to a run that was interrupted; the next export deletes those before
+appending, and rows are never exported twice.
+
+Writing needs pyarrow, which is not a production dependency:
+
+    pip install pyarrow
+    python manage.py export_analysis_parquet --out exports/
+"""
+import glob
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime, timedelta
+
+import pandas as pd
+from django.apps import apps
+from django.db import models
+from django.utils import timezone
+
+# table name -> (model, watermark column). The names match the SQLite
+# snapshots the audit scripts were written against.
+TABLES = {
+    'prediction_log': ('core.PredictionLog', None),
+    'prediction_snapshot': ('core.PredictionSnapshot', 'snapshot_created_at'),
+    'published_claim': ('core.PublishedClaim', 'published_at'),
+    'published_claim_result': ('core.PublishedClaimResult', 'settled_at'),
+    'signal_observation': ('core.SignalObservation', 'created_at'),
+    'fixture_result_observation': ('core.FixtureResultObservation', 'created_at'),
+}
+WATERMARKS_FILE = '_watermarks.json'
+RUN_FORMAT = '%Y%m%dT%H%M%S'
+SETTLE_SECONDS = 300
+CHUNK_SIZE = 20000
+
+_INTEGER_TYPES = {
+    'AutoField', 'BigAutoField', 'SmallAutoField', 'IntegerField',
+    'BigIntegerField', 'SmallIntegerField', 'PositiveIntegerField',
+    'PositiveBigIntegerField', 'PositiveSmallIntegerField',
+}
+
+
+class ExportUnavailable(Exception):
+    """Parquet cannot be written here (pyarrow is missing)."""
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise ExportUnavailable(f'pyarrow is required to write Parquet: {exc}')
+
+
+def _fields(model):
+    """Exported fields: every concrete column except raw bytes."""
+    return [f for f in model._meta.concrete_fields
+            if not isinstance(f, models.BinaryField)]
+
+
+def _column(field, values):
+    """One typed, nullable pandas column for `field`'s database values."""
+    target = field.target_field if field.is_relation else field
+    kind = target.get_internal_type()
+    if isinstance(target, models.JSONField):
+        return pd.array(
+            [None if v is None else json.dumps(v, sort_keys=True) for v in values],
+            dtype='string')
+    if kind == 'BooleanField':
+        return pd.array(values, dtype='boolean')
+    if kind in _INTEGER_TYPES:
+        return pd.array(values, dtype='Int64')
+    if kind in ('FloatField', 'DecimalField'):
+        return pd.array([None if v is None else float(v) for v in values],
+                        dtype='Float64')
+    if kind == 'DateTimeField':
+        return pd.to_datetime(pd.Series(values, dtype=object), utc=True).array
+    if kind == 'DateField':
+        return pd.to_datetime(pd.Series(values, dtype=object)).array
+    return pd.array([None if v is None else str(v) for v in values], dtype='string')
+
+
+def _signal_vectors(frame):
+    """Decoded vector columns for signal_observation, one decode per vector."""
+    from core.models import SignalVector
+
+    def dumps(value):
+        return None if value is None else json.dumps(value, sort_keys=True)
+
+    decoded = {
+        vector.pk: (dumps(vector.raw_vector), dumps(vector.market_price_vector))
+        for vector in SignalVector.objects.filter(pk__in=set(frame['vector_id'].dropna()))
+    }
+    pairs = [decoded.get(key, (None, None)) for key in frame['vector_id']]
+    frame['raw_vector'] = pd.array([p[0] for p in pairs], dtype='string')
+    frame['market_price_vector'] = pd.array([p[1] for p in pairs], dtype='string')
+    return frame
+
+
+def frames(table, since=None, until=None, chunk_size=CHUNK_SIZE):
+    """Yield `table` as typed DataFrames of at most `chunk_size` rows.
+
+    `since`/`until` bound the watermark column as (since, until]; they are
+    ignored for the table exported whole.
+    """
+    label, watermark = TABLES[table]
+    model = apps.get_model(label)
+    fields = _fields(model)
+    rows = model.objects.order_by(model._meta.pk.attname)
+    if watermark:
+        if since is not None:
+            rows = rows.filter(**{f'{watermark}__gt': since})
+        if until is not None:
+            rows = rows.filter(**{f'{watermark}__lte': until})
+    rows = rows.values_list(*(f.attname for f in fields))
+
+    chunk = []
+    for row in rows.iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield _frame(table, fields, chunk)
+            chunk = []
+    if chunk:
+        yield _frame(table, fields, chunk)
+
+
+def _frame(table, fields, rows):
+    columns = list(zip(*rows))
+    frame = pd.DataFrame({
+        field.attname: _column(field, values) for field, values in zip(fields, columns)
+    })
+    if table == 'signal_observation':
+        frame = _signal_vectors(frame)
+    return frame
+
+
+def read_watermarks(root):
+    path = os.path.join(root, WATERMARKS_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as handle:
+        return {table: datetime.fromisoformat(value)
+                for table, value in json.load(handle).items()}
+
+
+def _write_watermarks(root, watermarks):
+    path = os.path.join(root, WATERMARKS_FILE)
+    staging = f'{path}.tmp'
+    with open(staging, 'w', encoding='utf-8') as handle:
+        json.dump({t: w.isoformat() for t, w in sorted(watermarks.items())},
+                  handle, indent=2)
+    os.replace(staging, path)
+
+
+def _write_whole(root, table):
+    staging = os.path.join(root, f'.{table}-{uuid.uuid4().hex[:8]}')
+    os.makedirs(staging)
+    parts = list(frames(table))
+    frame = pd.concat(parts, ignore_index=True) if parts else None
+    count = 0 if frame is None else len(frame)
+    if frame is not None:
+        frame.to_parquet(os.path.join(staging, 'part-0.parquet'), index=False)
+    live = os.path.join(root, table)
+    retired = f'{staging}-old'
+    if os.path.exists(live):
+        os.replace(live, retired)
+    os.replace(staging, live)
+    shutil.rmtree(retired, ignore_errors=True)
+    return count
+
+
+def _append(root, table, since, until, run):
+    _, watermark = TABLES[table]
+    count = 0
+    for number, frame in enumerate(frames(table, since=since, until=until)):
+        months = frame[watermark].dt.strftime('%Y-%m')
+        for month, part in frame.groupby(months, sort=True):
+            directory = os.path.join(root, table, f'month={month}')
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f'part-{run}-{number}.parquet')
+            part.to_parquet(f'{path}.tmp', index=False)
+            os.replace(f'{path}.tmp', path)
+        count += len(frame)
+    return count
+
+
+def _discard_uncommitted(root, table, committed):
+    """Delete part files written after `table`'s saved watermark."""
+    committed_run = committed.strftime(RUN_FORMAT) if committed else ''
+    for path in glob.glob(os.path.join(root, table, 'month=*', 'part-*')):
+        run = os.path.basename(path)[len('part-'):].split('-', 1)[0]
+        if run > committed_run or path.endswith('.tmp'):
+            os.remove(path)
+
+
+def export(root, tables=None, full=False, now=None):
+    """Export `tables` (default: all) under `root`. Returns {table: rows written}.
+
+    `full` discards what was exported before and starts again from the first
+    row. Each table's watermark is saved once its rows are written; an
+    interrupted table leaves only part files newer than its watermark, which
+    the next export removes before writing those rows again.
+    """
+    _require_pyarrow()
+    os.makedirs(root, exist_ok=True)
+    until = (now or timezone.now()) - timedelta(seconds=SETTLE_SECONDS)
+    run = until.strftime(RUN_FORMAT)
+    watermarks = read_watermarks(root)
+    written = {}
+
+    for table in tables or TABLES:
+        if TABLES[table][1] is None:
+            written[table] = _write_whole(root, table)
+            continue
+        if full:
+            shutil.rmtree(os.path.join(root, table), ignore_errors=True)
+            watermarks.pop(table, None)
+        since = watermarks.get(table)
+        if since is not None and since >= until:
+            written[table] = 0
+            continue
+        _discard_uncommitted(root, table, since)
+        written[table] = _append(root, table, since, until, run)
+        watermarks[table] = until
+        _write_watermarks(root, watermarks)
+
+    return written
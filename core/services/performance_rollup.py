@@ -0,0 +1,175 @@
+"""
+Daily rollups of the settled public record.
+
+The public accuracy, ROI, league and weekly figures used to walk every
+verified claim on every request (public_universe.resolved_claims() hashes
+each claim in Python). Instead, each settlement adds one claim to a
+PerformanceRollup row keyed by kickoff day × market × league × pick ×
+confidence band, and the public endpoints sum those rows.
+
+The increment runs inside settle_published_claim's transaction, so a result
+and its rollup contribution are committed together. Eligibility is checked
+with the same rules as public_universe.verified_claims(). Anything that
+changes eligibility AFTER settlement — a failed integrity check, an audit
+exclusion, a correction superseding the claim — is not seen by the
+increment; check() recomputes the rollups from verified_claims() nightly
+and, with repair, rewrites them to match.
+"""
+import logging
+from collections import defaultdict
+from datetime import timezone as dt_timezone
+
+from django.db import transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from core.models import PerformanceRollup, PublishedClaim
+from core.services import public_universe
+
+logger = logging.getLogger(__name__)
+
+# (min, max, label, category), highest first. The label is the stored bucket.
+CONFIDENCE_BANDS = (
+    (0.70, 1.01, '70-100%', 'Very High'),
+    (0.65, 0.70, '65-70%', 'High'),
+    (0.60, 0.65, '60-65%', 'Medium-High'),
+    (0.55, 0.60, '55-60%', 'Medium'),
+)
+BELOW_BANDS = 'below-55%'
+
+KEY_FIELDS = ('day', 'market_type', 'league', 'predicted_outcome', 'confidence_bucket')
+COUNT_FIELDS = ('settled', 'wins', 'losses', 'voids', 'profit_units')
+
+_PROFIT_TOLERANCE = 1e-6
+
+
+def confidence_bucket(confidence):
+    value = confidence or 0
+    for low, high, label, _ in CONFIDENCE_BANDS:
+        if low <= value < high:
+            return label
+    return BELOW_BANDS
+
+
+def _key(claim):
+    return (
+        claim.kickoff.astimezone(dt_timezone.utc).date(),
+        claim.market_type,
+        claim.league,
+        claim.predicted_outcome,
+        confidence_bucket(claim.confidence),
+    )
+
+
+def _counts(claim, status):
+    """One settled claim's contribution, or None while it is pending."""
+    if status == PublishedClaim.STATUS_WON:
+        return {'settled': 1, 'wins': 1, 'losses': 0, 'voids': 0,
+                'profit_units': (claim.odds - 1) if claim.odds else 0.0}
+    if status == PublishedClaim.STATUS_LOST:
+        return {'settled': 1, 'wins': 0, 'losses': 1, 'voids': 0,
+                'profit_units': -1.0 if claim.odds else 0.0}
+    if status in (PublishedClaim.STATUS_VOID, PublishedClaim.STATUS_CANCELLED):
+        return {'settled': 1, 'wins': 0, 'losses': 0, 'voids': 1, 'profit_units': 0.0}
+    return None
+
+
+def record(claim, status):
+    """Add a newly settled claim to its rollup row, if it is publicly counted.
+
+    Call once per recorded result, inside the transaction that saves it.
+    """
+    counts = _counts(claim, status)
+    if counts is None or not public_universe.is_verified_claim(claim):
+        return
+    row, _ = PerformanceRollup.objects.get_or_create(
+        **dict(zip(KEY_FIELDS, _key(claim)))
+    )
+    PerformanceRollup.objects.filter(pk=row.pk).update(
+        updated_at=timezone.now(),
+        **{field: F(field) + value for field, value in counts.items()},
+    )
+
+
+def recompute():
+    """Rollup counts rebuilt from scratch: {key tuple: counts dict}."""
+    totals = defaultdict(lambda: dict.fromkeys(COUNT_FIELDS, 0))
+    for claim in public_universe.verified_claims():
+        counts = _counts(claim, claim.result_status)
+        if counts is None:
+            continue
+        row = totals[_key(claim)]
+        for field, value in counts.items():
+            row[field] += value
+    return dict(totals)
+
+
+def stored():
+    """The current rollup table: {key tuple: counts dict}."""
+    return {
+        tuple(row[f] for f in KEY_FIELDS): {f: row[f] for f in COUNT_FIELDS}
+        for row in PerformanceRollup.objects.values(*KEY_FIELDS, *COUNT_FIELDS)
+        if row['settled']
+    }
+
+
+def _differs(a, b):
+    return any(
+        abs(a[f] - b[f]) > _PROFIT_TOLERANCE if f == 'profit_units' else a[f] != b[f]
+        for f in COUNT_FIELDS
+    )
+
+
+def check(repair=False):
+    """Compare the rollups with a full recompute; optionally rewrite them.
+
+    Returns {'rows', 'mismatched', 'differences', 'repaired'}, where each
+    difference is {'key', 'stored', 'expected'} and a missing side is None.
+    """
+    with transaction.atomic():
+        expected = recompute()
+        current = stored()
+        empty = dict.fromkeys(COUNT_FIELDS, 0)
+        differences = [
+            {
+                'key': dict(zip(KEY_FIELDS, key)),
+                'stored': current.get(key),
+                'expected': expected.get(key),
+            }
+            for key in sorted(set(expected) | set(current), key=str)
+            if _differs(current.get(key, empty), expected.get(key, empty))
+        ]
+        if repair and differences:
+            now = timezone.now()
+            PerformanceRollup.objects.all().delete()
+            PerformanceRollup.objects.bulk_create(
+                PerformanceRollup(updated_at=now, **dict(zip(KEY_FIELDS, key)), **counts)
+                for key, counts in expected.items()
+            )
+    if differences:
+        logger.warning('Performance rollups: %d of %d rows differ from a full '
+                       'recompute%s', len(differences), len(expected),
+                       ' (repaired)' if repair else '')
+    return {
+        'rows': len(expected),
+        'mismatched': len(differences),
+        'differences': differences,
+        'repaired': bool(repair and differences),
+    }
+
+
+def totals(*fields, since=None):
+    """Summed rollup counts grouped by `fields`; one dict when none are given."""
+    rows = PerformanceRollup.objects.all()
+    if since is not None:
+        rows = rows.filter(day__gte=since)
+    # Aliases may not shadow the model's own field names.
+    sums = {f'total_{f}': Sum(f) for f in COUNT_FIELDS}
+    if not fields:
+        summed = rows.aggregate(**sums)
+        return {f: summed[f'total_{f}'] or 0 for f in COUNT_FIELDS}
+    return [
+        {**{f: row[f] for f in fields},
+         **{f: row[f'total_{f}'] or 0 for f in COUNT_FIELDS}}
+        for row in rows.values(*fields).annotate(**sums).order_by(*fields)
+    ]
@@ -0,0 +1,68 @@
+"""
+Non-blocking outbound HTTP for the async request handlers.
+
+Under the ASGI worker (Procfile: gunicorn -k uvicorn.workers.UvicornWorker), a
+view that awaits a provider or marketing call gives the event loop back to
+other requests while it waits. A sync view blocks its whole worker instead, so
+a handful of slow provider responses used to exhaust the pool. Views that call
+out use this module; the scheduler and management commands keep `requests`.
+
+One httpx.AsyncClient per event loop, so connections are pooled across
+requests in a worker. The Django test client and async_to_sync give each call a
+fresh loop, and a client must never outlive the loop it was opened on.
+"""
+import asyncio
+import weakref
+
+DEFAULT_TIMEOUT = 10
+
+_clients = weakref.WeakKeyDictionary()
+
+
+class ProviderError(Exception):
+    """The call failed: transport error or non-2xx status."""
+
+
+class ProviderTimeout(ProviderError):
+    pass
+
+
+def _httpx():
+    try:
+        import httpx
+    except ImportError as exc:  # pragma: no cover - dependency is declared
+        raise ProviderError(f'httpx not installed: {exc}')
+    return httpx
+
+
+def _client():
+    httpx = _httpx()
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = httpx.AsyncClient()
+    return client
+
+
+async def request(method, url, *, params=None, headers=None, json=None,
+                  timeout=DEFAULT_TIMEOUT):
+    """Decoded JSON body of a successful call ({} when the body is empty).
+
+    Raises ProviderTimeout or ProviderError. Their messages can contain the
+    resolved URL, and SportMonks authenticates by query parameter, so callers
+    must pass them through redact_exception before showing them anywhere.
+    """
+    httpx = _httpx()
+    try:
+        response = await _client().request(
+            method, url, params=params, headers=headers, json=json, timeout=timeout)
+        response.raise_for_status()
+    except httpx.TimeoutException as exc:
+        raise ProviderTimeout(str(exc)) from exc
+    except httpx.HTTPError as exc:
+        raise ProviderError(str(exc)) from exc
+    return response.json() if response.content else {}
+
+
+async def get_json(url, *, params=None, headers=None, timeout=DEFAULT_TIMEOUT):
+    return await request('GET', url, params=params, headers=headers, timeout=timeout)
@@ -188,24 +188,33 @@ def verified_claims():
     stored fields cannot be expressed in SQL. Tampered or incomplete claims are
     EXCLUDED rather than silently counted.
     """
-    out = []
-    for claim in _claim_base():
-        if not claim.verify_integrity():
-            logger.error(
-                'PublishedClaim %s failed integrity verification — excluded '
-                'from public statistics.', claim.claim_id
-            )
-            continue
-        if missing_provenance_fields(claim.odds_provenance, claim.market_type):
-            continue
-        if not claim_has_fresh_price(claim):
-            logger.warning(
-                'PublishedClaim %s used a missing or stale price — visible but '
-                'excluded from public statistics.', claim.claim_id
-            )
-            continue
-        out.append(claim)
-    return out
+    return [claim for claim in _claim_base() if _passes_claim_checks(claim)]
+
+
+def _passes_claim_checks(claim):
+    if not claim.verify_integrity():
+        logger.error(
+            'PublishedClaim %s failed integrity verification — excluded '
+            'from public statistics.', claim.claim_id
+        )
+        return False
+    if missing_provenance_fields(claim.odds_provenance, claim.market_type):
+        return False
+    if not claim_has_fresh_price(claim):
+        logger.warning(
+            'PublishedClaim %s used a missing or stale price — visible but '
+            'excluded from public statistics.', claim.claim_id
+        )
+        return False
+    return True
+
+
+def is_verified_claim(claim):
+    """verified_claims() membership for one claim, without the full scan."""
+    return (
+        _claim_base().filter(pk=claim.pk).exists()
+        and _passes_claim_checks(claim)
+    )
 
 
 def resolved_claims():
@@ -61,20 +61,30 @@ _CREDENTIAL_PARAMS = (
     'access_token', 'auth',
 )
 
-_PARAM_RE = re.compile(
-    r'(?i)\b(' + '|'.join(_CREDENTIAL_PARAMS) + r')=([^&\s\'"<>\\\]}),;]+)'
-)
+# Rules 2 and 3, as pattern text. They are compiled together with rule 1 into
+# one alternation by _build_engine() rather than run as separate passes.
+_PARAM_NAME = r'\b(?P<param>' + '|'.join(_CREDENTIAL_PARAMS) + r')='
+_PARAM_VALUE = r'[^&\s\'"<>\\\]}),;]'
 
-# The VALUE group deliberately eats to the closing quote or end of line rather
-# than stopping at the first space. `Authorization: Bearer <token>` has the
+# The VALUE deliberately eats to the closing quote or end of line rather than
+# stopping at the first space. `Authorization: Bearer <token>` has the
 # credential AFTER a word, so a space-terminated match redacts "Bearer" and
 # leaves the token — which is how this rule failed its own test first time.
-_HEADER_RE = re.compile(
-    r'(?i)(authorization|x-internal-auth|x-signature|x-api-key)'
-    r'(["\']?\s*[:=]\s*["\']?)([^\r\n\'"]+)'
+_HEADER_NAME = (
+    r'(?P<header>authorization|x-internal-auth|x-signature|x-api-key)'
+    r'(?P<sep>["\']?\s*[:=]\s*["\']?)'
 )
+_HEADER_VALUE = r'[^\r\n\'"]'
+
+_BEARER_NAME = r'\b(?P<bearer>bearer|token)\s+'
+_BEARER_VALUE = r'[A-Za-z0-9._\-]'
 
-_BEARER_RE = re.compile(r'(?i)\b(bearer|token)\s+([A-Za-z0-9._\-]{8,})')
+#: Letters a structural match can start with (param, header and bearer names).
+_STRUCTURAL_FIRST_CHARS = 'abkpstxABKPSTX'
+
+#: Every structural match contains one of these (the words case-insensitively).
+_TRIGGER_CHARS = ('=', ':')
+_TRIGGER_WORDS = ('bearer', 'token')
 
 #: Below this length a "secret" is probably a placeholder like "x" or "test",
 #: and blanket-replacing it would mangle unrelated text.
@@ -84,8 +94,8 @@ _MIN_SECRET_LEN = 8
 def _live_secret_values():
     """Current values of the secret env vars, longest first.
 
-    Longest first matters: if two secrets share a prefix, replacing the shorter
-    one first would leave the remainder of the longer one exposed.
+    Longest first matters: if two secrets share a prefix, the alternation must
+    try the longer one first or the remainder of it would be left exposed.
     """
     values = []
     for name in SECRET_ENV_VARS:
@@ -95,6 +105,102 @@ def _live_secret_values():
     return sorted(set(values), key=len, reverse=True)
 
 
+def _build_engine(secrets):
+    """One regex for all three rules.
+
+    A secret can contain characters that end a structural value (`;` in a
+    DATABASE_URL, say), so each value pattern also accepts a whole secret:
+    `key=<secret>` is consumed to the end of the secret, never cut short with
+    its tail left to leak. Secrets match case-sensitively, the structural rules
+    case-insensitively, as when they were separate passes.
+
+    The leading lookahead lets the scan step over every position that cannot
+    start any rule with one character-class test instead of trying each
+    alternative there.
+    """
+    if secrets:
+        literal = '(?-i:' + '|'.join(re.escape(s) for s in secrets) + ')'
+
+        def value(chars, minimum):
+            # Check the minimum up front rather than with {n,}: counted that
+            # way a secret is one unit, and backtracking off it would cut the
+            # match short partway into the secret.
+            head = f'(?={literal}|{chars}{{{minimum}}})' if minimum > 1 else ''
+            return f'{head}(?:{literal}|{chars})+'
+
+        alternatives = [f'(?P<secret>{literal})']
+    else:
+        def value(chars, minimum):
+            return f'{chars}{{{minimum},}}'
+
+        alternatives = []
+    alternatives += [
+        f'(?i:{_PARAM_NAME}{value(_PARAM_VALUE, 1)})',
+        f'(?i:{_HEADER_NAME}{value(_HEADER_VALUE, 1)})',
+        f'(?i:{_BEARER_NAME}{value(_BEARER_VALUE, 8)})',
+    ]
+    first_chars = set(_STRUCTURAL_FIRST_CHARS) | {s[0] for s in secrets}
+    start = '(?=[' + ''.join(re.escape(c) for c in sorted(first_chars)) + '])'
+    return re.compile(start + '(?:' + '|'.join(alternatives) + ')')
+
+
+def _replacement(match):
+    if match.group('param'):
+        return f"{match.group('param')}={REDACTED}"
+    if match.group('header'):
+        return f"{match.group('header')}{match.group('sep')}{REDACTED}"
+    if match.group('bearer'):
+        return f"{match.group('bearer')} {REDACTED}"
+    return REDACTED
+
+
+# (environment fingerprint, compiled pattern, secrets). Rebuilt only when one of
+# SECRET_ENV_VARS changes — a rotation, or a test patching os.environ. Replaced
+# as a whole tuple, so concurrent loggers never see a torn engine.
+_engine = (None, None, ())
+
+
+try:
+    _ENVIRON_KEYS = tuple(os.environ.encodekey(name) for name in SECRET_ENV_VARS)
+except AttributeError:  # pragma: no cover - not CPython's os._Environ
+    _ENVIRON_KEYS = None
+
+
+def _environment_fingerprint():
+    """The raw values of SECRET_ENV_VARS, read as cheaply as possible.
+
+    This runs on every log record. `os.environ.get()` encodes the name and
+    decodes the value on each call, which for ten names cost more than the
+    redaction itself; the mapping's backing dict holds the same values (and is
+    what `os.environ[...] = ` and `patch.dict` update) without the round trip.
+    """
+    data = getattr(os.environ, '_data', None)
+    if _ENVIRON_KEYS is None or data is None:  # pragma: no cover
+        return tuple(os.environ.get(name) for name in SECRET_ENV_VARS)
+    return tuple(map(data.get, _ENVIRON_KEYS))
+
+
+def _current_engine():
+    global _engine
+    fingerprint = _environment_fingerprint()
+    engine = _engine
+    if engine[0] != fingerprint:
+        secrets = tuple(_live_secret_values())
+        engine = (fingerprint, _build_engine(secrets), secrets)
+        _engine = engine
+    return engine[1], engine[2]
+
+
+def _has_trigger(text, secrets):
+    """False when no rule could match `text`, so the regex can be skipped."""
+    if any(c in text for c in _TRIGGER_CHARS):
+        return True
+    if any(s in text for s in secrets):
+        return True
+    lowered = text.lower()
+    return any(w in lowered for w in _TRIGGER_WORDS)
+
+
 def redact(value):
     """Return `value` as a string with every known credential removed.
 
@@ -106,14 +212,10 @@ def redact(value):
     except Exception:  # pragma: no cover - str() on a hostile __str__
         return REDACTED
 
-    for secret in _live_secret_values():
-        if secret in text:
-            text = text.replace(secret, REDACTED)
-
-    text = _PARAM_RE.sub(lambda m: f'{m.group(1)}={REDACTED}', text)
-    text = _HEADER_RE.sub(lambda m: f'{m.group(1)}{m.group(2)}{REDACTED}', text)
-    text = _BEARER_RE.sub(lambda m: f'{m.group(1)} {REDACTED}', text)
-    return text
+    pattern, secrets = _current_engine()
+    if not _has_trigger(text, secrets):
+        return text
+    return pattern.sub(_replacement, text)
 
 
 def redact_exception(exc):
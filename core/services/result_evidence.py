@@ -22,7 +22,7 @@ import requests
 from django.utils import timezone
 
 from core.models import (
-    FixtureResultObservation, SignalObservation, StrategyLabObservation,
+    FixtureLifecycle, FixtureResultObservation, SignalObservation,
 )
 from core.services.integrity import canonical_sha256, norm_dt
 
@@ -49,36 +49,18 @@ def fixtures_needing_results(now=None, limit=500):
     Skips fixtures whose latest result observation is already a confirmed
     final — that is the governed stop-polling rule. Void-like states are also
     terminal: a cancelled match will not acquire a score later.
+
+    Read from FixtureLifecycle, which capture keeps current, so the cost is
+    one indexed query over open fixtures however much evidence has built up.
     """
     now = now or timezone.now()
-
-    observed = set(
-        SignalObservation.objects
-        .filter(kickoff__lt=now)
-        .values_list('fixture_id', flat=True)
-        .distinct()
+    return list(
+        FixtureLifecycle.objects
+        .filter(result_state__in=FixtureLifecycle.OPEN_STATES,
+                kickoff__lt=now, first_observed_at__isnull=False)
+        .order_by('fixture_id')
+        .values_list('fixture_id', flat=True)[:limit]
     )
-    observed.update(
-        StrategyLabObservation.objects
-        .filter(kickoff__lt=now)
-        .values_list('fixture_id', flat=True)
-        .distinct()
-    )
-    if not observed:
-        return []
-
-    settled = set()
-    latest = {}
-    for row in (FixtureResultObservation.objects
-                .filter(fixture_id__in=observed)
-                .order_by('fixture_id', '-result_version', '-captured_at')):
-        latest.setdefault(row.fixture_id, row)
-    for fixture_id, row in latest.items():
-        terminal_void = row.provider_status in FixtureResultObservation.STATUS_VOIDLIKE
-        if (row.is_final and row.confirmed) or terminal_void:
-            settled.add(fixture_id)
-
-    return sorted(observed - settled)[:limit]
 
 
 def fetch_results(fixture_ids):
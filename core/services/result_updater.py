@@ -11,6 +11,7 @@ from typing import Dict, List, Optional
 import logging
 
 from core.models import PredictionLog
+from core.services import scheduler_health
 
 logger = logging.getLogger(__name__)
 
@@ -180,6 +181,7 @@ class ResultUpdaterService:
         """
         try:
             # Update fields
+            first_result = not prediction.actual_outcome
             prediction.actual_outcome = result_data['actual_outcome']
             prediction.actual_score_home = result_data['actual_score_home']
             prediction.actual_score_away = result_data['actual_score_away']
@@ -187,6 +189,8 @@ class ResultUpdaterService:
             
             # Calculate if prediction was correct
             prediction.calculate_performance()
+            if first_result and prediction.actual_outcome:
+                scheduler_health.report(results_updated=1)
             
             logger.info(
                 f"Updated {prediction.home_team} vs {prediction.away_team}: "
@@ -10,18 +10,30 @@ It records *that* work happened and how much. It never decides what the work
 is, never grades anything and never touches pricing integrity, snapshots,
 publication or settlement rules.
 """
+import functools
 import logging
+import os
+import sys
+import time
 import uuid
 from contextlib import contextmanager
+from contextvars import ContextVar
 
-from django.db import transaction
+import numpy as np
+import requests
+from django.db import connection, transaction
 from django.utils import timezone
 
+try:
+    import resource
+except ImportError:  # Not available on Windows.
+    resource = None
+
 from core.models import (
-    PredictionLog,
     PredictionSnapshot,
     PublishedClaimResult,
     SchedulerHeartbeat,
+    SchedulerStageTiming,
 )
 
 logger = logging.getLogger(__name__)
@@ -41,18 +53,142 @@ class SchedulerAlreadyRunning(RuntimeError):
 STALE_RUNNING_AFTER_MINUTES = 15
 
 
-def _counts():
-    """Table sizes used to derive per-run deltas.
+# Per-run counters on the heartbeat row. Writers report them as they happen
+# (`report()`), so recording a run costs nothing however large the evidence
+# tables grow — the previous before/after COUNT(*) scanned every append-only
+# table twice per cycle.
+COUNTERS = ('snapshots_created', 'results_updated', 'claims_settled')
+
+# What each stage cost, measured by `stage_metrics()` and kept per stage in
+# SchedulerStageTiming rather than summed onto the heartbeat.
+TIMINGS = (
+    'wall_seconds', 'db_queries', 'db_seconds',
+    'http_requests', 'http_seconds', 'rss_delta_kb',
+)
+
+# Cycles of per-stage timings kept; older rows are pruned at the end of each
+# run. Two days of hourly cycles — enough for a stable p95.
+STAGE_HISTORY_RUNS = int(os.environ.get('SCHEDULER_STAGE_HISTORY_RUNS', '48'))
+
+# Where report() adds to: the current stage's metrics inside `stage_metrics()`,
+# else the run's own tally inside `record_run()`, else nowhere.
+_sink = ContextVar('scheduler_metrics_sink', default=None)
+# The running stage's timings, for the outbound HTTP probe.
+_timings = ContextVar('scheduler_stage_timings', default=None)
+
+
+def report(**counts):
+    """Count work done by the running stage. A no-op outside a scheduler run."""
+    sink = _sink.get()
+    if sink is None:
+        return
+    for name, value in counts.items():
+        sink[name] = sink.get(name, 0) + value
+
+
+@contextmanager
+def stage_metrics():
+    """Collect every `report()` made inside the block into the yielded dict.
+
+    Also measures what the block cost — wall time, queries on the default
+    connection and their time, outbound `requests` calls and their latency,
+    and growth of the peak RSS — and adds those under the TIMINGS keys once
+    the block exits, whether or not it raised.
+    """
+    _install_http_probe()
+    metrics = {}
+    timings = {'db_queries': 0, 'db_seconds': 0.0, 'http_requests': 0, 'http_seconds': 0.0}
+
+    def db_probe(execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            timings['db_queries'] += 1
+            timings['db_seconds'] += time.perf_counter() - started
+
+    token = _sink.set(metrics)
+    timings_token = _timings.set(timings)
+    rss_before = _peak_rss_kb()
+    started = time.perf_counter()
+    try:
+        with connection.execute_wrapper(db_probe):
+            yield metrics
+    finally:
+        timings['wall_seconds'] = time.perf_counter() - started
+        rss_after = _peak_rss_kb()
+        timings['rss_delta_kb'] = (None if rss_before is None
+                                   else max(0, rss_after - rss_before))
+        _timings.reset(timings_token)
+        _sink.reset(token)
+        metrics.update(timings)
+
+
+def _peak_rss_kb():
+    """The process's peak resident set so far, in KiB; None if unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+_http_probe_installed = False
 
-    Deltas rather than parsing command output: the counts stay correct however
-    the individual management commands choose to report themselves, and adding
-    a task cannot silently break them.
+
+def _install_http_probe():
+    """Time every `requests` call made inside a stage.
+
+    Providers are reached through module-level `requests.get`/`post` from a
+    dozen commands; wrapping `Session.send` once covers all of them without
+    touching each call site. Outside a stage the wrapper only checks a
+    context variable and passes straight through.
     """
-    return {
-        'snapshots_created': PredictionSnapshot.objects.count(),
-        'results_updated': PredictionLog.objects.filter(actual_outcome__isnull=False).count(),
-        'claims_settled': PublishedClaimResult.objects.count(),
+    global _http_probe_installed
+    if _http_probe_installed:
+        return
+    send = requests.Session.send
+
+    @functools.wraps(send)
+    def timed_send(session, request, **kwargs):
+        timings = _timings.get()
+        if timings is None:
+            return send(session, request, **kwargs)
+        started = time.perf_counter()
+        try:
+            return send(session, request, **kwargs)
+        finally:
+            timings['http_requests'] += 1
+            timings['http_seconds'] += time.perf_counter() - started
+
+    requests.Session.send = timed_send
+    _http_probe_installed = True
+
+
+def _estimates_enabled():
+    return os.environ.get('SCHEDULER_ESTIMATED_COUNTS', '').strip().lower() in ('1', 'true', 'yes')
+
+
+def _estimated_sizes():
+    """Planner row estimates (pg_class.reltuples): constant-time, approximate.
+
+    Only as fresh as the last ANALYZE/autovacuum, so a delta over one cycle
+    may well read 0. Opt-in fallback for counters no stage reported, and only
+    for the tables a counter maps onto one-to-one.
+    """
+    if not _estimates_enabled() or connection.vendor != 'postgresql':
+        return {}
+    tables = {
+        'snapshots_created': PredictionSnapshot._meta.db_table,
+        'claims_settled': PublishedClaimResult._meta.db_table,
     }
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT relname, reltuples::bigint FROM pg_class WHERE relname = ANY(%s)',
+            [list(tables.values())],
+        )
+        sizes = dict(cursor.fetchall())
+    return {k: sizes[t] for k, t in tables.items() if t in sizes and sizes[t] >= 0}
 
 
 def get_heartbeat() -> SchedulerHeartbeat:
@@ -83,7 +219,7 @@ def record_run(interval_minutes: int = 60, version: str = ''):
 
     try:
         hb_pk = _begin(run_id, now, interval_minutes, version)
-        before = _counts()
+        before = _estimated_sizes_or_empty()
     except SchedulerAlreadyRunning:
         raise
     except Exception:
@@ -96,6 +232,10 @@ def record_run(interval_minutes: int = 60, version: str = ''):
     logger.info('scheduler run_id=%s started', run_id)
 
     stages = {}
+    # Reports made outside any stage land here directly; stage metrics are
+    # folded in by stage().
+    totals = {}
+    timings = []
 
     class _Run(str):
         """The run id, with somewhere for stages to report themselves.
@@ -103,9 +243,19 @@ def record_run(interval_minutes: int = 60, version: str = ''):
         A str subclass so every existing `with record_run() as run_id` caller
         keeps working unchanged.
         """
-        def stage(self, name, ok):
+        def stage(self, name, ok, metrics=None):
             stages[name] = 'ok' if ok else 'failed'
-
+            metrics = metrics or {}
+            for key in COUNTERS:
+                if key in metrics:
+                    totals[key] = totals.get(key, 0) + metrics[key]
+            if 'wall_seconds' in metrics:
+                timings.append(SchedulerStageTiming(
+                    run_id=run_id, run_started_at=now, stage=name[:64], ok=ok,
+                    **{k: metrics[k] for k in TIMINGS if k in metrics},
+                ))
+
+    token = _sink.set(totals)
     try:
         yield _Run(run_id)
     except Exception as exc:
@@ -121,11 +271,17 @@ def record_run(interval_minutes: int = 60, version: str = ''):
                 last_failure_code=type(exc).__name__[:64],
                 last_duration_seconds=(finished - now).total_seconds(),
             )
+            _record_timings(timings)
         raise
     else:
         finished = timezone.now()
         if hb_pk is not None:
-            after = _counts_or_empty()
+            counts = {k: totals.get(k, 0) for k in COUNTERS}
+            if before:
+                after = _estimated_sizes_or_empty()
+                for k in before.keys() & after.keys():
+                    if k not in totals:
+                        counts[k] = max(0, after[k] - before[k])
             failed_stages = [k for k, v in stages.items() if v != 'ok']
             degraded = bool(failed_stages)
             _safe_update(
@@ -141,23 +297,86 @@ def record_run(interval_minutes: int = 60, version: str = ''):
                 last_failure_code=(f'stage:{failed_stages[0]}'[:64] if degraded else ''),
                 stage_status=stages or None,
                 last_duration_seconds=(finished - now).total_seconds(),
-                **{
-                    k: max(0, after.get(k, 0) - before.get(k, 0))
-                    for k in ('snapshots_created', 'results_updated', 'claims_settled')
-                },
+                **counts,
             )
+            _record_timings(timings)
         logger.info('scheduler run_id=%s completed in %.1fs',
                     run_id, (finished - now).total_seconds())
+    finally:
+        _sink.reset(token)
 
 
-def _counts_or_empty():
+def _estimated_sizes_or_empty():
     try:
-        return _counts()
+        return _estimated_sizes()
     except Exception:
-        logger.exception('scheduler could not read post-run counts')
+        logger.exception('scheduler could not read table size estimates')
         return {}
 
 
+def _record_timings(timings):
+    """Append this run's stage timings and prune to STAGE_HISTORY_RUNS cycles.
+
+    Like the heartbeat itself, never raises into the caller's cycle.
+    """
+    if not timings:
+        return
+    try:
+        SchedulerStageTiming.objects.bulk_create(timings)
+        cutoff = list(
+            SchedulerStageTiming.objects
+            .order_by('-run_started_at')
+            .values_list('run_started_at', flat=True)
+            .distinct()[STAGE_HISTORY_RUNS - 1:STAGE_HISTORY_RUNS]
+        )
+        if cutoff:
+            SchedulerStageTiming.objects.filter(run_started_at__lt=cutoff[0]).delete()
+    except Exception:
+        logger.exception('scheduler could not record stage timings')
+
+
+def stage_timing_summary(runs=STAGE_HISTORY_RUNS):
+    """p50/p95 of each timing, per stage, over the most recent `runs` cycles.
+
+    Stages are listed in the order the latest cycle ran them; a stage missing
+    from the latest cycle follows, in name order.
+    """
+    starts = list(
+        SchedulerStageTiming.objects
+        .order_by('-run_started_at')
+        .values_list('run_started_at', flat=True)
+        .distinct()[:runs]
+    )
+    if not starts:
+        return {'cycles': 0, 'stages': {}}
+    rows = list(
+        SchedulerStageTiming.objects
+        .filter(run_started_at__gte=starts[-1])
+        .order_by('-run_started_at', 'id')
+        .values('run_started_at', 'stage', *TIMINGS)
+    )
+    by_stage = {}
+    for row in rows:
+        by_stage.setdefault(row['stage'], []).append(row)
+    order = list(dict.fromkeys(
+        [r['stage'] for r in rows if r['run_started_at'] == starts[0]] + sorted(by_stage)
+    ))
+
+    stages = {}
+    for name in order:
+        samples = by_stage[name]
+        summary = {'cycles': len(samples)}
+        for key in TIMINGS:
+            values = [s[key] for s in samples if s[key] is not None]
+            if not values:
+                summary[key] = None
+                continue
+            p50, p95 = np.percentile(values, [50, 95])
+            summary[key] = {'p50': round(float(p50), 3), 'p95': round(float(p95), 3)}
+        stages[name] = summary
+    return {'cycles': len(starts), 'stages': stages}
+
+
 def _safe_update(pk, **fields):
     """Recording a heartbeat must never raise into the caller's cycle."""
     try:
@@ -0,0 +1,98 @@
+"""
+Stale-while-revalidate over the shared cache, with one refresh at a time.
+
+The default cache (settings.CACHES) is shared by every web and scheduler
+process, so an expensive public report is built once per interval for the
+whole deployment instead of once per worker. Sharing alone still leaves a
+stampede at expiry: every worker that misses rebuilds at the same moment.
+
+get_or_refresh stores the value with a soft deadline. Past it, the entry is
+stale but still served; the one caller that wins the refresh lock (cache.add,
+atomic on every backend we configure) rebuilds while everyone else keeps
+getting the previous value. Only a cold key makes callers wait, and then only
+briefly, for the lock holder before falling back to building it themselves.
+"""
+import logging
+import time
+import uuid
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STALE_SECONDS = 600
+DEFAULT_LOCK_SECONDS = 30
+COLD_WAIT_SECONDS = 5
+POLL_SECONDS = 0.05
+
+
+def _lock_key(key):
+    return f'{key}:refresh-lock'
+
+
+def _store(key, value, fresh_for, stale_for):
+    cache.set(key, {'value': value, 'fresh_until': time.time() + fresh_for},
+              timeout=fresh_for + stale_for)
+
+
+def _acquire(key, lock_timeout):
+    token = uuid.uuid4().hex
+    return token if cache.add(_lock_key(key), token, timeout=lock_timeout) else None
+
+
+def _release(key, token):
+    # Not atomic, but a lock that expired and was re-taken in between only
+    # costs one extra rebuild, never a wrong value.
+    if cache.get(_lock_key(key)) == token:
+        cache.delete(_lock_key(key))
+
+
+def _refresh(key, compute, fresh_for, stale_for, token):
+    try:
+        value = compute()
+        _store(key, value, fresh_for, stale_for)
+        return value
+    finally:
+        _release(key, token)
+
+
+def get_or_refresh(key, compute, *, fresh_for, stale_for=DEFAULT_STALE_SECONDS,
+                   lock_timeout=DEFAULT_LOCK_SECONDS):
+    """Cached result of compute(), rebuilt by at most one caller at a time.
+
+    Fresh for `fresh_for` seconds, then served stale for up to `stale_for`
+    more while a single caller rebuilds it. A failed rebuild of a stale entry
+    is logged and the stale value returned; a failed cold build raises.
+    """
+    entry = cache.get(key)
+    if entry is not None:
+        if time.time() < entry['fresh_until']:
+            return entry['value']
+        token = _acquire(key, lock_timeout)
+        if token is None:
+            return entry['value']
+        try:
+            return _refresh(key, compute, fresh_for, stale_for, token)
+        except Exception:
+            logger.exception('Refresh of %s failed; serving the stale value', key)
+            return entry['value']
+
+    token = _acquire(key, lock_timeout)
+    if token is not None:
+        return _refresh(key, compute, fresh_for, stale_for, token)
+
+    deadline = time.time() + min(lock_timeout, COLD_WAIT_SECONDS)
+    while time.time() < deadline:
+        time.sleep(POLL_SECONDS)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry['value']
+    # The holder is slow or died holding the lock; build it here rather than
+    # fail the request.
+    value = compute()
+    _store(key, value, fresh_for, stale_for)
+    return value
+
+
+def invalidate(key):
+    cache.delete(key)
@@ -0,0 +1,120 @@
+"""
+Packed, shared storage for SignalObservation probability and price vectors.
+
+Every outcome row of a fixture-market sweep carries the same complete
+probability vector and the same market price vector. Both used to be stored as
+JSON on each row: three copies per 1x2 sweep, re-decoded by every evidence
+reader. They now live once in SignalVector, keyed by a content hash, and every
+row whose vectors are identical points at the same SignalVector. Hourly sweeps
+of an unchanged market share one SignalVector too.
+
+Encoding is lossless, because this is evidence:
+
+  * probabilities: outcome names joined by '|' plus one little-endian float64
+    per outcome. float64 is exactly what JSON decoding produced, so nothing is
+    rounded.
+  * prices: the same layout for each entry's 'odds'. Any other keys an entry
+    carries are kept as JSON in `price_extras`.
+  * anything that would not survive packing exactly (ints, strings, None
+    values, unusual shapes) is stored verbatim as JSON instead, per vector.
+
+Reads go through SignalObservation.raw_vector / .market_price_vector, which
+return the same dicts as before.
+"""
+import struct
+
+from core.services.integrity import canonical_sha256
+
+SEPARATOR = '|'
+
+
+def vector_hash(raw_vector, price_vector):
+    return canonical_sha256({'raw_vector': raw_vector, 'market_price_vector': price_vector})
+
+
+def _pack(values):
+    return struct.pack(f'<{len(values)}d', *values)
+
+
+def _unpack(blob):
+    blob = bytes(blob)
+    return struct.unpack(f'<{len(blob) // 8}d', blob)
+
+
+def _packable_names(vector):
+    return (
+        isinstance(vector, dict)
+        and all(isinstance(name, str) and SEPARATOR not in name for name in vector)
+    )
+
+
+def encode(raw_vector, price_vector):
+    """SignalVector field values for one pair of vectors."""
+    fields = {
+        'vector_hash': vector_hash(raw_vector, price_vector),
+        'outcomes': '', 'probabilities': None,
+        'price_outcomes': '', 'prices': None, 'price_extras': None,
+        'verbatim': None,
+    }
+    verbatim = {}
+
+    if _packable_names(raw_vector) and all(type(v) is float for v in raw_vector.values()):
+        fields['outcomes'] = SEPARATOR.join(raw_vector)
+        fields['probabilities'] = _pack(list(raw_vector.values()))
+    else:
+        verbatim['raw_vector'] = raw_vector
+
+    if price_vector is None:
+        pass
+    elif _packable_names(price_vector) and all(
+            isinstance(entry, dict) and type(entry.get('odds')) is float
+            for entry in price_vector.values()):
+        fields['price_outcomes'] = SEPARATOR.join(price_vector)
+        fields['prices'] = _pack([entry['odds'] for entry in price_vector.values()])
+        extras = {
+            outcome: {k: v for k, v in entry.items() if k != 'odds'}
+            for outcome, entry in price_vector.items()
+            if len(entry) > 1
+        }
+        fields['price_extras'] = extras or None
+    else:
+        verbatim['market_price_vector'] = price_vector
+
+    fields['verbatim'] = verbatim or None
+    return fields
+
+
+def _names(joined, count):
+    # ''.split('|') is [''], not []: an empty vector packs to no names.
+    return joined.split(SEPARATOR) if count else []
+
+
+def decode_raw(vector):
+    if vector.verbatim and 'raw_vector' in vector.verbatim:
+        return vector.verbatim['raw_vector']
+    values = _unpack(vector.probabilities)
+    return dict(zip(_names(vector.outcomes, len(values)), values))
+
+
+def decode_prices(vector):
+    if vector.verbatim and 'market_price_vector' in vector.verbatim:
+        return vector.verbatim['market_price_vector']
+    if vector.prices is None:
+        return None
+    values = _unpack(vector.prices)
+    extras = vector.price_extras or {}
+    return {
+        outcome: {'odds': odds, **extras.get(outcome, {})}
+        for outcome, odds in zip(_names(vector.price_outcomes, len(values)), values)
+    }
+
+
+def intern(raw_vector, price_vector):
+    """The SignalVector for this pair, created on first sight."""
+    from core.models import SignalVector
+
+    fields = encode(raw_vector, price_vector)
+    vector, _ = SignalVector.objects.get_or_create(
+        vector_hash=fields.pop('vector_hash'), defaults=fields,
+    )
+    return vector
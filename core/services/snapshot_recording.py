@@ -1,25 +1,31 @@
 """
 Recording immutable prediction snapshots.
 
-Every genuinely new model run appends a snapshot per (fixture, market, outcome),
-INCLUDING for fixtures already in the pool. The latest-state `PredictionLog` row
-is then updated as a convenience view.
+A model run appends a snapshot per (fixture, market, outcome) whenever the
+prediction, price or provenance differs from the fixture's newest snapshot,
+INCLUDING for fixtures already in the pool. A run that finds the newest state
+unchanged appends nothing: it is counted on that snapshot's
+SnapshotConfirmation instead, so the table grows with genuine changes rather
+than with scheduler frequency. The latest-state `PredictionLog` row is then
+updated as a convenience view.
 
     Prediction run -> immutable PredictionSnapshot -> update latest-state
-                                                     PredictionLog
+                      (or SnapshotConfirmation)       PredictionLog
 
 Nothing here ever rewrites a snapshot. A retried run is idempotent because the
-uniqueness key includes `prediction_run_id`.
+uniqueness key includes `prediction_run_id`, and a confirmation remembers the
+last run it counted.
 """
 import logging
 
 from django.db import IntegrityError, transaction
+from django.db.models import F
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 from datetime import timezone as dt_timezone
 
-from core.models import PredictionSnapshot
-from core.services import public_universe
+from core.models import PredictionSnapshot, SnapshotConfirmation
+from core.services import public_universe, scheduler_health
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +57,25 @@ def parse_odds_captured_at(provenance):
     return as_aware(str(raw))
 
 
+def _confirm(snapshot, prediction_run_id, generated):
+    """Count one more run that found `snapshot`'s state unchanged."""
+    confirmation, created = (
+        SnapshotConfirmation.objects.select_for_update().get_or_create(
+            snapshot=snapshot,
+            defaults={'last_confirmed_at': generated,
+                      'last_confirmed_run_id': prediction_run_id,
+                      'confirmed_run_count': 1},
+        )
+    )
+    if created or confirmation.last_confirmed_run_id == prediction_run_id:
+        return
+    confirmation.last_confirmed_at = max(confirmation.last_confirmed_at, generated)
+    confirmation.last_confirmed_run_id = prediction_run_id
+    confirmation.confirmed_run_count = F('confirmed_run_count') + 1
+    confirmation.save(update_fields=[
+        'last_confirmed_at', 'last_confirmed_run_id', 'confirmed_run_count'])
+
+
 @transaction.atomic
 def record_snapshot(
     *, prediction_run_id, prediction, fixture_id, home_team, away_team, league,
@@ -60,6 +85,12 @@ def record_snapshot(
 ):
     """Append one snapshot for this run, or return the existing one.
 
+    "Existing" is this run's own snapshot (a retry), or the fixture's newest
+    snapshot when this run repeats its state exactly — content_hash equal — in
+    which case the repeat is recorded on its SnapshotConfirmation. Only the
+    NEWEST snapshot can be confirmed: a state that changes and then changes
+    back is a new snapshot, because the one in between was current.
+
     `prediction_generated_at` is the RUN's generation time — deliberately NOT
     `PredictionLog.prediction_logged_at`, which is the fixture's first-seen time
     and would pair an old timestamp with a freshly captured price.
@@ -103,6 +134,20 @@ def record_snapshot(
     snapshot.snapshot_created_at = generated
     snapshot.pricing_integrity_status = public_universe.classify_snapshot(snapshot)
 
+    newest = (
+        PredictionSnapshot.objects.filter(fixture_id=fixture_id)
+        .order_by('-prediction_generated_at', '-snapshot_created_at')
+        .first()
+    )
+    if newest is not None and newest.content_hash == snapshot.compute_content_hash():
+        _confirm(newest, prediction_run_id, generated)
+        logger.info(
+            'Snapshot %s still current for fixture %s (%s/%s) at run %s',
+            newest.snapshot_id, fixture_id, market_type, predicted_outcome,
+            prediction_run_id,
+        )
+        return newest, False
+
     try:
         snapshot.save()
     except IntegrityError:
@@ -122,4 +167,5 @@ def record_snapshot(
         snapshot.snapshot_id, fixture_id, market_type, predicted_outcome,
         prediction_run_id, snapshot.pricing_integrity_status,
     )
+    scheduler_health.report(snapshots_created=1)
     return snapshot, True
@@ -21,6 +21,7 @@ from core.models import (
     StrategyLabObservation,
     StrategyLabSettlement,
 )
+from core.services import bootstrap, market_grading, shared_cache
 from core.services.integrity import canonical_sha256, norm_dt, norm_num
 
 
@@ -537,7 +538,7 @@ def _handicap_legs(line):
 
 def unit_profit(side, handicap, odds, home_score, away_score):
     difference = home_score - away_score
-    if side == 'away':
+    if side.lower() == 'away':
         difference *= -1
     profits = []
     for leg in _handicap_legs(handicap):
@@ -548,7 +549,7 @@ def unit_profit(side, handicap, odds, home_score, away_score):
 
 def total_unit_profit(side, line, odds, goals):
     """Settle Asian whole/half/quarter totals as equal split stakes."""
-    direction = side.rsplit('_', 1)[-1]
+    direction = side.lower().rsplit('_', 1)[-1]
     profits = []
     for leg in _handicap_legs(line):
         difference = goals - leg if direction == 'over' else leg - goals
@@ -634,7 +635,7 @@ def _profit_for(observation, result):
             result.home_score + result.away_score,
         )
     if observation.market == 'team_total_goals':
-        team = observation.side.split('_', 1)[0]
+        team = observation.side.lower().split('_', 1)[0]
         goals = result.home_score if team == 'home' else result.away_score
         return total_unit_profit(
             observation.side, observation.handicap, observation.odds, goals,
@@ -645,18 +646,41 @@ def _profit_for(observation, result):
     return observation.odds - 1 if won else -1
 
 
+def _profits(pairs):
+    """Unit profit per (observation, result) pair, graded as one batch.
+
+    Rows the batch grader does not cover (correct score, half-time markets)
+    go through the scalar _profit_for.
+    """
+    grades = market_grading.grade(
+        [observation.market for observation, _ in pairs],
+        [observation.side for observation, _ in pairs],
+        [observation.handicap for observation, _ in pairs],
+        [observation.odds for observation, _ in pairs],
+        [result.home_score for _, result in pairs],
+        [result.away_score for _, result in pairs],
+    )
+    return [
+        float(profit) if graded else _profit_for(observation, result)
+        for (observation, result), profit, graded
+        in zip(pairs, grades.profit, grades.graded)
+    ]
+
+
 def _settle_one(experiment):
     decisions = choose_decisions(experiment)
     fixture_ids = {row.fixture_id for row in decisions}
     latest = {}
     for result in (
         FixtureResultObservation.objects
+        .covering(row.kickoff for row in decisions)
         .filter(fixture_id__in=fixture_ids)
         .order_by('fixture_id', '-result_version', '-captured_at')
     ):
         latest.setdefault(result.fixture_id, result)
 
     written = skipped = awaiting_result = ungradable = 0
+    pending = []
     for decision in decisions:
         result = latest.get(decision.fixture_id)
         if not result or not result.confirmed or not result.is_scoreable:
@@ -665,7 +689,9 @@ def _settle_one(experiment):
         if StrategyLabSettlement.objects.filter(observation=decision, result=result).exists():
             skipped += 1
             continue
-        profit = _profit_for(decision, result)
+        pending.append((decision, result))
+
+    for (decision, result), profit in zip(pending, _profits(pending)):
         if profit is None:
             ungradable += 1
             continue
@@ -716,20 +742,24 @@ def _maximum_drawdown(settlements):
     return drawdown
 
 
-def _mean_ci(values, z=2.87):
+# Registered hypotheses the forward ROI gate is corrected for.
+FAMILYWISE_HYPOTHESES = 12
+
+
+def _mean_ci(values, clusters=None):
     """Family-wise 95% interval for mean ROI across the registered family.
 
-    2.87 is the two-sided Bonferroni critical value for roughly twelve
-    simultaneous hypotheses. It is deliberately stricter than a standalone
-    1.96 interval so adding markets cannot make a lucky strategy look proven.
+    Bonferroni-corrected for roughly twelve simultaneous hypotheses (about a
+    2.87 critical value), deliberately stricter than a standalone interval so
+    adding markets cannot make a lucky strategy look proven. Resamples whole
+    fixtures: several settled decisions off one scoreline are one draw.
     """
-    count = len(values)
-    if count < 2:
+    if len(values) < 2:
         return None
-    mean = sum(values) / count
-    variance = sum((value - mean) ** 2 for value in values) / (count - 1)
-    margin = z * math.sqrt(variance / count)
-    return [round(mean - margin, 4), round(mean + margin, 4)]
+    interval = bootstrap.bootstrap_ci(
+        values, clusters=clusters, family_size=FAMILYWISE_HYPOTHESES, seed=0,
+    )
+    return interval.as_list()
 
 
 def _latest_settlements(decisions):
@@ -750,6 +780,7 @@ def _closing_line_value(experiment, decisions):
     for decision in decisions:
         close = (
             StrategyLabObservation.objects
+            .covering([decision.kickoff])
             .filter(
                 experiment=experiment,
                 fixture_id=decision.fixture_id,
@@ -784,7 +815,9 @@ def _phase_report(experiment, phase):
         'outcomes': dict(Counter(row.outcome for row in settled)),
         'total_profit_units': round(total, 4),
         'flat_stake_roi': round(total / count, 4) if count else None,
-        'roi_mean_familywise_95': _mean_ci(profits),
+        'roi_mean_familywise_95': _mean_ci(
+            profits, clusters=[row.observation.fixture_id for row in settled],
+        ),
         'time_split_roi': {
             'earlier': round(sum(earlier) / len(earlier), 4) if earlier else None,
             'later': round(sum(later) / len(later), 4) if later else None,
@@ -1119,7 +1152,7 @@ def build_public_current_fits(strategy_key, *, limit=5):
         kickoff__gt=now,
         odds_captured_at__gte=now - timedelta(hours=maximum_age),
         odds_captured_at__lte=now + timedelta(minutes=5),
-    ).select_related('experiment', 'source_signal').order_by(
+    ).select_related('experiment', 'source_signal__vector').order_by(
         'fixture_id', 'side', 'handicap', '-observed_at',
     )
 
@@ -1251,3 +1284,34 @@ def build_public_strategy_highlights(*, limit=3):
             'empty_is_valid': True,
         },
     }
+
+
+# Public pages are read far more often than observations change. Served from
+# the shared cache: rebuilt at most once a minute across all workers, and past
+# that served stale while one request rebuilds.
+PUBLIC_FRESH_SECONDS = 60
+PUBLIC_STALE_SECONDS = 600
+
+
+def _public_cached(key, compute):
+    return shared_cache.get_or_refresh(
+        f'strategy_lab:{key}', compute,
+        fresh_for=PUBLIC_FRESH_SECONDS, stale_for=PUBLIC_STALE_SECONDS,
+    )
+
+
+def cached_public_report():
+    return _public_cached('public_report', build_public_report)
+
+
+def cached_public_strategy_highlights():
+    return _public_cached('highlights', build_public_strategy_highlights)
+
+
+def cached_public_current_fits(strategy_key):
+    # Unknown keys come straight from the URL; answering them without a cache
+    # entry keeps arbitrary paths from filling the cache.
+    if not any(item['strategy_key'] == strategy_key for item in STRATEGY_DEFINITIONS):
+        return None
+    return _public_cached(
+        f'fits:{strategy_key}', lambda: build_public_current_fits(strategy_key))
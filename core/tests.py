@@ -10,7 +10,7 @@ from django.test import TestCase, Client
 from django.utils import timezone
 from datetime import timedelta
 from decimal import Decimal
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 from core.models import BankrollTransaction, EmailSubscriber, MarketingEvent, PredictionLog, UserBankroll, UserProfile
 from core.bankroll_utils import calculate_kelly_criterion, calculate_stake_amount
 from django.contrib.auth import get_user_model
@@ -548,19 +548,10 @@ class MarketingAutomationTests(TestCase):
         'BREVO_WELCOME_EMAIL_ENABLED': 'True',
         'BREVO_SANDBOX_MODE': 'True',
     }, clear=False)
-    @patch('core.services.marketing.requests.request')
+    @patch('core.services.marketing.provider_http.request', new_callable=AsyncMock)
     def test_subscribe_triggers_brevo_contact_sync_and_welcome_email(self, mock_request):
-        contact_response = Mock()
-        contact_response.content = b'{}'
-        contact_response.json.return_value = {}
-        contact_response.raise_for_status.return_value = None
-
-        email_response = Mock()
-        email_response.content = b'{}'
-        email_response.json.return_value = {}
-        email_response.raise_for_status.return_value = None
-
-        mock_request.side_effect = [contact_response, email_response]
+        # subscribe_email is async, so the sync is awaited through provider_http.
+        mock_request.return_value = {}
 
         response = self.client.post(self.subscribe_url, data={
             'email': 'brevo@example.com',
@@ -576,6 +567,23 @@ class MarketingAutomationTests(TestCase):
         self.assertEqual(mock_request.call_args_list[0].args[1], 'https://api.brevo.com/v3/contacts')
         self.assertEqual(mock_request.call_args_list[1].args[1], 'https://api.brevo.com/v3/smtp/email')
 
+    @patch.dict('os.environ', {
+        'MARKETING_SYNC_ENABLED': 'True',
+        'MARKETING_SYNC_WEBHOOK_URL': 'https://hooks.invalid/marketing',
+    }, clear=False)
+    @patch('core.services.marketing.provider_http.request', new_callable=AsyncMock)
+    def test_failed_subscribe_sync_is_recorded(self, mock_request):
+        from core.services.provider_http import ProviderTimeout
+        mock_request.side_effect = ProviderTimeout('timed out')
+
+        response = self.client.post(self.subscribe_url, data={
+            'email': 'slow@example.com',
+        }, content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        subscriber = EmailSubscriber.objects.get(email='slow@example.com')
+        self.assertEqual(subscriber.email_platform_status, 'sync_failed')
+
     @patch.dict('os.environ', {'MARKETING_WEBHOOK_SECRET': 'top-secret'}, clear=False)
     def test_brevo_webhook_click_payload_logs_email_click(self):
         subscriber = EmailSubscriber.objects.create(email='clicked@example.com', source='homepage')
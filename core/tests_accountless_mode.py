@@ -9,6 +9,7 @@ class AccountlessModeTests(SimpleTestCase):
             ('post', '/api/auth/login/'),
             ('post', '/api/auth/password-reset/request/'),
             ('post', '/api/bankroll/create/'),
+            ('post', '/api/bankroll/simulate/'),
             ('post', '/api/subscribe/'),
             ('post', '/api/marketing/events/'),
         ]
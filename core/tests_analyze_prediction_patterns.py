@@ -0,0 +1,52 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import PredictionLog
+
+
+def _graded(fixture_id, won, **kw):
+    defaults = dict(
+        fixture_id=fixture_id, home_team='H', away_team='A', league='EPL',
+        kickoff=timezone.now() - timedelta(days=fixture_id % 50),
+        predicted_outcome='Home', confidence=0.62, expected_value=0.08,
+        probability_home=0.62, probability_draw=0.22, probability_away=0.16,
+        odds_home=1.8, odds_draw=3.6, odds_away=5.0,
+        actual_outcome='Home' if won else 'Away', was_correct=won,
+        profit_loss_10=8.0 if won else -10.0,
+    )
+    defaults.update(kw)
+    return PredictionLog.objects.create(**defaults)
+
+
+class AnalyzePredictionPatternsTests(TestCase):
+    def run_command(self, *args):
+        out = StringIO()
+        call_command('analyze_prediction_patterns', *args, stdout=out)
+        return out.getvalue()
+
+    def test_no_graded_predictions(self):
+        _graded(620000, True, actual_outcome=None, was_correct=None)
+        self.assertIn('No completed predictions found', self.run_command())
+
+    def test_tables_group_and_rank_the_graded_rows(self):
+        for i in range(6):
+            _graded(620000 + i, won=i < 4)
+        for i in range(3):
+            _graded(620100 + i, won=False, league='Liga', predicted_outcome='Draw',
+                    confidence=45, expected_value=None, odds_draw=None,
+                    home_team_form='W,W,L', variance=12)
+        out = self.run_command('--backtest')
+
+        self.assertIn('Correct: 4 (44.4%)', out)
+        self.assertIn('  %-35s %6d %8d %9.1f%% $%+8.2f' % ('EPL', 6, 4, 66.7, 12.0), out)
+        self.assertIn('    [X] Liga: 3 misses / 3 total (league accuracy: 0.0%)', out)
+        self.assertIn('    [X] Draw: 3 (60.0% of misses)', out)
+        # Draws had no price, so only the six home picks land in an odds band.
+        self.assertIn('  %-30s %6d %8d %9.1f%%' % ('1.60-2.00 (Moderate)', 6, 4, 66.7), out)
+        # Under ten predictions a grid cell is counted but not scored.
+        self.assertIn('  C>=50%        --/6        --/6        --/0', out)
+        self.assertIn('  >= %-11.0f%% %6d %8d %9.1f%%' % (0, 9, 4, 44.4), out)
@@ -60,7 +60,8 @@ def _decorated_functions(module):
     src = inspect.getsource(module)
     return [
         (m.group(2), m.group(1))
-        for m in re.finditer(r'((?:^@[^\n]*\n)+)def (\w+)\(', src, re.M)
+        # `async def` too: an async view is no less a view.
+        for m in re.finditer(r'((?:^@[^\n]*\n)+)(?:async )?def (\w+)\(', src, re.M)
     ]
 
 
@@ -11,7 +11,9 @@ from datetime import timedelta
 from io import StringIO
 
 from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework.test import APIClient
 
@@ -97,6 +99,46 @@ class AutoPublicationTests(TestCase):
         self.assertFalse(
             PublishedClaim.objects.filter(fixture_id=980006).exists())
 
+    def test_a_newest_snapshot_failing_the_prefilter_still_blocks(self):
+        """The newest check spans ALL snapshots — including one the cheap
+        pre-filter drops — and the waiting fixture is reported ineligible."""
+        pred = latest_state(980016, kickoff_in=timedelta(hours=48))
+        old = timezone.now() - timedelta(hours=2)
+        record(pred, run_id='runOld', generated_at=old,
+               captured_at=old - timedelta(minutes=30))
+        record(pred, run_id='runNew', is_recommended=False)
+
+        out = run_command()
+
+        self.assertFalse(
+            PublishedClaim.objects.filter(fixture_id=980016).exists())
+        self.assertIn('committed 0; 0 fixtures already hold a commitment; '
+                      '1 candidates ineligible', out)
+
+    def test_newest_check_is_one_query_not_one_per_fixture(self):
+        """Latest-per-fixture is chosen in SQL: fixtures waiting on a newer,
+        unpublishable snapshot add no queries to a run."""
+        def wait_on_newer(fixture_id):
+            pred = latest_state(fixture_id, kickoff_in=timedelta(hours=48))
+            old = timezone.now() - timedelta(hours=2)
+            record(pred, run_id='runOld', generated_at=old,
+                   captured_at=old - timedelta(minutes=30))
+            record(pred, run_id='runNew', is_recommended=False)
+
+        def queries():
+            with CaptureQueriesContext(connection) as ctx:
+                out = run_command(dry_run=True)
+            return len(ctx), out
+
+        wait_on_newer(980017)
+        one, _ = queries()
+        for fixture_id in (980018, 980019, 980020):
+            wait_on_newer(fixture_id)
+        four, out = queries()
+
+        self.assertEqual(one, four)
+        self.assertIn('4 candidates ineligible', out)
+
     def test_ineligible_snapshots_are_never_committed(self):
         pred = latest_state(980007, kickoff_in=timedelta(hours=48))
         record(pred, run_id='runA', prov='none')  # no price at all
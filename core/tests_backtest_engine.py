@@ -0,0 +1,170 @@
+import json
+import random
+from datetime import timedelta
+from io import StringIO
+from types import SimpleNamespace
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from core.models import PredictionLog
+from core.services import backtest_engine, backtester
+
+
+LEAGUES = ['Premier League', 'Allsvenskan', 'Liga Portugal', 'Serie A', '', None]
+MARKETS = ['1x2', None, 'over_under_2.5', 'btts']
+OUTCOMES = ['Home', 'Draw', 'Away', 'Over 2.5', 'Under 2.5', 'Yes', None]
+
+
+def random_rows(n, seed=7):
+    """Rows covering every unit quirk `passes()` normalises."""
+    rng = random.Random(seed)
+    start = timezone.now() - timedelta(days=90)
+    rows = []
+    for i in range(n):
+        was_correct = rng.choice([True, False, None])
+        conf = rng.uniform(0.3, 0.8)
+        ev = rng.choice([None, rng.uniform(-0.1, 0.4), rng.uniform(-10, 40)])
+        rows.append(SimpleNamespace(
+            confidence=rng.choice([conf, conf * 100, None]),
+            expected_value=ev,
+            odds=rng.choice([None, 0, round(rng.uniform(1.2, 4.0), 2)]),
+            odds_home=rng.choice([None, 1.9]),
+            odds_draw=3.3,
+            odds_away=rng.choice([None, 4.1]),
+            market_type=rng.choice(MARKETS),
+            predicted_outcome=rng.choice(OUTCOMES),
+            league=rng.choice(LEAGUES),
+            # Coarse kickoffs so ties exercise the stable ordering.
+            kickoff=start + timedelta(days=rng.randrange(30)),
+            was_correct=was_correct,
+            profit_loss_10=None if was_correct is None else rng.choice([-10.0, 8.5, 12.0]),
+            roi_percent=rng.choice([None, rng.uniform(-100, 150)]),
+        ))
+    return rows
+
+
+class BacktestEngineParityTests(SimpleTestCase):
+    """The columnar engine must agree with passes()/metrics() row for row."""
+
+    def setUp(self):
+        self.rows = random_rows(600)
+        self.universe = backtest_engine.Universe.from_rows(self.rows)
+
+    def assertMetricsEqual(self, got, expected):
+        for field in backtester.Metrics.__dataclass_fields__:
+            a, b = getattr(got, field), getattr(expected, field)
+            if a is None or b is None or isinstance(a, int):
+                self.assertEqual(a, b, field)
+            else:
+                self.assertAlmostEqual(a, b, places=6, msg=field)
+
+    def configs(self):
+        return [
+            *backtester.BASELINES,
+            backtester.FilterConfig(name='floor', min_confidence=0.55, min_odds=1.5),
+            backtester.FilterConfig(
+                name='watch', league_watchlist=['Serie A', ''],
+                watchlist_min_confidence=0.7, market_types_allowed=['1x2'],
+            ),
+            *backtest_engine.grid(
+                backtester.PHASE_2C,
+                min_ev=[None, 0.05], max_odds=[2.0, None],
+                league_tiers=[{}, backtester.V2_LEAGUE_TIERS, {'': {'min_ev': 0.1}}],
+            ),
+        ]
+
+    def test_mask_matches_passes(self):
+        for cfg in self.configs():
+            expected = [backtester.passes(r, cfg) for r in self.rows]
+            got = backtest_engine.mask(self.universe, cfg).tolist()
+            self.assertEqual(got, expected, cfg.name)
+
+    def test_metrics_match_evaluate(self):
+        for cfg in self.configs():
+            expected, kept = backtester.evaluate(self.rows, cfg)
+            got, kept_idx = backtest_engine.evaluate(self.universe, cfg)
+            self.assertEqual([self.rows[i] for i in kept_idx], kept, cfg.name)
+            self.assertMetricsEqual(got, expected)
+
+    def test_empty_selection(self):
+        cfg = backtester.FilterConfig(name='none', min_confidence=2.0)
+        m = backtest_engine.metrics(self.universe, backtest_engine.mask(self.universe, cfg))
+        self.assertEqual((m.n_kept, m.n_settled, m.accuracy), (0, 0, None))
+
+    def test_sweep_in_process_pool_matches_serial(self):
+        configs = self.configs()
+        serial = backtest_engine.sweep(self.universe, configs)
+        pooled = backtest_engine.sweep(self.universe, configs, workers=2)
+        self.assertEqual([c.name for c, _ in pooled], [c.name for c in configs])
+        for (_, a), (_, b) in zip(pooled, serial):
+            self.assertEqual(a, b)
+
+    def test_grid_names_and_rejects_unknown_fields(self):
+        configs = backtest_engine.grid(
+            backtester.CURRENT_PROD, min_ev=[0.05, 0.1], max_odds=[2.5, None],
+        )
+        self.assertEqual(len(configs), 4)
+        self.assertEqual(configs[1].name, 'current_prod[min_ev=0.05,max_odds=none]')
+        self.assertIsNone(configs[1].max_odds)
+        with self.assertRaises(ValueError):
+            backtest_engine.grid(backtester.CURRENT_PROD, min_evv=[0.1])
+
+
+class BacktestEngineQuerysetTests(TestCase):
+    def setUp(self):
+        kickoff = timezone.now() - timedelta(days=3)
+        for i, (conf, ev, odds, correct, pl) in enumerate([
+            (65.0, 12.0, 1.85, True, 8.5),
+            (0.60, 0.10, 1.80, False, -10.0),
+            (0.62, 0.25, 2.40, True, 14.0),
+        ]):
+            PredictionLog.objects.create(
+                fixture_id=470000 + i, home_team='A', away_team='B',
+                league='Premier League', kickoff=kickoff + timedelta(hours=i),
+                predicted_outcome='Home', market_type='1x2', confidence=conf,
+                probability_home=0, probability_draw=0, probability_away=0,
+                expected_value=ev, odds=odds, was_correct=correct,
+                profit_loss_10=pl, roi_percent=pl * 10, is_recommended=True,
+            )
+
+    def test_values_list_load_matches_instances(self):
+        qs = PredictionLog.objects.order_by('fixture_id')
+        from_qs = backtest_engine.Universe.from_queryset(qs)
+        rows = list(qs)
+        for cfg in backtester.BASELINES:
+            got, _ = backtest_engine.evaluate(from_qs, cfg)
+            expected, _ = backtester.evaluate(rows, cfg)
+            self.assertEqual(got.n_kept, expected.n_kept, cfg.name)
+            self.assertAlmostEqual(got.total_pl, expected.total_pl)
+
+    def test_command_grid_sweep(self):
+        out = StringIO()
+        call_command(
+            'backtest', '--grid', 'max_ev=0.15,none', '--grid', 'max_odds=2.0,2.5',
+            '--json', stdout=out,
+        )
+        payload = json.loads(out.getvalue())
+        self.assertEqual(payload['sample_size'], 3)
+        # Baseline plus the four swept configs.
+        self.assertEqual(len(payload['configs']), 5)
+        self.assertEqual(payload['configs'][0]['config']['name'], 'current_prod')
+        best = payload['configs'][1]
+        self.assertEqual(best['config']['name'], 'current_prod[max_ev=none,max_odds=2.5]')
+        self.assertEqual(best['metrics']['n_kept'], 3)
+
+    def test_command_grid_header_counts_settled_rows_only(self):
+        PredictionLog.objects.filter(fixture_id=470002).update(was_correct=None)
+        out = StringIO()
+        call_command('backtest', '--grid', 'max_odds=2.0,2.5', '--include-pending', stdout=out)
+        self.assertIn('Sample size:      3 rows, 2 settled', out.getvalue())
+
+    def test_command_grid_rejects_stratify_and_non_numeric_fields(self):
+        for args in (
+            ['--grid', 'min_ev=0.05,0.1', '--stratify', 'league'],
+            ['--grid', 'league_blacklist=1,2'],
+            ['--grid', 'min_evv=0.1'],
+        ):
+            with self.subTest(args=args), self.assertRaises(CommandError):
+                call_command('backtest', *args, stdout=StringIO())
@@ -0,0 +1,131 @@
+from decimal import Decimal
+
+import numpy as np
+from django.test import Client, TestCase
+
+from core.bankroll_utils import (
+    calculate_stake_amount,
+    simulate_bankroll_paths,
+    stake_percentages,
+)
+from core.models import UserBankroll
+
+
+class StakePercentageParityTests(TestCase):
+    """The vectorised stake sizing must agree with calculate_stake_amount."""
+
+    def test_matches_scalar_calculator_for_every_proportional_strategy(self):
+        rng = np.random.default_rng(4)
+        probs = rng.uniform(0.05, 0.95, 200)
+        odds = rng.uniform(1.05, 6.0, 200)
+        confs = rng.uniform(40, 100, 200)
+        for strategy in ('kelly', 'kelly_fractional', 'fixed_percentage',
+                         'confidence_scaled', 'unknown'):
+            got = stake_percentages(strategy, probs, odds, confs,
+                                    fixed_percentage=3.0, max_stake_percentage=5.0)
+            for i in range(len(probs)):
+                expected = calculate_stake_amount(
+                    bankroll=Decimal('1000.00'), strategy=strategy,
+                    win_probability=probs[i], odds=odds[i], confidence=confs[i],
+                    fixed_percentage=3.0, max_stake_percentage=5.0,
+                )['stake_percentage']
+                self.assertAlmostEqual(got[i], expected, places=2, msg=strategy)
+
+    def test_fixed_amount_is_not_a_percentage(self):
+        with self.assertRaises(ValueError):
+            stake_percentages('fixed_amount', [0.5], [2.0], [60])
+
+
+class BankrollSimulationTests(TestCase):
+    def test_every_bet_lost_is_deterministic(self):
+        result = simulate_bankroll_paths(
+            1000, [0.0] * 10, [2.0] * 10, strategy='fixed_percentage',
+            fixed_percentage=5.0, num_paths=500, ruin_fraction=0.65,
+        )
+        terminal = 1000 * 0.95 ** 10
+        self.assertAlmostEqual(result['terminal_bankroll']['mean'], terminal, places=2)
+        self.assertAlmostEqual(result['max_drawdown_pct']['mean'], (1 - 0.95 ** 10) * 100, places=2)
+        self.assertEqual(result['ruin_probability'], 1.0)
+        self.assertEqual(result['probability_of_profit'], 0.0)
+
+    def test_fixed_amount_stake_is_capped_by_bankroll_share(self):
+        result = simulate_bankroll_paths(
+            100, [1.0] * 3, [2.0] * 3, strategy='fixed_amount',
+            fixed_amount=Decimal('50.00'), max_stake_percentage=10.0, num_paths=10,
+        )
+        # 10% of 100, 110, 121: each stake is capped, each bet doubles it.
+        self.assertAlmostEqual(result['terminal_bankroll']['mean'], 133.1, places=2)
+        self.assertEqual(result['max_drawdown_pct']['mean'], 0.0)
+
+    def test_seeded_runs_reproduce_and_track_the_expected_growth(self):
+        kwargs = dict(strategy='kelly_fractional', num_paths=20000, seed=11)
+        bets = ([0.55] * 200, [2.0] * 200)
+        first = simulate_bankroll_paths(1000, *bets, **kwargs)
+        self.assertEqual(first, simulate_bankroll_paths(1000, *bets, **kwargs))
+        # 1/4 Kelly at a 10% edge stakes 2.5%: median growth ~ exp(n * E[log]).
+        f = 0.025
+        expected_log = 200 * (0.55 * np.log1p(f) + 0.45 * np.log1p(-f))
+        median = first['terminal_bankroll']['quantiles']['p50']
+        self.assertAlmostEqual(np.log(median / 1000), expected_log, delta=0.05)
+
+    def test_risk_profile_filters_bets_and_applies_caps(self):
+        result = simulate_bankroll_paths(
+            1000, [0.6, 0.6, 0.6], [2.0, 2.0, 2.0], confidences=[50, 75, 80],
+            risk_profile='conservative', num_paths=100, seed=1,
+        )
+        self.assertEqual(result['num_bets'], 2)  # confidence 50 < 70 is skipped
+        self.assertEqual(result['strategy'], 'kelly_fractional')
+
+    def test_aggressive_profile_stakes_half_kelly(self):
+        bets = ([0.55] * 50, [2.0] * 50)
+        aggressive = simulate_bankroll_paths(1000, *bets, risk_profile='aggressive',
+                                             num_paths=100, seed=2)
+        half_kelly = simulate_bankroll_paths(1000, *bets, strategy='kelly_fractional',
+                                             kelly_fraction=0.5, max_stake_percentage=10.0,
+                                             num_paths=100, seed=2)
+        self.assertEqual(aggressive['terminal_bankroll'], half_kelly['terminal_bankroll'])
+
+
+class SimulateBankrollEndpointTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        UserBankroll.objects.create(
+            session_id='sim-session', initial_bankroll=Decimal('500.00'),
+            current_bankroll=Decimal('500.00'), staking_strategy='fixed_percentage',
+            fixed_stake_percentage=2.0,
+        )
+
+    def test_simulates_repeated_bet_against_session_bankroll(self):
+        resp = self.client.post('/api/bankroll/simulate/', data={
+            'session_id': 'sim-session', 'win_probability': 0.5, 'odds': 2.1,
+            'num_bets': 50, 'num_paths': 1000, 'seed': 3,
+        }, content_type='application/json')
+        self.assertEqual(resp.status_code, 200)
+        sim = resp.json()['simulation']
+        self.assertEqual((sim['num_paths'], sim['num_bets']), (1000, 50))
+        self.assertEqual(sim['initial_bankroll'], 500.0)
+        self.assertIn('p95', sim['max_drawdown_pct']['quantiles'])
+
+    def test_rejects_oversized_and_invalid_requests(self):
+        for body in (
+            {'bets': [{'win_probability': 0.5, 'odds': 2.0}] * 501},
+            {'bets': [{'win_probability': 0.5, 'odds': 2.0}], 'num_paths': 100001},
+            {'bets': [{'win_probability': 1.5, 'odds': 2.0}]},
+            {'bets': [{'odds': 2.0}]},
+            {'bets': [{'win_probability': 0.5, 'odds': 2.0}], 'strategy': 'martingale'},
+            {'bets': [{'win_probability': 0.5, 'odds': 2.0}], 'risk_profile': 'yolo'},
+            {'win_probability': 0.5, 'odds': 2.0, 'num_bets': 10 ** 9},
+            {'bets': [{'win_probability': 0.5, 'odds': 'nan'}]},
+            {'bets': [{'win_probability': 'nan', 'odds': 2.0}]},
+            {'bets': [{'win_probability': 0.5, 'odds': 'inf'}]},
+        ):
+            resp = self.client.post('/api/bankroll/simulate/', data={
+                'session_id': 'sim-session', **body,
+            }, content_type='application/json')
+            self.assertEqual(resp.status_code, 400, body)
+
+    def test_unknown_session_is_404(self):
+        resp = self.client.post('/api/bankroll/simulate/', data={
+            'session_id': 'nope', 'win_probability': 0.5, 'odds': 2.0,
+        }, content_type='application/json')
+        self.assertEqual(resp.status_code, 404)
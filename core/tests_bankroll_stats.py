@@ -0,0 +1,66 @@
+from decimal import Decimal
+
+from django.test import Client, TestCase
+
+from core.models import BankrollStats, BankrollTransaction, UserBankroll
+
+
+class BankrollStatsTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.bankroll = UserBankroll.objects.create(
+            session_id='stats-session', initial_bankroll=Decimal('1000.00'),
+            current_bankroll=Decimal('1000.00'), max_stake_percentage=25.0,
+        )
+
+    def record(self, stake, odds):
+        response = self.client.post('/api/bankroll/record-bet/', {
+            'session_id': 'stats-session', 'selected_outcome': 'Home',
+            'odds': odds, 'stake_amount': stake,
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        return BankrollTransaction.objects.get(id=response.json()['transaction']['id'])
+
+    def stats(self):
+        response = self.client.get('/api/bankroll/stats-session/stats/')
+        self.assertEqual(response.status_code, 200)
+        return response.json()['stats']
+
+    def test_running_row_matches_one_query_aggregate(self):
+        self.stats()  # builds the row while history is empty
+        bets = [self.record(stake, odds) for stake, odds in
+                [('10.10', 1.33), ('20.20', 2.71), ('5.05', 3.1), ('7.00', 1.9)]]
+        bets[0].settle(won=True)
+        bets[1].settle(won=False)
+        bets[2].settle(void=True)
+
+        row = BankrollStats.objects.get(bankroll=self.bankroll)
+        expected = BankrollStats.aggregate(self.bankroll)
+        for field, value in expected.items():
+            self.assertEqual(getattr(row, field), value, field)
+        # 10.10 * 1.33 - 10.10 = 3.333 -> stored 3.33; minus the 20.20 loss.
+        self.assertEqual(row.total_profit, Decimal('-16.87'))
+
+        stats = self.stats()
+        self.assertEqual((stats['total_bets'], stats['wins'], stats['losses']), (2, 1, 1))
+        self.assertEqual(stats['win_rate'], 50.0)
+        self.assertEqual(stats['total_profit'], -16.87)
+        self.assertEqual((stats['pending_bets'], stats['pending_exposure']), (1, 7.0))
+
+    def test_legacy_bankroll_is_backfilled_on_first_read(self):
+        for i, (status_, pl) in enumerate([('settled_won', '9.00'), ('settled_lost', '-4.00'),
+                                           ('pending', None)]):
+            BankrollTransaction.objects.create(
+                bankroll=self.bankroll, transaction_type='bet_placed', odds=2.0,
+                stake_amount=Decimal('4.00') + i, bankroll_before=Decimal('1000.00'),
+                status=status_, profit_loss=None if pl is None else Decimal(pl),
+            )
+        self.assertFalse(BankrollStats.objects.filter(bankroll=self.bankroll).exists())
+
+        stats = self.stats()
+        self.assertEqual((stats['total_bets'], stats['total_profit']), (2, 5.0))
+        self.assertEqual((stats['pending_bets'], stats['pending_exposure']), (1, 6.0))
+        self.assertTrue(BankrollStats.objects.filter(bankroll=self.bankroll).exists())
+
+        with self.assertNumQueries(2):  # bankroll + stats row, whatever the history
+            self.stats()
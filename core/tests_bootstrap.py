@@ -0,0 +1,83 @@
+import math
+from unittest.mock import patch
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from core.services import bootstrap
+
+
+class BootstrapEngineTests(SimpleTestCase):
+    def setUp(self):
+        self.values = np.random.default_rng(0).normal(1.0, 8.0, size=400)
+
+    def test_row_level_mean_reproduces_the_audit_script_stream(self):
+        # The audit scripts drew default_rng(seed).integers(0, n, (n_iter, n));
+        # their published intervals must still reproduce exactly.
+        idx = np.random.default_rng(42).integers(0, 400, size=(2000, 400))
+        lo, hi = np.percentile(self.values[idx].mean(axis=1), [2.5, 97.5])
+        ci = bootstrap.bootstrap_ci(self.values, n_iter=2000, seed=42)
+        self.assertEqual((ci.lo, ci.hi), (lo, hi))
+        self.assertAlmostEqual(ci.point, self.values.mean())
+
+    def test_runs_past_one_block_are_equivalent_not_identical(self):
+        # 1,200 values x 10,000 iterations exceeds MAX_BLOCK_CELLS, so the run
+        # is drawn in child-seeded blocks and leaves the audit-script stream.
+        values = np.random.default_rng(1).normal(1.0, 8.0, size=1200)
+        idx = np.random.default_rng(42).integers(0, 1200, size=(10_000, 1200))
+        lo, hi = np.percentile(values[idx].mean(axis=1), [2.5, 97.5])
+        ci = bootstrap.bootstrap_ci(values, n_iter=10_000, seed=42)
+        self.assertNotEqual((ci.lo, ci.hi), (lo, hi))
+        self.assertAlmostEqual(ci.lo, lo, delta=0.05 * (hi - lo))
+        self.assertAlmostEqual(ci.hi, hi, delta=0.05 * (hi - lo))
+
+    def test_clusters_resample_whole_fixtures(self):
+        # Every fixture contributes four identical rows: a row-level bootstrap
+        # would treat them as independent and come out far too narrow.
+        base = self.values[:100]
+        rows = np.repeat(base, 4)
+        fixtures = np.repeat(np.arange(100), 4)
+        naive = bootstrap.bootstrap_ci(rows, n_iter=4000)
+        clustered = bootstrap.bootstrap_ci(rows, clusters=fixtures, n_iter=4000)
+        per_fixture = bootstrap.bootstrap_ci(base, n_iter=4000)
+        self.assertEqual(clustered.clusters, 100)
+        self.assertGreater(clustered.hi - clustered.lo, 1.5 * (naive.hi - naive.lo))
+        self.assertAlmostEqual(
+            clustered.hi - clustered.lo, per_fixture.hi - per_fixture.lo, delta=0.4,
+        )
+
+    def test_familywise_correction_widens_interval(self):
+        single = bootstrap.bootstrap_ci(self.values)
+        family = bootstrap.bootstrap_ci(self.values, family_size=12)
+        self.assertAlmostEqual(family.level, 1 - 0.05 / 12)
+        self.assertLess(family.lo, single.lo)
+        self.assertGreater(family.hi, single.hi)
+        self.assertAlmostEqual(
+            bootstrap.familywise_alpha(0.05, 12, 'sidak'), 1 - 0.95 ** (1 / 12),
+        )
+        with self.assertRaises(ValueError):
+            bootstrap.familywise_alpha(0.05, 3, 'holm-ish')
+
+    def test_weighted_statistic_matches_mean_path(self):
+        fast = bootstrap.bootstrap_samples(self.values, n_iter=500, seed=3)
+        weighted = bootstrap.bootstrap_samples(
+            self.values, statistic=bootstrap.weighted_mean, n_iter=500, seed=3,
+        )
+        np.testing.assert_allclose(fast, weighted)
+
+    def test_blocks_are_deterministic_whatever_the_worker_count(self):
+        clusters = np.arange(400) // 2
+        with patch.object(bootstrap, 'MAX_BLOCK_CELLS', 400 * 250):
+            serial = bootstrap.bootstrap_samples(
+                self.values, clusters=clusters, n_iter=1000, seed=9,
+            )
+            pooled = bootstrap.bootstrap_samples(
+                self.values, clusters=clusters, n_iter=1000, seed=9, workers=2,
+            )
+        self.assertEqual(len(serial), 1000)
+        np.testing.assert_array_equal(serial, pooled)
+
+    def test_empty_input_is_nan(self):
+        ci = bootstrap.bootstrap_ci([])
+        self.assertTrue(all(math.isnan(v) for v in (ci.point, ci.lo, ci.hi)))
+        self.assertEqual(ci.n, 0)
@@ -0,0 +1,95 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import PredictionLog
+from core.services import bulk_rows, public_universe
+
+
+def _pred(fixture_id, **kw):
+    defaults = dict(
+        fixture_id=fixture_id, home_team='H', away_team='A', league='L',
+        kickoff=timezone.now() - timedelta(days=2), predicted_outcome='Home',
+        confidence=0.6, probability_home=0.6, probability_draw=0.25,
+        probability_away=0.15, odds=2.1,
+    )
+    defaults.update(kw)
+    return PredictionLog.objects.create(**defaults)
+
+
+class ClassifyPricingIntegrityTests(TestCase):
+    def setUp(self):
+        for i in range(7):
+            _pred(560000 + i, pricing_integrity_status=PredictionLog.PRICING_VERIFIED,
+                  is_audit_excluded=(i == 3))
+
+    def run_command(self, *args):
+        out = StringIO()
+        call_command('classify_pricing_integrity', *args, '--chunk-size', '3', stdout=out)
+        return out.getvalue()
+
+    def test_every_row_ends_up_as_classify_row_says(self):
+        out = self.run_command()
+
+        for pred in PredictionLog.objects.all():
+            self.assertEqual(pred.pricing_integrity_status,
+                             public_universe.classify_row(pred), pred.fixture_id)
+        self.assertIn('Scanned 7 rows in', out)
+        self.assertIn('rows/s', out)
+
+    def test_dry_run_writes_nothing(self):
+        out = self.run_command('--dry-run')
+
+        self.assertIn('rows would change', out)
+        self.assertEqual(
+            PredictionLog.objects.filter(
+                pricing_integrity_status=PredictionLog.PRICING_VERIFIED).count(), 7)
+
+    def test_rerunning_changes_nothing(self):
+        self.run_command()
+        self.assertIn('\n0 rows changed', self.run_command('--workers', '4'))
+
+
+class RecalculatePerformanceTests(TestCase):
+    def test_bulk_recalculation_matches_per_row_grading(self):
+        logged = timezone.now() - timedelta(days=1)
+        cases = [('Home', 'Home', 2, 0), ('Home', 'Away', 0, 1), ('Draw', 'Draw', 1, 1),
+                 ('Away', 'Home', 3, 1), ('', 'Home', 1, 0)]
+        for i, (picked, actual, home, away) in enumerate(cases):
+            _pred(570000 + i, predicted_outcome=picked, actual_outcome=actual,
+                  actual_score_home=home, actual_score_away=away, match_status='FT',
+                  was_correct=None, profit_loss_10=None, result_logged_at=logged)
+        _pred(570099)  # no result: not touched
+
+        out = StringIO()
+        call_command('recalculate_performance', '--chunk-size', '2', stdout=out)
+
+        for pred in PredictionLog.objects.exclude(fixture_id=570099):
+            expected = PredictionLog.objects.get(pk=pred.pk)
+            expected.compute_performance()
+            self.assertEqual(
+                (pred.was_correct, pred.profit_loss_10, pred.roi_percent),
+                (expected.was_correct, expected.profit_loss_10, expected.roi_percent))
+            # Recomputing a grade is not receiving the result again.
+            self.assertEqual(pred.result_logged_at, logged)
+        self.assertIsNone(PredictionLog.objects.get(fixture_id=570099).was_correct)
+        self.assertEqual(PredictionLog.objects.get(fixture_id=570000).profit_loss_10,
+                         10 * (2.1 - 1))
+        self.assertIn('Successfully recalculated 4 predictions (4 changed)', out.getvalue())
+
+
+class IdRangeTests(TestCase):
+    def test_ranges_cover_every_row_exactly_once(self):
+        ids = [_pred(580000 + i).pk for i in range(10)]
+        qs = PredictionLog.objects.all()
+
+        for parts in (1, 3, 4, 50):
+            ranges = bulk_rows.id_ranges(qs, parts)
+            covered = [pk for pk in ids for lo, hi in ranges if lo <= pk < hi]
+            self.assertEqual(covered, ids, parts)
+
+    def test_an_empty_table_has_no_ranges(self):
+        self.assertEqual(bulk_rows.id_ranges(PredictionLog.objects.all(), 4), [])
@@ -12,14 +12,16 @@ claim; the future gem selector will call it with a snapshot it ranked.
 """
 import json
 from datetime import timedelta
+from unittest import mock
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from django.utils import timezone
 from rest_framework.test import APIClient
 
 from core.models import (PredictionLog, PredictionSnapshot, PublishedClaim,
-                         PublishedClaimResult)
+                         PublishedClaimResult, SnapshotConfirmation)
 from core.services import claim_publication, public_universe, snapshot_recording
 
 User = get_user_model()
@@ -128,6 +130,38 @@ class SnapshotCreationTests(TestCase):
         record(pred, run_id='r19')
         self.assertEqual(PredictionSnapshot.objects.count(), 3)
 
+    def test_an_unchanged_state_is_confirmed_not_appended(self):
+        pred = latest_state(970010)
+        captured = timezone.now() - timedelta(hours=2)
+        first, _ = record(pred, run_id='r09', captured_at=captured,
+                          generated_at=captured + timedelta(minutes=5))
+        later = captured + timedelta(hours=1)
+        again, created = record(pred, run_id='r10', captured_at=captured,
+                                generated_at=later)
+        record(pred, run_id='r10', captured_at=captured, generated_at=later)  # retry
+
+        self.assertFalse(created)
+        self.assertEqual(again.snapshot_id, first.snapshot_id)
+        self.assertEqual(PredictionSnapshot.objects.count(), 1)
+        confirmation = SnapshotConfirmation.objects.get(snapshot=first)
+        self.assertEqual(confirmation.confirmed_run_count, 1)
+        self.assertEqual(confirmation.last_confirmed_at, later)
+        self.assertTrue(PredictionSnapshot.objects.get().verify_integrity())
+
+    def test_a_state_that_returns_after_a_change_is_a_new_snapshot(self):
+        """Only the newest snapshot can be confirmed: the change in between was current."""
+        pred = latest_state(970011)
+        captured = timezone.now() - timedelta(hours=3)
+        a, _ = record(pred, run_id='r1', odds=1.80, captured_at=captured)
+        record(pred, run_id='r2', odds=1.70, captured_at=captured)
+        back, created = record(pred, run_id='r3', odds=1.80, captured_at=captured)
+
+        self.assertTrue(created)
+        self.assertNotEqual(back.snapshot_id, a.snapshot_id)
+        self.assertEqual(back.content_hash, a.content_hash)
+        self.assertEqual(PredictionSnapshot.objects.count(), 3)
+        self.assertFalse(SnapshotConfirmation.objects.exists())
+
     def test_snapshot_fields_are_internally_coherent(self):
         pred = latest_state(970005, odds=1.9)
         snap, _ = record(pred, run_id='runA', odds=1.9)
@@ -617,6 +651,24 @@ class PublicationQueueTests(TestCase):
         # And the payload explicitly disclaims being a ranking.
         self.assertIn('not a statistical score', body['note'].lower())
 
+    def test_integrity_verdicts_are_read_in_one_cache_call(self):
+        for fixture_id in (990060, 990061, 990062):
+            self._candidate(fixture_id, 12)
+        api = self._staff('qroot9')
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        with mock.patch.object(claim_publication, 'cache', wraps=cache) as spy:
+            first = json.loads(api.get('/api/proof/queue/').content)['candidates']
+            second = json.loads(api.get('/api/proof/queue/').content)['candidates']
+
+        self.assertEqual(len(first), 3)
+        self.assertEqual([c['snapshot_id'] for c in first],
+                         [c['snapshot_id'] for c in second])
+        self.assertEqual(spy.get_many.call_count, 2)
+        self.assertEqual(spy.set_many.call_count, 1)
+        spy.get.assert_not_called()
+
     def test_queue_never_publishes_anything(self):
         self._candidate(990050, 12)
         self._staff('qroot6').get('/api/proof/queue/')
@@ -674,3 +726,31 @@ class PublicationQueueTests(TestCase):
         first = body['candidates'][0]
         self.assertEqual(first['fixture_id'], 991011)
         self.assertLess(first['odds_age_minutes'], 60)
+
+    def test_tampered_snapshot_drops_out_and_cannot_publish(self):
+        _, snap = self._candidate(991020, 12)
+        PredictionSnapshot.objects.filter(pk=snap.pk).update(odds=9.99)
+
+        body = json.loads(self._staff('qroot10').get('/api/proof/queue/').content)
+        self.assertEqual(body['candidates'], [])
+        with self.assertRaises(claim_publication.PublicationError):
+            claim_publication.publish_prediction_claim(snap.snapshot_id)
+
+    def test_queue_query_count_does_not_grow_with_history(self):
+        """Newest-per-fixture and band order are computed in SQL, and cached
+        integrity verdicts mean a repeat load does no rehashing either."""
+        api = self._staff('qroot11')
+        for fixture_id in (991030, 991031):
+            pred = latest_state(fixture_id, kickoff_in=timedelta(hours=12))
+            for i in range(4):
+                at = timezone.now() - timedelta(hours=3 - i * 0.5)
+                record(pred, run_id=f'h{i}', generated_at=at,
+                       captured_at=at - timedelta(minutes=30))
+        api.get('/api/proof/queue/')
+
+        # The queue itself, plus one batched superseded_by prefetch.
+        with self.assertNumQueries(2):
+            body = json.loads(api.get('/api/proof/queue/').content)
+        self.assertEqual(body['count'], 8)
+        self.assertEqual(
+            sum(not r['newer_snapshot_exists'] for r in body['candidates']), 2)
@@ -0,0 +1,105 @@
+import uuid
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from core.models import FixtureResultObservation, SignalObservation
+from core.services import evidence_partitions as partitions
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=dt_timezone.utc)
+
+
+def signal(kickoff):
+    observed = kickoff - timedelta(hours=12)
+    return SignalObservation.objects.create(
+        observation_id=uuid.uuid4(), ingestion_run_id='run',
+        source_payload_hash=str(uuid.uuid4()), fixture_id=7101,
+        home_team='Alpha', away_team='Beta', kickoff=kickoff, observed_at=observed,
+        hours_to_kickoff=12.0, market='1x2', outcome='home', raw_probability=60,
+        normalized_probability=0.6, raw_vector={'home': 0.6}, vector_sum=1.0,
+    )
+
+
+class PartitionCalendarTests(SimpleTestCase):
+    def test_month_bounds_are_utc_and_roll_over_years(self):
+        local = datetime(2026, 3, 1, 0, 30, tzinfo=dt_timezone(timedelta(hours=2)))
+        self.assertEqual(partitions.month_start(local), utc(2026, 2, 1))
+        self.assertEqual(partitions.add_months(utc(2026, 11, 1), 3), utc(2027, 2, 1))
+        self.assertEqual(partitions.add_months(utc(2026, 1, 1), -1), utc(2025, 12, 1))
+        self.assertEqual(
+            partitions.months_between(utc(2026, 11, 20), utc(2027, 1, 2)),
+            [utc(2026, 11, 1), utc(2026, 12, 1), utc(2027, 1, 1)])
+
+    def test_partition_names_round_trip(self):
+        name = partitions.partition_name('core_signalobservation', utc(2026, 8, 1))
+        self.assertEqual(name, 'core_signalobservation_p2026_08')
+        self.assertEqual(partitions.month_of('core_signalobservation', name), utc(2026, 8, 1))
+        self.assertIsNone(partitions.month_of(
+            'core_signalobservation',
+            partitions.default_partition_name('core_signalobservation')))
+        self.assertEqual(partitions.parse_month('2026-08'), utc(2026, 8, 1))
+
+    def test_only_missing_months_are_created(self):
+        existing = [utc(2026, 9, 1), utc(2026, 10, 1)]
+        self.assertEqual(
+            partitions.months_to_create(existing, utc(2026, 10, 18), 2),
+            [utc(2026, 11, 1), utc(2026, 12, 1)])
+
+
+class EvidenceQuerySetTests(TestCase):
+    def test_kickoff_window_is_half_open(self):
+        inside = signal(utc(2026, 8, 1))
+        signal(utc(2026, 9, 1))
+        signal(utc(2026, 7, 31, 23, 59))
+
+        rows = SignalObservation.objects.kickoff_window(utc(2026, 8, 1), utc(2026, 9, 1))
+        self.assertEqual(list(rows), [inside])
+        self.assertEqual(SignalObservation.objects.kickoff_window().count(), 3)
+
+    def test_covering_starts_a_week_before_the_earliest_kickoff(self):
+        brought_forward = signal(utc(2026, 8, 10))
+        later = signal(utc(2026, 9, 2))
+        signal(utc(2026, 7, 1))
+
+        rows = SignalObservation.objects.covering([utc(2026, 8, 14), None, utc(2026, 9, 2)])
+        self.assertCountEqual(rows, [brought_forward, later])
+        self.assertIn('"kickoff" >=', str(rows.query))
+        self.assertEqual(SignalObservation.objects.covering([None]).count(), 3)
+
+
+def result(kickoff, supersedes=None):
+    return FixtureResultObservation.objects.create(
+        result_id=uuid.uuid4(), fixture_id=7101, kickoff=kickoff, provider_status='FT',
+        home_score=1, away_score=0, score_type='CURRENT', is_final=True,
+        is_scoreable=True, confirmed=True, supersedes=supersedes,
+        result_version=2 if supersedes else 1, captured_at=kickoff + timedelta(hours=2),
+        ingestion_run_id='run', source_payload_hash=str(uuid.uuid4()),
+    )
+
+
+class DetachPlanTests(TestCase):
+    def test_a_month_still_referenced_from_a_kept_month_stays_attached(self):
+        original = result(utc(2026, 1, 20))
+        result(utc(2026, 3, 3), supersedes=original)
+        months = {FixtureResultObservation: [utc(2026, 1, 1), utc(2026, 2, 1), utc(2026, 3, 1)]}
+
+        plan, kept = partitions.detach_plan(months, utc(2026, 3, 1))
+        self.assertEqual(plan[FixtureResultObservation], [utc(2026, 2, 1)])
+        self.assertEqual(kept, {(FixtureResultObservation, utc(2026, 1, 1)):
+                                {'core.FixtureResultObservation.supersedes': 1}})
+
+        plan, kept = partitions.detach_plan(months, utc(2026, 4, 1))
+        self.assertEqual(plan[FixtureResultObservation], months[FixtureResultObservation])
+        self.assertEqual(kept, {})
+
+
+class ManageEvidencePartitionsCommandTests(TestCase):
+    def test_sqlite_reports_nothing_to_do(self):
+        out = StringIO()
+        call_command('manage_evidence_partitions', '--detach-before', '2025-01', stdout=out)
+        self.assertIn('not partitioned on sqlite; nothing to do', out.getvalue())
+        self.assertFalse(partitions.is_partitioned(SignalObservation))
@@ -1,9 +1,13 @@
+import uuid
 from datetime import timedelta
 
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from core.models import FixtureContextObservation
+from core.models import FixtureContextObservation, SignalObservation
 from core.services import evidence_capture
 from core.services.fixture_context_timeline import build_timeline
 
@@ -120,3 +124,75 @@ class FixtureContextCaptureTests(TestCase):
         self.assertNotIn('sidelined', body['data']['current'])
         self.assertNotIn('referees', body['data']['current'])
         self.assertNotIn('latitude', body['data']['current']['venue'])
+
+
+def selected_signal(observed_at, outcome='home', probability=0.6, odds=2.0, market='1x2'):
+    kickoff = timezone.now() + timedelta(hours=24)
+    return SignalObservation.objects.create(
+        observation_id=uuid.uuid4(), ingestion_run_id='run',
+        source_payload_hash=str(uuid.uuid4()), fixture_id=7001,
+        home_team='Alpha', away_team='Beta', league='Test League',
+        kickoff=kickoff, observed_at=observed_at,
+        hours_to_kickoff=(kickoff - observed_at).total_seconds() / 3600,
+        market=market, outcome=outcome, raw_probability=probability * 100,
+        normalized_probability=probability, raw_vector={outcome: probability},
+        vector_sum=1.0, vector_complete=True, is_selected_outcome=True,
+        price_status='verified', odds=odds,
+    )
+
+
+class CachedTimelineTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.now = timezone.now()
+
+    def at(self, hours, **overrides):
+        observed = (self.now + timedelta(hours=hours)).isoformat()
+        evidence_capture.capture(payload(context(observed_at=observed, **overrides)))
+
+    def rebuilt(self):
+        cache.clear()
+        return build_timeline(7001)
+
+    def test_an_unchanged_fixture_costs_one_query(self):
+        self.at(0)
+        selected_signal(self.now)
+        first = build_timeline(7001)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(build_timeline(7001), first)
+
+    def test_a_cached_timeline_reads_only_from_its_kickoff_on(self):
+        self.at(0)
+        selected_signal(self.now)
+        build_timeline(7001)
+
+        with CaptureQueriesContext(connection) as queries:
+            build_timeline(7001)
+        self.assertEqual(queries[0]['sql'].count('"kickoff" >='), 2)
+
+    def test_appended_rows_are_diffed_onto_the_cached_timeline(self):
+        self.at(0)
+        selected_signal(self.now)
+        selected_signal(self.now + timedelta(hours=1), market='btts', outcome='yes')
+        build_timeline(7001)
+
+        self.at(2, lineup_status='confirmed', home_formation='4-3-3')
+        selected_signal(self.now + timedelta(hours=2), probability=0.64, odds=1.8)
+        selected_signal(self.now + timedelta(hours=3), market='btts', outcome='no')
+        # The check, then only the appended rows of each source.
+        with self.assertNumQueries(3):
+            incremental = build_timeline(7001)
+
+        self.assertEqual(incremental, self.rebuilt())
+        self.assertEqual(incremental['snapshot_count'], 2)
+        self.assertEqual(incremental['signal_snapshot_count'], 4)
+        self.assertIn('model_leader_changed', {e['code'] for e in incremental['events']})
+
+    def test_a_row_observed_before_the_cached_ones_forces_a_rebuild(self):
+        selected_signal(self.now, probability=0.6)
+        selected_signal(self.now + timedelta(hours=2), probability=0.7)
+        build_timeline(7001)
+
+        selected_signal(self.now + timedelta(hours=1), probability=0.65)
+        self.assertEqual(build_timeline(7001), self.rebuilt())
@@ -0,0 +1,95 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import FixtureSearchEntry
+from core.services import fixture_search
+
+
+def provider_fixture(fixture_id, home, away, kickoff, league='Premier League',
+                     league_id=8, predictions=()):
+    return {
+        'id': fixture_id,
+        'starting_at': kickoff.strftime('%Y-%m-%d %H:%M:%S'),
+        'league': {'id': league_id, 'name': league},
+        'participants': [
+            {'name': home, 'meta': {'location': 'home'}},
+            {'name': away, 'meta': {'location': 'away'}},
+        ],
+        'predictions': [{'type_id': t} for t in predictions],
+    }
+
+
+class FixtureSearchIndexTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now().replace(microsecond=0)
+        self.soon = self.now + timedelta(days=1)
+        fixture_search.refresh([
+            provider_fixture(1, 'Tottenham Hotspur', 'Chelsea', self.soon, predictions=[233]),
+            provider_fixture(2, 'Atlético Madrid', 'Sevilla', self.soon + timedelta(hours=2),
+                             league='La Liga', league_id=564),
+        ], now=self.now)
+
+    def test_names_aliases_and_accents_match(self):
+        self.assertEqual([r['fixture_id'] for r in fixture_search.search('spurs')], [1])
+        self.assertEqual([r['fixture_id'] for r in fixture_search.search('ATLETICO')], [2])
+        self.assertEqual([r['fixture_id'] for r in fixture_search.search('la liga')], [2])
+
+        hit = fixture_search.search('chelsea')[0]
+        self.assertEqual(hit['home_team'], 'Tottenham Hotspur')
+        self.assertTrue(hit['has_predictions'])
+        self.assertEqual(hit['kickoff'], self.soon.isoformat())
+
+    def test_league_filter_takes_an_id(self):
+        self.assertEqual(fixture_search.search('sevilla', league_filter='8'), [])
+        self.assertEqual(len(fixture_search.search('sevilla', league_filter='564')), 1)
+
+    def test_refresh_replaces_the_previous_sweep(self):
+        later = self.now + timedelta(hours=1)
+        summary = fixture_search.refresh([
+            provider_fixture(1, 'Tottenham Hotspur', 'Arsenal', self.soon),
+        ], now=later)
+
+        self.assertEqual(summary, {'indexed': 1, 'removed': 1})
+        entry = FixtureSearchEntry.objects.get()
+        self.assertEqual(entry.away_team, 'Arsenal')
+        self.assertEqual(entry.indexed_at, later)
+
+    def test_an_empty_sweep_keeps_the_index(self):
+        for sweep in ([], [{'id': 3, 'participants': []}]):
+            summary = fixture_search.refresh(sweep, now=self.now + timedelta(hours=1))
+            self.assertEqual(summary, {'indexed': 0, 'removed': 0})
+        self.assertEqual(FixtureSearchEntry.objects.count(), 2)
+        self.assertEqual([r['fixture_id'] for r in fixture_search.search('spurs')], [1])
+
+    def test_index_goes_cold_when_refreshes_stop(self):
+        self.assertTrue(fixture_search.is_warm(now=self.now))
+        self.assertFalse(fixture_search.is_warm(
+            now=self.now + fixture_search.STALE_AFTER + timedelta(seconds=1)))
+
+
+class SearchEndpointTests(TestCase):
+    def test_a_warm_index_answers_without_calling_the_provider(self):
+        fixture_search.refresh([provider_fixture(
+            5, 'Manchester United', 'Everton', timezone.now() + timedelta(days=2))])
+
+        with mock.patch('core.services.fixture_search.provider_http.get_json') as provider:
+            response = self.client.get('/api/search/?q=man utd')
+
+        provider.assert_not_called()
+        self.assertEqual(response.json()['count'], 1)
+
+    @mock.patch.dict('os.environ', {'SPORTMONKS_API_TOKEN': 'test-token'})
+    def test_a_cold_index_is_seeded_by_one_live_sweep(self):
+        body = {'data': [provider_fixture(
+            6, 'Newcastle United', 'Fulham', timezone.now() + timedelta(days=3))]}
+        with mock.patch('core.services.fixture_search.provider_http.get_json',
+                        new_callable=mock.AsyncMock, return_value=body) as provider:
+            first = self.client.get('/api/search/?q=newcastle')
+            second = self.client.get('/api/search/?q=fulham')
+
+        self.assertEqual(provider.call_count, 1)
+        self.assertEqual(first.json()['results'][0]['fixture_id'], 6)
+        self.assertEqual(second.json()['count'], 1)
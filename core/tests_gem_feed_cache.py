@@ -1,3 +1,5 @@
+import gzip
+import json
 from datetime import timedelta
 from io import StringIO
 from unittest.mock import Mock, patch
@@ -108,10 +110,54 @@ class GemFeedSnapshotEndpointTests(TestCase):
         body = response.json()
         self.assertTrue(body['available'])
         self.assertEqual(body['feed']['fixtures_analyzed'], 140)
-        self.assertGreaterEqual(body['age_seconds'], 299)
+        self.assertEqual(body['recommendation_count'], 0)
         self.assertIn('no-store', response['Cache-Control'])
         self.assertIn('X-Internal-Auth', response['Vary'])
 
+    @patch.dict('os.environ', {'INTERNAL_API_SECRET': SECRET}, clear=False)
+    def test_serves_stored_bytes_and_304_for_an_unchanged_feed(self):
+        cached = gem_feed_cache.store(feed(recommendations=[{'fixture_id': 7}]))
+        first = self.client.get(self.url, HTTP_X_INTERNAL_AUTH=SECRET)
+        self.assertEqual(first.content, bytes(cached.body))
+        self.assertEqual(first['ETag'], cached.etag)
+
+        with self.assertNumQueries(1):
+            again = self.client.get(
+                self.url, HTTP_X_INTERNAL_AUTH=SECRET, HTTP_IF_NONE_MATCH=first['ETag'],
+            )
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.content, b'')
+
+        gem_feed_cache.store(feed(ranking='gems-v4'))
+        changed = self.client.get(
+            self.url, HTTP_X_INTERNAL_AUTH=SECRET, HTTP_IF_NONE_MATCH=first['ETag'],
+        )
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.json()['ranking_version'], 'gems-v4')
+
+    @patch.dict('os.environ', {'INTERNAL_API_SECRET': SECRET}, clear=False)
+    def test_gzip_variant_is_served_when_accepted(self):
+        gem_feed_cache.store(feed())
+        response = self.client.get(
+            self.url, HTTP_X_INTERNAL_AUTH=SECRET, HTTP_ACCEPT_ENCODING='gzip;q=1, br;q=0',
+        )
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(
+            json.loads(gzip.decompress(response.content))['feed']['total'], 0,
+        )
+
+    @patch.dict('os.environ', {'INTERNAL_API_SECRET': SECRET}, clear=False)
+    def test_row_stored_before_encoding_is_encoded_on_first_poll(self):
+        gem_feed_cache.store(feed())
+        GemFeedCache.objects.update(body=None, body_gzip=None, body_br=None, etag='')
+
+        response = self.client.get(self.url, HTTP_X_INTERNAL_AUTH=SECRET)
+
+        self.assertTrue(response.json()['available'])
+        self.assertEqual(response['ETag'], gem_feed_cache.current_etag())
+
     @patch.dict('os.environ', {'INTERNAL_API_SECRET': SECRET}, clear=False)
     def test_rejects_writes(self):
         self.assertEqual(
@@ -212,8 +212,12 @@ class SignedIngestTests(TestCase):
         self.assertEqual(PredictionLog.objects.count(), 1)
 
     def test_two_genuinely_different_runs_create_distinct_snapshots(self):
+        moved = valid_rec(odds=2.05, best_market={
+            'type': '1x2', 'type_id': 1, 'odds': 2.05, 'bookmaker': 'bet365'})
+        moved['odds_provenance']['odds'] = 2.05
+        moved_body = json.dumps({'recommendations': [moved]})
         self._post(**signed_headers(self.body, request_id='runaaaa'))
-        self._post(**signed_headers(self.body, request_id='runbbbb'))
+        self._post(moved_body, **signed_headers(moved_body, request_id='runbbbb'))
 
         self.assertEqual(PredictionLog.objects.count(), 1, 'latest-state row is updated')
         self.assertEqual(PredictionSnapshot.objects.count(), 2, 'both runs are recorded')
@@ -221,6 +225,17 @@ class SignedIngestTests(TestCase):
             PredictionSnapshot.objects.values('prediction_run_id').distinct().count(), 2
         )
 
+    def test_a_run_repeating_the_newest_state_confirms_it(self):
+        self._post(**signed_headers(self.body, request_id='runaaaa'))
+        self._post(**signed_headers(self.body, request_id='runbbbb'))
+
+        self.assertEqual(PredictionSnapshot.objects.count(), 1, 'nothing changed')
+        snapshot = PredictionSnapshot.objects.get()
+        self.assertTrue(snapshot.verify_integrity())
+        self.assertEqual(snapshot.confirmation.confirmed_run_count, 1)
+        self.assertEqual(snapshot.confirmation.last_confirmed_run_id,
+                         hashlib.sha256(b'runbbbb').hexdigest()[:32])
+
     def test_run_id_is_derived_from_the_request_id(self):
         """So a retry lands on the same snapshot uniqueness key."""
         resp = self._post(**signed_headers(self.body, request_id='deadbeef'))
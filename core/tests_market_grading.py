@@ -0,0 +1,125 @@
+import itertools
+import math
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from core.services import market_evaluation, market_grading, market_outcomes, strategy_lab
+
+SCORES = list(itertools.product(range(6), repeat=2))
+LINES = [quarter / 4 for quarter in range(-14, 15)]
+ODDS = 1.91
+
+
+def scalar_rows():
+    """Every market/side/line the strategy lab settles, on every 0-5 score."""
+    bets = [('asian_handicap', side, line) for side in ('home', 'away') for line in LINES]
+    bets += [('asian_goal_line', side, line + 3) for side in ('over', 'under') for line in LINES]
+    bets += [
+        ('team_total_goals', side, line + 3)
+        for side in ('home_over', 'home_under', 'away_over', 'away_under')
+        for line in LINES[::2]
+    ]
+    bets += [('1x2', side, None) for side in ('home', 'draw', 'away')]
+    bets += [('btts', side, None) for side in ('yes', 'no')]
+    bets += [('double_chance', side, None) for side in ('1x', 'x2', '12')]
+    bets += [
+        (market, side, None)
+        for market in ('over_under_1.5', 'over_under_2.5', 'over_under_3.5')
+        for side in ('over', 'under')
+    ]
+    # Sides are matched case-insensitively, as _direct_win always has.
+    bets += [
+        ('asian_handicap', 'AWAY', -.75), ('asian_handicap', 'Home', .25),
+        ('asian_goal_line', 'Over', 2.75), ('asian_goal_line', 'UNDER', 2.5),
+        ('team_total_goals', 'Home_Over', 1.5), ('team_total_goals', 'AWAY_UNDER', .5),
+        ('1x2', 'Draw', None), ('btts', 'YES', None), ('over_under_2.5', 'Over', None),
+    ]
+    return [
+        (market, side, line, home, away)
+        for market, side, line in bets
+        for home, away in SCORES
+    ]
+
+
+def grade(rows, odds=ODDS):
+    return market_grading.grade(
+        [r[0] for r in rows], [r[1] for r in rows], [r[2] for r in rows],
+        [odds] * len(rows), [r[3] for r in rows], [r[4] for r in rows],
+    )
+
+
+class MarketGradingParityTests(SimpleTestCase):
+    def test_profit_and_outcome_match_the_strategy_lab_scalars(self):
+        rows = scalar_rows()
+        grades = grade(rows)
+        outcomes = grades.outcomes()
+
+        self.assertTrue(grades.graded.all())
+        for i, (market, side, line, home, away) in enumerate(rows):
+            expected = strategy_lab._profit_for(
+                SimpleNamespace(market=market, side=side, handicap=line, odds=ODDS),
+                SimpleNamespace(home_score=home, away_score=away),
+            )
+            with self.subTest(market=market, side=side, line=line, score=(home, away)):
+                self.assertTrue(math.isclose(grades.profit[i], expected, abs_tol=1e-12))
+                self.assertEqual(outcomes[i], strategy_lab.outcome_for(expected, ODDS))
+
+    def test_won_flag_matches_evaluate_prediction(self):
+        rows = [
+            (market, side, None, home, away)
+            for market, sides in market_grading.OUTCOME_NAMES.items()
+            for side in sides
+            for home, away in SCORES
+        ]
+        won = grade(rows).won
+
+        for i, (market, side, _, home, away) in enumerate(rows):
+            with self.subTest(market=market, side=side, score=(home, away)):
+                self.assertIs(
+                    bool(won[i]),
+                    market_evaluation.evaluate_prediction(market, side, home, away),
+                )
+
+    def test_outcome_vectors_match_the_scalar_vectors(self):
+        rows = [(market, home, away)
+                for market in market_outcomes.MARKETS for home, away in SCORES]
+        vectors = market_grading.outcome_vectors(*zip(*rows))
+
+        for (market, home, away), vector in zip(rows, vectors):
+            self.assertEqual(vector, market_outcomes.outcome_vector(market, home, away))
+
+    def test_outcome_vectors_keep_the_scalar_validation(self):
+        with self.assertRaises(ValueError):
+            market_grading.outcome_vectors(['1x2'], [None], [0])
+        with self.assertRaises(ValueError):
+            market_grading.outcome_vectors(['corners'], [1], [0])
+
+
+class MarketGradingEdgeTests(SimpleTestCase):
+    def test_rows_it_cannot_grade_are_flagged_not_guessed(self):
+        grades = market_grading.grade(
+            ['correct_score', '1x2', 'asian_handicap', 'btts', 'double_chance'],
+            ['1-0', 'home', 'home', 'maybe', '1x'],
+            [None, None, None, None, None],
+            [8.0, 2.0, 1.9, 1.9, None],
+            [1, None, 1, 1, 1],
+            [0, 0, 0, 1, 0],
+        )
+
+        self.assertFalse(grades.graded.any())
+        self.assertTrue(all(math.isnan(p) for p in grades.profit))
+        self.assertEqual(list(grades.outcomes()), [None] * 5)
+
+    def test_quarter_lines_split_the_stake(self):
+        grades = market_grading.grade(
+            ['asian_handicap', 'asian_handicap', 'asian_goal_line'],
+            ['home', 'away', 'over'],
+            [-0.25, 0.25, 2.75],
+            [2.0, 2.0, 2.0],
+            [1, 1, 2],
+            [1, 1, 1],
+        )
+
+        self.assertEqual(grades.profit.tolist(), [-0.5, 0.5, 0.5])
+        self.assertEqual(grades.outcomes().tolist(), ['half_loss', 'half_win', 'half_win'])
@@ -0,0 +1,133 @@
+import importlib.util
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
+
+from core.models import SignalObservation
+from core.services import evidence_frames, parquet_export
+
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=dt_timezone.utc)
+
+
+def signal(created_at, outcome='home', price_vector=None):
+    row = SignalObservation.objects.create(
+        observation_id=uuid.uuid4(), ingestion_run_id='run',
+        source_payload_hash=str(uuid.uuid4()), fixture_id=7101,
+        home_team='Alpha', away_team='Beta', kickoff=utc(2026, 8, 1),
+        observed_at=utc(2026, 7, 31), hours_to_kickoff=24.0, market='1x2',
+        outcome=outcome, raw_probability=60, normalized_probability=0.6,
+        raw_vector={'home': 0.6, 'away': 0.4}, market_price_vector=price_vector,
+        vector_sum=1.0,
+    )
+    SignalObservation.objects.filter(pk=row.pk).update(created_at=created_at)
+    return row
+
+
+class FrameTests(TestCase):
+    def test_columns_keep_their_types(self):
+        signal(utc(2026, 7, 31, 12), price_vector={'home': {'odds': 1.9}})
+
+        frame = next(parquet_export.frames('signal_observation'))
+
+        self.assertEqual(str(frame['fixture_id'].dtype), 'Int64')
+        self.assertEqual(str(frame['normalized_probability'].dtype), 'Float64')
+        self.assertEqual(str(frame['created_at'].dtype), 'datetime64[ns, UTC]')
+        self.assertEqual(str(frame['observation_id'].dtype), 'string')
+        self.assertEqual(json.loads(frame['raw_vector'][0]), {'away': 0.4, 'home': 0.6})
+        self.assertEqual(json.loads(frame['market_price_vector'][0]),
+                         {'home': {'odds': 1.9}})
+
+    def test_watermark_bounds_are_exclusive_then_inclusive(self):
+        signal(utc(2026, 7, 1), outcome='early')
+        signal(utc(2026, 7, 2), outcome='edge')
+        signal(utc(2026, 7, 3), outcome='late')
+
+        frame = next(parquet_export.frames(
+            'signal_observation', since=utc(2026, 7, 1), until=utc(2026, 7, 2)))
+
+        self.assertEqual(list(frame['outcome']), ['edge'])
+
+    def test_rows_are_chunked(self):
+        for hour in range(5):
+            signal(utc(2026, 7, 1, hour))
+
+        sizes = [len(f) for f in parquet_export.frames('signal_observation', chunk_size=2)]
+
+        self.assertEqual(sizes, [2, 2, 1])
+
+    def test_missing_pyarrow_is_a_command_error(self):
+        with mock.patch.dict('sys.modules', {'pyarrow': None}), \
+                tempfile.TemporaryDirectory() as out:
+            with self.assertRaisesMessage(CommandError, 'pyarrow is required'):
+                call_command('export_analysis_parquet', '--out', out, stdout=StringIO())
+
+
+@unittest.skipUnless(HAS_PYARROW, 'pyarrow is not installed')
+class ExportRoundTripTests(TestCase):
+    def test_second_run_appends_only_new_rows_by_month(self):
+        signal(utc(2026, 6, 30, 12), outcome='june')
+        signal(utc(2026, 7, 1, 12), outcome='july')
+        with tempfile.TemporaryDirectory() as out:
+            first = parquet_export.export(out, now=utc(2026, 7, 2))
+            signal(utc(2026, 7, 5), outcome='later')
+            second = parquet_export.export(out, now=utc(2026, 7, 6))
+
+            self.assertEqual(first['signal_observation'], 2)
+            self.assertEqual(second['signal_observation'], 1)
+            self.assertEqual(
+                sorted(os.listdir(os.path.join(out, 'signal_observation'))),
+                ['month=2026-06', 'month=2026-07'])
+            frame = evidence_frames.read_table(
+                out, 'signal_observation', columns=['outcome'], months=['2026-07'])
+            self.assertEqual(sorted(frame['outcome']), ['july', 'later'])
+            self.assertEqual(list(frame.columns), ['outcome'])
+
+    def test_interrupted_export_is_not_duplicated_by_the_rerun(self):
+        for outcome in ('home', 'draw', 'away'):
+            signal(utc(2026, 7, 1, 12), outcome=outcome)
+        append = parquet_export._append
+
+        def fail_after_writing(root, table, *args):
+            written = append(root, table, *args)
+            if table == 'signal_observation':
+                raise RuntimeError('disk full')
+            return written
+
+        with tempfile.TemporaryDirectory() as out:
+            with mock.patch.object(parquet_export, '_append', fail_after_writing):
+                with self.assertRaises(RuntimeError):
+                    parquet_export.export(out, now=utc(2026, 7, 2))
+            parquet_export.export(out, now=utc(2026, 7, 2, 0, 10))
+
+            frame = evidence_frames.read_table(
+                out, 'signal_observation', columns=['observation_id'])
+            self.assertEqual(len(frame), 3)
+            self.assertEqual(frame['observation_id'].nunique(), 3)
+
+
+class SqliteSnapshotTests(SimpleTestCase):
+    def test_sqlite_snapshot_reads_as_before(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'snapshot.sqlite')
+            conn = sqlite3.connect(path)
+            conn.execute('CREATE TABLE prediction_log (id TEXT, odds TEXT)')
+            conn.execute("INSERT INTO prediction_log VALUES ('1', '1.9')")
+            conn.commit()
+            conn.close()
+
+            frame = evidence_frames.read_table(path, 'prediction_log', columns=['odds'])
+
+        self.assertEqual(frame.to_dict('records'), [{'odds': '1.9'}])
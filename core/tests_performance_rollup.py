@@ -0,0 +1,114 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.models import PerformanceRollup, PredictionLog, PublishedClaim
+from core.services import performance_rollup
+from core.services.accuracy_calculator import AccuracyCalculator, RollupAccuracyCalculator
+from core.tests import publish_claim, settle_claim
+from core.tests_public_performance import _pred
+
+
+def comparable(stats):
+    stats = dict(stats)
+    stats.pop('timestamp')
+    stats['accuracy_by_league'] = sorted(stats['accuracy_by_league'], key=lambda r: r['league'])
+    return stats
+
+
+class RollupMatchesTheFullRecomputeTests(TestCase):
+    def setUp(self):
+        rows = [
+            (0.72, 'Premier League', 'over_under_2.5', True, 2.1),
+            (0.72, 'Premier League', 'over_under_2.5', False, 1.9),
+            (0.66, 'Premier League', 'btts', True, 1.8),
+            (0.61, 'La Liga', '1x2', False, 2.4),
+            (0.57, 'La Liga', 'double_chance', True, 1.4),
+            (0.57, 'Serie A', 'over_under_2.5', True, 3.0),
+        ]
+        for i, (confidence, league, market, correct, odds) in enumerate(rows):
+            publish_claim(_pred(960000 + i, confidence=confidence, league=league,
+                                market=market, correct=correct, odds=odds))
+        settle_claim(publish_claim(_pred(960100), settle=False), PublishedClaim.STATUS_VOID)
+
+    def test_every_public_figure_matches_the_claim_walk(self):
+        self.assertEqual(
+            comparable(RollupAccuracyCalculator().get_comprehensive_stats()),
+            comparable(AccuracyCalculator().get_comprehensive_stats()),
+        )
+
+    def test_voids_are_kept_but_never_score(self):
+        summed = performance_rollup.totals()
+        self.assertEqual((summed['settled'], summed['voids']), (7, 1))
+        self.assertEqual(RollupAccuracyCalculator().get_roi_simulation()['total_bets'], 6)
+
+    def test_checker_finds_nothing_to_repair(self):
+        summary = performance_rollup.check(repair=True)
+        self.assertEqual(summary['mismatched'], 0)
+        self.assertFalse(summary['repaired'])
+
+    def test_public_summary_reads_the_rollups(self):
+        body = self.client.get('/api/transparency/summary/').json()['summary']
+        self.assertEqual(body['total_predictions'], 6)
+        self.assertEqual(body['recent_7_days']['total'], 6)
+
+        PerformanceRollup.objects.all().delete()
+        body = self.client.get('/api/transparency/summary/').json()['summary']
+        self.assertEqual(body['total_predictions'], 0)
+
+
+class RollupMaintenanceTests(TestCase):
+    def test_settlement_is_counted_once(self):
+        claim = publish_claim(_pred(961001, correct=True, odds=2.5), settle=False)
+        settle_claim(claim, PublishedClaim.STATUS_WON)
+        settle_claim(claim, PublishedClaim.STATUS_WON)
+
+        row = PerformanceRollup.objects.get()
+        self.assertEqual((row.settled, row.wins, row.losses), (1, 1, 0))
+        self.assertAlmostEqual(row.profit_units, 1.5)
+        self.assertEqual(row.confidence_bucket, '60-65%')
+
+    def test_unverified_claims_never_enter_the_rollups(self):
+        publish_claim(
+            _pred(961002, status=PredictionLog.PRICING_LEGACY_UNVERIFIED),
+            pricing_integrity_status=PredictionLog.PRICING_LEGACY_UNVERIFIED,
+        )
+        self.assertFalse(PerformanceRollup.objects.exists())
+
+    def test_exclusion_after_settlement_is_repaired_by_the_checker(self):
+        claim = publish_claim(_pred(961003, correct=True))
+        PublishedClaim.objects.filter(pk=claim.claim_id).update(odds=99.0)
+
+        with self.assertLogs('core.services.performance_rollup', 'WARNING'):
+            summary = performance_rollup.check()
+        self.assertEqual(summary['mismatched'], 1)
+        self.assertIsNone(summary['differences'][0]['expected'])
+        self.assertEqual(RollupAccuracyCalculator().get_roi_simulation()['total_bets'], 1)
+
+        with self.assertLogs('core.services.performance_rollup', 'WARNING'):
+            performance_rollup.check(repair=True)
+        self.assertEqual(performance_rollup.check()['mismatched'], 0)
+        self.assertEqual(RollupAccuracyCalculator().get_roi_simulation()['total_bets'], 0)
+
+    def test_repair_backfills_claims_settled_before_the_table_existed(self):
+        publish_claim(_pred(961004, correct=True))
+        publish_claim(_pred(961005, correct=False))
+        PerformanceRollup.objects.all().delete()
+
+        call_command('check_performance_rollups', repair=True, stdout=StringIO())
+
+        self.assertEqual(RollupAccuracyCalculator().get_roi_simulation(),
+                         AccuracyCalculator().get_roi_simulation())
+
+    def test_scheduled_check_runs_once_a_day(self):
+        cache.delete('performance_rollup:last_check')
+        self.addCleanup(cache.delete, 'performance_rollup:last_check')
+        first, second = StringIO(), StringIO()
+
+        call_command('check_performance_rollups', if_due=True, stdout=first)
+        call_command('check_performance_rollups', if_due=True, stdout=second)
+
+        self.assertIn('rows match', first.getvalue())
+        self.assertIn('skipping', second.getvalue())
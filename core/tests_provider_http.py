@@ -0,0 +1,48 @@
+import importlib.util
+import unittest
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+
+from core.services import provider_http
+
+HAS_HTTPX = importlib.util.find_spec('httpx') is not None
+
+
+@unittest.skipUnless(HAS_HTTPX, 'httpx is not installed')
+class ProviderHttpTests(SimpleTestCase):
+    def _transport(self, handler):
+        import httpx
+
+        transport = httpx.MockTransport(handler)
+        return mock.patch.object(
+            provider_http, '_client',
+            side_effect=lambda: httpx.AsyncClient(transport=transport))
+
+    def test_json_body_is_returned(self):
+        import httpx
+
+        def handler(request):
+            self.assertEqual(request.url.params['page'], '2')
+            return httpx.Response(200, json={'data': [1]})
+
+        with self._transport(handler):
+            body = async_to_sync(provider_http.get_json)(
+                'https://provider.invalid/fixtures', params={'page': '2'})
+
+        self.assertEqual(body, {'data': [1]})
+
+    def test_status_and_timeout_become_provider_errors(self):
+        import httpx
+
+        with self._transport(lambda request: httpx.Response(502)):
+            with self.assertRaises(provider_http.ProviderError):
+                async_to_sync(provider_http.get_json)('https://provider.invalid/x')
+
+        def slow(request):
+            raise httpx.ReadTimeout('slow', request=request)
+
+        with self._transport(slow):
+            with self.assertRaises(provider_http.ProviderTimeout):
+                async_to_sync(provider_http.get_json)('https://provider.invalid/x')
@@ -0,0 +1,91 @@
+import json
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.test import AsyncClient, Client, TestCase
+from django.utils import timezone
+
+from core.models import PredictionLog
+
+URL = '/api/recommended-predictions/'
+
+
+class RecommendedPredictionModesTests(TestCase):
+    """Streamed and paged responses carry exactly what the buffered one does."""
+
+    def setUp(self):
+        self.client = Client()
+        kickoff = timezone.now().replace(microsecond=0)
+        for i in range(7):
+            done = i % 2 == 0
+            PredictionLog.objects.create(
+                fixture_id=610000 + i, home_team=f'H{i}', away_team=f'A{i}',
+                league='Eredivisie',
+                # Two pairs share a kickoff, so the cursor must break ties.
+                kickoff=kickoff - timedelta(hours=i // 2),
+                predicted_outcome='home', confidence=0.61, expected_value=0.08,
+                odds=1.9, probability_home=0.61, probability_draw=0.2,
+                probability_away=0.19, is_recommended=True,
+                pricing_integrity_status=PredictionLog.PRICING_VERIFIED,
+                actual_outcome='home' if done else None,
+                was_correct=True if done else None,
+                profit_loss_10=9.0 if done else None,
+                roi_percent=90.0 if done else None,
+            )
+
+    def buffered(self, **params):
+        body = json.loads(self.client.get(URL, params).content)
+        body.pop('timestamp')
+        return body
+
+    def test_stream_matches_the_buffered_response(self):
+        response = self.client.get(URL, {'stream': 'true'})
+        self.assertTrue(response.streaming)
+        body = json.loads(b''.join(response.streaming_content))
+        body.pop('timestamp')
+        self.assertEqual(body, self.buffered())
+
+    def test_stream_of_nothing_is_still_valid_json(self):
+        PredictionLog.objects.all().delete()
+        response = self.client.get(URL, {'stream': 'true'})
+        body = json.loads(b''.join(response.streaming_content))
+        self.assertEqual((body['data'], body['count']), ([], 0))
+        self.assertEqual(body['summary']['total_recommended'], 0)
+
+    def test_cursor_pages_cover_every_row_once_in_order(self):
+        full = self.buffered()
+        pages, cursor = [], None
+        while True:
+            params = {'page_size': 3}
+            if cursor:
+                params['cursor'] = cursor
+            body = json.loads(self.client.get(URL, params).content)
+            pages.append(body)
+            cursor = body['next_cursor']
+            if cursor is None:
+                break
+
+        self.assertEqual([p['count'] for p in pages], [3, 3, 1])
+        self.assertEqual([r for p in pages for r in p['data']], full['data'])
+        self.assertEqual(pages[0]['summary'], full['summary'])
+        self.assertNotIn('summary', pages[1])
+
+    def test_a_malformed_cursor_is_refused(self):
+        response = self.client.get(URL, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_rows_are_read_without_building_model_instances(self):
+        with mock.patch.object(PredictionLog, 'from_db',
+                               side_effect=AssertionError('model instance built')):
+            response = self.client.get(URL, {'stream': 'true'})
+            body = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(body['count'], 7)
+
+    async def test_asgi_stream_is_not_buffered_by_the_handler(self):
+        response = await AsyncClient().get(URL, {'stream': 'true'})
+        # A sync iterator here would be read whole into memory by the handler.
+        self.assertTrue(response.is_async)
+        body = json.loads(b''.join([chunk async for chunk in response.streaming_content]))
+        body.pop('timestamp')
+        self.assertEqual(body, await sync_to_async(self.buffered)())
@@ -1,11 +1,15 @@
 """Result-evidence and market-derivation contracts (Priority 1C)."""
 import uuid
 from datetime import timedelta
+from io import StringIO
 
+from django.core.management import call_command
 from django.test import TestCase
 from django.utils import timezone
 
-from core.models import FixtureResultObservation, PredictionLog, SignalObservation
+from core.models import (
+    FixtureLifecycle, FixtureResultObservation, PredictionLog, SignalObservation,
+)
 from core.services import market_outcomes, result_evidence
 
 
@@ -197,6 +201,100 @@ class ResultCaptureTests(TestCase):
         self.assertEqual(before, after)
 
 
+class FixtureLifecycleTests(TestCase):
+    """"Needing results" is read from a lifecycle row that capture maintains."""
+
+    def state(self, fixture_id):
+        return FixtureLifecycle.objects.get(fixture_id=fixture_id).result_state
+
+    def test_observations_open_a_lifecycle_and_widen_its_window(self):
+        first = _obs(fixture_id=8200, hours_ago=3)
+        later = _obs(fixture_id=8200, hours_ago=3,
+                     observed_at=first.observed_at + timedelta(hours=20))
+
+        row = FixtureLifecycle.objects.get(fixture_id=8200)
+        self.assertEqual(row.result_state, FixtureLifecycle.STATE_PENDING)
+        self.assertEqual((row.first_observed_at, row.last_observed_at),
+                         (first.observed_at, later.observed_at))
+        self.assertEqual(row.kickoff, first.kickoff)
+
+    def test_result_capture_moves_the_state_forward(self):
+        _obs(fixture_id=8201)
+        result_evidence.capture([_fixture(8201)])
+        self.assertEqual(self.state(8201), FixtureLifecycle.STATE_PROVISIONAL)
+
+        later = timezone.now() + timedelta(minutes=45)
+        result = result_evidence.capture([_fixture(8201)], now=later)
+        self.assertEqual(result['confirmed'], 1)
+        self.assertEqual(self.state(8201), FixtureLifecycle.STATE_CONFIRMED)
+        self.assertNotIn(8201, result_evidence.fixtures_needing_results())
+
+    def test_a_correction_after_confirmation_reopens_polling(self):
+        _obs(fixture_id=8202)
+        result_evidence.capture([_fixture(8202)])
+        result_evidence.capture([_fixture(8202)], now=timezone.now() + timedelta(hours=1))
+        result_evidence.capture([_fixture(8202, home=3, away=1)],
+                                now=timezone.now() + timedelta(hours=2))
+
+        self.assertEqual(self.state(8202), FixtureLifecycle.STATE_PROVISIONAL)
+        self.assertIn(8202, result_evidence.fixtures_needing_results())
+
+    def test_a_result_alone_does_not_enter_the_observed_universe(self):
+        result_evidence.capture([_fixture(8203)])
+        self.assertTrue(FixtureLifecycle.objects.filter(fixture_id=8203).exists())
+        self.assertNotIn(8203, result_evidence.fixtures_needing_results())
+
+        _obs(fixture_id=8203)
+        self.assertIn(8203, result_evidence.fixtures_needing_results())
+
+    def test_lookup_cost_does_not_grow_with_evidence(self):
+        for fixture_id in range(8210, 8240):
+            _obs(fixture_id=fixture_id)
+            if fixture_id % 2:
+                result_evidence.capture([_fixture(fixture_id, status='POSTP',
+                                                  home=None, away=None)])
+
+        with self.assertNumQueries(1):
+            pending = result_evidence.fixtures_needing_results()
+        self.assertEqual(pending, list(range(8210, 8240, 2)))
+
+    def test_the_migration_backfill_matches_live_maintenance(self):
+        import importlib
+        from django.apps import apps
+
+        _obs(fixture_id=8250)
+        _obs(fixture_id=8251)
+        result_evidence.capture([_fixture(8251)])
+        _obs(fixture_id=8252)
+        result_evidence.capture([_fixture(8252, status='CANCL', home=None, away=None)])
+        fields = ('fixture_id', 'kickoff', 'first_observed_at', 'last_observed_at',
+                  'result_state', 'result_version', 'result_captured_at')
+        live = list(FixtureLifecycle.objects.order_by('fixture_id').values_list(*fields))
+
+        FixtureLifecycle.objects.all().delete()
+        migration = importlib.import_module('core.migrations.0045_fixturelifecycle')
+        migration.backfill(apps, None)
+
+        rebuilt = list(FixtureLifecycle.objects.order_by('fixture_id').values_list(*fields))
+        self.assertEqual(rebuilt, live)
+
+
+class AuditShadowVariantsCommandTests(TestCase):
+    def test_a_settled_binary_market_is_scored(self):
+        for fixture_id in (8201, 8202):
+            for outcome, probability in (('over', 0.62), ('under', 0.38)):
+                _obs(fixture_id, outcome=outcome, raw_probability=probability * 100,
+                     normalized_probability=probability, variant_b_available=True,
+                     adjusted_score=probability + 0.03)
+        result_evidence.capture([_fixture(8201, home=2, away=1), _fixture(8202, home=0, away=0)])
+
+        out = StringIO()
+        call_command('audit_shadow_variants', stdout=out)
+        report = out.getvalue()
+        self.assertIn('--- over_under_2.5 (n=2) ---', report)
+        self.assertIn('A_raw        n=   2  Brier 0.26440', report)
+
+
 class SchedulerDegradedTests(TestCase):
     def test_a_failed_stage_makes_the_run_degraded_not_successful(self):
         from core.models import SchedulerHeartbeat
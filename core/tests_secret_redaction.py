@@ -74,6 +74,35 @@ class RedactCredentialShapedParams(SimpleTestCase):
         self.assertNotIn('SOMELONGSECRETVALUE123', out)
 
 
+class CompiledRedactionEngine(SimpleTestCase):
+    """All three rules run as one cached regex, rebuilt when a secret changes."""
+
+    def test_engine_is_reused_until_a_secret_changes(self):
+        from core.services import redaction
+
+        with patch.dict(os.environ, {'SPORTMONKS_API_TOKEN': FAKE_TOKEN}):
+            pattern, _ = redaction._current_engine()
+            self.assertIs(redaction._current_engine()[0], pattern)
+            os.environ['SPORTMONKS_API_TOKEN'] = FAKE_SECRET
+            self.assertIsNot(redaction._current_engine()[0], pattern)
+            self.assertNotIn(FAKE_SECRET, redact(f'x {FAKE_SECRET} y'))
+
+    def test_a_secret_is_never_cut_short_by_a_structural_rule(self):
+        # ':' and ';' end a bearer or param value; the secret must still go whole.
+        db_url = 'postgres://user:pw@db.internal:5432/prod;sslmode=require'
+        with patch.dict(os.environ, {'DATABASE_URL': db_url}):
+            for text in (f'token {db_url}, retrying', f'?key={db_url}&x=1',
+                         f'Bearer ab{db_url}'):
+                out = redact(text)
+                self.assertNotIn('db.internal', out, text)
+                self.assertNotIn('sslmode', out, text)
+
+    def test_lines_without_a_trigger_are_returned_as_is(self):
+        line = 'Fetched 20 fixtures for league 271 in 1.23s'
+        self.assertIs(redact(line), line)
+        self.assertEqual(redact('TOKEN abcdefgh12345'), f'TOKEN {REDACTED}')
+
+
 class RedactRealRequestsException(SimpleTestCase):
     """The actual 2026-08-06 shape: a requests exception carrying the URL."""
 
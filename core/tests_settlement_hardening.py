@@ -20,17 +20,23 @@ import io
 from datetime import timedelta
 from unittest import mock
 
+import requests
 from django.contrib.auth.models import User
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import NoReverseMatch, reverse
 from django.utils import timezone
 from rest_framework.test import APIClient
 
-from core.models import SchedulerHeartbeat
+from core.models import PublishedClaim, SchedulerHeartbeat, SchedulerStageTiming
 from core.services.scheduler_health import (
     SchedulerAlreadyRunning,
     get_heartbeat,
     record_run,
+    report,
+    stage_metrics,
+    stage_timing_summary,
 )
 
 REMOVED_PATHS = [
@@ -214,18 +220,121 @@ class SchedulerHeartbeatRecordingTests(TestCase):
 
         self.assertEqual(get_heartbeat().health(), SchedulerHeartbeat.HEALTH_HEALTHY)
 
-    def test_counts_are_recorded_as_deltas(self):
-        from core.models import PredictionLog
+    def test_counts_are_reported_by_the_stages(self):
+        with record_run(interval_minutes=60) as run:
+            with stage_metrics() as metrics:
+                report(results_updated=1)
+                report(results_updated=1, claims_settled=1)
+            run.stage('update_results', True, metrics=metrics)
 
+        hb = get_heartbeat()
+        self.assertEqual((hb.snapshots_created, hb.results_updated, hb.claims_settled),
+                         (0, 2, 1))
+
+    def test_a_report_outside_any_stage_still_counts(self):
         with record_run(interval_minutes=60):
-            PredictionLog.objects.create(
-                fixture_id=987654, home_team='A', away_team='B', league='L',
-                kickoff=timezone.now(), predicted_outcome='Home', confidence=70.0,
-                probability_home=0.7, probability_draw=0.2, probability_away=0.1,
-                actual_outcome='Home',
-            )
+            report(snapshots_created=3)
 
-        self.assertEqual(get_heartbeat().results_updated, 1)
+        self.assertEqual(get_heartbeat().snapshots_created, 3)
+
+    def test_a_report_outside_a_run_goes_nowhere(self):
+        report(claims_settled=1)
+        with record_run(interval_minutes=60):
+            pass
+
+        self.assertEqual(get_heartbeat().claims_settled, 0)
+
+    def test_recording_a_run_never_counts_the_evidence_tables(self):
+        with CaptureQueriesContext(connection) as ctx:
+            with record_run(interval_minutes=60):
+                pass
+
+        self.assertFalse([q for q in ctx.captured_queries if 'COUNT(' in q['sql'].upper()])
+
+    def test_a_settled_claim_reaches_the_heartbeat(self):
+        from core.services import claim_publication
+        from core.tests_claim_publication import latest_state, record
+
+        pred = latest_state(987654, kickoff_in=timedelta(hours=48))
+        snap, _ = record(pred, run_id='runA')
+        claim = claim_publication.publish_prediction_claim(snap.snapshot_id)
+
+        with record_run(interval_minutes=60) as run:
+            with stage_metrics() as metrics:
+                claim_publication.settle_published_claim(
+                    claim, status=PublishedClaim.STATUS_WON)
+            run.stage('settle_published_claims', True, metrics=metrics)
+
+        self.assertEqual(metrics['claims_settled'], 1)
+        self.assertEqual(get_heartbeat().claims_settled, 1)
+
+
+class SchedulerStageTimingTests(TestCase):
+    def run_cycle(self, stages):
+        with record_run(interval_minutes=60) as run:
+            for name, work in stages:
+                with stage_metrics() as metrics:
+                    work()
+                run.stage(name, True, metrics=metrics)
+
+    def test_a_stage_measures_its_queries_and_provider_calls(self):
+        ok = requests.Response()
+        ok.status_code = 200
+        with mock.patch('requests.adapters.HTTPAdapter.send', return_value=ok):
+            with stage_metrics() as metrics:
+                SchedulerHeartbeat.objects.count()
+                SchedulerHeartbeat.objects.exists()
+                requests.get('https://provider.invalid/fixtures')
+
+        self.assertEqual(metrics['db_queries'], 2)
+        self.assertEqual(metrics['http_requests'], 1)
+        self.assertGreaterEqual(metrics['wall_seconds'],
+                                metrics['db_seconds'] + metrics['http_seconds'])
+
+    def test_http_outside_a_stage_is_not_counted(self):
+        ok = requests.Response()
+        ok.status_code = 200
+        with mock.patch('requests.adapters.HTTPAdapter.send', return_value=ok):
+            with stage_metrics() as metrics:
+                pass
+            requests.get('https://provider.invalid/fixtures')
+
+        self.assertEqual(metrics['http_requests'], 0)
+
+    def test_each_stage_of_a_run_is_recorded(self):
+        self.run_cycle([
+            ('ingest', lambda: SchedulerHeartbeat.objects.count()),
+            ('settle', lambda: None),
+        ])
+
+        rows = list(SchedulerStageTiming.objects.order_by('id'))
+        self.assertEqual([r.stage for r in rows], ['ingest', 'settle'])
+        self.assertEqual([r.db_queries for r in rows], [1, 0])
+        self.assertEqual({r.run_id for r in rows}, {get_heartbeat().run_id})
+
+    def test_history_is_bounded_to_the_latest_cycles(self):
+        with mock.patch('core.services.scheduler_health.STAGE_HISTORY_RUNS', 2):
+            for _ in range(4):
+                self.run_cycle([('ingest', lambda: None)])
+
+        self.assertEqual(SchedulerStageTiming.objects.count(), 2)
+        self.assertIn(get_heartbeat().run_id,
+                      SchedulerStageTiming.objects.values_list('run_id', flat=True))
+
+    def test_summary_reports_p50_and_p95_per_stage(self):
+        for wall in (1.0, 2.0, 3.0, 4.0, 100.0):
+            self.run_cycle([('ingest', lambda: None), ('settle', lambda: None)])
+            SchedulerStageTiming.objects.filter(
+                run_id=get_heartbeat().run_id, stage='ingest').update(wall_seconds=wall)
+
+        summary = stage_timing_summary()
+
+        self.assertEqual(summary['cycles'], 5)
+        self.assertEqual(list(summary['stages']), ['ingest', 'settle'])
+        ingest = summary['stages']['ingest']
+        self.assertEqual(ingest['cycles'], 5)
+        self.assertEqual(ingest['wall_seconds'], {'p50': 3.0, 'p95': 80.8})
+        self.assertEqual(stage_timing_summary(runs=2)['stages']['ingest']['cycles'], 2)
 
 
 class SchedulerConcurrencyTests(TestCase):
@@ -358,6 +467,21 @@ class SchedulerHealthEndpointTests(TestCase):
         self.assertEqual(resp.data['health'], SchedulerHeartbeat.HEALTH_HEALTHY)
         self.assertEqual(resp.data['interval_minutes'], 60)
         self.assertIn('results_updated', resp.data)
+        self.assertEqual(resp.data['stage_timings'], {'cycles': 0, 'stages': {}})
+
+    def test_staff_sees_stage_percentiles(self):
+        with record_run(interval_minutes=60) as run:
+            with stage_metrics() as metrics:
+                pass
+            run.stage('update_results', True, metrics=metrics)
+
+        self.client.force_authenticate(user=self.staff)
+        resp = self.client.get(self.url, {'cycles': 'all'})
+
+        timings = resp.data['stage_timings']
+        self.assertEqual(timings['cycles'], 1)
+        self.assertEqual(set(timings['stages']['update_results']['wall_seconds']),
+                         {'p50', 'p95'})
 
     def test_response_never_carries_a_raw_exception_string(self):
         with self.assertRaises(RuntimeError):
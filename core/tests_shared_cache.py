@@ -0,0 +1,111 @@
+import importlib
+from unittest import mock
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from core.services import shared_cache
+
+
+class Clock:
+    def __init__(self, start=1_000_000.0):
+        self.now = start
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class SharedCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.clock = Clock()
+        patcher = mock.patch.object(shared_cache, 'time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(cache.clear)
+
+    def get(self, compute):
+        return shared_cache.get_or_refresh('report', compute, fresh_for=60, stale_for=600)
+
+    def test_fresh_entry_is_not_rebuilt(self):
+        compute = mock.Mock(side_effect=[1, 2])
+
+        self.assertEqual(self.get(compute), 1)
+        self.clock.now += 59
+        self.assertEqual(self.get(compute), 1)
+        self.assertEqual(compute.call_count, 1)
+
+    def test_stale_entry_is_served_while_another_worker_refreshes(self):
+        self.get(lambda: 'old')
+        self.clock.now += 61
+        cache.add('report:refresh-lock', 'other-worker', 30)
+
+        compute = mock.Mock(return_value='new')
+        self.assertEqual(self.get(compute), 'old')
+        compute.assert_not_called()
+
+        cache.delete('report:refresh-lock')
+        self.assertEqual(self.get(compute), 'new')
+        self.assertIsNone(cache.get('report:refresh-lock'))
+
+    def test_failed_refresh_keeps_serving_the_stale_value(self):
+        self.get(lambda: 'old')
+        self.clock.now += 61
+
+        with self.assertLogs('core.services.shared_cache', 'ERROR'):
+            self.assertEqual(self.get(mock.Mock(side_effect=RuntimeError)), 'old')
+        self.assertIsNone(cache.get('report:refresh-lock'))
+
+    def test_cold_key_waits_for_the_lock_holder(self):
+        cache.add('report:refresh-lock', 'other-worker', 30)
+
+        def holder_finishes(seconds):
+            self.clock.now += seconds
+            shared_cache._store('report', 'built', 60, 600)
+
+        compute = mock.Mock()
+        with mock.patch.object(self.clock, 'sleep', side_effect=holder_finishes):
+            self.assertEqual(self.get(compute), 'built')
+        compute.assert_not_called()
+
+    def test_cold_key_builds_itself_when_the_holder_never_finishes(self):
+        cache.add('report:refresh-lock', 'dead-worker', 30)
+
+        self.assertEqual(self.get(lambda: 'fallback'), 'fallback')
+        self.assertEqual(self.get(mock.Mock()), 'fallback')
+
+
+DATABASE_CACHE = {'default': {
+    'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+    'LOCATION': 'smartbet_cache',
+    'KEY_PREFIX': 'smartbet',
+}}
+
+
+@override_settings(CACHES=DATABASE_CACHE)
+class DatabaseCacheSharedCacheTests(SharedCacheTests, TestCase):
+    """The same cases on the production default, the DatabaseCache table."""
+
+    def setUp(self):
+        call_command('createcachetable', verbosity=0)
+        super().setUp()
+
+    def test_lock_is_refused_while_another_worker_holds_it(self):
+        self.assertTrue(cache.add('report:refresh-lock', 'first', 30))
+        self.assertFalse(cache.add('report:refresh-lock', 'second', 30))
+        self.assertEqual(cache.get('report:refresh-lock'), 'first')
+
+    def test_migration_creates_the_table(self):
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TABLE smartbet_cache')
+        migration = importlib.import_module('core.migrations.0054_cache_table')
+
+        migration.create_cache_table(apps, connection.schema_editor())
+        self.assertIn('smartbet_cache', connection.introspection.table_names())
+        self.assertTrue(cache.add('report', 'value', 30))
@@ -12,7 +12,7 @@ from datetime import timedelta
 from django.test import TestCase
 from django.utils import timezone
 
-from core.models import SignalObservation
+from core.models import SignalObservation, SignalVector
 from core.services import evidence_capture
 
 
@@ -323,6 +323,60 @@ class EvidenceIsolationTests(TestCase):
         self.assertIn('SignalObservation', code)
 
 
+class SharedVectorStorageTests(TestCase):
+    """Vectors are stored once per sweep and read back exactly as captured."""
+
+    def test_outcome_rows_of_one_sweep_share_one_vector(self):
+        evidence_capture.capture(_payload([
+            _candidate(outcome='over'),
+            _candidate(outcome='under', normalized_probability=0.38, raw_probability=38.0),
+        ]))
+        # A later sweep with unchanged vectors reuses it too.
+        evidence_capture.capture(_payload([_candidate(odds=1.8)]))
+
+        self.assertEqual(SignalObservation.objects.count(), 3)
+        self.assertEqual(SignalVector.objects.count(), 1)
+        vector = SignalVector.objects.get()
+        self.assertIsNone(vector.verbatim)
+        self.assertEqual(len(bytes(vector.probabilities)), 2 * 8)
+
+        rows = list(SignalObservation.objects.select_related('vector'))
+        with self.assertNumQueries(0):
+            for row in rows:
+                self.assertEqual(row.raw_vector, {'over': 0.62, 'under': 0.38})
+                self.assertEqual(row.market_price_vector,
+                                 {'over': {'odds': 1.75}, 'under': {'odds': 2.05}})
+
+    def test_vectors_round_trip_exactly(self):
+        cases = [
+            ({'home': 0.1 + 0.2, 'draw': 1e-9, 'away': 0.7}, None),
+            ({'home': 0.5, 'away': 0.5},
+             {'home': {'odds': 1.91, 'bookmaker': 'bet365'}, 'away': {'odds': 1.95}}),
+            # Neither survives float packing unchanged, so both stay verbatim.
+            ({'yes': 1, 'no': 0}, {'yes': {'odds': 2}, 'no': 'n/a'}),
+            ({}, {}),
+        ]
+        for i, (raw_vector, price_vector) in enumerate(cases):
+            evidence_capture.capture(_payload([_candidate(
+                fixture_id=5100 + i, raw_vector=raw_vector,
+                market_price_vector=price_vector)]))
+            row = SignalObservation.objects.select_related('vector').get(fixture_id=5100 + i)
+            self.assertEqual(row.raw_vector, raw_vector)
+            self.assertEqual([type(v) for v in row.raw_vector.values()],
+                             [type(v) for v in raw_vector.values()])
+            self.assertEqual(row.market_price_vector, price_vector)
+
+    def test_a_row_without_a_vector_is_refused(self):
+        with self.assertRaises(ValueError):
+            SignalObservation.objects.create(
+                observation_id=uuid.uuid4(), ingestion_run_id='r',
+                source_payload_hash='x' * 64, fixture_id=5200, home_team='A',
+                away_team='B', kickoff=timezone.now(), observed_at=timezone.now(),
+                hours_to_kickoff=0, market='btts', outcome='yes',
+                raw_probability=50, normalized_probability=0.5, vector_sum=1.0,
+            )
+
+
 class EvidenceHorizonTests(TestCase):
     """Hourly rows are observations, not decisions."""
 
@@ -0,0 +1,117 @@
+import json
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+import numpy as np
+from django.test import Client, SimpleTestCase, TestCase
+from django.utils import timezone
+
+from core import api_views
+from core.bankroll_utils import calculate_stake_amount, calculate_stake_amounts
+from core.models import PredictionLog, UserBankroll
+
+
+class BatchedStakeParityTests(SimpleTestCase):
+    """calculate_stake_amounts must return what calculate_stake_amount does, row for row."""
+
+    def test_matches_scalar_calculator(self):
+        rng = np.random.default_rng(11)
+        # Out-of-range probabilities and sub-1.0 odds exercise Kelly's refusals.
+        probs = rng.uniform(-0.05, 1.02, 400).tolist()
+        odds = np.round(rng.uniform(0.9, 6.0, 400), 2).tolist()
+        confs = rng.uniform(30, 100, 400).tolist()
+        for strategy in ('kelly', 'kelly_fractional', 'fixed_percentage',
+                         'fixed_amount', 'confidence_scaled', 'unknown'):
+            for bankroll in (Decimal('1000.00'), Decimal('37.50')):
+                got = calculate_stake_amounts(
+                    bankroll, strategy, probs, odds, confs,
+                    fixed_amount=Decimal('25.00'), fixed_percentage=3.0,
+                )
+                for i, row in enumerate(got):
+                    expected = calculate_stake_amount(
+                        bankroll, strategy, probs[i], odds[i], confs[i],
+                        fixed_amount=Decimal('25.00'), fixed_percentage=3.0,
+                    )
+                    expected.pop('kelly_info')
+                    self.assertEqual(row, expected, f'{strategy} {bankroll} row {i}')
+
+    def test_empty_page(self):
+        self.assertEqual(calculate_stake_amounts(Decimal('100'), 'kelly', [], [], []), [])
+
+    def test_fixed_amount_needs_a_positive_bankroll(self):
+        for bankroll in (Decimal('0.00'), Decimal('-5.00')):
+            with self.assertRaises(ValueError):
+                calculate_stake_amounts(bankroll, 'fixed_amount', [0.6], [2.0], [70.0])
+            with self.assertRaises(ValueError):
+                calculate_stake_amount(bankroll, 'fixed_amount', 0.6, 2.0, 70.0)
+
+
+class RecommendationStakeTests(TestCase):
+    def setUp(self):
+        kickoff = timezone.now() + timedelta(days=2)
+        for i, (outcome, prob, odds) in enumerate([('Home', 0.62, 1.9), ('Away', 0.55, 2.4),
+                                                   ('Draw', 0.61, None)]):
+            PredictionLog.objects.create(
+                fixture_id=530000 + i, home_team=f'H{i}', away_team=f'A{i}',
+                league='Serie A', kickoff=kickoff, predicted_outcome=outcome,
+                confidence=prob, expected_value=0.12, odds=odds,
+                probability_home=prob, probability_draw=prob, probability_away=prob,
+                odds_home=odds, odds_draw=odds, odds_away=odds,
+                model_count=3, ensemble_strategy='weighted_average',
+            )
+        self.bankroll = UserBankroll.objects.create(
+            session_id='stake-batch', initial_bankroll=Decimal('800.00'),
+            current_bankroll=Decimal('800.00'), staking_strategy='fixed_percentage',
+            fixed_stake_percentage=4.0,
+        )
+
+    def test_stakes_attached_per_prediction(self):
+        response = Client().get('/api/recommendations/?session_id=stake-batch')
+        self.assertEqual(response.status_code, 200)
+        by_fixture = {r['fixture_id']: r for r in response.json()['recommendations']}
+        for fixture_id, prob, odds in [(530000, 0.62, 1.9), (530001, 0.55, 2.4)]:
+            expected = calculate_stake_amount(
+                Decimal('800.00'), 'fixed_percentage', prob, odds, prob * 100,
+                fixed_percentage=4.0,
+            )
+            stake = by_fixture[fixture_id]['stake_recommendation']
+            self.assertEqual(stake['recommended_stake'], float(expected['recommended_stake']))
+            self.assertEqual(stake['risk_explanation'], expected['risk_explanation'])
+        # No odds for the predicted outcome: no stake, as before.
+        self.assertNotIn('stake_recommendation', by_fixture[530002])
+
+    def test_explanation_is_cached_until_inputs_change(self):
+        api_views._model_explanation.cache_clear()
+        pred = PredictionLog.objects.get(fixture_id=530000)
+        first = api_views.generate_model_explanation(pred)
+        self.assertIs(api_views.generate_model_explanation(pred), first)
+        self.assertEqual(api_views._model_explanation.cache_info().hits, 1)
+        pred.consensus = 0.9
+        self.assertIn('Excellent model consensus', api_views.generate_model_explanation(pred))
+
+    def test_zero_bankroll_reports_an_error_per_row_in_valid_json(self):
+        UserBankroll.objects.filter(pk=self.bankroll.pk).update(
+            current_bankroll=Decimal('0.00'), staking_strategy='fixed_amount')
+
+        response = Client().get('/api/recommendations/?session_id=stake-batch')
+        body = json.loads(response.content, parse_constant=self.fail)
+        by_fixture = {r['fixture_id']: r for r in body['recommendations']}
+        for fixture_id in (530000, 530001):
+            self.assertIn('error', by_fixture[fixture_id]['stake_recommendation'])
+
+    def test_a_failing_row_costs_only_its_own_stake(self):
+        scalar = calculate_stake_amount
+
+        def fails_on_away(*args, **kwargs):
+            if kwargs['odds'] == 2.4:
+                raise ValueError('bad row')
+            return scalar(*args, **kwargs)
+
+        with mock.patch.object(api_views, 'calculate_stake_amounts', side_effect=ValueError), \
+                mock.patch.object(api_views, 'calculate_stake_amount', side_effect=fails_on_away):
+            response = Client().get('/api/recommendations/?session_id=stake-batch')
+
+        by_fixture = {r['fixture_id']: r for r in response.json()['recommendations']}
+        self.assertEqual(by_fixture[530000]['stake_recommendation']['recommended_stake'], 32.0)
+        self.assertEqual(by_fixture[530001]['stake_recommendation'], {'error': 'ValueError: bad row'})
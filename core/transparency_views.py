@@ -8,50 +8,51 @@ from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 from django.views.decorators.csrf import csrf_exempt
 from django.http import JsonResponse
+from django.db.models import Case, F, IntegerField, OuterRef, Subquery, Value, When
 from django.utils import timezone
-from django.views.decorators.cache import cache_page
 import logging
 import os
 from datetime import timedelta
 
 from core.models import PredictionLog, PublishedClaim
-from core.services.accuracy_calculator import AccuracyCalculator
-from core.services import claim_publication, public_universe
+from core.services.accuracy_calculator import RollupAccuracyCalculator
+from core.services import claim_publication, public_universe, shared_cache
 
 logger = logging.getLogger(__name__)
 
+# The calibration report scans the whole evidence archive; it only changes
+# when results settle, so a few minutes of staleness is invisible.
+CALIBRATION_FRESH_SECONDS = 300
+
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
-@cache_page(60)
 def public_strategy_lab(request):
     """Public experiment progress without candidates or internal diagnostics."""
-    from core.services.strategy_lab import build_public_report
+    from core.services.strategy_lab import cached_public_report
 
-    return Response({'success': True, 'data': build_public_report()})
+    return Response({'success': True, 'data': cached_public_report()})
 
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
-@cache_page(60)
 def public_strategy_highlights(request):
     """Up to three distinct live research fits for the homepage."""
-    from core.services.strategy_lab import build_public_strategy_highlights
+    from core.services.strategy_lab import cached_public_strategy_highlights
 
     return Response({
         'success': True,
-        'data': build_public_strategy_highlights(),
+        'data': cached_public_strategy_highlights(),
     })
 
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
-@cache_page(60)
 def public_strategy_fits(request, strategy_key):
     """Fresh, qualified research fits for one public strategy page."""
-    from core.services.strategy_lab import build_public_current_fits
+    from core.services.strategy_lab import cached_public_current_fits
 
-    report = build_public_current_fits(strategy_key)
+    report = cached_public_current_fits(strategy_key)
     if report is None:
         return Response({
             'success': False,
@@ -66,7 +67,10 @@ def calibration_evidence(request):
     """Public probability-quality report from append-only pre-match evidence."""
     from core.services import calibration_evidence as evidence
 
-    report = evidence.build_report()
+    report = shared_cache.get_or_refresh(
+        'calibration_evidence:report', evidence.build_report,
+        fresh_for=CALIBRATION_FRESH_SECONDS,
+    )
     report['generated_at'] = timezone.now().isoformat()
     return Response({'success': True, 'data': report})
 
@@ -144,7 +148,7 @@ def public_accuracy_dashboard(request):
     Returns comprehensive accuracy metrics visible to all users.
     """
     try:
-        calculator = AccuracyCalculator()
+        calculator = RollupAccuracyCalculator()
         stats = calculator.get_comprehensive_stats()
         
         # Add metadata
@@ -192,32 +196,18 @@ def accuracy_summary(request):
     GET /api/transparency/summary/
     """
     try:
-        calculator = AccuracyCalculator()
+        calculator = RollupAccuracyCalculator()
         overall = calculator.get_overall_accuracy()
         roi = calculator.get_roi_simulation(stake_per_bet=10.0)
         
-        # Get recent performance (last 7 days)
-        seven_days_ago = timezone.now() - timedelta(days=7)
-        recent = [
-            c for c in public_universe.resolved_claims()
-            if c.kickoff >= seven_days_ago
-        ]
-
-        recent_total = len(recent)
-        recent_correct = sum(
-            1 for c in recent if c.result_status == PublishedClaim.STATUS_WON
-        )
-        recent_accuracy = (recent_correct / recent_total * 100) if recent_total > 0 else 0
+        recent = calculator.get_recent_accuracy(days=7)
         
         return Response({
             'success': True,
             'summary': {
                 'all_time_accuracy': overall['overall']['accuracy_percent'],
                 'total_predictions': overall['overall']['total_predictions'],
-                'recent_7_days': {
-                    'accuracy': round(recent_accuracy, 1),
-                    'total': recent_total
-                },
+                'recent_7_days': recent,
                 'roi': {
                     'percent': roi['roi_percent'],
                     'total_bets': roi['total_bets'],
@@ -251,7 +241,7 @@ def league_accuracy(request):
     GET /api/transparency/leagues/
     """
     try:
-        calculator = AccuracyCalculator()
+        calculator = RollupAccuracyCalculator()
         leagues = calculator.get_accuracy_by_league()
         
         return Response({
@@ -413,7 +403,7 @@ UNPUBLISHED_PROOF_MESSAGE = (
 
 
 def _record_block():
-    roi = AccuracyCalculator().get_roi_simulation(stake_per_bet=10.0)
+    roi = RollupAccuracyCalculator().get_roi_simulation(stake_per_bet=10.0)
     return {
         'wins': roi['wins'],
         'losses': roi['losses'],
@@ -762,6 +752,7 @@ def _snapshot_list_for(pred):
 
     snaps = list(
         PredictionSnapshot.objects.filter(fixture_id=pred.fixture_id)
+        .select_related('confirmation')
         .order_by('-prediction_generated_at')
     )
     if not snaps:
@@ -778,12 +769,18 @@ def _serialize_snapshot(snapshot, newest_generated_at=None):
     conf = snapshot.confidence or 0.0
     blockers = claim_publication.check_snapshot_publication_eligibility(snapshot)
     existing = snapshot.published_claims.filter(superseded_by__isnull=True).first()
+    confirmation = getattr(snapshot, 'confirmation', None)
 
     return {
         'snapshot_id': str(snapshot.snapshot_id),
         'prediction_run_id': snapshot.prediction_run_id,
         'prediction_generated_at': snapshot.prediction_generated_at.isoformat(),
         'snapshot_created_at': snapshot.snapshot_created_at.isoformat(),
+        # Later runs that found this state unchanged, and the newest of them.
+        'last_confirmed_at': (
+            confirmation.last_confirmed_at.isoformat() if confirmation else None
+        ),
+        'confirmed_run_count': confirmation.confirmed_run_count if confirmation else 0,
         'market_type': snapshot.market_type,
         'predicted_outcome': snapshot.predicted_outcome,
         'model_score_percent': round(conf * 100, 1) if conf <= 1 else round(conf, 1),
@@ -849,6 +846,19 @@ def _queue_band(hours_to_kickoff):
     return 9, 'unknown'
 
 
+def _queue_band_order(now):
+    """`_queue_band`'s order as a SQL expression over kickoff, for ORDER BY."""
+    return Case(
+        *(
+            When(kickoff__gte=now + timedelta(hours=low),
+                 kickoff__lt=now + timedelta(hours=high), then=Value(order))
+            for low, high, order, _ in PUBLICATION_QUEUE_BANDS
+        ),
+        default=Value(9),
+        output_field=IntegerField(),
+    )
+
+
 @api_view(['GET'])
 @permission_classes([IsAdminUser])
 def publication_queue(request):
@@ -867,6 +877,14 @@ def publication_queue(request):
     from core.services import claim_publication
 
     now = timezone.now()
+    # Newest generation time per fixture across ALL its snapshots, so a row
+    # can say whether it is stale.
+    newest_generated = (
+        PredictionSnapshot.objects
+        .filter(fixture_id=OuterRef('fixture_id'))
+        .order_by('-prediction_generated_at')
+        .values('prediction_generated_at')[:1]
+    )
     candidates = (
         PredictionSnapshot.objects
         .filter(
@@ -877,23 +895,26 @@ def publication_queue(request):
         )
         .filter(superseded_by__isnull=True)
         .filter(published_claims__isnull=True)      # not already published
-        .select_related('prediction')
-        .order_by('kickoff')
+        # Answers the gate's is_superseded from one batched query.
+        .prefetch_related('superseded_by')
+        .annotate(
+            latest_generated_at=Subquery(newest_generated),
+            band_order=_queue_band_order(now),
+        )
+        # Within a band: fresher odds first, then the newer snapshot. This is a
+        # practical freshness ordering, NOT a statistical score of any kind.
+        .order_by(
+            'band_order',
+            F('odds_captured_at').desc(nulls_last=True),
+            '-prediction_generated_at',
+        )
     )
 
-    # Newest generation time per fixture, so a row can say whether it is stale.
-    latest_by_fixture = {}
-    for fid, generated in (
-        PredictionSnapshot.objects
-        .filter(fixture_id__in=[c.fixture_id for c in candidates])
-        .values_list('fixture_id', 'prediction_generated_at')
-    ):
-        if fid not in latest_by_fixture or generated > latest_by_fixture[fid]:
-            latest_by_fixture[fid] = generated
-
+    candidates = list(candidates)
+    verified = claim_publication.integrity_verdicts(candidates)
     rows = []
     for snap in candidates:
-        if not snap.verify_integrity():
+        if not verified[snap.snapshot_id]:
             continue
         blockers = claim_publication.check_snapshot_publication_eligibility(
             snap, now=now
@@ -902,7 +923,7 @@ def publication_queue(request):
             continue
 
         hours = (snap.kickoff - now).total_seconds() / 3600.0
-        order, band = _queue_band(hours)
+        _, band = _queue_band(hours)
         prov = snap.odds_provenance or {}
         conf = snap.confidence or 0.0
 
@@ -913,7 +934,7 @@ def publication_queue(request):
                 (now - snap.odds_captured_at).total_seconds() / 60.0, 1
             )
 
-        latest = latest_by_fixture.get(snap.fixture_id)
+        latest = snap.latest_generated_at
         newer_exists = bool(
             latest and latest > snap.prediction_generated_at
         )
@@ -931,10 +952,6 @@ def publication_queue(request):
             )
 
         rows.append({
-            '_order': order,
-            '_hours': hours,
-            '_odds_age': odds_age_minutes if odds_age_minutes is not None else 10 ** 9,
-            '_generated': snap.prediction_generated_at,
             'odds_age_minutes': odds_age_minutes,
             'newer_snapshot_exists': newer_exists,
             'latest_snapshot_generated_at': latest.isoformat() if latest else None,
@@ -964,13 +981,6 @@ def publication_queue(request):
             'publish_endpoint': f'/api/proof/snapshot/{snap.snapshot_id}/publish/',
         })
 
-    # Within a band: fresher odds first, then the newer snapshot. This is a
-    # practical freshness ordering, NOT a statistical score of any kind.
-    rows.sort(key=lambda r: (r['_order'], r['_odds_age'], -r['_generated'].timestamp()))
-    for r in rows:
-        for key in ('_order', '_hours', '_odds_age', '_generated'):
-            r.pop(key)
-
     return Response({
         'count': len(rows),
         'generated_at': now.isoformat(),
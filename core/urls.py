@@ -33,12 +33,14 @@ urlpatterns = [
 
     # Bankroll Management API
     path('api/bankroll/create/', account_only(bankroll_views.create_bankroll), name='create_bankroll'),
+    # Before the <session_id> route, which would otherwise swallow it.
+    path('api/bankroll/simulate/', account_only(bankroll_views.simulate_bankroll), name='simulate_bankroll'),
+    path('api/bankroll/stake-recommendation/', account_only(bankroll_views.get_stake_recommendation), name='get_stake_recommendation'),
+    path('api/bankroll/record-bet/', account_only(bankroll_views.record_bet), name='record_bet'),
     path('api/bankroll/<str:session_id>/', account_only(bankroll_views.get_bankroll), name='get_bankroll'),
     path('api/bankroll/<str:session_id>/update/', account_only(bankroll_views.update_bankroll), name='update_bankroll'),
     path('api/bankroll/<str:session_id>/stats/', account_only(bankroll_views.get_bankroll_stats), name='get_bankroll_stats'),
     path('api/bankroll/<str:session_id>/transactions/', account_only(bankroll_views.get_transactions), name='get_transactions'),
-    path('api/bankroll/stake-recommendation/', account_only(bankroll_views.get_stake_recommendation), name='get_stake_recommendation'),
-    path('api/bankroll/record-bet/', account_only(bankroll_views.record_bet), name='record_bet'),
     path('api/bankroll/settle-bet/<int:transaction_id>/', account_only(bankroll_views.settle_bet), name='settle_bet'),
     
     # Authentication API
@@ -21,12 +21,15 @@ import traceback
 import requests
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-from django.core.cache import cache
+from core.services import shared_cache
 
 # Create your views here.
 
 # SportMonks Configuration for Fixture Verification
 SPORTMONKS_BASE_URL = "https://api.sportmonks.com/v3/football"
+VERIFIED_FIXTURES_FRESH_SECONDS = 300
+VERIFIED_FIXTURES_STALE_SECONDS = 3600
+VERIFIED_FIXTURES_LOCK_SECONDS = 120
 
 # 🚀 ENHANCED MAJOR LEAGUES - All Premier Betting Leagues
 MAJOR_LEAGUES = {
@@ -102,19 +105,30 @@ def fetch_verified_fixtures(days_ahead=14):
     Only shows real, officially scheduled matches from SportMonks API.
     Filters out any fake, test, or unscheduled matches.
     """
-    cache_key = f"verified_fixtures_{days_ahead}"
-    cached_fixtures = cache.get(cache_key)
-    
-    if cached_fixtures is not None:
-        print(f"📦 Using cached verified fixtures ({len(cached_fixtures)} matches)")
-        return cached_fixtures
-    
     token = get_sportmonks_token()
     if not token:
         print("⚠️ SportMonks API token not found - fixture verification disabled")
         print("   💡 To enable fixture verification, set SPORTMONKS_TOKEN in your environment")
         return []
     
+    # Shared across workers: fresh for 5 minutes, then served stale while a
+    # single worker re-runs the sweep, so an expiry never fans out into one
+    # full SportMonks sweep per worker.
+    return shared_cache.get_or_refresh(
+        verified_fixtures_cache_key(days_ahead),
+        lambda: _sweep_verified_fixtures(token, days_ahead),
+        fresh_for=VERIFIED_FIXTURES_FRESH_SECONDS,
+        stale_for=VERIFIED_FIXTURES_STALE_SECONDS,
+        lock_timeout=VERIFIED_FIXTURES_LOCK_SECONDS,
+    )
+
+
+def verified_fixtures_cache_key(days_ahead):
+    return f"verified_fixtures_{days_ahead}"
+
+
+def _sweep_verified_fixtures(token, days_ahead):
+    """One pass over MAJOR_LEAGUES; about a second per league."""
     print(f"🔄 Fetching verified fixtures from SportMonks for next {days_ahead} days")
     print(f"🏟️ Checking {len(MAJOR_LEAGUES)} major leagues for real fixtures...")
     
@@ -210,10 +224,6 @@ def fetch_verified_fixtures(days_ahead=14):
         if len(all_fixtures) > sample_size:
             print(f"   ... and {len(all_fixtures) - sample_size} more fixtures")
     
-    # Cache for 5 minutes to balance freshness and API limits
-    cache.set(cache_key, all_fixtures, 300)
-    print(f"📦 Cached {len(all_fixtures)} verified fixtures for 5 minutes")
-    
     return all_fixtures
 
 def process_sportmonks_fixtures(fixtures_data, league_name):
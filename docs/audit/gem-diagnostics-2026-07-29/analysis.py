@@ -4,12 +4,18 @@ Read-only: operates on CSV snapshots pulled by pull.py. No DB writes.
 """
 import csv
 import math
-import random
+import pathlib as _pathlib
+import sys
 import unicodedata
 from collections import defaultdict
 from datetime import datetime, timezone
 
-random.seed(42)  # matches prior audits
+# The shared bootstrap engine is pure NumPy; put the repo root on the path so
+# this script keeps running standalone, without Django settings.
+_REPO_ROOT = _pathlib.Path(__file__).resolve().parents[3]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+from core.services import bootstrap  # noqa: E402
 
 # ── Universe B (the audit standard) ───────────────────────────────────────
 PER_MARKET = {"over_under_2.5": 0.55}
@@ -96,14 +102,10 @@ def shrunk(n, roi, K=50, prior=0.0):
 def boot_ci(rs, iters=10000, lo=2.5, hi=97.5):
     if len(rs) < 2:
         return (float("nan"), float("nan"))
-    pls = [f(r["profit_loss_10"]) for r in rs]
-    n = len(pls)
-    out = []
-    for _ in range(iters):
-        s = sum(pls[random.randrange(n)] for _ in range(n))
-        out.append(s / (n * 10.0) * 100)
-    out.sort()
-    return (out[int(iters * lo / 100)], out[int(iters * hi / 100)])
+    roi = [f(r["profit_loss_10"]) / 10.0 * 100 for r in rs]
+    # Seed 42 matches prior audits; alpha is derived from the requested tails.
+    ci = bootstrap.bootstrap_ci(roi, n_iter=iters, seed=42, alpha=(lo + 100 - hi) / 100)
+    return (ci.lo, ci.hi)
 
 
 def main():
@@ -4,20 +4,27 @@ Design spec: docs/superpowers/specs/2026-07-16-roi-audit-design.md
 Reproducibility: docs/audit/README.md
 
 Usage:
-    python roi-audit-2026-07-16.py --snapshot <sqlite> [--out <report.md>]
+    python roi-audit-2026-07-16.py --snapshot <sqlite | parquet export dir> [--out <report.md>]
 """
 from __future__ import annotations
 
 import argparse
 import datetime as _dt
 import os as _os
-import sqlite3
+import pathlib as _pathlib
 import sys
 from typing import Optional
 
 import numpy as np
 import pandas as pd
 
+# The shared bootstrap engine is pure NumPy; put the repo root on the path so
+# this script keeps running standalone, without Django settings.
+_REPO_ROOT = _pathlib.Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+from core.services import bootstrap, evidence_frames  # noqa: E402
+
 
 # ---- Data loading -----------------------------------------------------
 
@@ -33,9 +40,9 @@ def load_and_filter(snapshot_path: str) -> tuple[pd.DataFrame, pd.DataFrame]:
 
     Returns (df_ui_matching, df_unfiltered).
     """
-    conn = sqlite3.connect(snapshot_path)
-    df = pd.read_sql_query('SELECT * FROM prediction_log', conn)
-    conn.close()
+    # A SQLite snapshot or an export_analysis_parquet directory; the coercions
+    # below are no-ops on the already-typed Parquet columns.
+    df = evidence_frames.read_table(snapshot_path, 'prediction_log')
 
     df['is_recommended'] = _coerce_bool(df['is_recommended'])
     df['is_audit_excluded'] = _coerce_bool(df.get('is_audit_excluded', pd.Series([False] * len(df))))
@@ -102,16 +109,12 @@ def q2_bootstrap_ci(profits: np.ndarray, n_iter: int = 10000, seed: int = 42) ->
         return {'point_roi_pct': float('nan'),
                 'ci_lo': float('nan'), 'ci_hi': float('nan'), 'ci_median': float('nan')}
 
-    rng = np.random.default_rng(seed)
-    n = len(profits)
-    idx = rng.integers(0, n, size=(n_iter, n))
-    resamples = profits[idx]
-    roi_samples = resamples.mean(axis=1) / 10.0 * 100.0
+    ci = bootstrap.bootstrap_ci(profits / 10.0 * 100.0, n_iter=n_iter, seed=seed)
     return {
-        'point_roi_pct': float(profits.mean() / 10.0 * 100.0),
-        'ci_lo': float(np.percentile(roi_samples, 2.5)),
-        'ci_median': float(np.percentile(roi_samples, 50)),
-        'ci_hi': float(np.percentile(roi_samples, 97.5)),
+        'point_roi_pct': ci.point,
+        'ci_lo': ci.lo,
+        'ci_median': ci.median,
+        'ci_hi': ci.hi,
     }
 
 
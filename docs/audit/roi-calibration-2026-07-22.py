@@ -10,14 +10,14 @@ confidence bucket / league / time period, emits per-target verdicts
 (Display / Kelly / Filter re-selection).
 
 Usage:
-    python roi-calibration-2026-07-22.py --snapshot <sqlite> [--out <report.md>]
+    python roi-calibration-2026-07-22.py --snapshot <sqlite | parquet export dir> [--out <report.md>]
 """
 from __future__ import annotations
 
 import argparse
 import datetime as _dt
 import os as _os
-import sqlite3
+import pathlib as _pathlib
 import sys
 from typing import Optional
 
@@ -26,6 +26,13 @@ import pandas as pd
 from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import StratifiedKFold
 
+# The shared bootstrap engine is pure NumPy; put the repo root on the path so
+# this script keeps running standalone, without Django settings.
+_REPO_ROOT = _pathlib.Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+from core.services import bootstrap, evidence_frames  # noqa: E402
+
 
 # ---- Data loading (adapted from prior scripts) ------------------------
 
@@ -47,9 +54,9 @@ def load_universe(snapshot_path: str) -> pd.DataFrame:
       AND profit_loss_10 NOT NULL AND confidence NOT NULL
       AND market_type = 'over_under_2.5'
     """
-    conn = sqlite3.connect(snapshot_path)
-    df = pd.read_sql_query('SELECT * FROM prediction_log', conn)
-    conn.close()
+    # A SQLite snapshot or an export_analysis_parquet directory; the coercions
+    # below are no-ops on the already-typed Parquet columns.
+    df = evidence_frames.read_table(snapshot_path, 'prediction_log')
 
     df['is_recommended'] = _coerce_bool(df['is_recommended'])
     df['is_audit_excluded'] = _coerce_bool(
@@ -88,16 +95,12 @@ def bootstrap_ci(values: np.ndarray, n_iter: int = 10000,
         return {'point': float('nan'),
                 'ci_lo': float('nan'), 'ci_hi': float('nan'),
                 'ci_median': float('nan')}
-    rng = np.random.default_rng(seed)
-    n = len(values)
-    idx = rng.integers(0, n, size=(n_iter, n))
-    resamples = values[idx]
-    means = resamples.mean(axis=1)
+    ci = bootstrap.bootstrap_ci(values, n_iter=n_iter, seed=seed)
     return {
-        'point': float(values.mean()),
-        'ci_lo': float(np.percentile(means, 2.5)),
-        'ci_median': float(np.percentile(means, 50)),
-        'ci_hi': float(np.percentile(means, 97.5)),
+        'point': ci.point,
+        'ci_lo': ci.lo,
+        'ci_median': ci.median,
+        'ci_hi': ci.hi,
     }
 
 
@@ -171,6 +174,28 @@ def ece(probs: np.ndarray, outcomes: np.ndarray, n_bins: int = 10) -> float:
 
 # ---- Cross-validated calibration --------------------------------------
 
+def weighted_ece(weights: np.ndarray, probs: np.ndarray,
+                 outcomes: np.ndarray, n_bins: int = 10) -> np.ndarray:
+    """`ece()` for every row of resample multiplicities at once.
+
+    Same equal-width bins as `reliability_curve`; `weights` has shape
+    (n_resamples, n) and the result has shape (n_resamples,).
+    """
+    edges = np.linspace(0.0, 1.0, n_bins + 1)
+    edges[-1] += 1e-9
+    total = np.zeros(weights.shape[0])
+    weighted = np.zeros(weights.shape[0])
+    for i in range(n_bins):
+        in_bin = ((probs >= edges[i]) & (probs < edges[i + 1])).astype(float)
+        n = weights @ in_bin
+        with np.errstate(invalid='ignore', divide='ignore'):
+            gap = (weights @ (probs * in_bin) - weights @ (outcomes * in_bin)) / n
+        weighted += np.where(n > 0, n * np.abs(gap), 0.0)
+        total += n
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return weighted / total
+
+
 def _bootstrap_ece_ci(probs: np.ndarray, outcomes: np.ndarray,
                       n_bins: int = 10, n_iter: int = 10000,
                       seed: int = 42) -> dict:
@@ -178,18 +203,16 @@ def _bootstrap_ece_ci(probs: np.ndarray, outcomes: np.ndarray,
     if len(probs) == 0:
         return {'point': float('nan'), 'ci_lo': float('nan'),
                 'ci_hi': float('nan'), 'ci_median': float('nan')}
-    rng = np.random.default_rng(seed)
-    n = len(probs)
-    samples = []
-    for _ in range(n_iter):
-        idx = rng.integers(0, n, size=n)
-        samples.append(ece(probs[idx], outcomes[idx], n_bins))
-    samples = np.array(samples)
+    ci = bootstrap.bootstrap_ci(
+        probs, outcomes.astype(float),
+        statistic=lambda w, p, y: weighted_ece(w, p, y, n_bins),
+        n_iter=n_iter, seed=seed,
+    )
     return {
         'point': float(ece(probs, outcomes, n_bins)),
-        'ci_lo': float(np.percentile(samples, 2.5)),
-        'ci_median': float(np.percentile(samples, 50)),
-        'ci_hi': float(np.percentile(samples, 97.5)),
+        'ci_lo': ci.lo,
+        'ci_median': ci.median,
+        'ci_hi': ci.hi,
     }
 
 
@@ -13,20 +13,27 @@ Reads the post-backfill snapshot and runs 5 experiments:
 Every experiment carries a bootstrap 95% CI and emits a SHIP/INVESTIGATE/DISCARD verdict.
 
 Usage:
-    python roi-tuning-2026-07-20.py --snapshot <sqlite> [--out <report.md>]
+    python roi-tuning-2026-07-20.py --snapshot <sqlite | parquet export dir> [--out <report.md>]
 """
 from __future__ import annotations
 
 import argparse
 import datetime as _dt
 import os as _os
-import sqlite3
+import pathlib as _pathlib
 import sys
 from typing import Optional
 
 import numpy as np
 import pandas as pd
 
+# The shared bootstrap engine is pure NumPy; put the repo root on the path so
+# this script keeps running standalone, without Django settings.
+_REPO_ROOT = _pathlib.Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+from core.services import bootstrap, evidence_frames  # noqa: E402
+
 
 # ---- Data loading (copied from audit script for reproducibility) ------
 
@@ -44,9 +51,9 @@ def load_universe(snapshot_path: str) -> pd.DataFrame:
       is_recommended=True AND actual_outcome IS NOT NULL
       AND match_status != 'archived' AND is_audit_excluded != True
     """
-    conn = sqlite3.connect(snapshot_path)
-    df = pd.read_sql_query('SELECT * FROM prediction_log', conn)
-    conn.close()
+    # A SQLite snapshot or an export_analysis_parquet directory; the coercions
+    # below are no-ops on the already-typed Parquet columns.
+    df = evidence_frames.read_table(snapshot_path, 'prediction_log')
 
     df['is_recommended'] = _coerce_bool(df['is_recommended'])
     df['is_audit_excluded'] = _coerce_bool(
@@ -70,7 +77,7 @@ def load_universe(snapshot_path: str) -> pd.DataFrame:
     return universe
 
 
-# ---- Bootstrap CI (copied from audit script) --------------------------
+# ---- Bootstrap CI (shared engine, same ROI convention as the audit) ----
 
 def bootstrap_ci(profits: np.ndarray, n_iter: int = 10000, seed: int = 42) -> dict:
     """Bootstrap 95% CI on ROI (%). ROI = mean(profit_loss_10) / 10 * 100.
@@ -80,16 +87,12 @@ def bootstrap_ci(profits: np.ndarray, n_iter: int = 10000, seed: int = 42) -> di
     if len(profits) == 0:
         return {'point_roi_pct': float('nan'),
                 'ci_lo': float('nan'), 'ci_hi': float('nan'), 'ci_median': float('nan')}
-    rng = np.random.default_rng(seed)
-    n = len(profits)
-    idx = rng.integers(0, n, size=(n_iter, n))
-    resamples = profits[idx]
-    roi_samples = resamples.mean(axis=1) / 10.0 * 100.0
+    ci = bootstrap.bootstrap_ci(profits / 10.0 * 100.0, n_iter=n_iter, seed=seed)
     return {
-        'point_roi_pct': float(profits.mean() / 10.0 * 100.0),
-        'ci_lo': float(np.percentile(roi_samples, 2.5)),
-        'ci_median': float(np.percentile(roi_samples, 50)),
-        'ci_hi': float(np.percentile(roi_samples, 97.5)),
+        'point_roi_pct': ci.point,
+        'ci_lo': ci.lo,
+        'ci_median': ci.median,
+        'ci_hi': ci.hi,
     }
 
 
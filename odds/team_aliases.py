@@ -0,0 +1,105 @@
+"""
+Team name aliases shared by odds matching and the fixture search index.
+
+Kept free of imports so anything can read it: odds.team_matching for linking
+OddsAPI names to SportMonks fixtures, core.services.fixture_search for
+indexing alternative spellings. Keys and values are lower case.
+"""
+
+# Team aliases for common variations
+TEAM_ALIASES = {
+    # Premier League
+    "brighton": "brighton and hove albion",
+    "brighton & hove albion": "brighton and hove albion",
+    "liverpool": "liverpool fc",
+    "manchester united": "man utd",
+    "man utd": "manchester united", 
+    "manchester city": "man city",
+    "man city": "manchester city",
+    "tottenham": "tottenham hotspur",
+    "spurs": "tottenham hotspur",
+    "chelsea": "chelsea fc",
+    "arsenal": "arsenal fc",
+    "west ham": "west ham united",
+    "newcastle": "newcastle united",
+    "leicester": "leicester city",
+    "crystal palace": "crystal palace fc",
+    "wolves": "wolverhampton wanderers",
+    "wolverhampton": "wolverhampton wanderers",
+    "sheffield united": "sheffield utd",
+    "sheffield utd": "sheffield united",
+    "nottingham forest": "nottm forest",
+    "nottm forest": "nottingham forest",
+    
+    # La Liga
+    "barcelona": "fc barcelona",
+    "fc barcelona": "barcelona",
+    "real madrid": "real madrid cf",
+    "atletico madrid": "atletico de madrid",
+    "athletic bilbao": "athletic club",
+    "athletic club": "athletic bilbao",
+    "real sociedad": "real sociedad de futbol",
+    "valencia": "valencia cf",
+    "sevilla": "sevilla fc",
+    "villarreal": "villarreal cf",
+    "real betis": "real betis balompie",
+    "celta vigo": "rc celta",
+    "rc celta": "celta vigo",
+    
+    # Bundesliga
+    "bayern munich": "fc bayern munich",
+    "fc bayern munich": "bayern munich",
+    "borussia dortmund": "bvb dortmund",
+    "bvb dortmund": "borussia dortmund",
+    "bayer leverkusen": "bayer 04 leverkusen",
+    "rb leipzig": "rasenballsport leipzig",
+    "eintracht frankfurt": "frankfurt",
+    "frankfurt": "eintracht frankfurt",
+    "borussia monchengladbach": "borussia mgladbach",
+    "borussia mgladbach": "borussia monchengladbach",
+    
+    # Serie A
+    "juventus": "juventus fc",
+    "ac milan": "milan",
+    "milan": "ac milan",
+    "inter": "inter milan",
+    "inter milan": "internazionale",
+    "internazionale": "inter milan",
+    "napoli": "ssc napoli",
+    "ssc napoli": "napoli",
+    "roma": "as roma",
+    "as roma": "roma",
+    "lazio": "ss lazio",
+    "ss lazio": "lazio",
+    "atalanta": "atalanta bc",
+    "fiorentina": "acf fiorentina",
+    
+    # Ligue 1
+    "psg": "paris saint germain",
+    "paris saint germain": "psg",
+    "paris sg": "paris saint germain",
+    "marseille": "olympique marseille",
+    "olympique marseille": "marseille",
+    "lyon": "olympique lyonnais",
+    "olympique lyonnais": "lyon",
+    "saint etienne": "as saint etienne",
+    "as saint etienne": "saint etienne",
+    
+    # Romanian Liga 1
+    "fcsb": "steaua bucuresti",
+    "steaua bucuresti": "fcsb",
+    "steaua": "fcsb",
+    "cfr cluj": "cfr 1907 cluj",
+    "rapid bucuresti": "fc rapid bucuresti",
+    "fc rapid bucuresti": "rapid bucuresti",
+    "dinamo bucuresti": "fc dinamo bucuresti",
+    "fc dinamo bucuresti": "dinamo bucuresti",
+    "universitatea craiova": "cs universitatea craiova",
+    "cs universitatea craiova": "universitatea craiova",
+    "sepsi": "sepsi osk",
+    "sepsi osk": "sepsi",
+    "uta arad": "fc uta arad",
+    "fc uta arad": "uta arad",
+    "petrolul ploiesti": "fc petrolul ploiesti",
+    "fc petrolul ploiesti": "petrolul ploiesti",
+}
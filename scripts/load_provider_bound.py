@@ -0,0 +1,147 @@
+"""
+Throughput of a provider-bound endpoint, sync workers versus the ASGI worker.
+
+Starts a local marketing-webhook stub that sleeps --delay seconds per call,
+points the marketing sync at it, and POSTs --requests subscriptions to
+/api/subscribe/ two ways, in process, against a throwaway SQLite database:
+
+  sync   --workers threads, each handling one request at a time and blocked
+         for the whole provider wait, as a gunicorn sync worker is
+  asgi   one event loop (one uvicorn worker) with up to --concurrency
+         requests in flight, the provider call awaited through httpx
+
+With the defaults the sync pool tops out near workers / delay requests per
+second, while the single ASGI worker is bounded by the stub, not by its own
+capacity. Needs httpx (requirements.txt).
+
+Usage:
+    python -m scripts.load_provider_bound [--requests 64] [--delay 0.5]
+        [--workers 4] [--concurrency 64]
+"""
+import argparse
+import asyncio
+import importlib.util
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'smartbet.settings')
+
+import django  # noqa: E402
+
+
+def start_stub(delay):
+    class SlowProvider(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'{}')
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlowProvider)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def body(label, i):
+    return {'email': f'{label}-{i}@load.invalid', 'source': 'load_test'}
+
+
+def run_sync(count, workers):
+    from django.test import Client
+
+    def one(i):
+        return Client().post('/api/subscribe/', body('sync', i),
+                             content_type='application/json').status_code
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        statuses = list(pool.map(one, range(count)))
+    return time.perf_counter() - started, statuses
+
+
+def run_asgi(count, concurrency):
+    from django.test import AsyncClient
+
+    async def main():
+        client = AsyncClient()
+        gate = asyncio.Semaphore(concurrency)
+
+        async def one(i):
+            async with gate:
+                response = await client.post('/api/subscribe/', body('asgi', i),
+                                             content_type='application/json')
+                return response.status_code
+
+        return await asyncio.gather(*(one(i) for i in range(count)))
+
+    started = time.perf_counter()
+    statuses = asyncio.run(main())
+    return time.perf_counter() - started, statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=64)
+    parser.add_argument('--delay', type=float, default=0.5,
+                        help='Seconds the provider stub takes per call.')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Sync workers in the baseline.')
+    parser.add_argument('--concurrency', type=int, default=64,
+                        help='Requests in flight on the ASGI worker.')
+    args = parser.parse_args()
+
+    if importlib.util.find_spec('httpx') is None:
+        sys.exit('httpx is not installed; pip install -r requirements.txt')
+
+    stub = start_stub(args.delay)
+    os.environ.update({
+        'MARKETING_SYNC_ENABLED': 'True',
+        'MARKETING_SYNC_WEBHOOK_URL': f'http://127.0.0.1:{stub.server_port}/hook',
+    })
+    os.environ.pop('BREVO_API_KEY', None)
+
+    django.setup()
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    from core.models import EmailSubscriber
+
+    settings.ACCOUNT_FEATURES_ENABLED = True
+    setup_test_environment()
+    original_name = connection.settings_dict['NAME']
+    with tempfile.TemporaryDirectory() as tmp:
+        connection.settings_dict['TEST']['NAME'] = os.path.join(tmp, 'load.sqlite3')
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            print(f'provider delay {args.delay:.2f}s, {args.requests} requests')
+            print('%-6s %10s %10s %8s' % ('mode', 'seconds', 'req/s', 'synced'))
+            for mode, run, width in (('sync', run_sync, args.workers),
+                                     ('asgi', run_asgi, args.concurrency)):
+                elapsed, statuses = run(args.requests, width)
+                # A 200 is returned even when the marketing sync failed, so
+                # count the subscribers the stub actually acknowledged.
+                synced = EmailSubscriber.objects.filter(
+                    email__startswith=f'{mode}-', email_platform_status='synced').count()
+                print('%-6s %10.2f %10.1f %8d' % (
+                    mode, elapsed, len(statuses) / elapsed, synced))
+        finally:
+            connection.creation.destroy_test_db(original_name, verbosity=0)
+            stub.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -20,20 +20,42 @@ const backendBase = () => {
   return configured.replace(/\/$/, '')
 }
 
+// The backend serves the feed as precompressed bytes with an ETag. Keeping the
+// last body lets a poll for an unchanged feed end in a bodiless 304.
+let lastFeed: { etag: string; body: CachedGemFeed } | null = null
+
+/** Seconds since the worker produced the feed, from this server's clock. */
+function ageSeconds(body: CachedGemFeed): number | null {
+  if (typeof body.age_seconds === 'number') return body.age_seconds
+  const generated = body.generated_at ? Date.parse(body.generated_at) : NaN
+  if (Number.isNaN(generated)) return null
+  return Math.max(0, Math.floor((Date.now() - generated) / 1000))
+}
+
 export async function loadCachedGemFeed(): Promise<CachedGemFeed> {
   const secret = process.env.INTERNAL_API_SECRET || ''
   if (!secret) throw new Error('Gem feed cache is not configured')
 
+  const headers: Record<string, string> = { 'X-Internal-Auth': secret }
+  if (lastFeed) headers['If-None-Match'] = lastFeed.etag
+
   const response = await fetch(`${backendBase()}/api/internal/gem-feed/`, {
     cache: 'no-store',
-    headers: { 'X-Internal-Auth': secret },
+    headers,
     signal: AbortSignal.timeout(5000),
   })
 
-  if (!response.ok) {
+  let body: CachedGemFeed
+  if (response.status === 304 && lastFeed) {
+    body = lastFeed.body
+  } else if (!response.ok) {
     // Do not include response text: even an internal failure should not become
     // part of a public error, log line or provider-credential disclosure.
     throw new Error(`Gem feed cache unavailable (${response.status})`)
+  } else {
+    body = await response.json()
+    const etag = response.headers.get('ETag')
+    lastFeed = etag ? { etag, body } : null
   }
-  return response.json()
+  return { ...body, age_seconds: ageSeconds(body) }
 }
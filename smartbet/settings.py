@@ -87,6 +87,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'smartbet.wsgi.application'
+ASGI_APPLICATION = 'smartbet.asgi.application'
 
 # Database
 if os.getenv('DATABASE_URL'):
@@ -135,7 +136,11 @@ if os.getenv('DATABASE_URL'):
                 'PASSWORD': url.password,
                 'HOST': url.hostname,
                 'PORT': url.port,
-                'CONN_MAX_AGE': 600,
+                # 0 under the ASGI web worker: each request runs in its own
+                # thread-sensitive context, so persistent connections are never
+                # reused and leak until Postgres hits max_connections. Reuse
+                # belongs in a pooler (PgBouncer in transaction mode) instead.
+                'CONN_MAX_AGE': 0,
             }
         }
         
@@ -187,6 +192,38 @@ if RUNNING_TESTS:
     # investigating a specific cutoff still wins.
     os.environ.setdefault('PRICING_INTEGRITY_CUTOFF', TEST_PRICING_INTEGRITY_CUTOFF)
 
+# Cache shared by every web worker and the scheduler. The per-process locmem
+# default meant each worker rebuilt the same public reports on its own clock
+# and a cleared key in one process stayed live in the others. REDIS_URL wins
+# when set; otherwise CACHE_BACKEND picks 'database' (default, table created by
+# migration 0054 and again by run_scheduler on start), 'file' or 'locmem'. Tests
+# keep locmem: several assert exact query counts, which a database cache would
+# add to; core.tests_shared_cache covers the database backend.
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'database').strip().lower()
+CACHE_KEY_PREFIX = 'smartbet'
+
+if RUNNING_TESTS or CACHE_BACKEND == 'locmem':
+    _default_cache = {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+elif os.environ.get('REDIS_URL'):
+    _default_cache = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ['REDIS_URL'],
+    }
+elif CACHE_BACKEND == 'file':
+    _default_cache = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('CACHE_DIR', str(BASE_DIR / '.cache' / 'django')),
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+else:
+    _default_cache = {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'smartbet_cache',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+
+CACHES = {'default': {**_default_cache, 'KEY_PREFIX': CACHE_KEY_PREFIX}}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     { 'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator', },